@@ -25,25 +25,41 @@ Graph Schema:
   Edges: INTERACTS_WITH, TARGETS, CAUSES, PARTICIPATES_IN, ACTIVATES,
          INHIBITS, PRODUCES, EXPRESSED_IN, ASSOCIATED_WITH, TREATS
 
+Parsing:
+  Source files are streamed in chunks (pyarrow CSV reader, or pandas for
+  files pyarrow cannot decode) and filtered column-wise into node and edge
+  tables.
+  The five source parsers run in parallel processes (KG_PARSE_WORKERS,
+  default: all cores); their tables are merged and the edges added to the
+  graph in one pass.
+
+Metrics:
+  Degree, PageRank, betweenness and connected components are computed on a
+  SciPy CSR adjacency.  Betweenness is sampled (500 sources) on the largest
+  component and exact on the rest, so every node gets all three
+  centralities; sources are split across KG_METRIC_WORKERS processes.
+
 Output Files:
-  - graph.graphml          (NetworkX GraphML format)
-  - graph_data.json        (JSON node/edge lists for web visualization)
+  - graph_artifact/        (Arrow node/edge tables + CSR adjacency, mmap-able)
   - graph_stats.json       (Statistics and metadata)
   - neo4j_import/          (CSV files for Neo4j bulk import)
   - embeddings_ready/      (Preprocessed data for GNN training)
 """
 
 import os
+import re
 import sys
 import json
-import gzip
 import csv
 import time
 import logging
 import hashlib
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import chain
 from urllib.request import urlretrieve, Request, urlopen
 from urllib.error import URLError
 from io import StringIO, BytesIO
@@ -73,6 +89,24 @@ except ImportError:
     os.system("pip3 install pandas")
     import pandas as pd
 
+try:
+    from scipy import sparse as sp_sparse
+    from scipy.sparse.csgraph import connected_components
+except ImportError:
+    os.system("pip3 install scipy")
+    from scipy import sparse as sp_sparse
+    from scipy.sparse.csgraph import connected_components
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    os.system("pip3 install pyarrow")
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+
 # ============================================================
 # Configuration
 # ============================================================
@@ -83,6 +117,17 @@ OUTPUT_DIR = BASE_DIR / "output"
 NEO4J_DIR = OUTPUT_DIR / "neo4j_import"
 EMBEDDINGS_DIR = OUTPUT_DIR / "embeddings_ready"
 
+# Source parsing: parser processes, pyarrow block size, pandas chunk rows
+PARSE_WORKERS = int(os.environ.get("KG_PARSE_WORKERS", os.cpu_count() or 1))
+CSV_BLOCK_SIZE = 64 * 1024 * 1024
+CSV_CHUNK_ROWS = 1_000_000
+
+# Graph metrics: betweenness processes, sampled sources in the largest
+# component, and dense work-array budget per betweenness batch
+METRIC_WORKERS = int(os.environ.get("KG_METRIC_WORKERS", os.cpu_count() or 1))
+BETWEENNESS_SAMPLES = 500
+BETWEENNESS_BATCH_BYTES = 512 * 1024 * 1024
+
 # Ensure directories exist
 for d in [DATA_DIR, OUTPUT_DIR, NEO4J_DIR, EMBEDDINGS_DIR]:
     d.mkdir(parents=True, exist_ok=True)
@@ -275,6 +320,826 @@ class DownloadManager:
         return None
 
 
+# ============================================================
+# Columnar Source Parsers
+# ============================================================
+#
+# Each source is parsed by a module-level function (so it can run in a
+# worker process) into tables of nodes and edges.  Files are streamed in
+# chunks and filtered with vectorized pandas operations; nothing touches
+# the NetworkX graph until KnowledgeGraphBuilder merges the tables.
+#
+# Node tables are merged in order.  A table is either "add if absent"
+# (the first source to add a node keeps its attributes) or "replace"
+# (attributes are updated, as add_node does).  An optional ``requires``
+# column names a node that must already be in the graph for the row to be
+# added.  Edge rows are kept only if both endpoints are in the graph.
+
+SIDER_FOCUS_EFFECT_KEYWORDS = [
+    "cytokine", "fever", "hypotension", "neurotoxicity", "encephalopathy",
+    "coagulopathy", "haemophagocytic", "immune", "inflammatory",
+    "infusion", "anaphyla",
+]
+
+CTD_FOCUS_DISEASE_KEYWORDS = [
+    "cytokine", "lymphoma", "leukemia", "myeloma", "immune", "inflam",
+    "hemophagocytic", "macrophage", "neurotoxicity", "encephalopathy",
+    "coagulation", "thrombocytopenia", "autoimmune", "lupus",
+]
+
+
+@dataclass
+class NodeTable:
+    """Nodes from one source; ``frame`` has an ``id`` column plus attributes.
+
+    Rows that cannot change the merge result are dropped up front (in the
+    worker): later duplicates of an "add if absent" node, and all but the
+    last values of a "replace" node.
+    """
+    frame: pd.DataFrame
+    replace: bool = False
+
+    def __post_init__(self):
+        if self.replace:
+            self.frame = _last_by_key(self.frame, ["id"])
+        else:
+            keys = ["id", "requires"] if "requires" in self.frame else ["id"]
+            self.frame = self.frame.drop_duplicates(keys)
+
+
+@dataclass
+class EdgeTable:
+    """Edges from one source; ``frame`` has ``u``, ``v`` and attribute columns.
+
+    ``frame`` is reduced to one row per ``(u, v)`` holding the last values,
+    which is what repeated ``add_edge`` calls leave behind; ``counts`` keeps
+    the number of input rows per ``(u, v, type)`` for the edge statistics.
+    ``stat`` names the builder stat that records the number of edges.
+    """
+    frame: pd.DataFrame
+    label: str
+    stat: str = None
+    counts: pd.DataFrame = field(init=False)
+
+    def __post_init__(self):
+        self.counts = (
+            self.frame.groupby(["u", "v", "type"], sort=False).size()
+            .rename("n").reset_index()
+        )
+        self.frame = _last_by_key(self.frame, ["u", "v"])
+
+
+@dataclass
+class ParsedSource:
+    """Columnar output of one source parser."""
+    name: str
+    nodes: list = field(default_factory=list)
+    edges: list = field(default_factory=list)
+    stats: dict = field(default_factory=dict)
+
+
+def _read_chunks(path: Path, n_columns: int, delimiter: str = "\t",
+                 header: bool = False):
+    """Yield DataFrames of string columns ``0..n_columns-1`` from a text file.
+
+    Gzip is detected from the file extension.  Rows with more than
+    ``n_columns`` fields are skipped; short rows are skipped by pyarrow and
+    padded by pandas, and the parsers drop rows missing a field they use.
+    Uses the multithreaded pyarrow streaming reader and falls back to the
+    pandas chunked reader for files pyarrow cannot decode.  If pyarrow
+    fails partway through, the pandas reader resumes after the last row
+    pyarrow yielded.
+    """
+    names = [str(i) for i in range(n_columns)]
+    skip_rows = 1 if header else 0
+    rows_yielded = 0
+    # (row number, too long) of every row pyarrow skipped so far
+    invalid: list[tuple[int, bool]] = []
+
+    def skip_row(row) -> str:
+        invalid.append((row.number - skip_rows, row.actual_columns > row.expected_columns))
+        return "skip"
+
+    try:
+        reader = pa_csv.open_csv(
+            str(path),
+            read_options=pa_csv.ReadOptions(
+                column_names=names, skip_rows=skip_rows,
+                block_size=CSV_BLOCK_SIZE,
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=delimiter, quote_char=False,
+                invalid_row_handler=skip_row,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                strings_can_be_null=False,
+            ),
+        )
+        for batch in reader:
+            rows_yielded += batch.num_rows
+            yield batch.to_pandas()
+        return
+    except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+        resume = f" after row {rows_yielded:,}" if rows_yielded else ""
+        log.warning(f"    pyarrow could not read {path.name} ({e}); "
+                    f"using the pandas reader{resume}")
+
+    skip = _pandas_rows_read(rows_yielded, invalid)
+    for chunk in pd.read_csv(
+        path, sep=delimiter, header=None, names=names,
+        skiprows=skip_rows, dtype=str, quoting=csv.QUOTE_NONE,
+        keep_default_na=False, na_values=[], on_bad_lines="skip",
+        encoding_errors="replace", chunksize=CSV_CHUNK_ROWS,
+    ):
+        if skip >= len(chunk):
+            skip -= len(chunk)
+            continue
+        yield chunk.iloc[skip:] if skip else chunk
+        skip = 0
+
+
+def _pandas_rows_read(rows_yielded: int, invalid: list[tuple[int, bool]]) -> int:
+    """Pandas rows covering the first ``rows_yielded`` rows pyarrow yielded.
+
+    Row numbers count every non-blank line, so the last yielded row is
+    line ``rows_yielded`` plus the skipped rows before it.  Pandas drops
+    the too-long rows among those lines but keeps (and pads) short ones.
+    """
+    if not rows_yielded:
+        return 0
+    last = rows_yielded
+    while True:
+        skipped = [too_long for number, too_long in invalid if number <= last]
+        if rows_yielded + len(skipped) == last:
+            return last - sum(skipped)
+        last = rows_yielded + len(skipped)
+
+
+def _contains_any(values: pd.Series, keywords) -> pd.Series:
+    """Case-insensitive "any keyword is a substring" test, vectorized."""
+    pattern = "|".join(re.escape(k.lower()) for k in keywords)
+    return values.str.lower().str.contains(pattern, regex=True)
+
+
+def _interleave(*columns: pd.Series) -> pd.Series:
+    """Row-major interleaving of equal-length columns (a1, b1, a2, b2, ...)."""
+    stacked = np.column_stack([c.to_numpy(dtype=object) for c in columns])
+    return pd.Series(stacked.ravel())
+
+
+def parse_string_source(downloaded: dict) -> ParsedSource:
+    """STRING PPI (human only, high confidence)."""
+    parsed = ParsedSource("string")
+
+    # Protein names first
+    protein_names = pd.Series(dtype=object)
+    info_path = downloaded.get("string_info")
+    if info_path and info_path.exists():
+        try:
+            info = pd.concat(
+                [c[["0", "1"]].dropna() for c in _read_chunks(info_path, 4, header=True)],
+                ignore_index=True,
+            )
+            protein_names = info.drop_duplicates("0", keep="last").set_index("0")["1"]
+        except Exception as e:
+            log.warning(f"    Could not parse STRING info: {e}")
+
+    links_path = downloaded.get("string_links")
+    if not links_path or not links_path.exists():
+        log.warning("    STRING links file not available, skipping")
+        return parsed
+
+    focus = list(CRS_FOCUS_GENES)
+    chunks = []
+    try:
+        for chunk in _read_chunks(links_path, 3, delimiter=" ", header=True):
+            chunk = chunk.dropna()
+            score = pd.to_numeric(chunk["2"], errors="coerce")
+            # Only high-confidence interactions (>700) are candidates
+            keep = score >= 700
+            chunk, score = chunk[keep], score[keep].astype(np.int64)
+            if chunk.empty:
+                continue
+            p1, p2 = chunk["0"], chunk["1"]
+            name1 = p1.map(protein_names).fillna(p1.str.replace("9606.", "", regex=False))
+            name2 = p2.map(protein_names).fillna(p2.str.replace("9606.", "", regex=False))
+            # Include every CRS-relevant interaction; others only above 900
+            is_focus = name1.isin(focus) | name2.isin(focus)
+            keep = is_focus | (score >= 900)
+            chunks.append(pd.DataFrame({
+                "p1": p1[keep], "p2": p2[keep],
+                "u": name1[keep], "v": name2[keep],
+                "score": score[keep], "is_focus": is_focus[keep],
+            }))
+    except Exception as e:
+        log.error(f"    Error parsing STRING: {e}")
+
+    if not chunks:
+        return parsed
+    links = pd.concat(chunks, ignore_index=True)
+
+    node_ids = _interleave(links["u"], links["v"])
+    parsed.nodes.append(NodeTable(pd.DataFrame({
+        "id": node_ids,
+        "type": "Protein",
+        "string_id": _interleave(links["p1"], links["p2"]),
+        "is_focus": node_ids.isin(focus),
+    })))
+    confidence = links["score"] / 1000
+    parsed.edges.append(EdgeTable(pd.DataFrame({
+        "u": links["u"], "v": links["v"],
+        "type": "INTERACTS_WITH", "source": "STRING",
+        "confidence": confidence, "weight": confidence,
+    }), "STRING interactions", stat="string_interactions"))
+    log.info(f"    STRING: {len(links)} interactions "
+             f"({int(links['is_focus'].sum())} CRS-relevant)")
+    return parsed
+
+
+def parse_reactome_source(downloaded: dict) -> ParsedSource:
+    """Reactome pathways, gene-pathway mappings and pathway hierarchy."""
+    parsed = ParsedSource("reactome")
+
+    # Pathway definitions
+    pathway_names = pd.Series(dtype=object)
+    pathways_file = downloaded.get("reactome_pathways")
+    if pathways_file and pathways_file.exists():
+        try:
+            rows = pd.concat(list(_read_chunks(pathways_file, 3)), ignore_index=True)
+            rows = rows[rows["2"] == "Homo sapiens"]
+            ids, names = rows["0"], rows["1"]
+            is_focus = _contains_any(names, CRS_FOCUS_PATHWAYS)
+            # Include every focus pathway plus the first 500 pathways listed
+            n_seen = (~ids.duplicated()).cumsum()
+            keep = is_focus | (n_seen < 500)
+            parsed.nodes.append(NodeTable(pd.DataFrame({
+                "id": names[keep], "type": "Pathway",
+                "reactome_id": ids[keep], "is_focus": is_focus[keep],
+            }), replace=True))
+            pathway_names = rows.drop_duplicates("0", keep="last").set_index("0")["1"]
+        except Exception as e:
+            log.warning(f"    Could not parse Reactome pathways: {e}")
+
+    log.info(f"    Reactome: {len(pathway_names)} human pathways loaded")
+    parsed.stats["reactome_pathways"] = len(pathway_names)
+
+    # Gene-pathway mappings: a gene joins the graph only if it is already
+    # there or is a focus gene, and only for pathways in the graph
+    genes_file = downloaded.get("reactome_genes")
+    if genes_file and genes_file.exists():
+        try:
+            frames = []
+            for chunk in _read_chunks(genes_file, 6):
+                chunk = chunk[chunk["5"].isna() | (chunk["5"] == "Homo sapiens")]
+                pathway = chunk["1"].map(pathway_names)
+                gene = chunk["2"].fillna(chunk["0"])
+                keep = pathway.notna()
+                frames.append(pd.DataFrame({
+                    "gene": gene[keep], "ensembl_id": chunk["0"][keep],
+                    "pathway": pathway[keep],
+                }))
+            mappings = pd.concat(frames, ignore_index=True)
+            focus_rows = mappings[mappings["gene"].isin(list(CRS_FOCUS_GENES))]
+            parsed.nodes.append(NodeTable(pd.DataFrame({
+                "id": focus_rows["gene"], "type": "Gene",
+                "ensembl_id": focus_rows["ensembl_id"], "is_focus": True,
+                "requires": focus_rows["pathway"],
+            })))
+            parsed.edges.append(EdgeTable(pd.DataFrame({
+                "u": mappings["gene"], "v": mappings["pathway"],
+                "type": "PARTICIPATES_IN", "source": "Reactome",
+            }), "Reactome gene-pathway mappings", stat="gene_pathway_mappings"))
+        except Exception as e:
+            log.warning(f"    Could not parse Reactome genes: {e}")
+
+    # Pathway hierarchy
+    relations_file = downloaded.get("reactome_relations")
+    if relations_file and relations_file.exists():
+        try:
+            rows = pd.concat(list(_read_chunks(relations_file, 2)), ignore_index=True)
+            parent, child = rows["0"].map(pathway_names), rows["1"].map(pathway_names)
+            keep = parent.notna() & child.notna()
+            parsed.edges.append(EdgeTable(pd.DataFrame({
+                "u": parent[keep], "v": child[keep],
+                "type": "HAS_SUBPROCESS", "source": "Reactome",
+            }), "Reactome pathway hierarchy relations"))
+        except Exception as e:
+            log.warning(f"    Could not parse Reactome relations: {e}")
+
+    return parsed
+
+
+def parse_sider_source(downloaded: dict) -> ParsedSource:
+    """SIDER drug side effects for focus drugs or CRS-relevant effects."""
+    parsed = ParsedSource("sider")
+
+    drug_names = pd.Series(dtype=object)
+    drug_names_file = downloaded.get("sider_drugs")
+    if drug_names_file and drug_names_file.exists():
+        try:
+            rows = pd.concat(list(_read_chunks(drug_names_file, 2)), ignore_index=True)
+            rows = rows.dropna()
+            drug_names = rows.drop_duplicates("0", keep="last").set_index("0")["1"]
+        except Exception as e:
+            log.warning(f"    Could not parse SIDER drug names: {e}")
+
+    effects_file = downloaded.get("sider_effects")
+    if not effects_file or not effects_file.exists():
+        return parsed
+
+    frames = []
+    try:
+        for chunk in _read_chunks(effects_file, 6):
+            chunk = chunk.dropna(subset=["0", "1", "2", "3", "4"])
+            drug_id = chunk["0"]
+            drug_name = drug_id.map(drug_names).fillna(drug_id)
+            effect = chunk["4"]
+            is_focus_drug = _contains_any(drug_name, CRS_FOCUS_DRUGS)
+            is_focus_effect = _contains_any(effect, SIDER_FOCUS_EFFECT_KEYWORDS)
+            keep = is_focus_drug | is_focus_effect
+            frames.append(pd.DataFrame({
+                "drug": drug_name[keep], "sider_id": drug_id[keep],
+                "effect": effect[keep],
+                "meddra_type": chunk["2"][keep], "meddra_code": chunk["3"][keep],
+                "is_focus_drug": is_focus_drug[keep],
+                "is_focus_effect": is_focus_effect[keep],
+            }))
+    except Exception as e:
+        log.warning(f"    Could not parse SIDER effects: {e}")
+
+    if not frames:
+        return parsed
+    effects = pd.concat(frames, ignore_index=True)
+
+    # Drug and effect nodes, in the order the rows introduce them
+    drugs = pd.DataFrame({
+        "id": effects["drug"], "type": "Drug", "sider_id": effects["sider_id"],
+        "is_focus": effects["is_focus_drug"],
+    })
+    aes = pd.DataFrame({
+        "id": effects["effect"], "type": "Adverse_Event",
+        "meddra_code": effects["meddra_code"], "meddra_type": effects["meddra_type"],
+        "is_focus": effects["is_focus_effect"],
+    })
+    parsed.nodes.append(NodeTable(_interleave_frames(drugs, aes)))
+    parsed.edges.append(EdgeTable(pd.DataFrame({
+        "u": effects["drug"], "v": effects["effect"],
+        "type": "CAUSES_AE", "source": "SIDER",
+    }), "SIDER drug-side effect associations", stat="sider_associations"))
+    return parsed
+
+
+def parse_ctd_chem_gene_source(downloaded: dict) -> ParsedSource:
+    """CTD chemical-gene interactions for CRS-relevant genes."""
+    parsed = ParsedSource("ctd_chem_gene")
+    cg_file = downloaded.get("ctd_chem_gene")
+    if not cg_file or not cg_file.exists():
+        return parsed
+
+    frames = []
+    try:
+        for chunk in _read_chunks(cg_file, 11):
+            chunk = chunk[~chunk["0"].str.startswith("#", na=False)]
+            chunk = chunk.dropna(subset=["0", "1", "2", "3", "4"])
+            chunk = chunk[chunk["3"].isin(list(CRS_FOCUS_GENES))]
+            frames.append(chunk[["0", "3", "4"]])
+    except Exception as e:
+        log.warning(f"    Could not parse CTD chem-gene: {e}")
+
+    if not frames:
+        return parsed
+    rows = pd.concat(frames, ignore_index=True)
+    chem, gene, interaction = rows["0"], rows["3"], rows["4"]
+
+    # Edge type from the interaction description
+    lowered = interaction.str.lower()
+    edge_type = np.select(
+        [lowered.str.contains("increase", regex=False),
+         lowered.str.contains("decrease", regex=False),
+         lowered.str.contains("bind", regex=False)],
+        ["INCREASES_EXPRESSION", "DECREASES_EXPRESSION", "BINDS"],
+        default="AFFECTS",
+    )
+
+    chems = pd.DataFrame({"id": chem, "type": "Chemical", "source": "CTD"})
+    genes = pd.DataFrame({"id": gene, "type": "Gene", "is_focus": True, "source": "CTD"})
+    parsed.nodes.append(NodeTable(_interleave_frames(chems, genes)))
+    parsed.edges.append(EdgeTable(pd.DataFrame({
+        "u": chem, "v": gene, "type": edge_type, "source": "CTD",
+        "interaction_desc": interaction.str.slice(0, 200),
+    }), "CTD chemical-gene interactions", stat="ctd_chem_gene"))
+    return parsed
+
+
+def parse_ctd_gene_disease_source(downloaded: dict) -> ParsedSource:
+    """CTD gene-disease associations for focus genes or diseases."""
+    parsed = ParsedSource("ctd_gene_disease")
+    gd_file = downloaded.get("ctd_gene_disease")
+    if not gd_file or not gd_file.exists():
+        return parsed
+
+    frames = []
+    try:
+        for chunk in _read_chunks(gd_file, 9):
+            chunk = chunk[~chunk["0"].str.startswith("#", na=False)]
+            chunk = chunk.dropna(subset=["0", "1", "2", "3"])
+            gene, disease = chunk["0"], chunk["2"]
+            is_focus_gene = gene.isin(list(CRS_FOCUS_GENES))
+            is_focus_disease = _contains_any(disease, CTD_FOCUS_DISEASE_KEYWORDS)
+            keep = is_focus_gene | is_focus_disease
+            frames.append(pd.DataFrame({
+                "gene": gene[keep], "disease": disease[keep],
+                "evidence": chunk["4"][keep].fillna(""),
+                "is_focus_gene": is_focus_gene[keep],
+                "is_focus_disease": is_focus_disease[keep],
+            }))
+    except Exception as e:
+        log.warning(f"    Could not parse CTD gene-disease: {e}")
+
+    if not frames:
+        return parsed
+    rows = pd.concat(frames, ignore_index=True)
+
+    genes = pd.DataFrame({"id": rows["gene"], "type": "Gene", "is_focus": rows["is_focus_gene"]})
+    diseases = pd.DataFrame({
+        "id": rows["disease"], "type": "Disease", "is_focus": rows["is_focus_disease"],
+    })
+    parsed.nodes.append(NodeTable(_interleave_frames(genes, diseases)))
+    parsed.edges.append(EdgeTable(pd.DataFrame({
+        "u": rows["gene"], "v": rows["disease"],
+        "type": "ASSOCIATED_WITH", "source": "CTD",
+        "evidence": rows["evidence"].str.slice(0, 100),
+    }), "CTD gene-disease associations", stat="ctd_gene_disease"))
+    return parsed
+
+
+def _interleave_frames(first: pd.DataFrame, second: pd.DataFrame) -> pd.DataFrame:
+    """Rows of two equal-length node frames interleaved (f1, s1, f2, s2, ...)."""
+    first = first.reset_index(drop=True)
+    second = second.reset_index(drop=True)
+    order = np.concatenate([np.arange(len(first)) * 2, np.arange(len(second)) * 2 + 1])
+    combined = pd.concat([first, second], ignore_index=True)
+    return combined.iloc[np.argsort(order, kind="stable")].reset_index(drop=True)
+
+
+def _last_by_key(frame: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """One row per key with the last row's values, in first-appearance order.
+
+    This is what repeated ``add_node`` / ``add_edge`` calls leave behind.
+    """
+    first_seen = frame.groupby(keys, sort=False).ngroup().to_numpy()
+    is_last = ~frame.duplicated(keys, keep="last").to_numpy()
+    order = np.argsort(first_seen[is_last], kind="stable")
+    return frame[is_last].iloc[order]
+
+
+def _attribute_records(frame: pd.DataFrame) -> list:
+    """Attribute dicts per row, leaving out missing (NaN) values.
+
+    Interleaved node tables share one frame, so a drug row has NaN in the
+    adverse-event columns; those attributes are simply absent on the node.
+    """
+    records = frame.to_dict("records")
+    sparse = [c for c in frame.columns if frame[c].isna().any()]
+    if sparse:
+        for record in records:
+            for column in sparse:
+                if pd.isna(record[column]):
+                    del record[column]
+    return records
+
+
+# Parsers in merge order; later sources see the nodes of earlier ones
+SOURCE_PARSERS = [
+    ("STRING", parse_string_source),
+    ("Reactome", parse_reactome_source),
+    ("SIDER", parse_sider_source),
+    ("CTD chemical-gene", parse_ctd_chem_gene_source),
+    ("CTD gene-disease", parse_ctd_gene_disease_source),
+]
+
+
+def parse_sources(downloaded: dict, workers: int = PARSE_WORKERS) -> list:
+    """Run every source parser, concurrently when ``workers > 1``.
+
+    Returns:
+        ParsedSource per parser, in SOURCE_PARSERS order.
+    """
+    if workers <= 1:
+        return [parser(downloaded) for _, parser in SOURCE_PARSERS]
+    with ProcessPoolExecutor(max_workers=min(workers, len(SOURCE_PARSERS))) as pool:
+        futures = [pool.submit(parser, downloaded) for _, parser in SOURCE_PARSERS]
+        return [f.result() for f in futures]
+
+
+# ============================================================
+# Sparse Graph Metrics
+# ============================================================
+#
+# Centrality on SciPy CSR matrices rather than NetworkX's per-node Python
+# loops.  PageRank is the power iteration of nx.pagerank; betweenness is
+# Brandes' algorithm run for a batch of sources at once (one sparse-dense
+# product per BFS level), with the sources split across processes.
+
+
+def graph_to_csr(G, weight: str = "weight"):
+    """Directed adjacency of ``G`` as CSR, in ``list(G)`` node order.
+
+    Edges without ``weight`` count as 1, as in ``nx.to_scipy_sparse_array``.
+
+    Returns:
+        (nodelist, A)
+    """
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
+    edges = list(G.edges(data=weight, default=1))
+    m = len(edges)
+    rows = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=m)
+    cols = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=m)
+    data = np.fromiter((w for _, _, w in edges), dtype=float, count=m)
+    n = len(nodelist)
+    return nodelist, sp_sparse.csr_array((data, (rows, cols)), shape=(n, n))
+
+
+def sparse_pagerank(A, alpha: float = 0.85, max_iter: int = 100,
+                    tol: float = 1.0e-6) -> np.ndarray:
+    """PageRank of a weighted CSR adjacency by power iteration.
+
+    Same iteration and stopping rule as ``nx.pagerank`` (uniform
+    teleport, dangling nodes redistributed uniformly).
+
+    Raises:
+        nx.PowerIterationFailedConvergence: If not converged in max_iter.
+    """
+    N = A.shape[0]
+    if N == 0:
+        return np.zeros(0)
+    S = np.asarray(A.sum(axis=1), dtype=float).ravel()
+    is_dangling = np.flatnonzero(S == 0)
+    S[S != 0] = 1.0 / S[S != 0]
+    M = sp_sparse.dia_array((S[np.newaxis, :], 0), shape=A.shape).tocsr() @ A
+
+    p = np.repeat(1.0 / N, N)
+    x = p
+    for _ in range(max_iter):
+        xlast = x
+        x = alpha * (x @ M + x[is_dangling].sum() * p) + (1 - alpha) * p
+        if np.absolute(x - xlast).sum() < N * tol:
+            return x
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _undirected_structure(A):
+    """Unweighted symmetric adjacency (1.0 per edge) of a directed CSR."""
+    S = sp_sparse.csr_array(
+        (np.ones(len(A.indices)), A.indices, A.indptr), shape=A.shape,
+    )
+    U = (S + S.T).tocsr()
+    U.data[:] = 1.0
+    return U
+
+
+def _brandes_batch(U, sources: np.ndarray) -> np.ndarray:
+    """Summed Brandes dependencies of every node over ``sources``.
+
+    ``U`` is an unweighted symmetric CSR adjacency.  Column j of the dense
+    work arrays is the BFS from ``sources[j]``; each level is one product
+    with ``U``.
+    """
+    n, b = U.shape[0], len(sources)
+    cols = np.arange(b)
+    sigma = np.zeros((n, b))
+    sigma[sources, cols] = 1.0
+    seen = sigma > 0
+    levels = [seen.copy()]
+
+    # Forward: shortest-path counts, level by level
+    frontier = sigma.copy()
+    while True:
+        reached = U @ frontier
+        new = (reached > 0) & ~seen
+        if not new.any():
+            break
+        sigma[new] = reached[new]
+        seen |= new
+        levels.append(new)
+        frontier = np.where(new, sigma, 0.0)
+
+    # Backward: delta_v = sigma_v * sum over successors w of (1 + delta_w) / sigma_w
+    delta = np.zeros((n, b))
+    safe_sigma = np.where(sigma > 0, sigma, 1.0)
+    for d in range(len(levels) - 1, 0, -1):
+        coeff = np.where(levels[d], (1.0 + delta) / safe_sigma, 0.0)
+        delta += np.where(levels[d - 1], sigma * (U @ coeff), 0.0)
+    delta[sources, cols] = 0.0
+    return delta.sum(axis=1)
+
+
+def _betweenness_worker(U, sources: np.ndarray, batch_size: int) -> np.ndarray:
+    total = np.zeros(U.shape[0])
+    for start in range(0, len(sources), batch_size):
+        total += _brandes_batch(U, sources[start:start + batch_size])
+    return total
+
+
+def sparse_betweenness(U, sources: np.ndarray, workers: int = 1) -> np.ndarray:
+    """Unnormalized dependency sums from ``sources``, across processes."""
+    n = max(U.shape[0], 1)
+    # About a dozen dense n x batch float arrays are live per batch
+    batch_size = int(max(1, min(64, BETWEENNESS_BATCH_BYTES // (n * 8 * 12))))
+    if workers <= 1 or len(sources) <= batch_size:
+        return _betweenness_worker(U, sources, batch_size)
+    chunks = [c for c in np.array_split(sources, workers) if len(c)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [pool.submit(_betweenness_worker, U, c, batch_size) for c in chunks]
+        return sum(f.result() for f in futures)
+
+
+def component_betweenness(U, labels: np.ndarray, k: int | None = None, seed=None,
+                          workers: int = 1) -> np.ndarray:
+    """Normalized betweenness of every node within its connected component.
+
+    ``U`` is the unweighted symmetric adjacency from
+    ``_undirected_structure`` and ``labels`` its connected-component labels,
+    so the result matches ``nx.betweenness_centrality`` on
+    ``G.to_undirected()`` restricted to each component.  The largest
+    component uses ``k`` sampled source nodes (all nodes if ``k`` is None
+    or at least its size), with the same sampling correction as NetworkX.
+    Every other component is computed exactly on its own; components of
+    one or two nodes have no interior nodes and stay 0.
+    """
+    sizes = np.bincount(labels)
+    largest = int(np.argmax(sizes))
+    betweenness = np.zeros(U.shape[0])
+
+    # Group each component's nodes contiguously, so a component is a block
+    order = np.argsort(labels, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(sizes)])
+    P = U[order][:, order]
+
+    # Largest component, sampled
+    lcc = slice(bounds[largest], bounds[largest + 1])
+    n = int(sizes[largest])
+    if k is not None and k >= n:
+        k = None
+    sources = (np.arange(n) if k is None
+               else np.sort(np.random.default_rng(seed).choice(n, size=k, replace=False)))
+    raw = sparse_betweenness(P[lcc, lcc], sources, workers)
+    N = n - 1
+    if N >= 2:
+        if k is None:
+            raw /= N * (N - 1)
+        else:
+            is_source = np.zeros(n, dtype=bool)
+            is_source[sources] = True
+            raw[is_source] /= (k - 1) * (N - 1) if k > 1 else np.nan
+            raw[~is_source] /= k * (N - 1)
+    betweenness[order[lcc]] = raw
+
+    # Remaining components, exact; each is normalized by its own size
+    for c in np.flatnonzero(sizes > 2).tolist():
+        if c == largest:
+            continue
+        block = slice(bounds[c], bounds[c + 1])
+        n_c = int(sizes[c])
+        raw = sparse_betweenness(P[block, block], np.arange(n_c), workers)
+        betweenness[order[block]] = raw / ((n_c - 1) * (n_c - 2))
+
+    return betweenness
+
+
+# ============================================================
+# Graph Artifact
+# ============================================================
+#
+# Binary export read by the explorer (task 3), the embedding fallback
+# (task 2) and src.data.graph.artifact.  All files in one directory:
+#
+#   nodes.arrow           Arrow IPC, one row per node: ``id`` + attributes
+#   edges.arrow           Arrow IPC, one row per edge in CSR order: attributes
+#   indptr.npy            int64[n + 1]  out-edges of node i: indptr[i]:indptr[i+1]
+#   indices.npy           int32[m]      target node of each edge
+#   reverse_indptr.npy    int64[n + 1]  in-edges, grouped by target node
+#   reverse_indices.npy   int32[m]      source node of each in-edge
+#   reverse_edges.npy     int64[m]      edge row of each in-edge
+#   id_order.npy          int64[n]      node rows sorted by id (binary search)
+#   metadata.json         counts, type tallies, JSON-encoded column names
+#
+# Tables are uncompressed and arrays are plain .npy, so readers can
+# memory-map everything.  Attributes that are not a single scalar type
+# (sets, lists, dicts, mixed types) are stored as JSON strings and listed
+# under "json_columns".  Files are replaced atomically, metadata.json last.
+
+ARTIFACT_FORMAT = "knowledge-graph-artifact"
+ARTIFACT_VERSION = 1
+
+
+def _json_value(value):
+    return list(value) if isinstance(value, set) else str(value)
+
+
+def _attribute_table(records: list, leading: dict = None):
+    """Arrow table with one column per attribute key (first-seen order).
+
+    Returns:
+        (table, json_columns)
+    """
+    keys = dict.fromkeys(leading or {})
+    for attrs in records:
+        keys.update(dict.fromkeys(attrs))
+    arrays, json_columns = {}, []
+    for key in keys:
+        if leading and key in leading:
+            arrays[key] = pa.array(leading[key])
+            continue
+        values = [attrs.get(key) for attrs in records]
+        try:
+            if any(isinstance(v, (set, list, tuple, dict)) for v in values):
+                raise TypeError(key)
+            arrays[key] = pa.array(values)
+        except (pa.ArrowException, TypeError, ValueError, OverflowError):
+            arrays[key] = pa.array(
+                [None if v is None else json.dumps(v, default=_json_value) for v in values],
+                type=pa.string(),
+            )
+            json_columns.append(key)
+    return pa.table(arrays), json_columns
+
+
+def _replace_file(path: Path, write):
+    """Call ``write(tmp_path)`` then move the file into place."""
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_arrow(path: Path, table):
+    def write(tmp):
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    _replace_file(path, write)
+
+
+def _write_npy(path: Path, array: np.ndarray):
+    def write(tmp):
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+    _replace_file(path, write)
+
+
+def write_graph_artifact(G, path: Path, metadata: dict = None) -> dict:
+    """Write ``G`` as node/edge tables plus CSR adjacency under ``path``.
+
+    Node rows follow ``list(G)``; edge rows follow ``G.edges()``, which
+    groups edges by source in that order, so edge row == CSR position.
+
+    Returns:
+        The metadata written to metadata.json.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    nodes = list(G)
+    index = {node: i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    edges = list(G.edges(data=True))
+    m = len(edges)
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=m)
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=m)
+
+    node_table, node_json = _attribute_table(
+        [attrs for _, attrs in G.nodes(data=True)], leading={"id": [str(v) for v in nodes]},
+    )
+    edge_table, edge_json = _attribute_table([attrs for _, _, attrs in edges])
+
+    reverse = np.argsort(targets, kind="stable")
+    arrays = {
+        "indptr": np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=n))]),
+        "indices": targets.astype(np.int32),
+        "reverse_indptr": np.concatenate([[0], np.cumsum(np.bincount(targets, minlength=n))]),
+        "reverse_indices": sources[reverse].astype(np.int32),
+        "reverse_edges": reverse.astype(np.int64),
+        "id_order": np.asarray(pc.sort_indices(node_table.column("id"))).astype(np.int64),
+    }
+
+    _write_arrow(path / "nodes.arrow", node_table)
+    _write_arrow(path / "edges.arrow", edge_table)
+    for name, array in arrays.items():
+        _write_npy(path / f"{name}.npy", array)
+
+    meta = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "node_count": n,
+        "edge_count": m,
+        **(metadata or {}),
+        "json_columns": {"nodes": node_json, "edges": edge_json},
+    }
+    _replace_file(path / "metadata.json",
+                  lambda tmp: tmp.write_text(json.dumps(meta, indent=2, default=str)))
+    return meta
+
+
 # ============================================================
 # Graph Builder
 # ============================================================
@@ -302,10 +1167,7 @@ class KnowledgeGraphBuilder:
 
         # Phase 2: Parse and integrate
         log.info("\n[Phase 2] Parsing and integrating data...")
-        self._parse_string(downloaded)
-        self._parse_reactome(downloaded)
-        self._parse_sider(downloaded)
-        self._parse_ctd(downloaded)
+        self._integrate_sources(parse_sources(downloaded))
 
         # Phase 3: Add curated CRS/ICANS/HLH mechanisms
         log.info("\n[Phase 3] Adding curated cell therapy safety mechanisms...")
@@ -320,8 +1182,7 @@ class KnowledgeGraphBuilder:
 
         # Phase 5: Export
         log.info("\n[Phase 5] Exporting graph...")
-        self._export_graphml()
-        self._export_json()
+        self._export_artifact()
         self._export_neo4j()
         self._export_embeddings_data()
         self._export_stats()
@@ -338,366 +1199,57 @@ class KnowledgeGraphBuilder:
             downloaded[key] = path
         return downloaded
 
-    # --- STRING Protein-Protein Interactions ---
-
-    def _parse_string(self, downloaded: dict):
-        """Parse STRING PPI data (human only, high confidence)."""
-        log.info("  Parsing STRING protein interactions...")
-
-        # Parse protein info first (names)
-        info_path = downloaded.get("string_info")
-        protein_names = {}
-        if info_path and info_path.exists():
-            try:
-                with gzip.open(info_path, 'rt') as f:
-                    reader = csv.reader(f, delimiter='\t')
-                    next(reader)  # header
-                    for row in reader:
-                        if len(row) >= 2:
-                            ensembl_id = row[0].replace("9606.", "")
-                            name = row[1]
-                            protein_names[row[0]] = name
-            except Exception as e:
-                log.warning(f"    Could not parse STRING info: {e}")
-
-        # Parse interactions
-        links_path = downloaded.get("string_links")
-        if not links_path or not links_path.exists():
-            log.warning("    STRING links file not available, skipping")
-            return
-
-        count = 0
-        focus_count = 0
-        try:
-            with gzip.open(links_path, 'rt') as f:
-                header = f.readline()
-                for line in f:
-                    parts = line.strip().split()
-                    if len(parts) < 3:
-                        continue
-
-                    p1, p2, score = parts[0], parts[1], int(parts[2])
-
-                    # Only high-confidence interactions (>700)
-                    if score < 700:
-                        continue
-
-                    name1 = protein_names.get(p1, p1.replace("9606.", ""))
-                    name2 = protein_names.get(p2, p2.replace("9606.", ""))
-
-                    # Prioritize CRS-relevant proteins (include all of those)
-                    is_focus = name1 in CRS_FOCUS_GENES or name2 in CRS_FOCUS_GENES
-
-                    # For non-focus proteins, only include very high confidence (>900)
-                    if not is_focus and score < 900:
-                        continue
-
-                    # Add protein nodes
-                    for name, pid in [(name1, p1), (name2, p2)]:
-                        if name not in self.G:
-                            self.G.add_node(name, type="Protein", string_id=pid,
-                                          is_focus=name in CRS_FOCUS_GENES)
-                            self.node_types["Protein"].add(name)
-
-                    # Add interaction edge
-                    self.G.add_edge(name1, name2, type="INTERACTS_WITH",
-                                   source="STRING", confidence=score/1000,
-                                   weight=score/1000)
-                    self.edge_types["INTERACTS_WITH"] += 1
-                    count += 1
-                    if is_focus:
-                        focus_count += 1
-
-                    if count % 10000 == 0:
-                        log.info(f"    Processed {count} interactions ({focus_count} CRS-relevant)...")
-
-        except Exception as e:
-            log.error(f"    Error parsing STRING: {e}")
-
-        log.info(f"    STRING: {count} interactions ({focus_count} CRS-relevant)")
-        self.stats["string_interactions"] = count
-
-    # --- Reactome Pathways ---
-
-    def _parse_reactome(self, downloaded: dict):
-        """Parse Reactome pathway data."""
-        log.info("  Parsing Reactome pathways...")
-
-        # Parse pathway definitions
-        pathways_file = downloaded.get("reactome_pathways")
-        pathway_names = {}
-        if pathways_file and pathways_file.exists():
-            try:
-                with open(pathways_file, 'r') as f:
-                    for line in f:
-                        parts = line.strip().split('\t')
-                        if len(parts) >= 3 and parts[2] == "Homo sapiens":
-                            pathway_id = parts[0]
-                            pathway_name = parts[1]
-                            pathway_names[pathway_id] = pathway_name
-
-                            # Check if CRS-relevant
-                            is_focus = any(kw.lower() in pathway_name.lower()
-                                         for kw in CRS_FOCUS_PATHWAYS)
-
-                            if is_focus or len(pathway_names) < 500:
-                                self.G.add_node(pathway_name, type="Pathway",
-                                              reactome_id=pathway_id,
-                                              is_focus=is_focus)
-                                self.node_types["Pathway"].add(pathway_name)
-
-            except Exception as e:
-                log.warning(f"    Could not parse Reactome pathways: {e}")
-
-        log.info(f"    Reactome: {len(pathway_names)} human pathways loaded")
-
-        # Parse gene-pathway mappings
-        genes_file = downloaded.get("reactome_genes")
-        gene_pathway_count = 0
-        if genes_file and genes_file.exists():
-            try:
-                with open(genes_file, 'r') as f:
-                    for line in f:
-                        parts = line.strip().split('\t')
-                        if len(parts) >= 4 and parts[5] == "Homo sapiens" if len(parts) > 5 else True:
-                            gene_id = parts[0]
-                            pathway_id = parts[1]
-                            pathway_name = pathway_names.get(pathway_id)
-
-                            if pathway_name and pathway_name in self.G:
-                                # Try to resolve gene name
-                                gene_name = parts[2] if len(parts) > 2 else gene_id
-
-                                if gene_name in self.G or gene_name in CRS_FOCUS_GENES:
-                                    if gene_name not in self.G:
-                                        self.G.add_node(gene_name, type="Gene",
-                                                      ensembl_id=gene_id,
-                                                      is_focus=gene_name in CRS_FOCUS_GENES)
-                                        self.node_types["Gene"].add(gene_name)
-
-                                    self.G.add_edge(gene_name, pathway_name,
-                                                   type="PARTICIPATES_IN",
-                                                   source="Reactome")
-                                    self.edge_types["PARTICIPATES_IN"] += 1
-                                    gene_pathway_count += 1
-
-            except Exception as e:
-                log.warning(f"    Could not parse Reactome genes: {e}")
-
-        log.info(f"    Reactome: {gene_pathway_count} gene-pathway mappings")
-        self.stats["reactome_pathways"] = len(pathway_names)
-        self.stats["gene_pathway_mappings"] = gene_pathway_count
-
-        # Parse pathway hierarchy
-        relations_file = downloaded.get("reactome_relations")
-        rel_count = 0
-        if relations_file and relations_file.exists():
-            try:
-                with open(relations_file, 'r') as f:
-                    for line in f:
-                        parts = line.strip().split('\t')
-                        if len(parts) >= 2:
-                            parent = pathway_names.get(parts[0])
-                            child = pathway_names.get(parts[1])
-                            if parent and child and parent in self.G and child in self.G:
-                                self.G.add_edge(parent, child, type="HAS_SUBPROCESS",
-                                              source="Reactome")
-                                self.edge_types["HAS_SUBPROCESS"] += 1
-                                rel_count += 1
-            except Exception as e:
-                log.warning(f"    Could not parse Reactome relations: {e}")
-
-        log.info(f"    Reactome: {rel_count} pathway hierarchy relations")
-
-    # --- SIDER Side Effects ---
-
-    def _parse_sider(self, downloaded: dict):
-        """Parse SIDER drug side effect data."""
-        log.info("  Parsing SIDER side effects...")
-
-        # Parse drug names
-        drug_names_file = downloaded.get("sider_drugs")
-        drug_names = {}
-        if drug_names_file and drug_names_file.exists():
-            try:
-                with open(drug_names_file, 'r', errors='replace') as f:
-                    for line in f:
-                        parts = line.strip().split('\t')
-                        if len(parts) >= 2:
-                            drug_names[parts[0]] = parts[1]
-            except Exception as e:
-                log.warning(f"    Could not parse SIDER drug names: {e}")
-
-        # Parse side effects
-        effects_file = downloaded.get("sider_effects")
-        se_count = 0
-        if effects_file and effects_file.exists():
-            try:
-                opener = gzip.open if str(effects_file).endswith('.gz') else open
-                with opener(effects_file, 'rt', errors='replace') as f:
-                    for line in f:
-                        parts = line.strip().split('\t')
-                        if len(parts) < 5:
-                            continue
-
-                        drug_id = parts[0]
-                        meddra_type = parts[2] if len(parts) > 2 else ""
-                        meddra_code = parts[3] if len(parts) > 3 else ""
-                        effect_name = parts[4] if len(parts) > 4 else parts[-1]
-
-                        drug_name = drug_names.get(drug_id, drug_id)
-
-                        # Only include focus drugs or CRS-relevant effects
-                        is_focus_drug = any(d.lower() in drug_name.lower()
-                                          for d in CRS_FOCUS_DRUGS)
-                        is_focus_effect = any(kw.lower() in effect_name.lower()
-                                            for kw in ["cytokine", "fever", "hypotension",
-                                                       "neurotoxicity", "encephalopathy",
-                                                       "coagulopathy", "haemophagocytic",
-                                                       "immune", "inflammatory",
-                                                       "infusion", "anaphyla"])
-
-                        if not (is_focus_drug or is_focus_effect):
-                            continue
-
-                        # Add drug node
-                        if drug_name not in self.G:
-                            self.G.add_node(drug_name, type="Drug",
-                                          sider_id=drug_id,
-                                          is_focus=is_focus_drug)
-                            self.node_types["Drug"].add(drug_name)
-
-                        # Add adverse event node
-                        if effect_name not in self.G:
-                            self.G.add_node(effect_name, type="Adverse_Event",
-                                          meddra_code=meddra_code,
-                                          meddra_type=meddra_type,
-                                          is_focus=is_focus_effect)
-                            self.node_types["Adverse_Event"].add(effect_name)
-
-                        # Add causation edge
-                        self.G.add_edge(drug_name, effect_name,
-                                       type="CAUSES_AE", source="SIDER")
-                        self.edge_types["CAUSES_AE"] += 1
-                        se_count += 1
-
-            except Exception as e:
-                log.warning(f"    Could not parse SIDER effects: {e}")
-
-        log.info(f"    SIDER: {se_count} drug-side effect associations")
-        self.stats["sider_associations"] = se_count
-
-    # --- CTD (Comparative Toxicogenomics Database) ---
-
-    def _parse_ctd(self, downloaded: dict):
-        """Parse CTD chemical-gene and gene-disease data."""
-        log.info("  Parsing CTD toxicogenomics data...")
-
-        # Chemical-gene interactions
-        cg_file = downloaded.get("ctd_chem_gene")
-        cg_count = 0
-        if cg_file and cg_file.exists():
-            try:
-                opener = gzip.open if str(cg_file).endswith('.gz') else open
-                with opener(cg_file, 'rt', errors='replace') as f:
-                    for line in f:
-                        if line.startswith('#'):
-                            continue
-                        parts = line.strip().split('\t')
-                        if len(parts) < 5:
-                            continue
-
-                        chem_name = parts[0]
-                        gene_symbol = parts[3] if len(parts) > 3 else ""
-                        interaction = parts[4] if len(parts) > 4 else ""
-
-                        # Only CRS-relevant genes
-                        if gene_symbol not in CRS_FOCUS_GENES:
-                            continue
-
-                        # Determine edge type from interaction description
-                        edge_type = "AFFECTS"
-                        if "increase" in interaction.lower():
-                            edge_type = "INCREASES_EXPRESSION"
-                        elif "decrease" in interaction.lower():
-                            edge_type = "DECREASES_EXPRESSION"
-                        elif "bind" in interaction.lower():
-                            edge_type = "BINDS"
-
-                        if chem_name not in self.G:
-                            self.G.add_node(chem_name, type="Chemical",
-                                          source="CTD")
-                            self.node_types["Chemical"].add(chem_name)
-
-                        if gene_symbol not in self.G:
-                            self.G.add_node(gene_symbol, type="Gene",
-                                          is_focus=True, source="CTD")
-                            self.node_types["Gene"].add(gene_symbol)
-
-                        self.G.add_edge(chem_name, gene_symbol,
-                                       type=edge_type, source="CTD",
-                                       interaction_desc=interaction[:200])
-                        self.edge_types[edge_type] += 1
-                        cg_count += 1
-
-            except Exception as e:
-                log.warning(f"    Could not parse CTD chem-gene: {e}")
-
-        log.info(f"    CTD: {cg_count} chemical-gene interactions")
-
-        # Gene-disease associations
-        gd_file = downloaded.get("ctd_gene_disease")
-        gd_count = 0
-        if gd_file and gd_file.exists():
-            try:
-                opener = gzip.open if str(gd_file).endswith('.gz') else open
-                with opener(gd_file, 'rt', errors='replace') as f:
-                    for line in f:
-                        if line.startswith('#'):
-                            continue
-                        parts = line.strip().split('\t')
-                        if len(parts) < 4:
-                            continue
-
-                        gene_symbol = parts[0]
-                        disease_name = parts[2] if len(parts) > 2 else ""
-                        evidence = parts[4] if len(parts) > 4 else ""
-
-                        # Only CRS-relevant genes or diseases
-                        is_focus_gene = gene_symbol in CRS_FOCUS_GENES
-                        is_focus_disease = any(kw.lower() in disease_name.lower()
-                                             for kw in ["cytokine", "lymphoma", "leukemia",
-                                                        "myeloma", "immune", "inflam",
-                                                        "hemophagocytic", "macrophage",
-                                                        "neurotoxicity", "encephalopathy",
-                                                        "coagulation", "thrombocytopenia",
-                                                        "autoimmune", "lupus"])
-
-                        if not (is_focus_gene or is_focus_disease):
-                            continue
-
-                        if gene_symbol not in self.G:
-                            self.G.add_node(gene_symbol, type="Gene",
-                                          is_focus=is_focus_gene)
-                            self.node_types["Gene"].add(gene_symbol)
-
-                        if disease_name not in self.G:
-                            self.G.add_node(disease_name, type="Disease",
-                                          is_focus=is_focus_disease)
-                            self.node_types["Disease"].add(disease_name)
-
-                        self.G.add_edge(gene_symbol, disease_name,
-                                       type="ASSOCIATED_WITH", source="CTD",
-                                       evidence=evidence[:100])
-                        self.edge_types["ASSOCIATED_WITH"] += 1
-                        gd_count += 1
-
-            except Exception as e:
-                log.warning(f"    Could not parse CTD gene-disease: {e}")
-
-        log.info(f"    CTD: {gd_count} gene-disease associations")
-        self.stats["ctd_chem_gene"] = cg_count
-        self.stats["ctd_gene_disease"] = gd_count
+    # --- Source Integration ---
+
+    def _integrate_sources(self, sources: list):
+        """Merge parsed source tables into the graph.
+
+        Node tables are merged source by source, and each source's edges are
+        filtered against the nodes present at that point, as the sources
+        were previously parsed in order.  Edges from all sources are then
+        added in a single pass.
+        """
+        edge_frames = []
+        for parsed in sources:
+            for table in parsed.nodes:
+                self._add_node_table(table)
+            for table in parsed.edges:
+                counts = table.counts[self._has_endpoints(table.counts)]
+                for edge_type, n in counts.groupby("type", sort=False)["n"].sum().items():
+                    self.edge_types[edge_type] += int(n)
+                n_rows = int(counts["n"].sum())
+                if table.stat:
+                    self.stats[table.stat] = n_rows
+                log.info(f"    {table.label}: {n_rows}")
+                edge_frames.append(table.frame[self._has_endpoints(table.frame)])
+            self.stats.update(parsed.stats)
+
+        n_edges = self.G.number_of_edges()
+        self.G.add_edges_from(chain.from_iterable(
+            zip(f["u"].tolist(), f["v"].tolist(), _attribute_records(f.drop(columns=["u", "v"])))
+            for f in edge_frames
+        ))
+        log.info(f"    Materialized {self.G.number_of_edges() - n_edges} source edges")
+
+    def _add_node_table(self, table: NodeTable):
+        """Add a node table: new nodes only, or update attributes if ``replace``."""
+        frame = table.frame
+        if "requires" in frame:
+            frame = frame[self._in_graph(frame["requires"])].drop(columns="requires")
+        if not table.replace:
+            frame = frame.drop_duplicates("id")
+            frame = frame[~self._in_graph(frame["id"])]
+        self.G.add_nodes_from(zip(frame["id"].tolist(), _attribute_records(frame.drop(columns="id"))))
+        for node_type, ids in frame.groupby("type", sort=False)["id"]:
+            self.node_types[node_type].update(ids)
+
+    def _has_endpoints(self, frame: pd.DataFrame) -> np.ndarray:
+        return self._in_graph(frame["u"]) & self._in_graph(frame["v"])
+
+    def _in_graph(self, ids: pd.Series) -> np.ndarray:
+        """Vectorized ``id in self.G`` (one lookup per distinct ID)."""
+        present = [n for n in ids.unique() if n in self.G]
+        return ids.isin(present).to_numpy()
 
     # --- Curated CRS/ICANS/HLH Mechanisms ---
 
@@ -908,108 +1460,66 @@ class KnowledgeGraphBuilder:
     # --- Graph Metrics ---
 
     def _compute_metrics(self):
-        """Compute graph-level and node-level metrics."""
+        """Compute graph-level and node-level metrics on a sparse adjacency."""
         log.info("  Computing centrality metrics...")
+        nodes, A = graph_to_csr(self.G)
+        n = len(nodes)
+        if n == 0:
+            return
 
-        # Only compute on the undirected version for some metrics
-        G_undirected = self.G.to_undirected()
-
-        # Degree centrality
-        degree_cent = nx.degree_centrality(self.G)
-        for node, cent in degree_cent.items():
+        # Degree centrality (in + out degree, as nx.degree_centrality)
+        degree = np.diff(A.indptr) + np.bincount(A.indices, minlength=n)
+        degree_cent = degree / (n - 1) if n > 1 else np.ones(n)
+        for node, cent in zip(nodes, degree_cent.tolist(), strict=True):
             self.G.nodes[node]['degree_centrality'] = round(cent, 6)
 
         # PageRank (works on directed graph)
         try:
-            pagerank = nx.pagerank(self.G, alpha=0.85, max_iter=100)
-            for node, pr in pagerank.items():
+            pagerank = sparse_pagerank(A, alpha=0.85, max_iter=100)
+            for node, pr in zip(nodes, pagerank.tolist(), strict=True):
                 self.G.nodes[node]['pagerank'] = round(pr, 8)
         except Exception as e:
             log.warning(f"    PageRank failed: {e}")
 
-        # Betweenness centrality (on largest connected component for efficiency)
+        # Weakly connected components
+        U = _undirected_structure(A)
+        n_components, labels = connected_components(U, directed=False)
+
+        # Betweenness centrality (sampled on the largest connected component,
+        # exact within the smaller ones)
         try:
-            largest_cc = max(nx.connected_components(G_undirected), key=len)
-            if len(largest_cc) < 50000:
-                subgraph = G_undirected.subgraph(largest_cc)
-                betweenness = nx.betweenness_centrality(subgraph, k=min(500, len(subgraph)))
-                for node, bc in betweenness.items():
-                    self.G.nodes[node]['betweenness_centrality'] = round(bc, 8)
+            betweenness = component_betweenness(
+                U, labels, k=BETWEENNESS_SAMPLES, workers=METRIC_WORKERS,
+            )
+            for node, bc in zip(nodes, betweenness.tolist(), strict=True):
+                self.G.nodes[node]['betweenness_centrality'] = round(bc, 8)
         except Exception as e:
             log.warning(f"    Betweenness centrality failed: {e}")
 
         # Connected components
-        n_components = nx.number_weakly_connected_components(self.G)
-        largest_wcc = max(nx.weakly_connected_components(self.G), key=len)
+        n_components = int(n_components)
+        largest_wcc = int(np.bincount(labels).max())
         self.stats["connected_components"] = n_components
-        self.stats["largest_component_size"] = len(largest_wcc)
+        self.stats["largest_component_size"] = largest_wcc
 
-        log.info(f"    Components: {n_components} (largest: {len(largest_wcc)} nodes)")
+        log.info(f"    Components: {n_components} (largest: {largest_wcc} nodes)")
 
     # --- Export ---
 
-    def _export_graphml(self):
-        """Export as GraphML."""
-        path = OUTPUT_DIR / "graph.graphml"
-        log.info(f"  Exporting GraphML to {path}...")
-
-        # GraphML can't handle all Python types - clean attributes
-        G_export = self.G.copy()
-        for node in G_export.nodes():
-            for key, val in list(G_export.nodes[node].items()):
-                if isinstance(val, (set, list, dict)):
-                    G_export.nodes[node][key] = str(val)
-                elif isinstance(val, bool):
-                    G_export.nodes[node][key] = str(val)
-        for u, v in G_export.edges():
-            for key, val in list(G_export.edges[u, v].items()):
-                if isinstance(val, (set, list, dict)):
-                    G_export.edges[u, v][key] = str(val)
-                elif isinstance(val, bool):
-                    G_export.edges[u, v][key] = str(val)
-
-        nx.write_graphml(G_export, str(path))
-        log.info(f"    GraphML: {os.path.getsize(path) / 1024 / 1024:.1f} MB")
-
-    def _export_json(self):
-        """Export as JSON for web visualization."""
-        path = OUTPUT_DIR / "graph_data.json"
-        log.info(f"  Exporting JSON to {path}...")
-
-        nodes = []
-        for node_id, attrs in self.G.nodes(data=True):
-            node_data = {"id": node_id, **attrs}
-            # Convert non-serializable types
-            for k, v in node_data.items():
-                if isinstance(v, set):
-                    node_data[k] = list(v)
-            nodes.append(node_data)
-
-        edges = []
-        for source, target, attrs in self.G.edges(data=True):
-            edge_data = {"source": source, "target": target, **attrs}
-            for k, v in edge_data.items():
-                if isinstance(v, set):
-                    edge_data[k] = list(v)
-            edges.append(edge_data)
-
-        data = {
-            "nodes": nodes,
-            "edges": edges,
-            "metadata": {
-                "node_count": len(nodes),
-                "edge_count": len(edges),
-                "node_types": {k: len(v) for k, v in self.node_types.items()},
-                "edge_types": dict(self.edge_types),
-                "built": datetime.now().isoformat(),
-                "builder": "Knowledge Graph Builder v1.0"
-            }
-        }
+    def _export_artifact(self):
+        """Export node/edge tables and CSR adjacency (see Graph Artifact)."""
+        path = OUTPUT_DIR / "graph_artifact"
+        log.info(f"  Exporting graph artifact to {path}...")
 
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        write_graph_artifact(self.G, path, metadata={
+            "node_types": {k: len(v) for k, v in self.node_types.items()},
+            "edge_types": dict(self.edge_types),
+            "built": datetime.now().isoformat(),
+            "builder": "Knowledge Graph Builder v1.0",
+        })
 
-        log.info(f"    JSON: {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+        size = sum(f.stat().st_size for f in path.iterdir() if f.is_file())
+        log.info(f"    Artifact: {size / 1024 / 1024:.1f} MB")
 
     def _export_neo4j(self):
         """Export CSV files for Neo4j bulk import."""
@@ -87,7 +87,7 @@ try:
     from torch_geometric.utils import negative_sampling, train_test_split_edges
     HAS_PYG = True
 except ImportError:
-    log.warning("PyTorch Geometric not available. Using fallback NetworkX-based methods.")
+    log.warning("PyTorch Geometric not available. Using fallback sparse-matrix methods.")
     HAS_PYG = False
 
 from sklearn.metrics import (
@@ -618,29 +618,46 @@ class GNNTrainer:
 
 
 # ============================================================
-# Fallback: NetworkX-based embeddings if PyG unavailable
+# Fallback: sparse-matrix embeddings if PyG unavailable
 # ============================================================
 
-def networkx_fallback():
-    """If PyTorch Geometric isn't available, use NetworkX + numpy."""
-    log.info("Running NetworkX fallback (no PyG)...")
+def sparse_fallback():
+    """If PyTorch Geometric isn't available, use SciPy + numpy."""
+    log.info("Running sparse-matrix fallback (no PyG)...")
 
-    # Load the graph
-    graph_path = KG_DIR / "graph.graphml"
-    if not graph_path.exists():
-        log.error(f"Graph file not found at {graph_path}")
+    # Load the graph artifact (CSR adjacency + Arrow tables, memory-mapped)
+    artifact_dir = KG_DIR / "graph_artifact"
+    if not (artifact_dir / "metadata.json").exists():
+        log.error(f"Graph artifact not found at {artifact_dir}")
         log.error("Run Task 1 first to build the knowledge graph.")
         sys.exit(1)
 
-    import networkx as nx
-    G = nx.read_graphml(str(graph_path))
-    log.info(f"Loaded graph: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    import pyarrow as pa
+    from scipy.sparse import csr_array
+
+    def read_table(name):
+        return pa.ipc.open_file(pa.memory_map(str(artifact_dir / name))).read_all()
+
+    nodes = read_table("nodes.arrow")
+    edges = read_table("edges.arrow")
+    indptr = np.load(artifact_dir / "indptr.npy", mmap_mode="r")
+    indices = np.load(artifact_dir / "indices.npy", mmap_mode="r")
+    n = len(nodes)
+    weights = np.ones(len(indices))
+    if "weight" in edges.column_names:
+        weights = edges.column("weight").to_numpy().astype(float)
+        weights[np.isnan(weights)] = 1.0
+    A_directed = csr_array((weights, indices, indptr), shape=(n, n))
+    log.info(f"Loaded graph: {n} nodes, {len(indices)} edges")
+
+    # Undirected adjacency (one weight per node pair, as G.to_undirected())
+    A_undirected = A_directed.maximum(A_directed.T).tocsr()
 
     # Compute spectral embeddings
     log.info("Computing spectral embeddings...")
     try:
         from sklearn.decomposition import TruncatedSVD
-        A = nx.adjacency_matrix(G.to_undirected())
+        A = A_undirected
         svd = TruncatedSVD(n_components=min(128, A.shape[0] - 1), random_state=42)
         embeddings = svd.fit_transform(A.astype(float))
         np.save(MODEL_DIR / "spectral_embeddings.npy", embeddings)
@@ -653,9 +670,8 @@ def networkx_fallback():
     try:
         from sklearn.decomposition import TruncatedSVD
 
-        G_undirected = G.to_undirected()
         # DeepWalk-style: power of adjacency matrix
-        A = nx.adjacency_matrix(G_undirected).astype(float)
+        A = A_undirected.astype(float)
         # Normalize
         from scipy.sparse import diags
         degrees = np.array(A.sum(axis=1)).flatten()
@@ -678,7 +694,7 @@ def networkx_fallback():
         log.error(f"  Random walk embedding failed: {e}")
 
     # Save node mapping
-    node_list = list(G.nodes())
+    node_list = nodes.column("id").to_pylist()
     with open(MODEL_DIR / "node_list.json", 'w') as f:
         json.dump(node_list, f)
 
@@ -697,9 +713,9 @@ def main():
 
     # Check if Task 1 output exists
     if not (EMBEDDINGS_DIR / "node_features.npy").exists():
-        log.warning("Embeddings data not found. Checking for GraphML...")
-        if (KG_DIR / "graph.graphml").exists():
-            networkx_fallback()
+        log.warning("Embeddings data not found. Checking for the graph artifact...")
+        if (KG_DIR / "graph_artifact" / "metadata.json").exists():
+            sparse_fallback()
             return
         else:
             log.error("No graph data found. Run Task 1 first.")
@@ -707,7 +723,7 @@ def main():
 
     if not HAS_PYG:
         log.warning("PyTorch Geometric not available. Using fallback.")
-        networkx_fallback()
+        sparse_fallback()
         return
 
     # Load data
@@ -40,7 +40,7 @@ import os
 import json
 import logging
 from pathlib import Path
-from collections import defaultdict
+from collections import deque
 
 try:
     from flask import Flask, render_template_string, jsonify, request
@@ -50,6 +50,16 @@ except ImportError:
     from flask import Flask, render_template_string, jsonify, request
     from flask_cors import CORS
 
+try:
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    os.system("pip3 install numpy pyarrow")
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
 # Setup
 BASE_DIR = Path("/home/alton/psp-graph")
 KG_DIR = BASE_DIR / "knowledge_graph" / "output"
@@ -65,43 +75,50 @@ CORS(app)
 # ============================================================
 # Data Loading
 # ============================================================
+#
+# The graph is the binary artifact written by Task 1 (graph_artifact/):
+# Arrow node/edge tables and CSR adjacency arrays, all memory-mapped.  Node
+# rows are found by binary search over ``id_order``; neighbors are CSR
+# slices in both directions, merged back into edge order.
+
+ARTIFACT_DIR = KG_DIR / "graph_artifact"
+CSR_ARRAYS = ["indptr", "indices", "reverse_indptr", "reverse_indices",
+              "reverse_edges", "id_order"]
+
+graph_meta = {}      # metadata.json of the artifact
+node_table = None    # Arrow table, one row per node
+edge_table = None    # Arrow table, one row per edge (CSR order)
+node_ids = None      # Arrow string array of node ids, by row
+csr = {}             # array name -> memory-mapped numpy array
+tsne_coords = {}     # node_id -> (x, y)
+
+
+def _read_arrow(path: Path):
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
 
-graph_data = {"nodes": [], "edges": [], "metadata": {}}
-node_index = {}  # name -> node data
-adjacency = defaultdict(list)  # node -> [(neighbor, edge_data)]
-tsne_coords = {}  # node_id -> (x, y)
+
+def _single_chunk(column):
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
 
 
 def load_graph():
-    """Load graph data into memory."""
-    global graph_data, node_index, adjacency, tsne_coords
+    """Memory-map the graph artifact."""
+    global graph_meta, node_table, edge_table, node_ids, tsne_coords
 
-    json_path = KG_DIR / "graph_data.json"
-    if not json_path.exists():
-        log.error(f"Graph data not found at {json_path}")
+    meta_path = ARTIFACT_DIR / "metadata.json"
+    if not meta_path.exists():
+        log.error(f"Graph artifact not found at {ARTIFACT_DIR}")
         log.error("Run Task 1 first.")
         return False
 
-    log.info(f"Loading graph from {json_path}...")
-    with open(json_path) as f:
-        graph_data = json.load(f)
-
-    # Build index
-    for node in graph_data["nodes"]:
-        node_index[node["id"]] = node
-
-    # Build adjacency
-    for edge in graph_data["edges"]:
-        adjacency[edge["source"]].append({
-            "target": edge["target"],
-            "type": edge.get("type", "RELATED"),
-            "source_db": edge.get("source", ""),
-        })
-        adjacency[edge["target"]].append({
-            "target": edge["source"],
-            "type": edge.get("type", "RELATED"),
-            "source_db": edge.get("source", ""),
-        })
+    log.info(f"Loading graph from {ARTIFACT_DIR}...")
+    with open(meta_path) as f:
+        graph_meta = json.load(f)
+    node_table = _read_arrow(ARTIFACT_DIR / "nodes.arrow")
+    edge_table = _read_arrow(ARTIFACT_DIR / "edges.arrow")
+    node_ids = _single_chunk(node_table.column("id"))
+    for name in CSR_ARRAYS:
+        csr[name] = np.load(ARTIFACT_DIR / f"{name}.npy", mmap_mode="r")
 
     # Load t-SNE if available
     tsne_path = MODEL_DIR / "tsne_coordinates.json"
@@ -111,12 +128,85 @@ def load_graph():
                 tsne_coords[item["id"]] = (item["x"], item["y"])
         log.info(f"  Loaded t-SNE for {len(tsne_coords)} nodes")
 
-    meta = graph_data.get("metadata", {})
-    log.info(f"  Nodes: {meta.get('node_count', len(graph_data['nodes']))}")
-    log.info(f"  Edges: {meta.get('edge_count', len(graph_data['edges']))}")
+    log.info(f"  Nodes: {graph_meta.get('node_count', len(node_table))}")
+    log.info(f"  Edges: {graph_meta.get('edge_count', len(csr['indices']))}")
     return True
 
 
+def find_node(node_id: str):
+    """Row of ``node_id``, or None."""
+    order = csr["id_order"]
+    lo, hi = 0, len(order)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if node_ids[int(order[mid])].as_py() < node_id:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(order) and node_ids[int(order[lo])].as_py() == node_id:
+        return int(order[lo])
+    return None
+
+
+def _decode(record: dict, kind: str) -> dict:
+    """Drop null attributes and decode JSON-encoded ones."""
+    json_columns = graph_meta.get("json_columns", {}).get(kind, [])
+    record = {k: v for k, v in record.items() if v is not None}
+    for key in json_columns:
+        if key in record:
+            record[key] = json.loads(record[key])
+    return record
+
+
+def node_record(row: int) -> dict:
+    """All attributes of the node at ``row`` (including ``id``)."""
+    return _decode(node_table.slice(row, 1).to_pylist()[0], "nodes")
+
+
+def column_values(table, name: str, rows, default):
+    """Values of column ``name`` at ``rows``, with ``default`` for nulls."""
+    if name not in table.column_names:
+        return [default] * len(rows)
+    values = table.column(name).take(pa.array(rows, type=pa.int64())).to_pylist()
+    return [default if v is None else v for v in values]
+
+
+def degree(row: int) -> int:
+    """In-degree plus out-degree."""
+    indptr, reverse_indptr = csr["indptr"], csr["reverse_indptr"]
+    return int(indptr[row + 1] - indptr[row] + reverse_indptr[row + 1] - reverse_indptr[row])
+
+
+def incident_edges(row: int):
+    """Edges at ``row`` in either direction, in edge order.
+
+    Returns:
+        (edge_rows, other_end_rows) as numpy arrays.
+    """
+    indptr, reverse_indptr = csr["indptr"], csr["reverse_indptr"]
+    out_start, out_end = int(indptr[row]), int(indptr[row + 1])
+    in_start, in_end = int(reverse_indptr[row]), int(reverse_indptr[row + 1])
+    edge_rows = np.concatenate([np.arange(out_start, out_end),
+                                csr["reverse_edges"][in_start:in_end]])
+    other = np.concatenate([csr["indices"][out_start:out_end],
+                            csr["reverse_indices"][in_start:in_end]]).astype(np.int64)
+    order = np.argsort(edge_rows, kind="stable")
+    return edge_rows[order], other[order]
+
+
+def neighbors(row: int, limit: int = None) -> list:
+    """Neighbor dicts (target, type, source_db) of the node at ``row``."""
+    edge_rows, other = incident_edges(row)
+    edge_rows, other = edge_rows[:limit], other[:limit]
+    targets = node_ids.take(pa.array(other)).to_pylist()
+    types = column_values(edge_table, "type", edge_rows, "RELATED")
+    source_dbs = column_values(edge_table, "source", edge_rows, "")
+    return [
+        {"target": target, "type": edge_type, "source_db": source_db}
+        for target, edge_type, source_db in zip(targets, types, source_dbs)
+    ]
+
+
 # ============================================================
 # API Routes
 # ============================================================
@@ -124,12 +214,11 @@ def load_graph():
 @app.route("/api/stats")
 def api_stats():
     """Graph statistics."""
-    meta = graph_data.get("metadata", {})
     return jsonify({
-        "nodes": meta.get("node_count", len(graph_data["nodes"])),
-        "edges": meta.get("edge_count", len(graph_data["edges"])),
-        "node_types": meta.get("node_types", {}),
-        "edge_types": meta.get("edge_types", {}),
+        "nodes": graph_meta.get("node_count", len(node_table)),
+        "edges": graph_meta.get("edge_count", len(csr["indices"])),
+        "node_types": graph_meta.get("node_types", {}),
+        "edge_types": graph_meta.get("edge_types", {}),
         "has_tsne": len(tsne_coords) > 0,
     })
 
@@ -141,21 +230,34 @@ def api_search():
     node_type = request.args.get("type", "")
     limit = int(request.args.get("limit", 50))
 
-    results = []
-    for node in graph_data["nodes"]:
-        if node_type and node.get("type") != node_type:
-            continue
-        if query and query not in node["id"].lower():
-            continue
-        results.append({
-            "id": node["id"],
-            "type": node.get("type", "Unknown"),
-            "is_focus": node.get("is_focus", False),
-            "degree": len(adjacency.get(node["id"], [])),
-            "pagerank": node.get("pagerank", 0),
-        })
-        if len(results) >= limit:
-            break
+    mask = np.ones(len(node_ids), dtype=bool)
+    if node_type:
+        if "type" not in node_table.column_names:
+            mask[:] = False
+        else:
+            matches = pc.equal(node_table.column("type"), node_type)
+            mask &= pc.fill_null(matches, False).to_numpy(zero_copy_only=False)
+    if query:
+        matches = pc.match_substring(node_ids, query, ignore_case=True)
+        mask &= matches.to_numpy(zero_copy_only=False)
+    rows = np.flatnonzero(mask)[:limit]
+
+    results = [
+        {
+            "id": node_id,
+            "type": node_type_,
+            "is_focus": is_focus,
+            "degree": degree(int(row)),
+            "pagerank": pagerank,
+        }
+        for row, node_id, node_type_, is_focus, pagerank in zip(
+            rows,
+            node_ids.take(pa.array(rows)).to_pylist(),
+            column_values(node_table, "type", rows, "Unknown"),
+            column_values(node_table, "is_focus", rows, False),
+            column_values(node_table, "pagerank", rows, 0),
+        )
+    ]
 
     results.sort(key=lambda x: x.get("pagerank", 0), reverse=True)
     return jsonify(results)
@@ -164,15 +266,14 @@ def api_search():
 @app.route("/api/node/<path:node_id>")
 def api_node(node_id):
     """Get node details and neighborhood."""
-    node = node_index.get(node_id)
-    if not node:
+    row = find_node(node_id)
+    if row is None:
         return jsonify({"error": "Node not found"}), 404
 
-    neighbors = adjacency.get(node_id, [])
     return jsonify({
-        "node": node,
-        "neighbors": neighbors[:100],
-        "degree": len(neighbors),
+        "node": node_record(row),
+        "neighbors": neighbors(row, limit=100),
+        "degree": degree(row),
         "tsne": tsne_coords.get(node_id),
     })
 
@@ -185,26 +286,28 @@ def api_subgraph():
     max_nodes = int(request.args.get("max_nodes", 150))
     filter_type = request.args.get("filter_type", "")
 
-    if not center or center not in node_index:
+    center_row = find_node(center) if center else None
+    if center_row is None:
         return jsonify({"error": "Center node not found"}), 404
 
     # BFS to collect neighborhood
     visited = set()
-    queue = [(center, 0)]
+    queue = deque([(center_row, 0)])
     nodes = []
     edges = []
 
     while queue and len(visited) < max_nodes:
-        node_id, d = queue.pop(0)
-        if node_id in visited:
+        row, d = queue.popleft()
+        if row in visited:
             continue
         if d > depth:
             continue
 
-        visited.add(node_id)
-        node = node_index.get(node_id, {"id": node_id, "type": "Unknown"})
+        visited.add(row)
+        node = node_record(row)
+        node_id = node["id"]
 
-        if filter_type and node.get("type") != filter_type and node_id != center:
+        if filter_type and node.get("type") != filter_type and row != center_row:
             continue
 
         nodes.append({
@@ -213,19 +316,20 @@ def api_subgraph():
             "is_focus": node.get("is_focus", False),
             "pagerank": node.get("pagerank", 0),
             "degree_centrality": node.get("degree_centrality", 0),
-            "is_center": node_id == center,
+            "is_center": row == center_row,
             "depth": d,
         })
 
-        for neighbor in adjacency.get(node_id, []):
-            target = neighbor["target"]
+        edge_rows, other = incident_edges(row)
+        edge_types = column_values(edge_table, "type", edge_rows, "RELATED")
+        for target, edge_type in zip(other.tolist(), edge_types):
             if d < depth:
                 queue.append((target, d + 1))
             if target in visited:
                 edges.append({
                     "source": node_id,
-                    "target": target,
-                    "type": neighbor["type"],
+                    "target": node_ids[target].as_py(),
+                    "type": edge_type,
                 })
 
     return jsonify({"nodes": nodes, "edges": edges})
@@ -253,7 +357,8 @@ def api_pathway(pathway_name):
     nodes = []
     edges = []
     for node_id in path:
-        node = node_index.get(node_id, {"id": node_id, "type": "Unknown"})
+        row = find_node(node_id)
+        node = node_record(row) if row is not None else {"id": node_id, "type": "Unknown"}
         nodes.append({
             "id": node_id,
             "type": node.get("type", "Unknown"),
@@ -278,15 +383,22 @@ def api_tsne():
     if not tsne_coords:
         return jsonify({"error": "t-SNE not available. Run Task 2 first."}), 404
 
+    # One hash lookup for all ids instead of a search per node
+    ids = list(tsne_coords)
+    rows = pc.index_in(pa.array(ids, type=pa.string()), value_set=node_ids).to_pylist()
+    found = [r for r in rows if r is not None]
+    types = iter(column_values(node_table, "type", found, "Unknown"))
+    focus = iter(column_values(node_table, "is_focus", found, False))
+
     data = []
-    for node_id, (x, y) in tsne_coords.items():
-        node = node_index.get(node_id, {})
+    for node_id, row in zip(ids, rows):
+        x, y = tsne_coords[node_id]
         data.append({
             "id": node_id,
             "x": x,
             "y": y,
-            "type": node.get("type", "Unknown"),
-            "is_focus": node.get("is_focus", False),
+            "type": "Unknown" if row is None else next(types),
+            "is_focus": False if row is None else next(focus),
         })
 
     return jsonify(data)
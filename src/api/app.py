@@ -21,10 +21,13 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import time
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -89,6 +92,25 @@ _model_last_run: dict[str, datetime] = {}
 # WebSocket connections for real-time monitoring
 _ws_connections: dict[str, list[WebSocket]] = defaultdict(list)
 
+# Ensemble scoring is CPU-bound, so it runs in a bounded worker pool rather
+# than on the event loop.  ``SAFETY_PREDICT_WORKERS`` sets both the pool size
+# and the number of patients a single batch request may have in flight.
+_prediction_workers: int = max(
+    1, int(os.environ.get("SAFETY_PREDICT_WORKERS", min(8, os.cpu_count() or 1)))
+)
+_prediction_executor: ThreadPoolExecutor | None = None
+
+
+def _get_prediction_executor() -> ThreadPoolExecutor:
+    """Return the shared scoring pool, creating it on first use."""
+    global _prediction_executor
+    if _prediction_executor is None:
+        _prediction_executor = ThreadPoolExecutor(
+            max_workers=_prediction_workers,
+            thread_name_prefix="safety-predict",
+        )
+    return _prediction_executor
+
 
 # ---------------------------------------------------------------------------
 # Lifespan
@@ -98,10 +120,14 @@ _ws_connections: dict[str, list[WebSocket]] = defaultdict(list)
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown hooks."""
     global _start_time
+    global _prediction_executor
     _start_time = time.monotonic()
     logger.info("Safety Prediction API starting up")
     yield
     logger.info("Safety Prediction API shutting down")
+    if _prediction_executor is not None:
+        _prediction_executor.shutdown(wait=True)
+        _prediction_executor = None
 
 
 # ---------------------------------------------------------------------------
@@ -454,30 +480,23 @@ async def _notify_ws_clients(patient_id: str, data: dict[str, Any]) -> None:
         connections.remove(ws)
 
 
-# ---------------------------------------------------------------------------
-# POST /api/v1/predict -- Full ensemble prediction
-# ---------------------------------------------------------------------------
+@dataclass
+class _ScoredPrediction:
+    """A completed prediction plus the side effects still to be published."""
 
-@app.post(
-    "/api/v1/predict",
-    response_model=PredictionResponse,
-    tags=["Prediction"],
-    summary="Run prediction for a patient",
-    description=(
-        "Runs all applicable biomarker scoring models and produces an ensemble "
-        "risk prediction. Returns individual model scores, layer results, "
-        "composite score, alerts, and contributing factors."
-    ),
-    responses={
-        400: {"model": ErrorResponse, "description": "Invalid input data"},
-        500: {"model": ErrorResponse, "description": "Server error"},
-    },
-)
-async def predict(
-    request: PatientDataRequest,
-    raw_request: Any = None,
-) -> PredictionResponse:
-    """Run full ensemble prediction for a patient."""
+    response: PredictionResponse
+    timeline_point: dict[str, Any]
+    ws_payload: dict[str, Any]
+    models_scored: list[str]
+
+
+def _score_patient(request: PatientDataRequest) -> _ScoredPrediction:
+    """Run the ensemble for one patient and build its response.
+
+    Pure CPU work with no shared-state mutation, so it is safe to run in
+    the prediction worker pool.  Timeline, WebSocket, and model last-run
+    updates are returned for the caller to publish on the event loop.
+    """
     request_id = str(uuid.uuid4())
 
     # Build a flat patient_data dict with standardised keys
@@ -493,10 +512,6 @@ async def predict(
             detail=f"Prediction failed: {exc}",
         )
 
-    # Update last-run times
-    for score in ensemble_result.all_scores:
-        _model_last_run[score.model_name] = datetime.utcnow()
-
     # Build layer details
     layer_details = []
     for layer in ensemble_result.layers:
@@ -542,7 +557,6 @@ async def predict(
         if s.is_valid and s.score is not None:
             model_scores[s.model_name] = _normalise_score(s.model_name, s.score)
 
-    # Store in timeline
     timeline_point = {
         "timestamp": now.isoformat(),
         "composite_score": composite_score,
@@ -550,9 +564,7 @@ async def predict(
         "hours_since_infusion": request.product.hours_since_infusion,
         "model_scores": model_scores,
     }
-    _patient_timelines[request.patient_id].append(timeline_point)
 
-    # Notify WebSocket clients
     ws_payload = {
         "type": "prediction_update",
         "patient_id": request.patient_id,
@@ -561,9 +573,8 @@ async def predict(
         "timestamp": now.isoformat(),
         "models_run": ensemble_result.model_count_run,
     }
-    await _notify_ws_clients(request.patient_id, ws_payload)
 
-    return PredictionResponse(
+    response = PredictionResponse(
         request_id=request_id,
         timestamp=now,
         patient_id=request.patient_id,
@@ -583,6 +594,69 @@ async def predict(
         },
     )
 
+    return _ScoredPrediction(
+        response=response,
+        timeline_point=timeline_point,
+        ws_payload=ws_payload,
+        models_scored=[s.model_name for s in ensemble_result.all_scores],
+    )
+
+
+async def _run_scoring(request: PatientDataRequest) -> _ScoredPrediction:
+    """Score a patient in the worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_prediction_executor(), _score_patient, request,
+    )
+
+
+async def _publish_predictions(scored: list[_ScoredPrediction]) -> None:
+    """Record timeline points and notify WebSocket clients for predictions.
+
+    Shared state is only mutated here, on the event loop, so worker
+    threads never race on the in-memory stores.  Notifications for
+    different patients are sent concurrently.
+    """
+    now = datetime.utcnow()
+    for item in scored:
+        for model_name in item.models_scored:
+            _model_last_run[model_name] = now
+        _patient_timelines[item.response.patient_id].append(item.timeline_point)
+
+    await asyncio.gather(*(
+        _notify_ws_clients(item.response.patient_id, item.ws_payload)
+        for item in scored
+    ))
+
+
+# ---------------------------------------------------------------------------
+# POST /api/v1/predict -- Full ensemble prediction
+# ---------------------------------------------------------------------------
+
+@app.post(
+    "/api/v1/predict",
+    response_model=PredictionResponse,
+    tags=["Prediction"],
+    summary="Run prediction for a patient",
+    description=(
+        "Runs all applicable biomarker scoring models and produces an ensemble "
+        "risk prediction. Returns individual model scores, layer results, "
+        "composite score, alerts, and contributing factors."
+    ),
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid input data"},
+        500: {"model": ErrorResponse, "description": "Server error"},
+    },
+)
+async def predict(
+    request: PatientDataRequest,
+    raw_request: Any = None,
+) -> PredictionResponse:
+    """Run full ensemble prediction for a patient."""
+    scored = await _run_scoring(request)
+    await _publish_predictions([scored])
+    return scored.response
+
 
 # ---------------------------------------------------------------------------
 # POST /api/v1/predict/batch -- Batch prediction
@@ -593,7 +667,11 @@ async def predict(
     response_model=BatchPredictionResponse,
     tags=["Prediction"],
     summary="Batch prediction for multiple patients",
-    description="Runs ensemble prediction for up to 100 patients in a single request.",
+    description=(
+        "Runs ensemble prediction for up to 100 patients in a single request. "
+        "Patients are scored in parallel in a bounded worker pool; timeline "
+        "and WebSocket updates are published once the whole batch completes."
+    ),
     responses={
         400: {"model": ErrorResponse, "description": "Invalid input data"},
     },
@@ -605,35 +683,46 @@ async def predict_batch(
     request_id = str(uuid.uuid4())
     now = datetime.utcnow()
 
-    predictions: list[PredictionResponse] = []
+    # Cap in-flight patients so one large batch cannot flood the pool queue
+    # ahead of concurrent single-patient requests.
+    in_flight = asyncio.Semaphore(_prediction_workers)
+
+    async def _score_bounded(patient_request: PatientDataRequest) -> _ScoredPrediction:
+        async with in_flight:
+            return await _run_scoring(patient_request)
+
+    outcomes = await asyncio.gather(
+        *(_score_bounded(p) for p in batch_request.patients),
+        return_exceptions=True,
+    )
+
+    scored: list[_ScoredPrediction] = []
     errors: list[dict[str, str]] = []
-    successful = 0
-    failed = 0
 
-    for patient_request in batch_request.patients:
-        try:
-            result = await predict(patient_request)
-            predictions.append(result)
-            successful += 1
-        except Exception as exc:
-            failed += 1
+    # gather() also returns BaseException results such as CancelledError
+    for patient_request, outcome in zip(batch_request.patients, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
             errors.append({
                 "patient_id": patient_request.patient_id,
-                "error": str(exc),
+                "error": str(outcome),
             })
             logger.error(
                 "Batch prediction failed for patient %s: %s",
                 patient_request.patient_id,
-                exc,
+                outcome,
             )
+        else:
+            scored.append(outcome)
+
+    await _publish_predictions(scored)
 
     return BatchPredictionResponse(
         request_id=request_id,
         timestamp=now,
-        predictions=predictions,
+        predictions=[item.response for item in scored],
         total_patients=len(batch_request.patients),
-        successful=successful,
-        failed=failed,
+        successful=len(scored),
+        failed=len(errors),
         errors=errors,
     )
 
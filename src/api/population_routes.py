@@ -14,6 +14,7 @@ mechanism chains, molecular targets, cell types, and PubMed references.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import pathlib
@@ -26,6 +27,8 @@ from fastapi import APIRouter, HTTPException, Query
 
 from src.api.schemas import (
     ArchitectureResponse,
+    BayesianBatchRequest,
+    BayesianBatchResponse,
     BayesianPosteriorRequest,
     BayesianPosteriorResponse,
     CorrelationDetail,
@@ -56,6 +59,9 @@ from src.api.schemas import (
     KnowledgeTargetResponse,
     MitigationAnalysisRequest,
     MitigationAnalysisResponse,
+    MitigationOptimizationRequest,
+    MitigationOptimizationResponse,
+    MitigationRegimen,
     ModuleInfo,
     MonitoringActivity,
     MonitoringScheduleResponse,
@@ -98,17 +104,21 @@ from src.models.bayesian_risk import (
     STUDY_TIMELINE,
     compute_evidence_accrual,
     compute_posterior,
-    compute_stopping_boundaries,
+    compute_posterior_batch,
 )
+from src.models.stopping_boundaries import get_boundary_table
 from src.models.mitigation_model import (
     MITIGATION_STRATEGIES,
+    RegimenEvaluation,
     calculate_mitigated_risk,
     combine_correlated_rr,
     combine_multiple_rrs,
     get_mitigation_correlation,
     monte_carlo_mitigated_risk,
+    optimize_mitigation_regimens,
 )
 from src.models.faers_signal import get_faers_signals
+from src.models.faers_offline import precomputed_faers_signals
 from src.data.faers_cache import get_faers_comparison
 from data.sle_cart_studies import (
     ADVERSE_EVENT_RATES,
@@ -350,6 +360,111 @@ async def bayesian_posterior(
     )
 
 
+# ---------------------------------------------------------------------------
+# POST /api/v1/population/bayesian/batch -- Batched Bayesian posteriors
+# ---------------------------------------------------------------------------
+
+@router.post(
+    "/api/v1/population/bayesian/batch",
+    response_model=BayesianBatchResponse,
+    tags=["Population"],
+    summary="Compute many Bayesian posteriors at once",
+    description=(
+        "Computes Beta-Binomial posteriors for a list of (adverse event, events, "
+        "patients) queries in one vectorized pass. Each estimate matches "
+        "POST /api/v1/population/bayesian for the same query."
+    ),
+)
+async def bayesian_posterior_batch(
+    request: BayesianBatchRequest,
+) -> BayesianBatchResponse:
+    """Compute Bayesian posterior estimates for a batch of queries."""
+    request_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+
+    priors = []
+    for query in request.queries:
+        prior = _PRIOR_MAP.get(query.adverse_event)
+        if prior is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown adverse event '{query.adverse_event}'. "
+                       f"Valid: {list(_PRIOR_MAP.keys())}",
+            )
+        priors.append(prior)
+
+    try:
+        batch = compute_posterior_batch(
+            alpha=[p.alpha for p in priors],
+            beta=[p.beta for p in priors],
+            events=[q.n_events for q in request.queries],
+            n=[q.n_patients for q in request.queries],
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    estimates = []
+    for query, prior, estimate in zip(request.queries, priors, batch.to_estimates()):
+        estimates.append(PosteriorEstimateResponse(
+            adverse_event=query.adverse_event,
+            prior_alpha=prior.alpha,
+            prior_beta=prior.beta,
+            posterior_alpha=estimate.alpha,
+            posterior_beta=estimate.beta,
+            n_patients=estimate.n_patients,
+            n_events=estimate.n_events,
+            mean_pct=estimate.mean,
+            ci_low_pct=estimate.ci_low,
+            ci_high_pct=estimate.ci_high,
+            ci_width_pct=estimate.ci_width,
+        ))
+
+    return BayesianBatchResponse(
+        request_id=request_id,
+        timestamp=now,
+        estimates=estimates,
+    )
+
+
+def _baseline_risk_pct(target_ae: str) -> float:
+    """Pooled SLE baseline risk (%) for an AE type, preferring grade 3+."""
+    baseline_risk_data = get_sle_baseline_risk()
+    target_key = f"{target_ae.lower()}_grade3_plus"
+    if target_key not in baseline_risk_data:
+        target_key = target_ae.lower()
+    if target_key not in baseline_risk_data:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No baseline data for AE '{target_ae}'",
+        )
+    return baseline_risk_data[target_key]["estimate"]
+
+
+def _baseline_beta_params(target_ae_upper: str) -> tuple[float, float]:
+    """Beta posterior ``(alpha, beta)`` for an AE's pooled SLE baseline.
+
+    Derives posterior parameters dynamically from actual pooled baseline data
+    for the target AE, using the rate fields from the pooled SLE entry.
+    """
+    prior = _PRIOR_MAP.get(target_ae_upper, CRS_PRIOR)
+    _pooled = ADVERSE_EVENT_RATES[0]  # Pooled SLE entry
+    _n_total = _pooled.n_patients
+
+    # Map AE type -> rate field on the pooled AdverseEventRate record.
+    # Events are derived from (rate_pct / 100) * n_patients, rounded to the
+    # nearest integer, so they stay in sync with the curated data rather
+    # than being hardcoded constants.
+    _ae_rate_field_map: dict[str, str] = {
+        "CRS": "crs_grade3_plus",
+        "ICANS": "icans_grade3_plus",
+        "ICAHS": "icahs_rate",
+    }
+    _rate_field = _ae_rate_field_map.get(target_ae_upper, "crs_grade3_plus")
+    _rate_pct = getattr(_pooled, _rate_field, 0.0)
+    _n_events = round(_rate_pct / 100.0 * _n_total)
+    return prior.alpha + _n_events, prior.beta + (_n_total - _n_events)
+
+
 # ---------------------------------------------------------------------------
 # POST /api/v1/population/mitigations -- Correlated mitigation analysis
 # ---------------------------------------------------------------------------
@@ -385,17 +500,7 @@ async def mitigation_analysis(
         )
 
     # Get baseline risk and prior for target AE
-    baseline_risk_data = get_sle_baseline_risk()
-    target_key = f"{request.target_ae.lower()}_grade3_plus"
-    if target_key not in baseline_risk_data:
-        target_key = request.target_ae.lower()
-    if target_key not in baseline_risk_data:
-        raise HTTPException(
-            status_code=400,
-            detail=f"No baseline data for AE '{request.target_ae}'",
-        )
-
-    baseline_pct = baseline_risk_data[target_key]["estimate"]
+    baseline_pct = _baseline_risk_pct(request.target_ae)
     baseline_risk = baseline_pct / 100.0
 
     # Filter mitigations that target this AE
@@ -452,27 +557,10 @@ async def mitigation_analysis(
                 ))
 
     # Monte Carlo for uncertainty
-    # Derive posterior parameters dynamically from actual pooled baseline data
-    # for the target AE, using the rate fields from the pooled SLE entry.
-    prior = _PRIOR_MAP.get(target_ae_upper, CRS_PRIOR)
-    _pooled = ADVERSE_EVENT_RATES[0]  # Pooled SLE entry
-    _n_total = _pooled.n_patients
-
-    # Map AE type -> rate field on the pooled AdverseEventRate record.
-    # Events are derived from (rate_pct / 100) * n_patients, rounded to the
-    # nearest integer, so they stay in sync with the curated data rather
-    # than being hardcoded constants.
-    _ae_rate_field_map: dict[str, str] = {
-        "CRS": "crs_grade3_plus",
-        "ICANS": "icans_grade3_plus",
-        "ICAHS": "icahs_rate",
-    }
-    _rate_field = _ae_rate_field_map.get(target_ae_upper, "crs_grade3_plus")
-    _rate_pct = getattr(_pooled, _rate_field, 0.0)
-    _n_events = round(_rate_pct / 100.0 * _n_total)
+    baseline_alpha, baseline_beta = _baseline_beta_params(target_ae_upper)
     mc_result = monte_carlo_mitigated_risk(
-        baseline_alpha=prior.alpha + _n_events,
-        baseline_beta=prior.beta + (_n_total - _n_events),
+        baseline_alpha=baseline_alpha,
+        baseline_beta=baseline_beta,
         mitigation_ids=applicable_ids,
         n_samples=request.n_monte_carlo_samples,
     )
@@ -641,7 +729,9 @@ async def trial_registry(
     description=(
         "Queries the FDA Adverse Event Reporting System via openFDA and computes "
         "disproportionality metrics (PRR, ROR, EBGM) for approved CAR-T products. "
-        "Note: Queries the live openFDA API and may take 30-60 seconds."
+        "When SAFETY_FAERS_SCREEN_PATH names a precomputed offline screen, results "
+        "are read from it; otherwise the live openFDA API is queried, which may "
+        "take 30-60 seconds."
     ),
 )
 async def faers_signals(
@@ -660,7 +750,10 @@ async def faers_signals(
         product_list = [p.strip() for p in products.split(",") if p.strip()]
 
     try:
-        summary = await get_faers_signals(products=product_list)
+        # Loading the Parquet screen is blocking file I/O; keep it off the loop
+        summary = await asyncio.to_thread(precomputed_faers_signals, products=product_list)
+        if summary is None:
+            summary = await get_faers_signals(products=product_list)
     except Exception as exc:
         logger.exception("FAERS signal detection failed")
         raise HTTPException(
@@ -785,6 +878,71 @@ async def signal_triangulation(
     }
 
 
+# ---------------------------------------------------------------------------
+# POST /api/v1/population/mitigations/optimize -- Best mitigation regimens
+# ---------------------------------------------------------------------------
+
+@router.post(
+    "/api/v1/population/mitigations/optimize",
+    response_model=MitigationOptimizationResponse,
+    tags=["Population"],
+    summary="Optimal mitigation regimens",
+    description=(
+        "Scores every mitigation regimen up to the requested size against the "
+        "target adverse events and returns the Pareto frontier (combined RR per "
+        "AE vs. number of interventions), with Monte Carlo intervals for "
+        "frontier regimens, plus the best regimen of each size."
+    ),
+)
+async def mitigation_optimization(
+    request: MitigationOptimizationRequest,
+) -> MitigationOptimizationResponse:
+    """Find the best mitigation regimens under the request's constraints."""
+    request_id = str(uuid.uuid4())
+    now = datetime.now(timezone.utc)
+
+    target_aes = list(dict.fromkeys(ae.upper() for ae in request.target_aes))
+    baseline_pct = {ae: _baseline_risk_pct(ae) for ae in target_aes}
+
+    try:
+        result = optimize_mitigation_regimens(
+            baseline_risks={ae: pct / 100.0 for ae, pct in baseline_pct.items()},
+            max_size=request.max_size,
+            required=request.required_mitigations,
+            excluded=request.excluded_mitigations,
+            baseline_params={ae: _baseline_beta_params(ae) for ae in target_aes},
+            n_samples=request.n_monte_carlo_samples,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    def to_response(evaluation: RegimenEvaluation) -> MitigationRegimen:
+        return MitigationRegimen(
+            mitigation_ids=evaluation.mitigation_ids,
+            size=evaluation.size,
+            combined_rr={ae: round(rr, 4) for ae, rr in evaluation.combined_rr.items()},
+            mitigated_risk_pct={
+                ae: round(risk * 100, 4) for ae, risk in evaluation.mitigated_risk.items()
+            },
+            pareto_optimal=evaluation.pareto_optimal,
+            intervals_pct={
+                ae: {key: round(value * 100, 4) for key, value in interval.items()}
+                for ae, interval in evaluation.intervals.items()
+            },
+        )
+
+    return MitigationOptimizationResponse(
+        request_id=request_id,
+        timestamp=now,
+        target_aes=result.target_aes,
+        baseline_risk_pct=baseline_pct,
+        n_regimens_evaluated=len(result.evaluations),
+        n_combination_evaluations=result.n_combination_evaluations,
+        pareto_frontier=[to_response(e) for e in result.pareto_frontier],
+        best_by_size=[to_response(e) for e in result.best_by_size.values()],
+    )
+
+
 # ---------------------------------------------------------------------------
 # GET /api/v1/population/mitigations/strategies -- List available mitigations
 # ---------------------------------------------------------------------------
@@ -1198,6 +1356,9 @@ async def cdp_eligibility_criteria(
 # GET /api/v1/cdp/stopping-rules -- Bayesian stopping rule boundaries
 # ---------------------------------------------------------------------------
 
+_MAX_STOPPING_N = 10_000
+
+
 @router.get(
     "/api/v1/cdp/stopping-rules",
     response_model=StoppingRulesResponse,
@@ -1214,6 +1375,11 @@ async def cdp_stopping_rules(
         "car-t-cd19-sle",
         description="Therapy type identifier (e.g. 'car-t-cd19-sle')",
     ),
+    sample_sizes: str | None = Query(
+        None,
+        description="Comma-separated sample sizes to report (e.g. '50,500,2000'). "
+                    f"Defaults to 10,20,30,50,75,100; at most {_MAX_STOPPING_N}.",
+    ),
 ) -> StoppingRulesResponse:
     """Return Bayesian stopping rule boundaries for key AEs."""
     ae_configs = [
@@ -1248,34 +1414,34 @@ async def cdp_stopping_rules(
 
     # Key sample sizes to report
     key_ns = [10, 20, 30, 50, 75, 100]
+    if sample_sizes:
+        try:
+            key_ns = sorted({int(n) for n in sample_sizes.split(",") if n.strip()})
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"sample_sizes must be comma-separated integers, got '{sample_sizes}'",
+            )
+        if not key_ns or key_ns[0] < 1 or key_ns[-1] > _MAX_STOPPING_N:
+            raise HTTPException(
+                status_code=400,
+                detail=f"sample_sizes must be between 1 and {_MAX_STOPPING_N}",
+            )
 
     rules = []
     for cfg in ae_configs:
-        all_boundaries = compute_stopping_boundaries(
+        # Cached table; any max_n up to the longest computed is a slice
+        table = get_boundary_table(
             target_rate=cfg["target_rate"],
             posterior_threshold=cfg["threshold"],
-            max_n=100,
+            max_n=key_ns[-1],
             prior_alpha=0.5,
             prior_beta=0.5,
         )
 
-        # Build a lookup from full boundaries
-        boundary_lookup: dict[int, int] = {}
-        last_max = 0
-        for bd in all_boundaries:
-            last_max = bd["max_events"]
-            boundary_lookup[bd["n_patients"]] = last_max
-        # Fill in intermediate values
-        current_max = 0
-        filled: dict[int, int] = {}
-        for n in range(1, 101):
-            if n in boundary_lookup:
-                current_max = boundary_lookup[n]
-            filled[n] = current_max
-
         # Extract boundaries at key sample sizes
         compact_boundaries = [
-            StoppingBoundary(n_patients=n, max_events=filled.get(n, 0))
+            StoppingBoundary(n_patients=n, max_events=table.at(n))
             for n in key_ns
         ]
 
@@ -2226,11 +2392,26 @@ async def system_architecture() -> ArchitectureResponse:
             path="src/models/bayesian_risk.py",
             description="Beta-Binomial posteriors, evidence accrual, stopping boundaries",
             public_functions=[
-                "compute_posterior", "compute_evidence_accrual",
+                "compute_posterior", "compute_posterior_batch",
+                "prior_sensitivity_grid", "compute_evidence_accrual",
                 "compute_stopping_boundaries",
             ],
-            classes=["PriorSpec", "PosteriorEstimate", "StudyDataPoint"],
-            lines_of_code=378,
+            classes=[
+                "PriorSpec", "PosteriorEstimate", "StudyDataPoint",
+                "PosteriorBatch", "SensitivityGrid",
+            ],
+            lines_of_code=719,
+        ),
+        ModuleInfo(
+            name="stopping_boundaries",
+            path="src/models/stopping_boundaries.py",
+            description="Vectorized stopping-boundary tables with memory and disk cache",
+            public_functions=[
+                "compute_boundary_table", "get_boundary_table",
+                "boundary_cache_stats",
+            ],
+            classes=["BoundaryTable", "BoundaryTableService"],
+            lines_of_code=369,
         ),
         ModuleInfo(
             name="mitigation_model",
@@ -2239,9 +2420,12 @@ async def system_architecture() -> ArchitectureResponse:
             public_functions=[
                 "combine_correlated_rr", "combine_multiple_rrs",
                 "monte_carlo_mitigated_risk", "calculate_mitigated_risk",
-                "get_mitigation_correlation",
+                "get_mitigation_correlation", "optimize_mitigation_regimens",
+            ],
+            classes=[
+                "MitigationStrategy", "MitigationResult",
+                "RegimenEvaluation", "MitigationOptimizationResult",
             ],
-            classes=["MitigationStrategy", "MitigationResult"],
             lines_of_code=545,
         ),
         ModuleInfo(
@@ -2255,18 +2439,30 @@ async def system_architecture() -> ArchitectureResponse:
             classes=["FAERSSignal", "FAERSSummary"],
             lines_of_code=935,
         ),
+        ModuleInfo(
+            name="faers_offline",
+            path="src/models/faers_offline.py",
+            description="Offline full-matrix FAERS screen over a local quarterly extract",
+            public_functions=[
+                "ingest_faers_extract", "build_contingency_table",
+                "compute_disproportionality", "run_faers_screen",
+                "precomputed_faers_signals",
+            ],
+            classes=["FAERSScreen"],
+            lines_of_code=536,
+        ),
         ModuleInfo(
             name="model_registry",
             path="src/models/model_registry.py",
             description="7-model risk estimation registry with unified interface",
             public_functions=[
                 "estimate_risk", "compare_models", "list_models",
-                "bayesian_beta_binomial", "frequentist_exact",
-                "wilson_score", "random_effects_meta",
+                "bayesian_beta_binomial", "bayesian_beta_binomial_update",
+                "frequentist_exact", "wilson_score", "random_effects_meta",
                 "empirical_bayes", "kaplan_meier", "predictive_posterior",
             ],
             classes=["RiskModel"],
-            lines_of_code=917,
+            lines_of_code=1052,
         ),
         ModuleInfo(
             name="model_validation",
@@ -2274,11 +2470,11 @@ async def system_architecture() -> ArchitectureResponse:
             description="Calibration diagnostics, scoring rules, coverage, cross-validation",
             public_functions=[
                 "calibration_check", "brier_score", "coverage_probability",
-                "leave_one_out_cv", "model_comparison",
+                "run_evaluation_tasks", "leave_one_out_cv", "model_comparison",
                 "sequential_prediction_test",
             ],
             classes=[],
-            lines_of_code=480,
+            lines_of_code=603,
         ),
         ModuleInfo(
             name="biomarker_scores",
@@ -2319,8 +2515,8 @@ async def system_architecture() -> ArchitectureResponse:
             description="Population-level API routes (Bayesian, mitigation, trials, FAERS, CDP)",
             public_functions=[
                 "population_risk", "bayesian_posterior",
-                "mitigation_analysis", "evidence_accrual",
-                "trial_registry", "faers_signals",
+                "mitigation_analysis", "mitigation_optimization",
+                "evidence_accrual", "trial_registry", "faers_signals",
                 "list_mitigations", "ae_comparison",
                 "list_therapies", "cdp_monitoring_schedule",
                 "cdp_eligibility_criteria", "cdp_stopping_rules",
@@ -2367,7 +2563,31 @@ async def system_architecture() -> ArchitectureResponse:
             description="In-memory biological pathway graph with optional Neo4j backend",
             public_functions=[],
             classes=["KnowledgeGraph"],
-            lines_of_code=400,
+            lines_of_code=820,
+        ),
+        ModuleInfo(
+            name="compiled_graph",
+            path="src/data/graph/compiled.py",
+            description="CSR adjacency snapshot used for knowledge-graph traversals",
+            public_functions=[],
+            classes=["CompiledGraph", "CSRAdjacency"],
+            lines_of_code=462,
+        ),
+        ModuleInfo(
+            name="patient_similarity",
+            path="src/data/graph/similarity.py",
+            description="Inverted-index and MinHash/LSH nearest-patient search over active pathways",
+            public_functions=[],
+            classes=["PatientSimilarityIndex"],
+            lines_of_code=406,
+        ),
+        ModuleInfo(
+            name="graph_artifact",
+            path="src/data/graph/artifact.py",
+            description="Loads the builder's Arrow/CSR graph artifact into a KnowledgeGraph",
+            public_functions=["load_graph_artifact"],
+            classes=[],
+            lines_of_code=165,
         ),
         ModuleInfo(
             name="sle_cart_studies",
@@ -2420,8 +2640,8 @@ async def system_architecture() -> ArchitectureResponse:
         ),
         DependencyEdge(
             source="population_routes", target="bayesian_risk",
-            import_names=["compute_posterior", "compute_evidence_accrual",
-                          "CRS_PRIOR", "ICANS_PRIOR"],
+            import_names=["compute_posterior", "compute_posterior_batch",
+                          "compute_evidence_accrual", "CRS_PRIOR", "ICANS_PRIOR"],
         ),
         DependencyEdge(
             source="population_routes", target="mitigation_model",
@@ -2432,6 +2652,15 @@ async def system_architecture() -> ArchitectureResponse:
             source="population_routes", target="faers_signal",
             import_names=["get_faers_signals"],
         ),
+        DependencyEdge(
+            source="population_routes", target="faers_offline",
+            import_names=["precomputed_faers_signals"],
+        ),
+        DependencyEdge(
+            source="faers_offline", target="faers_signal",
+            import_names=["compute_prr_batch", "compute_ror_batch",
+                          "compute_ebgm_batch", "classify_signal_batch"],
+        ),
         DependencyEdge(
             source="population_routes", target="sle_cart_studies",
             import_names=["CLINICAL_TRIALS", "get_sle_baseline_risk",
@@ -2450,6 +2679,30 @@ async def system_architecture() -> ArchitectureResponse:
             source="model_registry", target="bayesian_risk",
             import_names=["PriorSpec", "compute_posterior"],
         ),
+        DependencyEdge(
+            source="knowledge_graph", target="compiled_graph",
+            import_names=["CompiledGraph"],
+        ),
+        DependencyEdge(
+            source="patient_similarity", target="knowledge_graph",
+            import_names=["KnowledgeGraph", "SimilarityResult"],
+        ),
+        DependencyEdge(
+            source="graph_artifact", target="knowledge_graph",
+            import_names=["KnowledgeGraph"],
+        ),
+        DependencyEdge(
+            source="model_validation", target="model_registry",
+            import_names=["MODEL_REGISTRY"],
+        ),
+        DependencyEdge(
+            source="population_routes", target="stopping_boundaries",
+            import_names=["get_boundary_table"],
+        ),
+        DependencyEdge(
+            source="bayesian_risk", target="stopping_boundaries",
+            import_names=["get_boundary_table"],
+        ),
     ]
 
     # --- Endpoints ---
@@ -2517,6 +2770,13 @@ async def system_architecture() -> ArchitectureResponse:
             request_schema="BayesianPosteriorRequest",
             response_schema="BayesianPosteriorResponse",
         ),
+        EndpointInfo(
+            method="POST", path="/api/v1/population/bayesian/batch",
+            summary="Compute many Bayesian posteriors at once",
+            tags=["Population"],
+            request_schema="BayesianBatchRequest",
+            response_schema="BayesianBatchResponse",
+        ),
         EndpointInfo(
             method="POST", path="/api/v1/population/mitigations",
             summary="Correlated mitigation risk analysis",
@@ -2524,6 +2784,13 @@ async def system_architecture() -> ArchitectureResponse:
             request_schema="MitigationAnalysisRequest",
             response_schema="MitigationAnalysisResponse",
         ),
+        EndpointInfo(
+            method="POST", path="/api/v1/population/mitigations/optimize",
+            summary="Optimal mitigation regimens",
+            tags=["Population"],
+            request_schema="MitigationOptimizationRequest",
+            response_schema="MitigationOptimizationResponse",
+        ),
         EndpointInfo(
             method="GET", path="/api/v1/population/evidence-accrual",
             summary="Evidence accrual timeline",
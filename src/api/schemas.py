@@ -365,6 +365,23 @@ class BayesianPosteriorResponse(BaseModel):
     estimate: PosteriorEstimateResponse
 
 
+class BayesianBatchRequest(BaseModel):
+    """Request for many Bayesian posteriors in one call."""
+
+    queries: list[BayesianPosteriorRequest] = Field(
+        ..., description="Posterior queries, evaluated together",
+        min_length=1, max_length=10000,
+    )
+
+
+class BayesianBatchResponse(BaseModel):
+    """Response for batched Bayesian posterior computation."""
+
+    request_id: str
+    timestamp: datetime
+    estimates: list[PosteriorEstimateResponse]
+
+
 class MitigationAnalysisRequest(BaseModel):
     """Request for correlated mitigation analysis."""
 
@@ -419,6 +436,57 @@ class MitigationAnalysisResponse(BaseModel):
         return self
 
 
+class MitigationOptimizationRequest(BaseModel):
+    """Request for the mitigation regimen optimizer."""
+
+    target_aes: list[str] = Field(
+        default_factory=lambda: ["CRS", "ICANS"],
+        description="Adverse events to optimize against: CRS, ICANS, and/or ICAHS",
+        min_length=1,
+    )
+    max_size: int = Field(
+        3, description="Maximum number of mitigations in a regimen", ge=1, le=10,
+    )
+    required_mitigations: list[str] = Field(
+        default_factory=list, description="Mitigation IDs every regimen must include",
+    )
+    excluded_mitigations: list[str] = Field(
+        default_factory=list, description="Mitigation IDs no regimen may include",
+    )
+    n_monte_carlo_samples: int = Field(
+        5000,
+        description="Monte Carlo samples per frontier regimen (0 disables intervals)",
+        ge=0, le=100000,
+    )
+
+
+class MitigationRegimen(BaseModel):
+    """One scored mitigation regimen."""
+
+    mitigation_ids: list[str]
+    size: int = Field(ge=1)
+    combined_rr: dict[str, float] = Field(description="Combined RR per target AE")
+    mitigated_risk_pct: dict[str, float] = Field(description="Mitigated risk per target AE")
+    pareto_optimal: bool
+    intervals_pct: dict[str, dict[str, float]] = Field(
+        default_factory=dict,
+        description="Monte Carlo p2_5/median/p97_5/mean per AE (frontier regimens only)",
+    )
+
+
+class MitigationOptimizationResponse(BaseModel):
+    """Response for the mitigation regimen optimizer."""
+
+    request_id: str
+    timestamp: datetime
+    target_aes: list[str]
+    baseline_risk_pct: dict[str, float]
+    n_regimens_evaluated: int = Field(ge=0)
+    n_combination_evaluations: int = Field(ge=0)
+    pareto_frontier: list[MitigationRegimen]
+    best_by_size: list[MitigationRegimen]
+
+
 class EvidenceAccrualPoint(BaseModel):
     """Single timepoint in the evidence accrual timeline."""
 
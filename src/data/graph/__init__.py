@@ -3,7 +3,8 @@ Biological knowledge graph for cell therapy safety.
 
 Provides a typed graph of genes, proteins, cytokines, receptors, cell types,
 pathways, adverse events, drugs, and biomarkers -- plus query methods for
-pathway traversal, patient similarity, and mechanism validation.
+pathway traversal, patient similarity, and mechanism validation, and a
+loader for the binary graph artifact written by the graph builder.
 """
 
 from src.data.graph.schema import (
@@ -13,7 +14,10 @@ from src.data.graph.schema import (
     GraphEdge,
     PathwayDefinition,
 )
+from src.data.graph.compiled import CompiledGraph
 from src.data.graph.knowledge_graph import KnowledgeGraph
+from src.data.graph.similarity import PatientSimilarityIndex
+from src.data.graph.artifact import load_graph_artifact
 
 __all__ = [
     "NodeType",
@@ -22,4 +26,7 @@ __all__ = [
     "GraphEdge",
     "PathwayDefinition",
     "KnowledgeGraph",
+    "CompiledGraph",
+    "PatientSimilarityIndex",
+    "load_graph_artifact",
 ]
@@ -0,0 +1,165 @@
+"""
+Load the binary knowledge-graph artifact into a :class:`KnowledgeGraph`.
+
+The artifact is the ``graph_artifact/`` directory written by the knowledge
+graph builder (``gpuserver_tasks/task1_build_knowledge_graph.py``) and
+memory-mapped by the graph explorer:
+
+    nodes.arrow          Arrow IPC table, one row per node: ``id`` and the
+                         node attributes (``type``, ``is_focus``, ...)
+    edges.arrow          Arrow IPC table, one row per edge in CSR order
+    indptr.npy           int64[n + 1]; node i's edges are rows
+                         ``indptr[i]:indptr[i + 1]`` of edges.arrow
+    indices.npy          int32[m] target node of each edge
+    reverse_*.npy        incoming-edge CSR, used by the explorer
+    id_order.npy         node rows sorted by id, used by the explorer
+    metadata.json        format version, counts, JSON-encoded column names
+
+Node and edge ``type`` strings are matched against :class:`NodeType` and
+:class:`EdgeType` values.  Builder types outside the schema (``Chemical``,
+``INTERACTS_WITH``, ...) are skipped unless mapped with ``node_types`` /
+``edge_types``, as are edges with a skipped endpoint.  The remaining
+attributes become ``properties``; JSON-encoded values come back as lists
+and dicts.
+
+Usage::
+
+    kg = load_graph_artifact(
+        "/data/knowledge_graph/output/graph_artifact",
+        edge_types={"INTERACTS_WITH": EdgeType.BINDS},
+    )
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from src.data.graph.knowledge_graph import KnowledgeGraph
+from src.data.graph.schema import (
+    EdgeType,
+    GraphEdge,
+    GraphNode,
+    NodeType,
+    PathwayDefinition,
+)
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT = "knowledge-graph-artifact"
+ARTIFACT_VERSION = 1
+
+
+def load_graph_artifact(
+    path: str | Path,
+    kg: KnowledgeGraph | None = None,
+    node_types: dict[str, NodeType] | None = None,
+    edge_types: dict[str, EdgeType] | None = None,
+) -> KnowledgeGraph:
+    """Load a graph artifact directory into a knowledge graph.
+
+    The nodes and edges are loaded as one pathway
+    (``KnowledgeGraph.load_pathway``), so ``PARTICIPATES_IN`` membership
+    and the optional Neo4j mirror are handled as for curated pathways.
+
+    Args:
+        path: The ``graph_artifact`` directory.
+        kg: Graph to load into; a new one is created if None.  Nodes it
+            already has are kept as they are.
+        node_types: Extra node ``type`` string -> NodeType mappings.
+        edge_types: Extra edge ``type`` string -> EdgeType mappings.
+
+    Returns:
+        The graph the artifact was loaded into.
+
+    Raises:
+        FileNotFoundError: If an artifact file is missing.
+        ValueError: If the artifact has an unknown format or version, or its
+            tables and adjacency arrays disagree.
+    """
+    path = Path(path)
+    with open(path / "metadata.json") as f:
+        meta = json.load(f)
+    if meta.get("format") != ARTIFACT_FORMAT or meta.get("version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Unsupported graph artifact {meta.get('format')!r} "
+            f"version {meta.get('version')!r} at {path}"
+        )
+
+    nodes = _read_table(path / "nodes.arrow")
+    edges = _read_table(path / "edges.arrow")
+    indptr = np.load(path / "indptr.npy", mmap_mode="r")
+    targets = np.load(path / "indices.npy", mmap_mode="r")
+    n, m = nodes.num_rows, len(targets)
+    if (len(indptr) != n + 1 or int(indptr[-1]) != m
+            or (edges.num_columns and edges.num_rows != m)):
+        raise ValueError(f"Graph artifact tables and adjacency disagree at {path}")
+    sources = np.repeat(np.arange(n), np.diff(indptr))
+
+    json_columns = meta.get("json_columns", {})
+    node_map = {t.value: t for t in NodeType} | (node_types or {})
+    edge_map = {t.value: t for t in EdgeType} | (edge_types or {})
+
+    ids = nodes.column("id").to_pylist()
+    graph_nodes: list[GraphNode | None] = []
+    for node_id, attrs in zip(
+        ids, _records(nodes, json_columns.get("nodes", []), n), strict=True,
+    ):
+        attrs.pop("id", None)
+        node_type = node_map.get(attrs.pop("type", None))
+        if node_type is None:
+            graph_nodes.append(None)
+            continue
+        name = attrs.pop("name", node_id)
+        graph_nodes.append(GraphNode(node_id, node_type, str(name), attrs))
+
+    graph_edges: list[GraphEdge] = []
+    for s, t, attrs in zip(
+        sources.tolist(), targets.tolist(), _records(edges, json_columns.get("edges", []), m),
+        strict=True,
+    ):
+        edge_type = edge_map.get(attrs.pop("type", None))
+        if edge_type is None or graph_nodes[s] is None or graph_nodes[t] is None:
+            continue
+        weight = attrs.pop("weight", 1.0)
+        graph_edges.append(GraphEdge(ids[s], ids[t], edge_type, float(weight), attrs))
+
+    loaded_nodes = [node for node in graph_nodes if node is not None]
+    logger.info(
+        "Graph artifact %s: %d/%d nodes and %d/%d edges have schema types",
+        path, len(loaded_nodes), n, len(graph_edges), m,
+    )
+
+    if kg is None:
+        kg = KnowledgeGraph()
+    kg.load_pathway(PathwayDefinition(
+        pathway_id=f"ARTIFACT:{path.name}",
+        name=str(meta.get("builder", path.name)),
+        description=f"Graph artifact built {meta.get('built', 'unknown')}",
+        nodes=loaded_nodes,
+        edges=graph_edges,
+    ))
+    return kg
+
+
+def _read_table(path: Path) -> pa.Table:
+    return pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+
+
+def _records(table: pa.Table, json_columns: list[str], num_rows: int) -> list[dict[str, Any]]:
+    """Row dicts without null attributes, with JSON columns decoded."""
+    if table.num_columns == 0:
+        return [{} for _ in range(num_rows)]
+    records = []
+    for row in table.to_pylist():
+        record = {k: v for k, v in row.items() if v is not None}
+        for key in json_columns:
+            if key in record:
+                record[key] = json.loads(record[key])
+        records.append(record)
+    return records
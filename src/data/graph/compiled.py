@@ -0,0 +1,462 @@
+"""
+Compiled (CSR) adjacency for the knowledge graph.
+
+:class:`CompiledGraph` is an immutable snapshot of a ``KnowledgeGraph``
+with nodes numbered ``0..n-1`` and edges stored in compressed sparse row
+form: for node ``i`` the outgoing edges are ``indptr[i]:indptr[i + 1]`` of
+the ``neighbors`` / ``edge_ids`` arrays.  Within a node, edges keep their
+insertion order, so traversals visit them in the same order as the
+dict-of-lists adjacency they replace.
+
+A CSR restricted to a set of edge types is built on first use and cached,
+so type-filtered traversals (``get_upstream_causes`` follows five causal
+edge types) run on a graph that contains only the edges they can follow.
+Traversals work on Python lists of integers taken from the arrays once per
+CSR, which avoids string hashing and ``GraphEdge`` attribute lookups in the
+inner loops.
+
+Path queries first run a reverse breadth-first search from the target to
+get each node's hop distance to it, and never extend a partial path into a
+node that cannot reach the target within the remaining hops.  On top of
+that:
+
+    enumerate_paths   all simple paths, breadth-first (exhaustive)
+    best_paths        the k highest-weight paths, best-first, stopping as
+                      soon as k are known
+    shortest_hops     reachability by bidirectional breadth-first search
+
+Enumeration and best-first search accept a ``node_budget`` that caps the
+number of partial paths expanded per query.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.data.graph.schema import EdgeType, GraphEdge
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_TYPE_CODES: dict[EdgeType, int] = {t: i for i, t in enumerate(EdgeType)}
+
+# Added to best-first bounds so float rounding never makes them inadmissible
+_BOUND_SLACK = 1e-9
+
+
+@dataclass(frozen=True)
+class CSRAdjacency:
+    """One direction of the adjacency, optionally restricted by edge type.
+
+    Attributes:
+        indptr: ``int64[n + 1]`` row offsets.
+        neighbors: Node index at the other end of each edge.
+        edge_ids: Position of each edge in the graph's edge list.
+    """
+
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    edge_ids: np.ndarray
+
+    def row(self, node: int) -> np.ndarray:
+        """Edge IDs incident to ``node``, in insertion order."""
+        return self.edge_ids[self.indptr[node]:self.indptr[node + 1]]
+
+
+class CompiledGraph:
+    """Integer-indexed CSR snapshot of a knowledge graph.
+
+    Usage::
+
+        compiled = CompiledGraph(node_ids, edges)
+        paths, truncated = compiled.best_paths(src, tgt, k=3, max_hops=4)
+    """
+
+    def __init__(self, node_ids: Iterable[str], edges: list[GraphEdge]) -> None:
+        """Compile the graph.
+
+        Args:
+            node_ids: All node IDs; their order defines the node indices.
+            edges: All edges, in insertion order.  Every endpoint must be in
+                ``node_ids``.
+        """
+        self.node_ids: list[str] = list(node_ids)
+        self.index: dict[str, int] = {nid: i for i, nid in enumerate(self.node_ids)}
+        m = len(edges)
+
+        self.sources = np.fromiter(
+            (self.index[e.source_id] for e in edges), dtype=np.int64, count=m,
+        )
+        self.targets = np.fromiter(
+            (self.index[e.target_id] for e in edges), dtype=np.int64, count=m,
+        )
+        self.weights = np.fromiter((e.weight for e in edges), dtype=np.float64, count=m)
+        self.type_codes = np.fromiter(
+            (_TYPE_CODES[e.edge_type] for e in edges), dtype=np.int16, count=m,
+        )
+
+        # A path hop (source, type, target) is scored by the first edge with
+        # that key, which is what a scan of the adjacency list would find
+        first_weight: dict[tuple[int, int, int], float] = {}
+        for key, w in zip(
+            zip(self.sources.tolist(), self.type_codes.tolist(), self.targets.tolist(),
+                strict=True),
+            self.weights.tolist(),
+            strict=True,
+        ):
+            first_weight.setdefault(key, w)
+        self._hop_weights: list[float] = [
+            first_weight[key] for key in zip(
+                self.sources.tolist(), self.type_codes.tolist(), self.targets.tolist(),
+                strict=True,
+            )
+        ]
+        self._weights: list[float] = self.weights.tolist()
+
+        self._csr: dict[tuple[str, frozenset[int] | None], CSRAdjacency] = {}
+        self._lists: dict[tuple[str, frozenset[int] | None], tuple[list[int], ...]] = {}
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.weights)
+
+    # ------------------------------------------------------------------
+    # Adjacency
+    # ------------------------------------------------------------------
+
+    def adjacency(
+        self,
+        direction: str = "outgoing",
+        edge_types: Iterable[EdgeType] | None = None,
+    ) -> CSRAdjacency:
+        """CSR adjacency in one direction, restricted to ``edge_types``.
+
+        Args:
+            direction: ``'outgoing'`` (rows are sources) or ``'incoming'``
+                (rows are targets).
+            edge_types: Edge types to keep; ``None`` keeps all.
+        """
+        key = self._key(direction, edge_types)
+        csr = self._csr.get(key)
+        if csr is None:
+            direction, codes = key
+            if codes is None:
+                edge_ids = np.arange(self.edge_count, dtype=np.int64)
+            else:
+                mask = np.isin(self.type_codes, np.fromiter(codes, dtype=np.int16))
+                edge_ids = np.flatnonzero(mask)
+            rows, cols = (
+                (self.sources, self.targets) if direction == "outgoing"
+                else (self.targets, self.sources)
+            )
+            # Stable sort keeps insertion order within each row
+            order = edge_ids[np.argsort(rows[edge_ids], kind="stable")]
+            indptr = np.zeros(self.node_count + 1, dtype=np.int64)
+            np.cumsum(np.bincount(rows[order], minlength=self.node_count), out=indptr[1:])
+            csr = CSRAdjacency(indptr, cols[order], order)
+            self._csr[key] = csr
+        return csr
+
+    def neighbor_edges(
+        self,
+        node: int,
+        direction: str = "outgoing",
+        edge_types: Iterable[EdgeType] | None = None,
+    ) -> list[int]:
+        """Edge IDs incident to ``node`` (``'both'``: outgoing then incoming)."""
+        if direction == "both":
+            return (
+                self.neighbor_edges(node, "outgoing", edge_types)
+                + self.neighbor_edges(node, "incoming", edge_types)
+            )
+        indptr, _, edge_ids = self._adjacency_lists(direction, edge_types)
+        return edge_ids[indptr[node]:indptr[node + 1]]
+
+    # ------------------------------------------------------------------
+    # Traversals
+    # ------------------------------------------------------------------
+
+    def enumerate_paths(
+        self,
+        source: int,
+        target: int,
+        max_hops: int,
+        edge_types: Iterable[EdgeType] | None = None,
+        node_budget: int | None = None,
+    ) -> tuple[list[tuple[tuple[int, ...], float]], bool]:
+        """All simple paths from ``source`` to ``target``, breadth-first.
+
+        Returns:
+            ``(paths, truncated)``: ``(edge_ids, weight)`` per path in
+            discovery order, where the weight is the sum of the path's hop
+            weights, and whether ``node_budget`` stopped the search early.
+        """
+        indptr, neighbors, edge_ids = self._adjacency_lists("outgoing", edge_types)
+        hop_weights = self._hop_weights
+        dist = self.hop_distances(target, max_hops, edge_types)
+        found: list[tuple[tuple[int, ...], float]] = []
+        if source not in dist:
+            return found, False
+
+        # Each entry carries the nodes on its path, so there is no shared
+        # visited set to copy; tuples of at most max_hops + 1 ints are cheap
+        queue: deque[tuple[int, tuple[int, ...], tuple[int, ...], float]] = deque()
+        queue.append((source, (source,), (), 0.0))
+        expanded = 0
+        while queue:
+            current, nodes, path, weight = queue.popleft()
+            if current == target and path:
+                found.append((path, weight))
+                continue
+            if len(path) >= max_hops:
+                continue
+            if node_budget is not None and expanded >= node_budget:
+                return found, True
+            expanded += 1
+            remaining = max_hops - len(path) - 1
+            for j in range(indptr[current], indptr[current + 1]):
+                nxt = neighbors[j]
+                if nxt not in nodes and dist.get(nxt, remaining + 1) <= remaining:
+                    e = edge_ids[j]
+                    queue.append((nxt, (*nodes, nxt), (*path, e), weight + hop_weights[e]))
+        return found, False
+
+    def best_paths(
+        self,
+        source: int,
+        target: int,
+        k: int,
+        max_hops: int,
+        edge_types: Iterable[EdgeType] | None = None,
+        node_budget: int | None = None,
+    ) -> tuple[list[tuple[tuple[int, ...], float]], bool]:
+        """The ``k`` highest-weight simple paths, best-first.
+
+        Partial paths are ordered by an upper bound on the weight of any
+        completion (each remaining hop weighs at most the heaviest edge), so
+        a complete path leaves the heap only once no partial path can beat
+        it, and the search stops after ``k`` of them.  Ties are broken
+        exactly as ``enumerate_paths`` orders paths (fewer hops first, then
+        adjacency order), so the first path is the first maximum of the
+        exhaustive enumeration.
+
+        Returns:
+            ``(paths, truncated)`` as for :meth:`enumerate_paths`, with
+            paths in descending weight.
+        """
+        csr = self.adjacency("outgoing", edge_types)
+        indptr, neighbors, edge_ids = self._adjacency_lists("outgoing", edge_types)
+        hop_weights = self._hop_weights
+        dist = self.hop_distances(target, max_hops, edge_types)
+        found: list[tuple[tuple[int, ...], float]] = []
+        if k < 1 or source not in dist or source == target:
+            return found, False
+        w_max = float(self.weights[csr.edge_ids].max())
+
+        # Entries: (-priority, complete, hops, adjacency positions, node,
+        # nodes on path, edge ids, weight); partial paths sort before
+        # complete ones of equal priority so that ties are settled first
+        heap: list[tuple] = [
+            (-(max_hops * w_max + _BOUND_SLACK), 0, 0, (), source, (source,), (), 0.0),
+        ]
+        expanded = 0
+        while heap and len(found) < k:
+            _, complete, hops, positions, current, nodes, path, weight = heapq.heappop(heap)
+            if complete:
+                found.append((path, weight))
+                continue
+            if node_budget is not None and expanded >= node_budget:
+                return found, True
+            expanded += 1
+            remaining = max_hops - hops - 1
+            for j in range(indptr[current], indptr[current + 1]):
+                nxt = neighbors[j]
+                if nxt in nodes or dist.get(nxt, remaining + 1) > remaining:
+                    continue
+                e = edge_ids[j]
+                w = weight + hop_weights[e]
+                if nxt == target:
+                    entry = (-w, 1, hops + 1, (*positions, j), nxt, nodes, (*path, e), w)
+                else:
+                    bound = w + remaining * w_max + _BOUND_SLACK
+                    entry = (-bound, 0, hops + 1, (*positions, j), nxt,
+                             (*nodes, nxt), (*path, e), w)
+                heapq.heappush(heap, entry)
+        return found, False
+
+    def shortest_hops(
+        self,
+        source: int,
+        target: int,
+        max_hops: int,
+        edge_types: Iterable[EdgeType] | None = None,
+    ) -> int | None:
+        """Length of the shortest path (at least one hop), or None.
+
+        Bidirectional breadth-first search: the smaller frontier is expanded
+        one full level at a time until the two searches meet.
+        """
+        if source == target:
+            return None
+        out_ptr, out_nbrs, _ = self._adjacency_lists("outgoing", edge_types)
+        in_ptr, in_nbrs, _ = self._adjacency_lists("incoming", edge_types)
+        seen_fwd = {source: 0}
+        seen_bwd = {target: 0}
+        front_fwd, front_bwd = [source], [target]
+        depth_fwd = depth_bwd = 0
+
+        while front_fwd and front_bwd and depth_fwd + depth_bwd < max_hops:
+            if len(front_fwd) <= len(front_bwd):
+                depth_fwd += 1
+                front_fwd, best = _expand_level(
+                    front_fwd, out_ptr, out_nbrs, seen_fwd, seen_bwd, depth_fwd,
+                )
+            else:
+                depth_bwd += 1
+                front_bwd, best = _expand_level(
+                    front_bwd, in_ptr, in_nbrs, seen_bwd, seen_fwd, depth_bwd,
+                )
+            if best is not None:
+                return best if best <= max_hops else None
+        return None
+
+    def shortest_path(
+        self,
+        source: int,
+        target: int,
+        max_hops: int,
+        edge_types: Iterable[EdgeType] | None = None,
+    ) -> tuple[int, ...] | None:
+        """Edge ids of a shortest path (at least one hop), or None.
+
+        Walks down the hop distances to ``target``, taking the first edge
+        in adjacency order that gets one hop closer, so the cost is one
+        backward BFS plus the path length.
+        """
+        if source == target:
+            return None
+        dist = self.hop_distances(target, max_hops, edge_types)
+        if source not in dist:
+            return None
+        indptr, neighbors, edge_ids = self._adjacency_lists("outgoing", edge_types)
+        path: list[int] = []
+        current = source
+        while current != target:
+            closer = dist[current] - 1
+            for j in range(indptr[current], indptr[current + 1]):
+                if dist.get(neighbors[j]) == closer:
+                    path.append(edge_ids[j])
+                    current = neighbors[j]
+                    break
+        return tuple(path)
+
+    def hop_distances(
+        self,
+        target: int,
+        max_hops: int,
+        edge_types: Iterable[EdgeType] | None = None,
+    ) -> dict[int, int]:
+        """Hops from every node within ``max_hops`` of ``target`` to it."""
+        indptr, neighbors, _ = self._adjacency_lists("incoming", edge_types)
+        dist = {target: 0}
+        frontier = [target]
+        for depth in range(1, max_hops + 1):
+            nxt = []
+            for v in frontier:
+                for j in range(indptr[v], indptr[v + 1]):
+                    u = neighbors[j]
+                    if u not in dist:
+                        dist[u] = depth
+                        nxt.append(u)
+            if not nxt:
+                break
+            frontier = nxt
+        return dist
+
+    def upstream_weights(
+        self,
+        start: int,
+        max_depth: int,
+        edge_types: Iterable[EdgeType],
+    ) -> dict[int, float]:
+        """Reverse breadth-first walk from ``start`` over ``edge_types``.
+
+        Returns:
+            Node index -> product of edge weights along the first path that
+            reached it, in visiting order (``start`` itself excluded).
+        """
+        indptr, neighbors, edge_ids = self._adjacency_lists("incoming", edge_types)
+        weights = self._weights
+        results: dict[int, float] = {}
+        visited: set[int] = set()
+        queue: deque[tuple[int, float, int]] = deque()
+        queue.append((start, 1.0, 0))
+
+        while queue:
+            current, cumulative, depth = queue.popleft()
+            if depth > max_depth or current in visited:
+                continue
+            visited.add(current)
+            if current != start:
+                results[current] = max(results.get(current, 0.0), cumulative)
+            for j in range(indptr[current], indptr[current + 1]):
+                queue.append((neighbors[j], cumulative * weights[edge_ids[j]], depth + 1))
+        return results
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(
+        direction: str, edge_types: Iterable[EdgeType] | None,
+    ) -> tuple[str, frozenset[int] | None]:
+        if direction not in ("outgoing", "incoming"):
+            raise ValueError(f"direction must be 'outgoing' or 'incoming', got {direction!r}")
+        codes = None if edge_types is None else frozenset(_TYPE_CODES[t] for t in edge_types)
+        return direction, codes
+
+    def _adjacency_lists(
+        self, direction: str, edge_types: Iterable[EdgeType] | None,
+    ) -> tuple[list[int], ...]:
+        key = self._key(direction, edge_types)
+        lists = self._lists.get(key)
+        if lists is None:
+            csr = self.adjacency(direction, edge_types)
+            lists = (csr.indptr.tolist(), csr.neighbors.tolist(), csr.edge_ids.tolist())
+            self._lists[key] = lists
+        return lists
+
+
+def _expand_level(
+    frontier: list[int],
+    indptr: list[int],
+    neighbors: list[int],
+    seen: dict[int, int],
+    seen_other: dict[int, int],
+    depth: int,
+) -> tuple[list[int], int | None]:
+    """Expand one BFS level; returns the next frontier and the shortest
+    total length through any node the other search has reached."""
+    nxt: list[int] = []
+    best: int | None = None
+    for v in frontier:
+        for j in range(indptr[v], indptr[v + 1]):
+            u = neighbors[j]
+            if u in seen:
+                continue
+            seen[u] = depth
+            nxt.append(u)
+            other = seen_other.get(u)
+            if other is not None and (best is None or depth + other < best):
+                best = depth + other
+    return nxt, best
@@ -4,15 +4,29 @@ Knowledge graph for biological pathway data.
 Provides an in-memory graph with an optional Neo4j backend. Supports pathway
 loading, traversal queries, patient similarity search, and mechanism validation
 used by the reasoning engine.
+
+Queries run on a compiled CSR snapshot of the graph (see
+:mod:`src.data.graph.compiled`).  The snapshot is built by :meth:`freeze`, or
+on the first query after a mutation, so a graph that is loaded once and then
+queried is compiled once.
+
+Results of path, upstream-cause and cytokine-pathway queries are memoized in a
+bounded LRU cache keyed by the query arguments and the graph version, which
+every mutation increments; hit/miss counters are reported by ``summary()``.
+
+``compute_patient_similarity`` compares two patients; nearest-neighbor
+search over a whole cohort is :mod:`src.data.graph.similarity`.
 """
 
 from __future__ import annotations
 
 import logging
-from collections import defaultdict, deque
+import threading
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
+from src.data.graph.compiled import CompiledGraph
 from src.data.graph.schema import (
     EdgeType,
     GraphEdge,
@@ -23,6 +37,17 @@ from src.data.graph.schema import (
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_QUERY_CACHE_SIZE = 4096
+
+# Partial paths expanded per bounded path query before it gives up
+DEFAULT_NODE_BUDGET = 50_000
+
+# Edges followed (in reverse) by get_upstream_causes
+_CAUSAL_EDGE_TYPES = frozenset({
+    EdgeType.TRIGGERS, EdgeType.CAUSES, EdgeType.ACTIVATES,
+    EdgeType.UPSTREAM_OF, EdgeType.AMPLIFIES,
+})
+
 
 # ---------------------------------------------------------------------------
 # Neo4j backend protocol (optional external dependency)
@@ -45,11 +70,14 @@ class PathQueryResult:
         paths: Each path is an ordered list of (node_id, edge_type, node_id) triples.
         min_hops: Shortest path length found.
         max_weight_path: The path with the highest cumulative edge weight.
+        truncated: True if the query's node budget ran out, so ``paths`` may
+            be incomplete.
     """
 
     paths: list[list[tuple[str, EdgeType, str]]]
     min_hops: int
     max_weight_path: list[tuple[str, EdgeType, str]]
+    truncated: bool = False
 
 
 @dataclass
@@ -80,13 +108,21 @@ class KnowledgeGraph:
         result = kg.find_paths("CYTOKINE:IL6", "AE:CRS")
     """
 
-    def __init__(self, neo4j_driver: Neo4jDriver | None = None) -> None:
+    def __init__(
+        self,
+        neo4j_driver: Neo4jDriver | None = None,
+        query_cache_size: int = _DEFAULT_QUERY_CACHE_SIZE,
+    ) -> None:
         """Initialize the knowledge graph.
 
         Args:
             neo4j_driver: Optional Neo4j driver instance. When provided, all
                 mutations are mirrored to the database.
+            query_cache_size: Maximum number of memoized query results; 0
+                disables the cache.
         """
+        if query_cache_size < 0:
+            raise ValueError("query_cache_size must be >= 0")
         self._nodes: dict[str, GraphNode] = {}
         self._edges: list[GraphEdge] = []
         self._adj: dict[str, list[GraphEdge]] = defaultdict(list)
@@ -94,6 +130,14 @@ class KnowledgeGraph:
         self._type_index: dict[NodeType, set[str]] = defaultdict(set)
         self._pathway_membership: dict[str, set[str]] = defaultdict(set)
         self._neo4j: Neo4jDriver | None = neo4j_driver
+        self._compiled: CompiledGraph | None = None
+
+        self._version = 0
+        self._query_cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._query_cache_size = query_cache_size
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
         logger.info("KnowledgeGraph initialized (neo4j=%s)", neo4j_driver is not None)
 
     # ------------------------------------------------------------------
@@ -110,6 +154,7 @@ class KnowledgeGraph:
             return
         self._nodes[node.node_id] = node
         self._type_index[node.node_type].add(node.node_id)
+        self._mutated()
 
     def add_edge(self, edge: GraphEdge) -> None:
         """Add a directed edge to the graph.
@@ -129,6 +174,7 @@ class KnowledgeGraph:
         self._edges.append(edge)
         self._adj[edge.source_id].append(edge)
         self._rev_adj[edge.target_id].append(edge)
+        self._mutated()
 
     def load_pathway(self, pathway: PathwayDefinition) -> int:
         """Load all nodes and edges from a PathwayDefinition.
@@ -168,6 +214,40 @@ class KnowledgeGraph:
 
         return added
 
+    def freeze(self) -> CompiledGraph:
+        """Compile the graph into integer-indexed CSR adjacency.
+
+        Queries compile the graph on demand, so calling this is optional; it
+        moves the cost to load time.  Any later mutation discards the
+        compiled form, and the next query recompiles it.
+
+        Returns:
+            The compiled graph.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledGraph(self._nodes, self._edges)
+            logger.info(
+                "Compiled KnowledgeGraph: %d nodes, %d edges",
+                self._compiled.node_count, self._compiled.edge_count,
+            )
+        return self._compiled
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the compiled form is current."""
+        return self._compiled is not None
+
+    @property
+    def version(self) -> int:
+        """Counter incremented by every mutation of the graph."""
+        return self._version
+
+    def _mutated(self) -> None:
+        self._version += 1
+        self._compiled = None
+        with self._cache_lock:
+            self._query_cache.clear()
+
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
@@ -211,20 +291,20 @@ class KnowledgeGraph:
             List of ``(edge, neighbor_node)`` tuples.
         """
         results: list[tuple[GraphEdge, GraphNode]] = []
+        compiled = self.freeze()
+        node = compiled.index.get(node_id)
+        if node is None:
+            return results
 
         if direction in ("outgoing", "both"):
-            for edge in self._adj.get(node_id, []):
-                if edge_types is None or edge.edge_type in edge_types:
-                    neighbor = self._nodes.get(edge.target_id)
-                    if neighbor is not None:
-                        results.append((edge, neighbor))
+            for e in compiled.neighbor_edges(node, "outgoing", edge_types):
+                edge = self._edges[e]
+                results.append((edge, self._nodes[edge.target_id]))
 
         if direction in ("incoming", "both"):
-            for edge in self._rev_adj.get(node_id, []):
-                if edge_types is None or edge.edge_type in edge_types:
-                    neighbor = self._nodes.get(edge.source_id)
-                    if neighbor is not None:
-                        results.append((edge, neighbor))
+            for e in compiled.neighbor_edges(node, "incoming", edge_types):
+                edge = self._edges[e]
+                results.append((edge, self._nodes[edge.source_id]))
 
         return results
 
@@ -234,14 +314,20 @@ class KnowledgeGraph:
         target_id: str,
         max_hops: int = 6,
         edge_types: set[EdgeType] | None = None,
+        node_budget: int | None = None,
     ) -> PathQueryResult:
         """Find all simple paths between two nodes using BFS.
 
+        The number of paths grows combinatorially with ``max_hops`` on dense
+        graphs; use :meth:`has_path` for existence and :meth:`top_k_paths`
+        for the best paths.
+
         Args:
             source_id: Starting node ID.
             target_id: Destination node ID.
             max_hops: Maximum path length to search.
             edge_types: Restrict traversal to these edge types.
+            node_budget: Maximum partial paths to expand; None is unbounded.
 
         Returns:
             A PathQueryResult with all discovered paths.
@@ -249,53 +335,177 @@ class KnowledgeGraph:
         if source_id not in self._nodes or target_id not in self._nodes:
             return PathQueryResult(paths=[], min_hops=0, max_weight_path=[])
 
-        all_paths: list[list[tuple[str, EdgeType, str]]] = []
-
-        # BFS with path tracking
-        queue: deque[tuple[str, list[tuple[str, EdgeType, str]], set[str]]] = deque()
-        queue.append((source_id, [], {source_id}))
+        key = (
+            "find_paths", source_id, target_id, max_hops,
+            None if edge_types is None else frozenset(edge_types), node_budget,
+            self._version,
+        )
+        result = self._cached(key)
+        if result is None:
+            compiled = self.freeze()
+            found, truncated = compiled.enumerate_paths(
+                compiled.index[source_id], compiled.index[target_id],
+                max_hops, edge_types, node_budget,
+            )
+            # Highest-weight path (first one on ties)
+            best = max(range(len(found)), key=lambda i: found[i][1], default=0)
+            result = self._path_result(found, best, truncated)
+            self._store(key, result)
+        return _copy_result(result)
 
-        while queue:
-            current, path, visited = queue.popleft()
+    def top_k_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        k: int = 5,
+        max_hops: int = 6,
+        edge_types: set[EdgeType] | None = None,
+        node_budget: int | None = DEFAULT_NODE_BUDGET,
+    ) -> PathQueryResult:
+        """Find the ``k`` highest-weight simple paths between two nodes.
 
-            if len(path) > max_hops:
-                continue
+        Best-first search that stops as soon as the ``k`` best paths are
+        known, instead of enumerating every path.  Path weight is the sum
+        of edge weights, as for ``find_paths``; with ``k=1`` the result's
+        ``max_weight_path`` is the one ``find_paths`` would pick.
 
-            if current == target_id and path:
-                all_paths.append(path)
-                continue
+        Args:
+            source_id: Starting node ID.
+            target_id: Destination node ID.
+            k: Number of paths to return.
+            max_hops: Maximum path length to search.
+            edge_types: Restrict traversal to these edge types.
+            node_budget: Maximum partial paths to expand; None is unbounded.
+                If it runs out, the paths found so far are returned and
+                ``truncated`` is set.
 
-            for edge in self._adj.get(current, []):
-                if edge_types is not None and edge.edge_type not in edge_types:
-                    continue
-                if edge.target_id not in visited:
-                    new_visited = visited | {edge.target_id}
-                    new_path = path + [(edge.source_id, edge.edge_type, edge.target_id)]
-                    queue.append((edge.target_id, new_path, new_visited))
+        Returns:
+            A PathQueryResult with up to ``k`` paths in descending weight;
+            ``min_hops`` is the shortest of those paths.
 
-        if not all_paths:
+        Raises:
+            ValueError: If ``k`` is less than 1.
+        """
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        if source_id not in self._nodes or target_id not in self._nodes:
             return PathQueryResult(paths=[], min_hops=0, max_weight_path=[])
 
-        min_hops = min(len(p) for p in all_paths)
+        key = (
+            "top_k_paths", source_id, target_id, k, max_hops,
+            None if edge_types is None else frozenset(edge_types), node_budget,
+            self._version,
+        )
+        result = self._cached(key)
+        if result is None:
+            compiled = self.freeze()
+            found, truncated = compiled.best_paths(
+                compiled.index[source_id], compiled.index[target_id],
+                k, max_hops, edge_types, node_budget,
+            )
+            result = self._path_result(found, 0, truncated)
+            self._store(key, result)
+        return _copy_result(result)
+
+    def shortest_path_length(
+        self,
+        source_id: str,
+        target_id: str,
+        max_hops: int = 6,
+        edge_types: set[EdgeType] | None = None,
+    ) -> int | None:
+        """Hops on the shortest path from source to target, by bidirectional BFS.
+
+        Returns:
+            The path length (at least 1), or None if there is no path of at
+            most ``max_hops`` hops.
+        """
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return None
+
+        key = (
+            "shortest_path_length", source_id, target_id, max_hops,
+            None if edge_types is None else frozenset(edge_types), self._version,
+        )
+        hit = self._cached(key)
+        if hit is not None:
+            return hit[0]
+        compiled = self.freeze()
+        hops = compiled.shortest_hops(
+            compiled.index[source_id], compiled.index[target_id], max_hops, edge_types,
+        )
+        self._store(key, (hops,))
+        return hops
+
+    def shortest_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_hops: int = 6,
+        edge_types: set[EdgeType] | None = None,
+    ) -> list[tuple[str, EdgeType, str]] | None:
+        """A fewest-hops path from source to target, found by BFS.
+
+        Unlike ``find_paths`` and ``top_k_paths`` this never needs a node
+        budget, so it is the bounded fallback when a weighted search is
+        truncated before finding anything.
 
-        # Find highest-weight path
-        def _path_weight(path: list[tuple[str, EdgeType, str]]) -> float:
-            total = 0.0
-            for src, etype, tgt in path:
-                for edge in self._adj.get(src, []):
-                    if edge.target_id == tgt and edge.edge_type == etype:
-                        total += edge.weight
-                        break
-            return total
+        Returns:
+            The path as ``(source, edge_type, target)`` triples, or None if
+            there is no path of at most ``max_hops`` hops.
+        """
+        if source_id not in self._nodes or target_id not in self._nodes:
+            return None
+
+        key = (
+            "shortest_path", source_id, target_id, max_hops,
+            None if edge_types is None else frozenset(edge_types), self._version,
+        )
+        hit = self._cached(key)
+        if hit is None:
+            compiled = self.freeze()
+            edge_ids = compiled.shortest_path(
+                compiled.index[source_id], compiled.index[target_id], max_hops, edge_types,
+            )
+            hit = (None if edge_ids is None else self._edge_triples(edge_ids),)
+            self._store(key, hit)
+        return None if hit[0] is None else list(hit[0])
 
-        max_weight_path = max(all_paths, key=_path_weight)
+    def has_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_hops: int = 6,
+        edge_types: set[EdgeType] | None = None,
+    ) -> bool:
+        """Whether a directed path of at most ``max_hops`` hops exists."""
+        return self.shortest_path_length(source_id, target_id, max_hops, edge_types) is not None
 
+    def _path_result(
+        self,
+        found: list[tuple[tuple[int, ...], float]],
+        best: int,
+        truncated: bool,
+    ) -> PathQueryResult:
+        if not found:
+            return PathQueryResult(
+                paths=[], min_hops=0, max_weight_path=[], truncated=truncated,
+            )
+        paths = [self._edge_triples(edge_ids) for edge_ids, _ in found]
         return PathQueryResult(
-            paths=all_paths,
-            min_hops=min_hops,
-            max_weight_path=max_weight_path,
+            paths=paths,
+            min_hops=min(len(p) for p in paths),
+            max_weight_path=paths[best],
+            truncated=truncated,
         )
 
+    def _edge_triples(self, edge_ids: tuple[int, ...]) -> list[tuple[str, EdgeType, str]]:
+        edges = self._edges
+        return [
+            (edges[e].source_id, edges[e].edge_type, edges[e].target_id)
+            for e in edge_ids
+        ]
+
     def get_upstream_causes(
         self,
         adverse_event_id: str,
@@ -313,65 +523,58 @@ class KnowledgeGraph:
         Returns:
             List of ``(node, cumulative_weight)`` sorted by weight descending.
         """
-        causal_types = {
-            EdgeType.TRIGGERS, EdgeType.CAUSES, EdgeType.ACTIVATES,
-            EdgeType.UPSTREAM_OF, EdgeType.AMPLIFIES,
-        }
-
-        results: dict[str, float] = {}
-        visited: set[str] = set()
-        queue: deque[tuple[str, float, int]] = deque()
-        queue.append((adverse_event_id, 1.0, 0))
-
-        while queue:
-            current, cumulative, depth = queue.popleft()
-
-            if depth > max_depth:
-                continue
-            if current in visited:
-                continue
-            visited.add(current)
-
-            if current != adverse_event_id:
-                results[current] = max(results.get(current, 0.0), cumulative)
-
-            for edge in self._rev_adj.get(current, []):
-                if edge.edge_type in causal_types:
-                    queue.append((edge.source_id, cumulative * edge.weight, depth + 1))
-
-        ranked = [
-            (self._nodes[nid], weight)
-            for nid, weight in results.items()
-            if nid in self._nodes
-        ]
-        ranked.sort(key=lambda x: x[1], reverse=True)
-        return ranked
+        key = ("get_upstream_causes", adverse_event_id, max_depth, self._version)
+        ranked = self._cached(key)
+        if ranked is None:
+            compiled = self.freeze()
+            start = compiled.index.get(adverse_event_id)
+            results = (
+                compiled.upstream_weights(start, max_depth, _CAUSAL_EDGE_TYPES)
+                if start is not None else {}
+            )
+            ranked = [
+                (self._nodes[compiled.node_ids[i]], weight)
+                for i, weight in results.items()
+            ]
+            ranked.sort(key=lambda x: x[1], reverse=True)
+            self._store(key, ranked)
+        return list(ranked)
 
     def validate_mechanism(
         self,
         cause_id: str,
         effect_id: str,
         required_intermediates: list[str] | None = None,
+        max_hops: int = 6,
+        node_budget: int | None = DEFAULT_NODE_BUDGET,
     ) -> tuple[bool, str]:
         """Validate that a causal mechanism exists between two entities.
 
-        Checks whether a directed path exists and optionally whether specified
-        intermediate nodes appear on at least one path.
+        Checks whether a directed path exists (bidirectional BFS) and
+        optionally whether specified intermediate nodes appear on at least
+        one path.  Only the intermediate check enumerates paths, within
+        ``node_budget``.
 
         Args:
             cause_id: The proposed causal entity.
             effect_id: The proposed effect entity.
             required_intermediates: Node IDs that must appear on the path.
+            max_hops: Maximum path length.
+            node_budget: Maximum partial paths to expand when searching for
+                a path through the intermediates.
 
         Returns:
             Tuple of ``(is_valid, explanation)``.
         """
-        result = self.find_paths(cause_id, effect_id, max_hops=6)
+        min_hops = self.shortest_path_length(cause_id, effect_id, max_hops)
 
-        if not result.paths:
+        if min_hops is None:
             return False, f"No mechanistic path found from '{cause_id}' to '{effect_id}'"
 
         if required_intermediates:
+            result = self.find_paths(
+                cause_id, effect_id, max_hops=max_hops, node_budget=node_budget,
+            )
             for path in result.paths:
                 path_nodes = set()
                 for src, _, tgt in path:
@@ -390,15 +593,13 @@ class KnowledgeGraph:
                     for p in result.paths
                 )
             ]
+            searched = " (search truncated)" if result.truncated else ""
             return False, (
-                f"Path exists ({result.min_hops} hops) but missing required "
-                f"intermediates: {missing}"
+                f"Path exists ({min_hops} hops) but missing required "
+                f"intermediates: {missing}{searched}"
             )
 
-        return True, (
-            f"Valid mechanism: {result.min_hops}-hop path found "
-            f"({len(result.paths)} total paths)"
-        )
+        return True, f"Valid mechanism: {min_hops}-hop path found"
 
     def compute_patient_similarity(
         self,
@@ -420,22 +621,8 @@ class KnowledgeGraph:
         Returns:
             SimilarityResult with score, shared pathways, and unique pathways.
         """
-        def _active_pathways(cytokines: dict[str, float]) -> set[str]:
-            active = set()
-            for cyt_id, value in cytokines.items():
-                node = self._nodes.get(cyt_id)
-                if node is None:
-                    continue
-                normal_range = node.properties.get("normal_range_pg_ml")
-                if normal_range and value > normal_range[1] * threshold_multiplier:
-                    # Find pathways this cytokine participates in
-                    for edge in self._adj.get(cyt_id, []):
-                        if edge.edge_type == EdgeType.PARTICIPATES_IN:
-                            active.add(edge.target_id)
-            return active
-
-        pathways_a = _active_pathways(patient_cytokines_a)
-        pathways_b = _active_pathways(patient_cytokines_b)
+        pathways_a = self.active_pathways(patient_cytokines_a, threshold_multiplier)
+        pathways_b = self.active_pathways(patient_cytokines_b, threshold_multiplier)
 
         intersection = pathways_a & pathways_b
         union = pathways_a | pathways_b
@@ -448,6 +635,68 @@ class KnowledgeGraph:
             unique_to_query=sorted(pathways_a - pathways_b),
         )
 
+    def active_pathways(
+        self,
+        cytokines: dict[str, float],
+        threshold_multiplier: float = 2.0,
+    ) -> set[str]:
+        """Pathways that a patient's elevated cytokines participate in.
+
+        Args:
+            cytokines: Cytokine node ID -> measured value.
+            threshold_multiplier: A cytokine is 'elevated' if its value
+                exceeds this multiple of the upper normal range.
+
+        Returns:
+            Set of pathway node IDs.
+        """
+        table = self._cytokine_pathways(threshold_multiplier)
+        active: set[str] = set()
+        for cyt_id, value in cytokines.items():
+            entry = table.get(cyt_id)
+            if entry is not None and value > entry[0]:
+                active.update(entry[1])
+        return active
+
+    def cytokine_pathway_map(
+        self,
+        threshold_multiplier: float = 2.0,
+    ) -> dict[str, tuple[float, tuple[str, ...]]]:
+        """Elevation cutoff and pathways for every node with a normal range.
+
+        Used by ``active_pathways`` and by
+        :class:`~src.data.graph.similarity.PatientSimilarityIndex`.
+
+        Returns:
+            Node ID -> ``(cutoff, pathway_ids)``, where a value above
+            ``cutoff`` (upper normal range times ``threshold_multiplier``)
+            activates the ``PARTICIPATES_IN`` targets ``pathway_ids``.
+            Nodes without pathways are omitted.
+        """
+        return dict(self._cytokine_pathways(threshold_multiplier))
+
+    def _cytokine_pathways(
+        self,
+        threshold_multiplier: float,
+    ) -> dict[str, tuple[float, tuple[str, ...]]]:
+        key = ("cytokine_pathway_map", threshold_multiplier, self._version)
+        table = self._cached(key)
+        if table is None:
+            table = {}
+            for node_id, node in self._nodes.items():
+                normal_range = node.properties.get("normal_range_pg_ml")
+                if not normal_range:
+                    continue
+                pathways = tuple(
+                    pathway.node_id for _, pathway in self.get_neighbors(
+                        node_id, {EdgeType.PARTICIPATES_IN},
+                    )
+                )
+                if pathways:
+                    table[node_id] = (normal_range[1] * threshold_multiplier, pathways)
+            self._store(key, table)
+        return table
+
     # ------------------------------------------------------------------
     # Stats
     # ------------------------------------------------------------------
@@ -481,8 +730,52 @@ class KnowledgeGraph:
             "node_counts": dict(node_counts),
             "edge_counts": dict(edge_counts),
             "pathways": sorted(self._pathway_membership.keys()),
+            "query_cache": self.query_cache_stats(),
         }
 
+    def query_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters of the query-result cache."""
+        with self._cache_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "version": self._version,
+                "entries": len(self._query_cache),
+                "max_entries": self._query_cache_size,
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            }
+
+    def clear_query_cache(self) -> None:
+        """Drop memoized query results (counters are kept)."""
+        with self._cache_lock:
+            self._query_cache.clear()
+
+    # ------------------------------------------------------------------
+    # Query cache (private)
+    # ------------------------------------------------------------------
+
+    def _cached(self, key: tuple) -> Any | None:
+        with self._cache_lock:
+            value = self._query_cache.get(key)
+            if value is None:
+                self._cache_misses += 1
+                return None
+            self._query_cache.move_to_end(key)
+            self._cache_hits += 1
+            return value
+
+    def _store(self, key: tuple, value: Any) -> None:
+        if self._query_cache_size == 0:
+            return
+        with self._cache_lock:
+            # A mutation since the query started makes the result stale
+            if key[-1] != self._version:
+                return
+            self._query_cache[key] = value
+            while len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+
     # ------------------------------------------------------------------
     # Neo4j sync (private)
     # ------------------------------------------------------------------
@@ -515,3 +808,13 @@ class KnowledgeGraph:
             logger.info("Synced pathway '%s' to Neo4j", pathway.pathway_id)
         except Exception:
             logger.exception("Failed to sync pathway '%s' to Neo4j", pathway.pathway_id)
+
+
+def _copy_result(result: PathQueryResult) -> PathQueryResult:
+    """Copy of a cached result, so callers cannot modify the cache."""
+    return PathQueryResult(
+        paths=[list(p) for p in result.paths],
+        min_hops=result.min_hops,
+        max_weight_path=list(result.max_weight_path),
+        truncated=result.truncated,
+    )
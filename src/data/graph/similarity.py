@@ -0,0 +1,406 @@
+"""
+Patient similarity index over knowledge-graph pathways.
+
+A patient's mechanistic profile is the set of pathways their elevated
+cytokines participate in (``KnowledgeGraph.active_pathways``).
+:class:`PatientSimilarityIndex` maps a cohort onto those sets once and then
+answers "which prior patients are most similar to this one" without a
+pairwise comparison per patient:
+
+    bitsets          each patient's pathway set is an integer bitmask over
+                     the graph's pathway vocabulary
+    inverted index   pathway -> patients with that pathway active; the
+                     intersection size with every candidate is one
+                     ``bincount`` over the query's posting lists, and
+                     patients sharing no pathway are never touched
+    MinHash / LSH    for large cohorts, banded MinHash signatures select
+                     candidates whose Jaccard is likely high; candidates are
+                     then scored exactly from their bitsets
+
+The per-slot arrays and posting lists grow in place as patients are added.
+Removing or replacing a patient leaves a dead slot behind; once dead slots
+outnumber live ones (and exceed ``compact_min_dead``) the index renumbers
+the live patients and rebuilds its postings and LSH buckets.
+
+The cytokine -> pathway mapping is taken from the graph when the index is
+built.  Adding patients or querying after the graph has changed raises
+``RuntimeError``; rebuild the index instead.
+
+Usage::
+
+    index = PatientSimilarityIndex(kg)
+    for patient_id, cytokines in registry:
+        index.add(patient_id, cytokines)
+    index.nearest(current_cytokines, k=20)   # [(patient_id, SimilarityResult)]
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.data.graph.knowledge_graph import KnowledgeGraph, SimilarityResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Live patients above which method="auto" switches from exact search to LSH
+_DEFAULT_LSH_THRESHOLD = 100_000
+_DEFAULT_NUM_PERM = 64
+_DEFAULT_BANDS = 16
+# Dead slots tolerated before they may trigger a compaction
+_DEFAULT_COMPACT_MIN_DEAD = 1024
+
+
+class PatientSimilarityIndex:
+    """Top-k Jaccard search over patients' active-pathway sets.
+
+    Usage::
+
+        index = PatientSimilarityIndex(kg, threshold_multiplier=2.0)
+        index.add("PT-001", {"CYTOKINE:IL6": 450.0, "CYTOKINE:IFNG": 90.0})
+        neighbors = index.nearest({"CYTOKINE:IL6": 300.0}, k=20)
+
+    Attributes:
+        pathway_ids: Pathway vocabulary; pathway ``i`` is bit ``i``.
+        threshold_multiplier: Elevation multiplier the index was built with.
+        graph_version: ``KnowledgeGraph.version`` when the index was built.
+    """
+
+    def __init__(
+        self,
+        kg: KnowledgeGraph,
+        threshold_multiplier: float = 2.0,
+        num_perm: int = _DEFAULT_NUM_PERM,
+        bands: int = _DEFAULT_BANDS,
+        lsh_threshold: int = _DEFAULT_LSH_THRESHOLD,
+        seed: int = 0,
+        compact_min_dead: int = _DEFAULT_COMPACT_MIN_DEAD,
+    ) -> None:
+        """Build an empty index for the graph's current pathways.
+
+        Args:
+            kg: Graph that defines cytokine normal ranges and pathway
+                participation.
+            threshold_multiplier: A cytokine is 'elevated' if its value
+                exceeds this multiple of the upper normal range, as in
+                ``KnowledgeGraph.compute_patient_similarity``.
+            num_perm: MinHash signature length.
+            bands: LSH bands; must divide ``num_perm``.  More bands (fewer
+                rows each) find lower-similarity neighbors at the cost of
+                more candidates.
+            lsh_threshold: Live patients above which ``method="auto"`` uses
+                LSH instead of the exact inverted-index search.
+            seed: Seed for the MinHash permutations.
+            compact_min_dead: Removed or replaced patients to accumulate
+                before compacting; compaction also waits until dead slots
+                outnumber live patients.
+
+        Raises:
+            ValueError: If ``bands`` does not divide ``num_perm``.
+        """
+        if num_perm < 1 or bands < 1 or num_perm % bands:
+            raise ValueError(
+                f"bands must divide num_perm, got num_perm={num_perm}, bands={bands}"
+            )
+        self.threshold_multiplier = threshold_multiplier
+        self._kg = kg
+        self.graph_version = kg.version
+        self._lsh_threshold = lsh_threshold
+        self._compact_min_dead = compact_min_dead
+
+        cytokines = kg.cytokine_pathway_map(threshold_multiplier)
+        self.pathway_ids: list[str] = sorted({
+            p for _, pathways in cytokines.values() for p in pathways
+        })
+        self._bit: dict[str, int] = {p: i for i, p in enumerate(self.pathway_ids)}
+        # cytokine ID -> (elevation cutoff, pathway bitmask)
+        self._cytokine_masks: dict[str, tuple[float, int]] = {
+            cyt_id: (cutoff, self._mask(pathways))
+            for cyt_id, (cutoff, pathways) in cytokines.items()
+        }
+
+        # MinHash: row i of _ranks is a random permutation of the bit
+        # positions, and a set's signature is its minimum rank per row
+        rng = np.random.default_rng(seed)
+        n_bits = len(self.pathway_ids)
+        self._ranks = np.stack([
+            rng.permutation(n_bits) for _ in range(num_perm)
+        ]).astype(np.int32).reshape(num_perm, n_bits)
+        self._rows_per_band = num_perm // bands
+        self._bands = bands
+
+        self._slot: dict[str, int] = {}
+        self._reset_slots()
+
+    # ------------------------------------------------------------------
+    # Cohort
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._slot)
+
+    def __contains__(self, patient_id: object) -> bool:
+        return patient_id in self._slot
+
+    def add(self, patient_id: str, cytokines: dict[str, float]) -> None:
+        """Add a patient, replacing any earlier entry with the same ID.
+
+        Args:
+            patient_id: Registry identifier.
+            cytokines: Cytokine node ID -> measured value.
+
+        Raises:
+            RuntimeError: If the graph changed since the index was built.
+        """
+        self._check_graph()
+        self._add_mask(patient_id, self._cytokine_mask(cytokines))
+
+    def add_pathways(self, patient_id: str, pathway_ids: Iterable[str]) -> None:
+        """Add a patient from an already computed active-pathway set.
+
+        Pathways outside the index vocabulary are ignored.
+
+        Raises:
+            RuntimeError: If the graph changed since the index was built.
+        """
+        self._check_graph()
+        self._add_mask(
+            patient_id, self._mask(p for p in pathway_ids if p in self._bit),
+        )
+
+    def remove(self, patient_id: str) -> None:
+        """Remove a patient.
+
+        Raises:
+            KeyError: If the patient is not in the index.
+        """
+        slot = self._slot.pop(patient_id)
+        self._alive.data[slot] = False
+        dead = len(self._patient_ids) - len(self._slot)
+        if dead >= self._compact_min_dead and dead > len(self._slot):
+            self._compact()
+
+    def pathways(self, patient_id: str) -> list[str]:
+        """Sorted active pathways of an indexed patient."""
+        return self._pathway_list(self._masks[self._slot[patient_id]])
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def nearest(
+        self,
+        cytokines: dict[str, float],
+        k: int = 20,
+        method: str = "auto",
+        exclude: Iterable[str] = (),
+    ) -> list[tuple[str, SimilarityResult]]:
+        """The ``k`` indexed patients most similar to a cytokine profile.
+
+        Args:
+            cytokines: Cytokine node ID -> measured value for the query.
+            k: Number of neighbors to return.
+            method: ``"exact"`` (inverted index), ``"lsh"`` (MinHash
+                candidates, exactly rescored; may miss low-similarity
+                neighbors), or ``"auto"`` (LSH once the cohort exceeds
+                ``lsh_threshold``).
+            exclude: Patient IDs to leave out of the result.
+
+        Returns:
+            ``(patient_id, SimilarityResult)`` pairs in descending score,
+            ties in insertion order.  Patients sharing no active pathway
+            with the query (score 0) are not returned.
+
+        Raises:
+            ValueError: If ``k`` is less than 1 or ``method`` is unknown.
+            RuntimeError: If the graph changed since the index was built.
+        """
+        return self._nearest_mask(self._cytokine_mask(cytokines), k, method, exclude)
+
+    def nearest_to_patient(
+        self,
+        patient_id: str,
+        k: int = 20,
+        method: str = "auto",
+    ) -> list[tuple[str, SimilarityResult]]:
+        """The ``k`` patients most similar to an indexed patient (not itself).
+
+        Raises:
+            KeyError: If the patient is not in the index.
+            RuntimeError: If the graph changed since the index was built.
+        """
+        mask = self._masks[self._slot[patient_id]]
+        return self._nearest_mask(mask, k, method, (patient_id,))
+
+    def _nearest_mask(
+        self,
+        query: int,
+        k: int,
+        method: str,
+        exclude: Iterable[str],
+    ) -> list[tuple[str, SimilarityResult]]:
+        if k < 1:
+            raise ValueError(f"k must be >= 1, got {k}")
+        self._check_graph()
+        if method == "auto":
+            method = "lsh" if len(self) > self._lsh_threshold else "exact"
+        if method == "exact":
+            slots, inter = self._exact_candidates(query)
+        elif method == "lsh":
+            slots, inter = self._lsh_candidates(query)
+        else:
+            raise ValueError(f"method must be 'exact', 'lsh' or 'auto', got {method!r}")
+
+        excluded = {self._slot[p] for p in exclude if p in self._slot}
+        if excluded:
+            keep = ~np.isin(slots, list(excluded))
+            slots, inter = slots[keep], inter[keep]
+        if not slots.size:
+            return []
+
+        scores = inter / (query.bit_count() + self._sizes.view()[slots] - inter)
+        top = np.lexsort((slots, -scores))[:k]
+        return [
+            (self._patient_ids[s], self._result(query, self._masks[s], score))
+            for s, score in zip(slots[top].tolist(), scores[top].tolist(), strict=True)
+        ]
+
+    def _exact_candidates(self, query: int) -> tuple[np.ndarray, np.ndarray]:
+        """Live slots sharing a pathway with ``query`` and the overlap size."""
+        lists = [self._postings[bit].view() for bit in _bits(query)]
+        if not lists:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        counts = np.bincount(np.concatenate(lists), minlength=len(self._patient_ids))
+        slots = np.flatnonzero((counts > 0) & self._alive.view())
+        return slots, counts[slots]
+
+    def _lsh_candidates(self, query: int) -> tuple[np.ndarray, np.ndarray]:
+        """Live slots colliding with ``query`` in any LSH band."""
+        if not query:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        candidates: set[int] = set()
+        for bucket, key in zip(self._buckets, self._band_keys(query), strict=True):
+            candidates.update(bucket.get(key, ()))
+        alive = self._alive.data
+        slots = sorted(s for s in candidates if alive[s])
+        inter = [(query & self._masks[s]).bit_count() for s in slots]
+        keep = [i for i, n in enumerate(inter) if n]
+        return (
+            np.array([slots[i] for i in keep], dtype=np.int64),
+            np.array([inter[i] for i in keep], dtype=np.int64),
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _check_graph(self) -> None:
+        if self._kg.version != self.graph_version:
+            raise RuntimeError(
+                f"Knowledge graph changed since the similarity index was built "
+                f"(version {self.graph_version}, now {self._kg.version}); "
+                f"rebuild the index"
+            )
+
+    def _reset_slots(self) -> None:
+        """Empty per-slot storage (``_slot`` is maintained by the caller)."""
+        # Patients, by insertion slot; replaced or removed slots are dead
+        self._patient_ids: list[str] = []
+        self._masks: list[int] = []
+        self._sizes = _GrowableArray(np.float64)
+        self._alive = _GrowableArray(np.bool_)
+        self._postings = [_GrowableArray(np.int64) for _ in self.pathway_ids]
+        self._buckets: list[dict[bytes, list[int]]] = [
+            defaultdict(list) for _ in range(self._bands)
+        ]
+
+    def _add_mask(self, patient_id: str, mask: int) -> None:
+        if patient_id in self._slot:
+            self.remove(patient_id)
+        self._slot[patient_id] = self._append_slot(patient_id, mask)
+
+    def _append_slot(self, patient_id: str, mask: int) -> int:
+        slot = len(self._patient_ids)
+        self._patient_ids.append(patient_id)
+        self._masks.append(mask)
+        self._sizes.append(mask.bit_count())
+        self._alive.append(True)
+        for bit in _bits(mask):
+            self._postings[bit].append(slot)
+        if mask:
+            for bucket, key in zip(self._buckets, self._band_keys(mask), strict=True):
+                bucket[key].append(slot)
+        return slot
+
+    def _compact(self) -> None:
+        """Drop dead slots, renumbering live patients in insertion order."""
+        live = np.flatnonzero(self._alive.view()).tolist()
+        patients = [(self._patient_ids[s], self._masks[s]) for s in live]
+        self._reset_slots()
+        for patient_id, mask in patients:
+            self._slot[patient_id] = self._append_slot(patient_id, mask)
+
+    def _cytokine_mask(self, cytokines: dict[str, float]) -> int:
+        mask = 0
+        for cyt_id, value in cytokines.items():
+            entry = self._cytokine_masks.get(cyt_id)
+            if entry is not None and value > entry[0]:
+                mask |= entry[1]
+        return mask
+
+    def _mask(self, pathway_ids: Iterable[str]) -> int:
+        mask = 0
+        for pathway_id in pathway_ids:
+            mask |= 1 << self._bit[pathway_id]
+        return mask
+
+    def _pathway_list(self, mask: int) -> list[str]:
+        return [self.pathway_ids[bit] for bit in _bits(mask)]
+
+    def _band_keys(self, mask: int) -> list[bytes]:
+        signature = self._ranks[:, _bits(mask)].min(axis=1)
+        r = self._rows_per_band
+        return [
+            signature[i:i + r].tobytes() for i in range(0, len(signature), r)
+        ]
+
+    def _result(self, query: int, other: int, score: float) -> SimilarityResult:
+        return SimilarityResult(
+            score=score,
+            shared_pathways=self._pathway_list(query & other),
+            unique_to_query=self._pathway_list(query & ~other),
+        )
+
+
+def _bits(mask: int) -> list[int]:
+    """Set bit positions of ``mask``, ascending."""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return bits
+
+
+class _GrowableArray:
+    """NumPy array with amortized O(1) appends (capacity doubles when full)."""
+
+    __slots__ = ("data", "size")
+
+    def __init__(self, dtype: type, capacity: int = 16) -> None:
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, value: float | bool) -> None:
+        if self.size == len(self.data):
+            grown = np.zeros(2 * len(self.data), dtype=self.data.dtype)
+            grown[:self.size] = self.data
+            self.data = grown
+        self.data[self.size] = value
+        self.size += 1
+
+    def view(self) -> np.ndarray:
+        return self.data[:self.size]
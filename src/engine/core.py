@@ -21,6 +21,7 @@ from src.engine.orchestrator.router import (
     ModelBackend,
     ModelCapability,
     PromptRouter,
+    RoutingDecision,
     SafetyQuery,
 )
 from src.engine.orchestrator.normalizer import ResponseNormalizer, SafetyPrediction
@@ -77,6 +78,40 @@ class PredictionResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(frozen=True)
+class PipelineExecutionConfig:
+    """Execution settings for the per-adverse-event pipelines.
+
+    Attributes:
+        concurrent_events: Run the pipelines for each adverse event
+            concurrently in an asyncio task group instead of one after
+            another. Results are merged in the requested AE order, so the
+            output is identical to sequential mode apart from timing.
+        max_concurrent_events: Maximum number of AE pipelines in flight at
+            once for a single patient (only used in concurrent mode).
+        event_timeout_s: Per-AE pipeline timeout in seconds. ``None``
+            disables the timeout. Applies in both execution modes.
+        hedge_requests: If the primary model has not answered within its
+            observed p95 latency, fire the next-ranked fallback model and
+            keep whichever returns a valid prediction first.
+        max_hedged_requests: Maximum number of hedge calls per primary call.
+    """
+
+    concurrent_events: bool = False
+    max_concurrent_events: int = 3
+    event_timeout_s: float | None = None
+    hedge_requests: bool = False
+    max_hedged_requests: int = 1
+
+    def __post_init__(self) -> None:
+        if self.max_concurrent_events < 1:
+            raise ValueError("max_concurrent_events must be >= 1")
+        if self.max_hedged_requests < 0:
+            raise ValueError("max_hedged_requests must be >= 0")
+        if self.event_timeout_s is not None and self.event_timeout_s <= 0:
+            raise ValueError("event_timeout_s must be positive or None")
+
+
 # ---------------------------------------------------------------------------
 # SafetyEngine
 # ---------------------------------------------------------------------------
@@ -108,6 +143,8 @@ class SafetyEngine:
         knowledge_graph: KnowledgeGraph | None = None,
         gateway: SecureAPIGateway | None = None,
         model_backend: ModelBackend | None = None,
+        execution_config: PipelineExecutionConfig | None = None,
+        audit_trail: AuditTrail | None = None,
     ) -> None:
         """Initialize the Safety Engine.
 
@@ -117,10 +154,15 @@ class SafetyEngine:
             gateway: Secure API gateway for model calls. If None, model calls
                 will use the model_backend directly.
             model_backend: Direct model backend (alternative to gateway).
+            execution_config: How the per-adverse-event pipelines are
+                scheduled. Defaults to sequential execution with no timeout.
+            audit_trail: Audit trail to record into, e.g. one backed by
+                persistent storage. Defaults to an in-memory trail.
         """
         self._kg = knowledge_graph or KnowledgeGraph()
         self._gateway = gateway
         self._model_backend = model_backend
+        self._execution = execution_config or PipelineExecutionConfig()
 
         # Sub-components (initialized in initialize())
         self._router = PromptRouter()
@@ -130,7 +172,7 @@ class SafetyEngine:
         self._validator: MechanisticValidator | None = None
         self._scorer: PatientRiskScorer | None = None
         self._alert_engine = AlertEngine()
-        self._audit = AuditTrail()
+        self._audit = audit_trail or AuditTrail()
 
         self._initialized = False
 
@@ -156,6 +198,7 @@ class SafetyEngine:
             pathways = get_all_pathways()
             for pathway in pathways:
                 self._kg.load_pathway(pathway)
+            self._kg.freeze()
             logger.info(
                 "Loaded %d pathways (%d nodes, %d edges)",
                 len(pathways), self._kg.node_count, self._kg.edge_count,
@@ -238,24 +281,17 @@ class SafetyEngine:
         )
 
         # Process each adverse event
-        for ae in adverse_events:
-            try:
-                await self._process_adverse_event(
+        if self._execution.concurrent_events and len(adverse_events) > 1:
+            await self._process_adverse_events_concurrently(
+                patient, adverse_events, result, session_id,
+                generate_hypotheses, validate_predictions,
+            )
+        else:
+            for ae in adverse_events:
+                await self._run_adverse_event(
                     patient, ae, result, session_id,
                     generate_hypotheses, validate_predictions,
                 )
-            except Exception:
-                logger.exception(
-                    "Error processing %s for patient %s",
-                    ae.value, patient.patient_id,
-                )
-                self._audit.record(
-                    event_type=AuditEventType.ERROR,
-                    patient_id=patient.patient_id,
-                    session_id=session_id,
-                    actor="SafetyEngine",
-                    output_data={"adverse_event": ae.value, "error": "pipeline_failure"},
-                )
 
         pipeline_duration = int((time.monotonic() - pipeline_start) * 1000)
         result.pipeline_duration_ms = pipeline_duration
@@ -267,6 +303,114 @@ class SafetyEngine:
 
         return result
 
+    async def _process_adverse_events_concurrently(
+        self,
+        patient: PatientData,
+        adverse_events: list[AdverseEventType],
+        result: PredictionResult,
+        session_id: str,
+        generate_hypotheses: bool,
+        validate_predictions: bool,
+    ) -> None:
+        """Run the AE pipelines in a task group and merge them into ``result``.
+
+        Each pipeline writes into its own scratch ``PredictionResult`` so that
+        concurrent tasks never interleave writes to shared lists; the scratch
+        results are merged back in the order the AEs were requested. Audit
+        records carry ``session_id`` explicitly and therefore stay attributed
+        to this patient's session regardless of scheduling order.
+        """
+        semaphore = asyncio.Semaphore(self._execution.max_concurrent_events)
+        partials = {
+            ae: PredictionResult(
+                patient_id=patient.patient_id,
+                adverse_events=[ae],
+                session_id=session_id,
+            )
+            for ae in adverse_events
+        }
+
+        async def _bounded(ae: AdverseEventType) -> None:
+            async with semaphore:
+                await self._run_adverse_event(
+                    patient, ae, partials[ae], session_id,
+                    generate_hypotheses, validate_predictions,
+                )
+
+        async with asyncio.TaskGroup() as group:
+            for ae in adverse_events:
+                group.create_task(_bounded(ae))
+
+        for ae in adverse_events:
+            self._merge_partial_result(result, partials[ae])
+
+    @staticmethod
+    def _merge_partial_result(
+        result: PredictionResult,
+        partial: PredictionResult,
+    ) -> None:
+        """Merge a single-AE scratch result into the patient-level result."""
+        result.safety_indices.update(partial.safety_indices)
+        result.ensemble_predictions.update(partial.ensemble_predictions)
+        result.individual_predictions.update(partial.individual_predictions)
+        result.hypotheses.update(partial.hypotheses)
+        result.validation_reports.update(partial.validation_reports)
+        result.alerts.extend(partial.alerts)
+        result.metadata.update(partial.metadata)
+
+    async def _run_adverse_event(
+        self,
+        patient: PatientData,
+        adverse_event: AdverseEventType,
+        result: PredictionResult,
+        session_id: str,
+        generate_hypotheses: bool,
+        validate_predictions: bool,
+    ) -> None:
+        """Run one AE pipeline with timeout and failure isolation.
+
+        Failures and timeouts are logged and audited but never propagate, so
+        one adverse event cannot abort the assessment of the others.
+        """
+        timeout_s = self._execution.event_timeout_s
+        try:
+            async with asyncio.timeout(timeout_s):
+                await self._process_adverse_event(
+                    patient, adverse_event, result, session_id,
+                    generate_hypotheses, validate_predictions,
+                )
+        except TimeoutError:
+            logger.warning(
+                "Timed out processing %s for patient %s after %.1fs",
+                adverse_event.value, patient.patient_id, timeout_s,
+            )
+            self._audit.record(
+                event_type=AuditEventType.ERROR,
+                patient_id=patient.patient_id,
+                session_id=session_id,
+                actor="SafetyEngine",
+                output_data={
+                    "adverse_event": adverse_event.value,
+                    "error": "pipeline_timeout",
+                    "timeout_s": timeout_s,
+                },
+            )
+        except Exception:
+            logger.exception(
+                "Error processing %s for patient %s",
+                adverse_event.value, patient.patient_id,
+            )
+            self._audit.record(
+                event_type=AuditEventType.ERROR,
+                patient_id=patient.patient_id,
+                session_id=session_id,
+                actor="SafetyEngine",
+                output_data={
+                    "adverse_event": adverse_event.value,
+                    "error": "pipeline_failure",
+                },
+            )
+
     async def _process_adverse_event(
         self,
         patient: PatientData,
@@ -429,79 +573,191 @@ class SafetyEngine:
     async def _call_models(
         self,
         query: SafetyQuery,
-        routing_decision: Any,
+        routing_decision: RoutingDecision,
         session_id: str,
     ) -> list[SafetyPrediction]:
-        """Call all routed models and normalize their responses."""
-        predictions: list[SafetyPrediction] = []
+        """Call all routed models concurrently and normalize their responses.
 
-        for model_cap in routing_decision.all_models:
-            model_start = time.monotonic()
-            prompt = self._router.format_prompt(query, model_cap)
+        Ensemble members are fanned out in parallel, matching the router's
+        latency estimate (the max of the members, not the sum). When hedging
+        is enabled, the primary call may be raced against fallback models.
+        Predictions are returned in routing order; failed calls are omitted.
+        """
+        primary, *ensemble = routing_decision.all_models
 
-            self._audit.record(
-                event_type=AuditEventType.MODEL_CALL,
-                patient_id=query.patient_id,
-                session_id=session_id,
-                actor=model_cap.model_id,
-                input_data={"prompt_length": len(prompt)},
-                parameters={
-                    "model_id": model_cap.model_id,
-                    "provider": model_cap.provider,
-                },
-            )
+        hedges: list[ModelCapability] = []
+        if self._execution.hedge_requests:
+            hedges = routing_decision.fallback_models[
+                : self._execution.max_hedged_requests
+            ]
 
-            try:
-                raw_response: dict[str, Any] = {}
+        calls = [self._call_with_hedging(query, primary, hedges, session_id)]
+        calls.extend(
+            self._call_single_model(query, model_cap, session_id)
+            for model_cap in ensemble
+        )
+        results = await asyncio.gather(*calls)
 
-                if self._gateway:
-                    raw_response = await self._gateway.call_model(
-                        model_id=model_cap.model_id,
-                        prompt=prompt,
-                        patient_id=query.patient_id,
-                    )
-                elif self._model_backend:
-                    raw_response = await self._model_backend.predict(
-                        prompt=prompt,
-                        model_id=model_cap.model_id,
+        return [prediction for prediction in results if prediction is not None]
+
+    async def _call_with_hedging(
+        self,
+        query: SafetyQuery,
+        primary: ModelCapability,
+        hedges: list[ModelCapability],
+        session_id: str,
+    ) -> SafetyPrediction | None:
+        """Call ``primary``, hedging with ``hedges`` if it is slow or fails.
+
+        A hedge is launched when the most recently launched candidate has not
+        answered within its p95 latency, or immediately when every in-flight
+        candidate has failed. The first valid prediction wins and the
+        remaining in-flight calls are cancelled; if none is valid, the last
+        prediction received is returned, as an unhedged call would.
+        """
+        if not hedges:
+            return await self._call_single_model(query, primary, session_id)
+
+        candidates = [primary, *hedges]
+        pending: set[asyncio.Task[SafetyPrediction | None]] = set()
+        launched = 0
+        fallback: SafetyPrediction | None = None
+
+        def _launch() -> None:
+            nonlocal launched
+            model_cap = candidates[launched]
+            hedge_for = primary.model_id if launched > 0 else None
+            launched += 1
+            pending.add(asyncio.create_task(
+                self._call_single_model(query, model_cap, session_id, hedge_for)
+            ))
+
+        _launch()
+        try:
+            while pending:
+                wait_s: float | None = None
+                if launched < len(candidates):
+                    wait_s = self._router.p95_latency_ms(candidates[launched - 1]) / 1000
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=wait_s, return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    prediction = task.result()
+                    if prediction is None:
+                        continue
+                    if self._is_valid_prediction(prediction):
+                        return prediction
+                    fallback = prediction
+
+                if launched < len(candidates) and (not done or not pending):
+                    logger.info(
+                        "Hedging %s call for patient %s with %s",
+                        primary.model_id, query.patient_id,
+                        candidates[launched].model_id,
                     )
+                    _launch()
+        finally:
+            for task in pending:
+                task.cancel()
 
-                latency_ms = int((time.monotonic() - model_start) * 1000)
+        return fallback
+
+    async def _call_single_model(
+        self,
+        query: SafetyQuery,
+        model_cap: ModelCapability,
+        session_id: str,
+        hedge_for: str | None = None,
+    ) -> SafetyPrediction | None:
+        """Call one model, normalize and audit its response.
+
+        The call's latency is recorded however it ends, including when a
+        hedged call is cancelled, so slow models are not under-sampled.
+
+        Returns:
+            The normalized prediction, or None if the call failed.
+        """
+        model_start = time.monotonic()
+        latency_ms: int | None = None
+        prompt = self._router.format_prompt(query, model_cap)
+
+        parameters: dict[str, Any] = {
+            "model_id": model_cap.model_id,
+            "provider": model_cap.provider,
+        }
+        if hedge_for is not None:
+            parameters["hedge_for"] = hedge_for
+
+        self._audit.record(
+            event_type=AuditEventType.MODEL_CALL,
+            patient_id=query.patient_id,
+            session_id=session_id,
+            actor=model_cap.model_id,
+            input_data={"prompt_length": len(prompt)},
+            parameters=parameters,
+        )
+
+        try:
+            raw_response: dict[str, Any] = {}
 
-                prediction = self._normalizer.normalize(
-                    raw_response=raw_response,
+            if self._gateway:
+                raw_response = await self._gateway.call_model(
                     model_id=model_cap.model_id,
+                    prompt=prompt,
                     patient_id=query.patient_id,
-                    adverse_event=query.adverse_events[0] if query.adverse_events else "UNKNOWN",
-                    latency_ms=latency_ms,
                 )
-                predictions.append(prediction)
-
-                self._audit.record(
-                    event_type=AuditEventType.MODEL_RESPONSE,
-                    patient_id=query.patient_id,
-                    session_id=session_id,
-                    actor=model_cap.model_id,
-                    output_data={
-                        "risk_score": prediction.risk_score,
-                        "confidence": prediction.confidence,
-                    },
-                    duration_ms=latency_ms,
+            elif self._model_backend:
+                raw_response = await self._model_backend.predict(
+                    prompt=prompt,
+                    model_id=model_cap.model_id,
                 )
 
-            except Exception as exc:
-                logger.error(
-                    "Model call to %s failed: %s", model_cap.model_id, exc,
-                )
-                self._audit.record(
-                    event_type=AuditEventType.ERROR,
-                    patient_id=query.patient_id,
-                    session_id=session_id,
-                    actor=model_cap.model_id,
-                    output_data={"error": str(exc)},
-                )
+            latency_ms = int((time.monotonic() - model_start) * 1000)
 
-        return predictions
+            prediction = self._normalizer.normalize(
+                raw_response=raw_response,
+                model_id=model_cap.model_id,
+                patient_id=query.patient_id,
+                adverse_event=query.adverse_events[0] if query.adverse_events else "UNKNOWN",
+                latency_ms=latency_ms,
+            )
+
+            self._audit.record(
+                event_type=AuditEventType.MODEL_RESPONSE,
+                patient_id=query.patient_id,
+                session_id=session_id,
+                actor=model_cap.model_id,
+                output_data={
+                    "risk_score": prediction.risk_score,
+                    "confidence": prediction.confidence,
+                },
+                duration_ms=latency_ms,
+            )
+            return prediction
+
+        except Exception as exc:
+            logger.error(
+                "Model call to %s failed: %s", model_cap.model_id, exc,
+            )
+            self._audit.record(
+                event_type=AuditEventType.ERROR,
+                patient_id=query.patient_id,
+                session_id=session_id,
+                actor=model_cap.model_id,
+                output_data={"error": str(exc)},
+            )
+            return None
+        finally:
+            if latency_ms is None:
+                # Failed or cancelled: the model took at least this long
+                latency_ms = int((time.monotonic() - model_start) * 1000)
+            self._router.record_latency(model_cap.model_id, latency_ms)
+
+    @staticmethod
+    def _is_valid_prediction(prediction: SafetyPrediction) -> bool:
+        """Whether a normalized prediction came from a parseable response."""
+        return prediction.raw_response.get("error") != "unparseable"
 
     # ------------------------------------------------------------------
     # Configuration helpers
@@ -562,6 +818,11 @@ class SafetyEngine:
         """Access the alert engine."""
         return self._alert_engine
 
+    @property
+    def execution_config(self) -> PipelineExecutionConfig:
+        """The pipeline execution settings."""
+        return self._execution
+
     @property
     def is_initialized(self) -> bool:
         """Whether the engine has been initialized."""
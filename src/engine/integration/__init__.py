@@ -2,5 +2,13 @@
 
 from src.engine.integration.alerts import AlertEngine
 from src.engine.integration.audit import AuditTrail
+from src.engine.integration.audit_serializers import CanonicalSerializer
+from src.engine.integration.audit_storage import AuditStorage, SegmentedAuditStorage
 
-__all__ = ["AlertEngine", "AuditTrail"]
+__all__ = [
+    "AlertEngine",
+    "AuditStorage",
+    "AuditTrail",
+    "CanonicalSerializer",
+    "SegmentedAuditStorage",
+]
@@ -9,17 +9,34 @@ so that any prediction can be fully reproduced and explained at a later date.
 from __future__ import annotations
 
 import hashlib
-import json
+import itertools
 import logging
+import re
 import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from src.engine.integration.audit_serializers import (
+    CanonicalSerializer,
+    PendingContentHash,
+    get_serializer,
+    hash_content,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from src.engine.integration.audit_storage import AuditStorage
 
 logger = logging.getLogger(__name__)
 
+_SESSION_ID_PATTERN = re.compile(r"^SESSION-(\d+)$")
+
 
 class AuditEventType(Enum):
     """Types of events recorded in the audit trail."""
@@ -77,6 +94,80 @@ class AuditRecord:
     chain_hash: str = ""
 
 
+class _KeyFilter:
+    """Fixed-size Bloom filter of string keys.
+
+    False positives are possible (an unnecessary storage scan); false
+    negatives are not. Memory stays constant however many keys are added.
+    """
+
+    def __init__(self, size_bits: int = 1 << 23, num_hashes: int = 4) -> None:
+        self._size = size_bits
+        self._num_hashes = num_hashes
+        self._bits = bytearray(size_bits // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=4 * self._num_hashes).digest()
+        return [
+            int.from_bytes(digest[4 * i:4 * i + 4], "little") % self._size
+            for i in range(self._num_hashes)
+        ]
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class _KeyIndex:
+    """Maps a key (session or patient ID) to its in-memory record IDs.
+
+    IDs are kept oldest first, so archiving the oldest records only ever
+    pops from the front. Keys with archived records are remembered (in a
+    Bloom filter once none of their records remain in memory) so queries
+    only consult storage when it may hold matches.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, deque[int]] = {}
+        self._partially_archived: set[str] = set()
+        self._archived = _KeyFilter()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, key: str, record_id: int) -> None:
+        if key:
+            self._ids.setdefault(key, deque()).append(record_id)
+
+    def evict(self, key: str) -> None:
+        """Drop the oldest in-memory record ID for ``key``."""
+        if not key:
+            return
+        ids = self._ids[key]
+        ids.popleft()
+        if ids:
+            self._partially_archived.add(key)
+        else:
+            del self._ids[key]
+            self._partially_archived.discard(key)
+            self._archived.add(key)
+
+    def mark_archived(self, key: str) -> None:
+        """Record that ``key`` has records outside the in-memory window."""
+        if key:
+            self._archived.add(key)
+
+    def ids(self, key: str) -> list[int]:
+        return list(self._ids.get(key, ()))
+
+    def may_have_archived(self, key: str) -> bool:
+        """Whether some of ``key``'s records may live only in storage."""
+        return key in self._partially_archived or key in self._archived
+
+
 class AuditTrail:
     """Immutable, append-only audit trail for full prediction reproducibility.
 
@@ -87,6 +178,12 @@ class AuditTrail:
         - **Session tracking**: Related operations are grouped by session ID.
         - **Full provenance**: Input data, parameters, and outputs are captured.
         - **Thread-safe**: Uses locking for concurrent access.
+        - **Indexed queries**: Record, session, and patient lookups use
+          secondary indexes rather than scanning, and ``summary()`` reads
+          incrementally maintained counters.
+        - **Pluggable persistence**: With a storage backend attached, every
+          record is also written to durable storage; records evicted from
+          the in-memory window stay queryable and survive restarts.
 
     Usage::
 
@@ -107,20 +204,60 @@ class AuditTrail:
         records = audit.get_session_records(session_id)
     """
 
-    def __init__(self, max_records: int = 100_000) -> None:
+    def __init__(
+        self,
+        max_records: int = 100_000,
+        storage: AuditStorage | None = None,
+        serializer: str | CanonicalSerializer | None = None,
+    ) -> None:
         """Initialize the audit trail.
 
         Args:
             max_records: Maximum number of records to retain in memory.
-                Older records are archived (logged) when this limit is reached.
+                Older records are archived when this limit is reached: with
+                a storage backend they remain readable from storage,
+                otherwise they are logged and dropped.
+            storage: Optional durable storage backend. If it already holds
+                records, the record counter, session counter, and hash chain
+                resume from the newest stored record.
+            serializer: Canonical serializer for content hashing: ``"json"``
+                (default, compatible with existing chains), ``"orjson"``, or
+                a :class:`CanonicalSerializer`. A trail must keep the same
+                serializer for its whole lifetime, including across restarts
+                with persistent storage.
         """
+        # In-memory window. Archived records before ``_head`` are released
+        # in amortized batches; IDs in the window are contiguous, so a
+        # record's position is ``_head + (record_id - first live ID)``.
         self._records: list[AuditRecord] = []
+        self._head = 0
+        self._session_index = _KeyIndex()
+        self._patient_index = _KeyIndex()
+        self._event_counts: dict[str, int] = {}
         self._record_counter = 0
         self._session_counter = 0
         self._max_records = max_records
         self._lock = threading.Lock()
         self._last_chain_hash = "genesis"
-        logger.info("AuditTrail initialized (max_records=%d)", max_records)
+        self._storage = storage
+        self._serializer = get_serializer(serializer)
+
+        # Highest record ID no longer held in memory, and its chain hash
+        # (the starting point for in-memory chain verification).
+        self._archived_through = 0
+        self._archived_chain_hash = "genesis"
+
+        # Checkpoint of the last record verified by verify_chain_integrity.
+        self._verified_through = 0
+        self._verified_chain_hash = "genesis"
+
+        if storage is not None:
+            self._recover_from_storage(storage)
+
+        logger.info(
+            "AuditTrail initialized (max_records=%d, persistent=%s)",
+            max_records, storage is not None,
+        )
 
     def start_session(self, patient_id: str = "") -> str:
         """Start a new audit session and return its ID.
@@ -173,24 +310,30 @@ class AuditTrail:
         Returns:
             The record ID of the new audit record.
         """
+        # Serialize and hash everything except the record ID outside the
+        # lock, and pre-encode the storage frame the same way; only the ID,
+        # the chain link, and the frame's header fields are computed under it.
+        content = {
+            "event_type": event_type.value,
+            "patient_id": patient_id,
+            "session_id": session_id,
+            "actor": actor,
+            "input_data": input_data or {},
+            "output_data": output_data or {},
+            "parameters": parameters or {},
+            "duration_ms": duration_ms,
+            "parent_record_id": parent_record_id,
+        }
+        pending_hash = PendingContentHash(
+            self._serializer, content, deferred_key="record_id",
+        )
+        prepared = self._storage.prepare(content) if self._storage is not None else None
+        flush_due = False
+
         with self._lock:
             self._record_counter += 1
             record_id = self._record_counter
-
-            # Compute content hash
-            content = {
-                "record_id": record_id,
-                "event_type": event_type.value,
-                "patient_id": patient_id,
-                "session_id": session_id,
-                "actor": actor,
-                "input_data": input_data or {},
-                "output_data": output_data or {},
-                "parameters": parameters or {},
-                "duration_ms": duration_ms,
-                "parent_record_id": parent_record_id,
-            }
-            content_hash = self._compute_hash(content)
+            content_hash = pending_hash.finish(record_id)
 
             # Compute chain hash (links to previous record)
             chain_input = f"{self._last_chain_hash}:{content_hash}"
@@ -213,11 +356,23 @@ class AuditTrail:
             )
 
             self._records.append(record)
+            self._session_index.add(session_id, record_id)
+            self._patient_index.add(patient_id, record_id)
+            self._event_counts[event_type.value] = (
+                self._event_counts.get(event_type.value, 0) + 1
+            )
             self._last_chain_hash = chain_hash
+            if self._storage is not None:
+                flush_due = self._storage.append(record, prepared)
 
             # Archive old records if needed
-            if len(self._records) > self._max_records:
-                self._archive_oldest(len(self._records) - self._max_records)
+            live_count = len(self._records) - self._head
+            if live_count > self._max_records:
+                self._archive_oldest(live_count - self._max_records)
+
+        # Disk writes happen outside the trail lock
+        if flush_due:
+            self._storage.flush()
 
         logger.debug(
             "Audit record %d: %s (patient=%s, session=%s)",
@@ -240,9 +395,12 @@ class AuditTrail:
             The AuditRecord, or None if not found.
         """
         with self._lock:
-            for record in self._records:
-                if record.record_id == record_id:
-                    return record
+            archived = record_id <= self._archived_through
+            if not archived:
+                position = self._position(record_id)
+                return self._records[position] if position is not None else None
+        if archived and self._storage is not None:
+            return self._storage.get_record(record_id)
         return None
 
     def get_session_records(self, session_id: str) -> list[AuditRecord]:
@@ -255,7 +413,13 @@ class AuditTrail:
             Chronologically ordered list of records.
         """
         with self._lock:
-            return [r for r in self._records if r.session_id == session_id]
+            recent = self._lookup(self._session_index.ids(session_id))
+            archived_through = (
+                self._archived_through
+                if self._session_index.may_have_archived(session_id) else 0
+            )
+        archived = list(self._iter_archived("session_id", session_id, archived_through))
+        return archived + recent
 
     def get_patient_records(
         self,
@@ -274,12 +438,18 @@ class AuditTrail:
             Chronologically ordered list of records.
         """
         with self._lock:
-            records = [r for r in self._records if r.patient_id == patient_id]
-            if event_type is not None:
-                records = [r for r in records if r.event_type == event_type]
-            if since is not None:
-                records = [r for r in records if r.timestamp >= since]
-            return records
+            recent = self._lookup(self._patient_index.ids(patient_id))
+            archived_through = (
+                self._archived_through
+                if self._patient_index.may_have_archived(patient_id) else 0
+            )
+        records = list(self._iter_archived("patient_id", patient_id, archived_through))
+        records += recent
+        if event_type is not None:
+            records = [r for r in records if r.event_type == event_type]
+        if since is not None:
+            records = [r for r in records if r.timestamp >= since]
+        return records
 
     def get_prediction_provenance(self, session_id: str) -> dict[str, Any]:
         """Get complete provenance for a prediction session.
@@ -324,50 +494,97 @@ class AuditTrail:
     # Integrity verification
     # ------------------------------------------------------------------
 
-    def verify_chain_integrity(self) -> tuple[bool, str]:
+    def verify_chain_integrity(
+        self,
+        incremental: bool = False,
+        max_workers: int | None = None,
+        include_archived: bool = False,
+        chunk_size: int = 5_000,
+    ) -> tuple[bool, str]:
         """Verify the integrity of the audit trail hash chain.
 
+        The writer lock is held only to snapshot the records to check;
+        hashing runs outside it. Every record stores its own chain hash,
+        so a chunk can be verified independently given the stored chain
+        hash of the record before it. Chunks are therefore checked in
+        parallel and stitched at their boundaries.
+
+        Args:
+            incremental: Only verify records after the last successfully
+                verified record (the checkpoint). A full verification
+                always runs when the checkpoint has been archived.
+            max_workers: Verify chunks across a process pool of this size.
+                ``None`` or 1 verifies in-process.
+            include_archived: Also verify records held only in the storage
+                backend, streaming them from storage chunk by chunk.
+            chunk_size: Number of records per verification chunk.
+
         Returns:
             Tuple of ``(is_valid, message)``.
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
         with self._lock:
-            if not self._records:
-                return True, "Audit trail is empty"
-
-            prev_chain_hash = "genesis"
-            for record in self._records:
-                # Recompute content hash
-                content = {
-                    "record_id": record.record_id,
-                    "event_type": record.event_type.value,
-                    "patient_id": record.patient_id,
-                    "session_id": record.session_id,
-                    "actor": record.actor,
-                    "input_data": record.input_data,
-                    "output_data": record.output_data,
-                    "parameters": record.parameters,
-                    "duration_ms": record.duration_ms,
-                    "parent_record_id": record.parent_record_id,
-                }
-                expected_content_hash = self._compute_hash(content)
-
-                if record.content_hash != expected_content_hash:
-                    return False, (
-                        f"Content hash mismatch at record {record.record_id}"
-                    )
-
-                # Verify chain hash
-                chain_input = f"{prev_chain_hash}:{record.content_hash}"
-                expected_chain_hash = hashlib.sha256(chain_input.encode()).hexdigest()
-
-                if record.chain_hash != expected_chain_hash:
-                    return False, (
-                        f"Chain hash mismatch at record {record.record_id}"
-                    )
-
-                prev_chain_hash = record.chain_hash
-
-        return True, f"Audit trail integrity verified ({len(self._records)} records)"
+            archived_through = self._archived_through
+            archived_chain_hash = self._archived_chain_hash
+            checkpoint = self._verified_through if incremental else 0
+            checkpoint_hash = self._verified_chain_hash if incremental else "genesis"
+
+            if checkpoint > archived_through:
+                position = self._position(checkpoint)
+                live = self._records[position + 1:]
+                live_prev_hash = checkpoint_hash
+            else:
+                live = self._records[self._head:]
+                live_prev_hash = archived_chain_hash
+
+        chunks: list[Iterator[tuple[list[AuditRecord], str]]] = []
+        verify_archived = (
+            include_archived
+            and self._storage is not None
+            and checkpoint < archived_through
+        )
+        if verify_archived:
+            chunks.append(self._archived_chunks(
+                checkpoint, checkpoint_hash, archived_through, archived_chain_hash,
+                chunk_size,
+            ))
+        chunks.append(_chunk_records(live, live_prev_hash, chunk_size))
+
+        if not live and not verify_archived:
+            if checkpoint:
+                return True, "Audit trail integrity verified (0 new records)"
+            return True, "Audit trail is empty"
+
+        failure, checked, last = _verify_chunks(
+            itertools.chain.from_iterable(chunks), self._serializer, max_workers,
+        )
+        if failure is not None:
+            return False, failure
+
+        if last is not None:
+            with self._lock:
+                if last.record_id > self._verified_through:
+                    self._verified_through = last.record_id
+                    self._verified_chain_hash = last.chain_hash
+
+        scope = "new records" if checkpoint else "records"
+        return True, f"Audit trail integrity verified ({checked} {scope})"
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Persist any records buffered by the storage backend."""
+        if self._storage is not None:
+            self._storage.flush()
+
+    def close(self) -> None:
+        """Flush and close the storage backend, if any."""
+        if self._storage is not None:
+            self._storage.close()
 
     # ------------------------------------------------------------------
     # Statistics
@@ -377,26 +594,19 @@ class AuditTrail:
     def record_count(self) -> int:
         """Total number of records in the audit trail."""
         with self._lock:
-            return len(self._records)
+            return len(self._records) - self._head
 
     def summary(self) -> dict[str, Any]:
         """Return a summary of the audit trail."""
         with self._lock:
-            event_counts: dict[str, int] = {}
-            for record in self._records:
-                key = record.event_type.value
-                event_counts[key] = event_counts.get(key, 0) + 1
-
-            unique_patients = len({r.patient_id for r in self._records if r.patient_id})
-            unique_sessions = len({r.session_id for r in self._records if r.session_id})
-
+            has_records = len(self._records) > self._head
             return {
-                "total_records": len(self._records),
-                "unique_patients": unique_patients,
-                "unique_sessions": unique_sessions,
-                "event_counts": event_counts,
-                "oldest_timestamp": self._records[0].timestamp if self._records else None,
-                "newest_timestamp": self._records[-1].timestamp if self._records else None,
+                "total_records": len(self._records) - self._head,
+                "unique_patients": len(self._patient_index),
+                "unique_sessions": len(self._session_index),
+                "event_counts": dict(self._event_counts),
+                "oldest_timestamp": self._records[self._head].timestamp if has_records else None,
+                "newest_timestamp": self._records[-1].timestamp if has_records else None,
             }
 
     # ------------------------------------------------------------------
@@ -404,10 +614,24 @@ class AuditTrail:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _compute_hash(content: dict[str, Any]) -> str:
-        """Compute SHA-256 hash of a dict's JSON representation."""
-        serialized = json.dumps(content, sort_keys=True, default=str)
-        return hashlib.sha256(serialized.encode()).hexdigest()
+    def _record_content(record: AuditRecord) -> dict[str, Any]:
+        """The fields covered by a record's content hash."""
+        return {
+            "record_id": record.record_id,
+            "event_type": record.event_type.value,
+            "patient_id": record.patient_id,
+            "session_id": record.session_id,
+            "actor": record.actor,
+            "input_data": record.input_data,
+            "output_data": record.output_data,
+            "parameters": record.parameters,
+            "duration_ms": record.duration_ms,
+            "parent_record_id": record.parent_record_id,
+        }
+
+    def _compute_hash(self, content: dict[str, Any]) -> str:
+        """Compute SHA-256 hash of a dict's canonical representation."""
+        return hash_content(self._serializer, content)
 
     @staticmethod
     def _summarize_data(data: dict[str, Any], max_keys: int = 5) -> dict[str, str]:
@@ -428,12 +652,222 @@ class AuditTrail:
         return summary
 
     def _archive_oldest(self, count: int) -> None:
-        """Archive the oldest records (log them and remove from memory)."""
-        to_archive = self._records[:count]
-        self._records = self._records[count:]
+        """Archive the oldest records (remove them from memory).
+
+        With a storage backend the records remain readable from storage;
+        otherwise they are only logged.
+        """
+        to_archive = self._records[self._head:self._head + count]
+        for record in to_archive:
+            self._session_index.evict(record.session_id)
+            self._patient_index.evict(record.patient_id)
+            key = record.event_type.value
+            self._event_counts[key] -= 1
+            if not self._event_counts[key]:
+                del self._event_counts[key]
+        self._head += len(to_archive)
+
+        # Release archived slots once they make up half the list, keeping
+        # archiving amortized O(1) per record.
+        if self._head * 2 >= len(self._records):
+            del self._records[:self._head]
+            self._head = 0
+
+        if to_archive:
+            self._archived_through = to_archive[-1].record_id
+            self._archived_chain_hash = to_archive[-1].chain_hash
         logger.info(
-            "Archived %d audit records (IDs %d - %d)",
+            "Archived %d audit records (IDs %d - %d)%s",
             len(to_archive),
             to_archive[0].record_id if to_archive else 0,
             to_archive[-1].record_id if to_archive else 0,
+            "" if self._storage is not None else " without persistent storage",
         )
+
+    def _position(self, record_id: int) -> int | None:
+        """List position of an in-memory record, or None (lock held)."""
+        if len(self._records) == self._head:
+            return None
+        position = self._head + (record_id - self._records[self._head].record_id)
+        if self._head <= position < len(self._records):
+            return position
+        return None
+
+    def _lookup(self, record_ids: list[int]) -> list[AuditRecord]:
+        """Resolve in-memory record IDs to records (lock held)."""
+        records = []
+        for record_id in record_ids:
+            position = self._position(record_id)
+            if position is not None:
+                records.append(self._records[position])
+        return records
+
+    def _archived_chunks(
+        self,
+        after_id: int,
+        prev_chain_hash: str,
+        archived_through: int,
+        archived_chain_hash: str,
+        chunk_size: int,
+    ) -> Iterator[tuple[list[AuditRecord], str]]:
+        """Stream archived records from storage as verification chunks.
+
+        A final empty-bodied check confirms the stored chain joins up with
+        the chain hash the in-memory window starts from.
+        """
+        records = self._storage.iter_records(
+            start_id=after_id + 1, end_id=archived_through,
+        )
+        last_hash = prev_chain_hash
+        for chunk, chunk_prev in _chunk_records(records, prev_chain_hash, chunk_size):
+            last_hash = chunk[-1].chain_hash
+            yield chunk, chunk_prev
+        if last_hash != archived_chain_hash:
+            raise _ChainGapError(
+                f"Archived chain does not join the in-memory window at record "
+                f"{archived_through + 1}"
+            )
+
+    def _iter_archived(self, key_field: str, key: str, archived_through: int):
+        """Iterate archived records with ``key_field == key``, oldest first."""
+        if self._storage is None or archived_through == 0:
+            return iter(())
+        return self._storage.iter_matching(key_field, key, end_id=archived_through)
+
+    def _recover_from_storage(self, storage: AuditStorage) -> None:
+        """Resume counters and the hash chain from previously stored records."""
+        recent = storage.recent_records()
+        if not recent:
+            return
+
+        last = recent[-1]
+        self._record_counter = last.record_id
+        self._last_chain_hash = last.chain_hash
+        self._archived_through = last.record_id
+        self._archived_chain_hash = last.chain_hash
+
+        # From storage's key index rather than its records: resume the
+        # session counter past every stored session (not just the newest
+        # segment's), and rebuild the archived-key filters so lookups for
+        # keys that never reach storage can skip the disk.
+        for key_field, key in storage.stored_keys():
+            if key_field == "patient_id":
+                self._patient_index.mark_archived(key)
+                continue
+            match = _SESSION_ID_PATTERN.match(key)
+            if match:
+                self._session_counter = max(self._session_counter, int(match.group(1)))
+            self._session_index.mark_archived(key)
+
+        logger.info(
+            "AuditTrail resumed from storage at record %d (session counter %d)",
+            self._record_counter, self._session_counter,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Chain verification helpers (module level so process pools can pickle them)
+# ---------------------------------------------------------------------------
+
+class _ChainGapError(Exception):
+    """Raised when verified chunks do not stitch together."""
+
+
+def _chunk_records(
+    records: Iterable[AuditRecord],
+    prev_chain_hash: str,
+    chunk_size: int,
+) -> Iterator[tuple[list[AuditRecord], str]]:
+    """Split records into ``(chunk, previous chain hash)`` pairs.
+
+    The previous chain hash of each chunk is the *stored* chain hash of
+    the record before it; if that value was tampered with, the chunk
+    holding that record reports the mismatch.
+    """
+    chunk: list[AuditRecord] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk, prev_chain_hash
+            prev_chain_hash = chunk[-1].chain_hash
+            chunk = []
+    if chunk:
+        yield chunk, prev_chain_hash
+
+
+def _verify_chunk(
+    records: list[AuditRecord],
+    prev_chain_hash: str,
+    serializer: CanonicalSerializer,
+) -> str | None:
+    """Verify one chunk; return a failure message or None."""
+    for record in records:
+        expected_content_hash = hash_content(serializer, AuditTrail._record_content(record))
+        if record.content_hash != expected_content_hash:
+            return f"Content hash mismatch at record {record.record_id}"
+
+        chain_input = f"{prev_chain_hash}:{record.content_hash}"
+        expected_chain_hash = hashlib.sha256(chain_input.encode()).hexdigest()
+        if record.chain_hash != expected_chain_hash:
+            return f"Chain hash mismatch at record {record.record_id}"
+
+        prev_chain_hash = record.chain_hash
+    return None
+
+
+def _verify_chunks(
+    chunks: Iterator[tuple[list[AuditRecord], str]],
+    serializer: CanonicalSerializer,
+    max_workers: int | None,
+) -> tuple[str | None, int, AuditRecord | None]:
+    """Verify chunks in order, optionally across a process pool.
+
+    Returns:
+        Tuple of ``(failure message or None, records checked, last record)``.
+        On failure, the reported record is the earliest bad one.
+    """
+    checked = 0
+    last: AuditRecord | None = None
+
+    if max_workers is None or max_workers <= 1:
+        try:
+            for chunk, prev_chain_hash in chunks:
+                failure = _verify_chunk(chunk, prev_chain_hash, serializer)
+                if failure is not None:
+                    return failure, checked, last
+                checked += len(chunk)
+                last = chunk[-1]
+        except _ChainGapError as exc:
+            return str(exc), checked, last
+        return None, checked, last
+
+    # Keep a bounded number of chunks in flight so archived segments are
+    # streamed rather than loaded all at once.
+    gap: str | None = None
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pending: deque = deque()
+        try:
+            for chunk, prev_chain_hash in chunks:
+                future = pool.submit(_verify_chunk, chunk, prev_chain_hash, serializer)
+                pending.append((chunk, future))
+                if len(pending) < 2 * max_workers:
+                    continue
+                chunk_done, future = pending.popleft()
+                failure = future.result()
+                if failure is not None:
+                    return failure, checked, last
+                checked += len(chunk_done)
+                last = chunk_done[-1]
+        except _ChainGapError as exc:
+            gap = str(exc)
+
+        # Chunks still in flight precede any stitching gap.
+        while pending:
+            chunk_done, future = pending.popleft()
+            failure = future.result()
+            if failure is not None:
+                return failure, checked, last
+            checked += len(chunk_done)
+            last = chunk_done[-1]
+
+    return gap, checked, last
@@ -0,0 +1,172 @@
+"""
+Canonical serializers for audit content hashing.
+
+A record's content hash is the SHA-256 of a canonical (sorted-key,
+deterministic) encoding of its content. The serializer is pluggable:
+
+- ``"json"`` (default): ``json.dumps(content, sort_keys=True, default=str)``.
+  Byte-identical to the historical encoding, so existing hash chains
+  continue to verify.
+- ``"orjson"``: orjson with sorted keys and compact separators. Several
+  times faster on large payloads, but produces different bytes, so a
+  trail (including any persisted segments) must use one serializer for
+  its whole lifetime.
+
+Content hashing is split in two so the expensive part can run outside
+the audit trail's lock: :class:`PendingContentHash` serializes and hashes
+every field except one deferred field (the record ID, which is only
+assigned under the lock), and :meth:`PendingContentHash.finish` appends
+that field. The result equals hashing the full canonical encoding.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Protocol, runtime_checkable
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+@runtime_checkable
+class CanonicalSerializer(Protocol):
+    """Protocol for a deterministic encoding of JSON-like values.
+
+    ``dumps`` must sort object keys at every level. An object is encoded
+    as ``{`` + items joined by ``item_separator`` + ``}``, where each item
+    is ``dumps(key) + key_separator + dumps(value)``; this is what lets
+    content be hashed field by field.
+    """
+
+    name: str
+    item_separator: bytes
+    key_separator: bytes
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a value canonically."""
+        ...
+
+
+class JSONCanonicalSerializer:
+    """Standard-library JSON encoding with sorted keys."""
+
+    name = "json"
+    item_separator = b", "
+    key_separator = b": "
+
+    def __init__(self) -> None:
+        # Equivalent to json.dumps(value, sort_keys=True, default=str), but
+        # without constructing a new encoder on every call.
+        self._encoder = json.JSONEncoder(sort_keys=True, default=str)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode()
+
+    def __reduce__(self):
+        return (JSONCanonicalSerializer, ())
+
+
+class ORJSONCanonicalSerializer:
+    """orjson encoding with sorted keys and compact separators.
+
+    Values orjson cannot encode natively are passed through ``str``, as
+    with the JSON serializer. Integers beyond 64 bits, which orjson
+    rejects, fall back to the standard library with the same compact
+    layout.
+    """
+
+    name = "orjson"
+    item_separator = b","
+    key_separator = b":"
+
+    def __init__(self) -> None:
+        if not _HAS_ORJSON:
+            raise ImportError("orjson is required for the 'orjson' audit serializer")
+        self._options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, value: Any) -> bytes:
+        try:
+            return orjson.dumps(value, default=str, option=self._options)
+        except orjson.JSONEncodeError:
+            return json.dumps(
+                value, sort_keys=True, default=str,
+                separators=(",", ":"), ensure_ascii=False,
+            ).encode()
+
+    def __reduce__(self):
+        # Rebuild from scratch in worker processes rather than pickling options.
+        return (ORJSONCanonicalSerializer, ())
+
+
+_SERIALIZERS: dict[str, type] = {
+    "json": JSONCanonicalSerializer,
+    "orjson": ORJSONCanonicalSerializer,
+}
+
+
+def get_serializer(serializer: str | CanonicalSerializer | None) -> CanonicalSerializer:
+    """Resolve a serializer name (or instance) to a serializer instance.
+
+    Raises:
+        ValueError: For an unknown serializer name.
+        ImportError: If the named serializer's dependency is missing.
+    """
+    if serializer is None:
+        return JSONCanonicalSerializer()
+    if isinstance(serializer, str):
+        if serializer not in _SERIALIZERS:
+            raise ValueError(
+                f"Unknown audit serializer {serializer!r}; "
+                f"expected one of {sorted(_SERIALIZERS)}"
+            )
+        return _SERIALIZERS[serializer]()
+    return serializer
+
+
+def hash_content(serializer: CanonicalSerializer, content: dict[str, Any]) -> str:
+    """SHA-256 hex digest of the canonical encoding of ``content``."""
+    return hashlib.sha256(serializer.dumps(content)).hexdigest()
+
+
+class PendingContentHash:
+    """A content hash computed up to one deferred top-level field.
+
+    Fields sorting before the deferred key are hashed immediately; fields
+    sorting after it are pre-encoded. :meth:`finish` then only has to
+    encode the deferred value and hash a few bytes. Each group of fields
+    is encoded as one object with its braces stripped, which yields the
+    same bytes as the corresponding items of the full object.
+    """
+
+    def __init__(
+        self,
+        serializer: CanonicalSerializer,
+        content: dict[str, Any],
+        deferred_key: str,
+    ) -> None:
+        self._serializer = serializer
+        self._deferred_key = deferred_key
+        self._hash = hashlib.sha256(b"{")
+
+        before = {k: v for k, v in content.items() if k < deferred_key}
+        after = {k: v for k, v in content.items() if k > deferred_key}
+
+        sep = serializer.item_separator
+        self._hash.update(self._items(before))
+        self._lead = sep if before else b""
+        self._tail = (sep + self._items(after) if after else b"") + b"}"
+
+    def _items(self, fields: dict[str, Any]) -> bytes:
+        return self._serializer.dumps(fields)[1:-1]
+
+    def finish(self, deferred_value: Any) -> str:
+        """Append the deferred field and return the hex digest."""
+        self._hash.update(
+            self._lead + self._items({self._deferred_key: deferred_value}) + self._tail
+        )
+        return self._hash.hexdigest()
@@ -0,0 +1,637 @@
+"""
+Persistent storage backends for the audit trail.
+
+``AuditTrail`` keeps a bounded window of recent records in memory. When a
+storage backend is attached, every record is also appended to durable
+storage, so records evicted from memory remain queryable and survive a
+restart.
+
+The default backend, :class:`SegmentedAuditStorage`, is an append-only log
+split into segment files. Each record is framed as a 4-byte big-endian
+length followed by the record's UTF-8 JSON encoding::
+
+    <len><json><len><json>...
+
+Segments are named after the first record ID they contain
+(``segment-000000000001.log``) and rotated once they reach
+``segment_max_bytes``. Writes are buffered in memory: ``append`` never
+touches the disk, it only reports when ``flush_batch_size`` records are
+waiting, and the caller then flushes after releasing its own lock. Buffered
+records, and records being flushed, are still visible to readers. A torn
+frame at the end of the newest segment (e.g. from a crash mid-write) is
+truncated on open.
+
+When a segment is sealed (rotated away from), the session and patient IDs
+it holds are written to a JSON sidecar next to it
+(``segment-000000000001.keys``). Key lookups read only the segments whose
+sidecar lists the key, and the distinct stored keys can be listed without
+decoding any sealed segment. A missing sidecar (a log written before
+sidecars existed, or a crash just after rotation) is rebuilt the first time
+it is needed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from src.engine.integration.audit import AuditEventType, AuditRecord
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+_FRAME_HEADER = struct.Struct(">I")
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log"
+_KEYS_SUFFIX = ".keys"
+
+# Record fields indexed per segment, and how many segments' key sets to
+# keep in memory
+_KEY_FIELDS = ("session_id", "patient_id")
+_KEY_CACHE_SIZE = 64
+
+
+# ---------------------------------------------------------------------------
+# Storage protocol
+# ---------------------------------------------------------------------------
+
+@runtime_checkable
+class AuditStorage(Protocol):
+    """Protocol for durable audit record storage.
+
+    Backends must return records in ascending ``record_id`` order.
+    :meth:`append` is called with the audit trail's lock held and must not
+    block on I/O; every other method is called without it, and reads may
+    run concurrently with writes.
+    """
+
+    def prepare(self, fields: dict[str, Any]) -> Any:
+        """Pre-encode a record's fields before its ID and hashes are known.
+
+        Called before the trail lock is taken; the result is passed back
+        to :meth:`append`.
+        """
+        ...
+
+    def append(self, record: AuditRecord, prepared: Any = None) -> bool:
+        """Buffer a record; returns whether a :meth:`flush` is due."""
+        ...
+
+    def flush(self) -> None:
+        """Persist any buffered records."""
+        ...
+
+    def close(self) -> None:
+        """Flush and release any open resources."""
+        ...
+
+    def get_record(self, record_id: int) -> AuditRecord | None:
+        """Look up a single record by ID."""
+        ...
+
+    def iter_records(
+        self,
+        start_id: int | None = None,
+        end_id: int | None = None,
+    ) -> Iterator[AuditRecord]:
+        """Iterate records with ``start_id <= record_id <= end_id``."""
+        ...
+
+    def iter_matching(
+        self,
+        field: str,
+        key: str,
+        end_id: int | None = None,
+    ) -> Iterator[AuditRecord]:
+        """Iterate records whose ``field`` (``session_id`` or
+        ``patient_id``) equals ``key``, with ``record_id <= end_id``."""
+        ...
+
+    def stored_keys(self) -> Iterator[tuple[str, str]]:
+        """Yield ``(field, key)`` for the session and patient IDs in storage.
+
+        A key may be yielded more than once.
+        """
+        ...
+
+    def recent_records(self) -> list[AuditRecord]:
+        """Return the records of the newest segment, used for recovery."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Record encoding
+# ---------------------------------------------------------------------------
+
+def record_to_dict(record: AuditRecord) -> dict[str, Any]:
+    """Convert an AuditRecord to a JSON-serializable dict."""
+    return {
+        "record_id": record.record_id,
+        "event_type": record.event_type.value,
+        "timestamp": record.timestamp,
+        "patient_id": record.patient_id,
+        "session_id": record.session_id,
+        "actor": record.actor,
+        "input_data": record.input_data,
+        "output_data": record.output_data,
+        "parameters": record.parameters,
+        "duration_ms": record.duration_ms,
+        "parent_record_id": record.parent_record_id,
+        "content_hash": record.content_hash,
+        "chain_hash": record.chain_hash,
+    }
+
+
+def record_from_dict(data: dict[str, Any]) -> AuditRecord:
+    """Rebuild an AuditRecord from :func:`record_to_dict` output."""
+    return AuditRecord(
+        record_id=data["record_id"],
+        event_type=AuditEventType(data["event_type"]),
+        timestamp=data["timestamp"],
+        patient_id=data.get("patient_id", ""),
+        session_id=data.get("session_id", ""),
+        actor=data.get("actor", ""),
+        input_data=data.get("input_data", {}),
+        output_data=data.get("output_data", {}),
+        parameters=data.get("parameters", {}),
+        duration_ms=data.get("duration_ms", 0),
+        parent_record_id=data.get("parent_record_id"),
+        content_hash=data.get("content_hash", ""),
+        chain_hash=data.get("chain_hash", ""),
+    )
+
+
+class PendingFrame:
+    """A record frame encoded up to the fields assigned under the trail lock.
+
+    The caller-supplied fields (payload dicts, IDs, actor) are encoded up
+    front; :meth:`finish` only encodes the record ID, timestamp, and hashes
+    and splices them in ahead of the rest of the object.
+    """
+
+    def __init__(self, fields: dict[str, Any]) -> None:
+        # default=str matches the content hash serialization, so a record
+        # read back from disk re-hashes to the same value.
+        body = json.dumps(fields, separators=(",", ":"), default=str).encode("utf-8")
+        self._tail = b"," + body[1:]
+
+    def finish(self, record: AuditRecord) -> bytes:
+        """Return the complete length-prefixed frame for ``record``."""
+        head = json.dumps(
+            {
+                "record_id": record.record_id,
+                "timestamp": record.timestamp,
+                "content_hash": record.content_hash,
+                "chain_hash": record.chain_hash,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        payload = head[:-1] + self._tail
+        return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def _encode_frame(record: AuditRecord) -> bytes:
+    fields = record_to_dict(record)
+    for key in ("record_id", "timestamp", "content_hash", "chain_hash"):
+        del fields[key]
+    return PendingFrame(fields).finish(record)
+
+
+def _decode_frames(data: bytes) -> tuple[list[AuditRecord], int]:
+    """Decode complete frames from ``data``.
+
+    Returns:
+        Tuple of ``(records, valid_length)`` where ``valid_length`` is the
+        byte offset just past the last complete frame.
+    """
+    records: list[AuditRecord] = []
+    offset = 0
+    header_size = _FRAME_HEADER.size
+    while offset + header_size <= len(data):
+        (length,) = _FRAME_HEADER.unpack_from(data, offset)
+        end = offset + header_size + length
+        if end > len(data):
+            break
+        try:
+            payload = json.loads(data[offset + header_size:end])
+        except ValueError:
+            break
+        records.append(record_from_dict(payload))
+        offset = end
+    return records, offset
+
+
+def _empty_keys() -> dict[str, set[str]]:
+    return {field: set() for field in _KEY_FIELDS}
+
+
+def _add_keys(keys: dict[str, set[str]], records: Iterable[AuditRecord]) -> None:
+    for record in records:
+        for field in _KEY_FIELDS:
+            value = getattr(record, field)
+            if value:
+                keys[field].add(value)
+
+
+# ---------------------------------------------------------------------------
+# Segmented file storage
+# ---------------------------------------------------------------------------
+
+class SegmentedAuditStorage:
+    """Append-only, segmented on-disk audit log.
+
+    Usage::
+
+        storage = SegmentedAuditStorage("/var/lib/safety/audit")
+        audit = AuditTrail(max_records=10_000, storage=storage)
+        ...
+        audit.close()
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        flush_batch_size: int = 256,
+        fsync: bool = False,
+    ) -> None:
+        """Open (or create) a segmented audit log.
+
+        Args:
+            directory: Directory holding the segment files.
+            segment_max_bytes: Rotate to a new segment once the active
+                segment reaches this size.
+            flush_batch_size: Number of buffered records that triggers a
+                flush to disk.
+            fsync: Whether to ``fsync`` the segment after every flush.
+        """
+        if segment_max_bytes <= 0:
+            raise ValueError("segment_max_bytes must be positive")
+        if flush_batch_size < 1:
+            raise ValueError("flush_batch_size must be >= 1")
+
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._segment_max_bytes = segment_max_bytes
+        self._flush_batch_size = flush_batch_size
+        self._fsync = fsync
+        # _lock guards the in-memory state and is only held briefly;
+        # _write_lock serializes flushes for the duration of their I/O.
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        self._buffer: list[AuditRecord] = []
+        self._buffer_frames: list[bytes] = []
+        # Records taken from the buffer by a flush and not yet on disk
+        self._writing: list[AuditRecord] = []
+
+        # Keys written to the active segment so far, and an LRU cache of
+        # sealed segments' sidecars
+        self._active_keys = _empty_keys()
+        self._key_cache: OrderedDict[Path, dict[str, frozenset[str]]] = OrderedDict()
+
+        # (first_record_id, path) in ascending order
+        self._segments: list[tuple[int, Path]] = self._discover_segments()
+        self._active_size = 0
+        if self._segments:
+            self._active_size, active = self._repair_tail(self._segments[-1][1])
+            _add_keys(self._active_keys, active)
+
+        logger.info(
+            "SegmentedAuditStorage opened at %s (%d segments)",
+            self._dir, len(self._segments),
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def prepare(self, fields: dict[str, Any]) -> PendingFrame:
+        """Encode everything but a record's ID, timestamp, and hashes."""
+        return PendingFrame(fields)
+
+    def append(self, record: AuditRecord, prepared: PendingFrame | None = None) -> bool:
+        """Buffer a record without writing to disk.
+
+        Args:
+            record: The record to append.
+            prepared: The record's :meth:`prepare` result, if any.
+
+        Returns:
+            Whether ``flush_batch_size`` records are buffered, in which case
+            the caller should :meth:`flush`.
+        """
+        frame = _encode_frame(record) if prepared is None else prepared.finish(record)
+        with self._lock:
+            self._buffer.append(record)
+            self._buffer_frames.append(frame)
+            return len(self._buffer) >= self._flush_batch_size
+
+    def flush(self) -> None:
+        """Write all buffered records to disk.
+
+        The buffer is swapped out under the state lock and written with
+        only the write lock held, so appends and reads are not blocked by
+        the I/O.
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._buffer:
+                    return
+                records, frames = self._buffer, self._buffer_frames
+                self._buffer, self._buffer_frames = [], []
+                self._writing = records
+            try:
+                self._write(records, frames)
+            finally:
+                with self._lock:
+                    # Unwritten records (after an I/O error) go back to the
+                    # front of the buffer so the next flush retries them.
+                    unwritten = len(self._writing)
+                    self._buffer[:0] = self._writing
+                    self._buffer_frames[:0] = frames[len(frames) - unwritten:]
+                    self._writing = []
+
+    def close(self) -> None:
+        """Flush buffered records. The storage may be reopened later."""
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_record(self, record_id: int) -> AuditRecord | None:
+        """Look up a single record by ID."""
+        for record in self.iter_records(record_id, record_id):
+            return record
+        return None
+
+    def iter_records(
+        self,
+        start_id: int | None = None,
+        end_id: int | None = None,
+    ) -> Iterator[AuditRecord]:
+        """Iterate stored records in ID order, including buffered ones.
+
+        Only segments whose ID range overlaps ``[start_id, end_id]`` are
+        read from disk.  The active segment is read only up to its size
+        when the buffer was copied, so records flushed in between are not
+        returned twice.
+        """
+        with self._lock:
+            segments = list(self._segments)
+            active_size = self._active_size
+            buffered = self._writing + self._buffer
+
+        for index, (first_id, path) in enumerate(segments):
+            if end_id is not None and first_id > end_id:
+                return
+            if (start_id is not None and index + 1 < len(segments)
+                    and segments[index + 1][0] <= start_id):
+                continue
+            limit = active_size if index == len(segments) - 1 else None
+            for record in self._read_segment(path, limit):
+                if start_id is not None and record.record_id < start_id:
+                    continue
+                if end_id is not None and record.record_id > end_id:
+                    return
+                yield record
+
+        for record in buffered:
+            if start_id is not None and record.record_id < start_id:
+                continue
+            if end_id is not None and record.record_id > end_id:
+                return
+            yield record
+
+    def iter_matching(
+        self,
+        field: str,
+        key: str,
+        end_id: int | None = None,
+    ) -> Iterator[AuditRecord]:
+        """Iterate records whose ``field`` equals ``key``, in ID order.
+
+        Sealed segments are read only if their sidecar lists ``key``, and
+        the active segment only if a record with ``key`` was written to it.
+
+        Args:
+            field: ``"session_id"`` or ``"patient_id"``.
+            key: The session or patient ID to match.
+            end_id: Only return records with ``record_id <= end_id``.
+
+        Raises:
+            ValueError: If ``field`` is not an indexed field.
+        """
+        if field not in _KEY_FIELDS:
+            raise ValueError(f"Cannot look up audit records by {field!r}")
+        return self._iter_matching(field, key, end_id)
+
+    def stored_keys(self) -> Iterator[tuple[str, str]]:
+        """Yield ``(field, key)`` for every session and patient ID stored.
+
+        Sealed segments are listed from their sidecars, so nothing but the
+        sidecars is read. Keys are distinct within a segment but may repeat
+        across segments.
+        """
+        with self._lock:
+            sealed = [path for _, path in self._segments[:-1]]
+            active = {field: set(keys) for field, keys in self._active_keys.items()}
+            buffered = self._writing + self._buffer
+        _add_keys(active, buffered)
+        for path in sealed:
+            for field, keys in self._sealed_keys(path).items():
+                for key in keys:
+                    yield field, key
+        for field, keys in active.items():
+            for key in keys:
+                yield field, key
+
+    def recent_records(self) -> list[AuditRecord]:
+        """Return the newest segment's records plus any buffered records."""
+        with self._lock:
+            last = self._segments[-1][1] if self._segments else None
+            active_size = self._active_size
+            buffered = self._writing + self._buffer
+        records = self._read_segment(last, active_size) if last is not None else []
+        return records + buffered
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files on disk."""
+        with self._lock:
+            return len(self._segments)
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the segment files."""
+        return self._dir
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _iter_matching(
+        self,
+        field: str,
+        key: str,
+        end_id: int | None,
+    ) -> Iterator[AuditRecord]:
+        with self._lock:
+            segments = list(self._segments)
+            active_size = self._active_size
+            in_active = key in self._active_keys[field]
+            buffered = self._writing + self._buffer
+
+        for index, (first_id, path) in enumerate(segments):
+            if end_id is not None and first_id > end_id:
+                return
+            if index == len(segments) - 1:
+                if not in_active:
+                    continue
+                records = self._read_segment(path, active_size)
+            elif key in self._sealed_keys(path)[field]:
+                records = self._read_segment(path)
+            else:
+                continue
+            for record in records:
+                if end_id is not None and record.record_id > end_id:
+                    return
+                if getattr(record, field) == key:
+                    yield record
+
+        for record in buffered:
+            if end_id is not None and record.record_id > end_id:
+                return
+            if getattr(record, field) == key:
+                yield record
+
+    def _sealed_keys(self, path: Path) -> dict[str, frozenset[str]]:
+        """The keys of a sealed segment, from its sidecar.
+
+        A missing or unreadable sidecar is rebuilt by decoding the segment
+        once.
+        """
+        with self._lock:
+            keys = self._key_cache.get(path)
+            if keys is not None:
+                self._key_cache.move_to_end(path)
+                return keys
+
+        sidecar = path.with_suffix(_KEYS_SUFFIX)
+        try:
+            data = json.loads(sidecar.read_bytes())
+            keys = {field: frozenset(data[field]) for field in _KEY_FIELDS}
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.info("Rebuilding key index for audit segment %s", path.name)
+            found = _empty_keys()
+            _add_keys(found, self._read_segment(path))
+            with self._write_lock:
+                self._write_keys(path, found)
+            keys = {field: frozenset(found[field]) for field in _KEY_FIELDS}
+
+        with self._lock:
+            self._key_cache[path] = keys
+            while len(self._key_cache) > _KEY_CACHE_SIZE:
+                self._key_cache.popitem(last=False)
+        return keys
+
+    @staticmethod
+    def _write_keys(path: Path, keys: dict[str, set[str]]) -> None:
+        """Atomically write the key sidecar of segment ``path``."""
+        sidecar = path.with_suffix(_KEYS_SUFFIX)
+        tmp = sidecar.with_name(sidecar.name + ".tmp")
+        tmp.write_text(json.dumps({field: sorted(keys[field]) for field in _KEY_FIELDS}))
+        os.replace(tmp, sidecar)
+
+    def _write(self, records: list[AuditRecord], frames: list[bytes]) -> None:
+        """Append frames to the segments (write lock held, state lock not).
+
+        Only the writer changes the segment list, active size, and active
+        keys, so it can read them without the state lock; each update is
+        published under it together with dropping the written records from
+        ``_writing``.
+        """
+        start = 0
+        while start < len(records):
+            if not self._segments or self._active_size >= self._segment_max_bytes:
+                if self._segments:
+                    # Seal the full segment before readers can see it as such
+                    self._write_keys(self._segments[-1][1], self._active_keys)
+                self._rotate(records[start].record_id)
+
+            # Fill the active segment up to its size limit (at least one frame).
+            end = start
+            size = 0
+            while end < len(frames):
+                frame_len = len(frames[end])
+                if end > start and self._active_size + size + frame_len > self._segment_max_bytes:
+                    break
+                size += frame_len
+                end += 1
+
+            path = self._segments[-1][1]
+            with open(path, "ab") as fh:
+                fh.write(b"".join(frames[start:end]))
+                if self._fsync:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+            with self._lock:
+                self._active_size += size
+                _add_keys(self._active_keys, records[start:end])
+                self._writing = records[end:]
+            start = end
+
+    def _rotate(self, first_record_id: int) -> None:
+        path = self._dir / f"{_SEGMENT_PREFIX}{first_record_id:012d}{_SEGMENT_SUFFIX}"
+        path.touch()
+        with self._lock:
+            self._segments.append((first_record_id, path))
+            self._active_size = 0
+            self._active_keys = _empty_keys()
+        logger.debug("Audit log rotated to %s", path.name)
+
+    def _discover_segments(self) -> list[tuple[int, Path]]:
+        segments: list[tuple[int, Path]] = []
+        for path in self._dir.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"):
+            stem = path.name[len(_SEGMENT_PREFIX):-len(_SEGMENT_SUFFIX)]
+            if stem.isdigit():
+                segments.append((int(stem), path))
+        segments.sort()
+        return segments
+
+    def _repair_tail(self, path: Path) -> tuple[int, list[AuditRecord]]:
+        """Truncate a torn trailing frame.
+
+        Returns:
+            Tuple of ``(segment_size, records)``.
+        """
+        data = path.read_bytes()
+        records, valid_length = _decode_frames(data)
+        if valid_length < len(data):
+            logger.warning(
+                "Truncating %d trailing bytes from torn audit segment %s",
+                len(data) - valid_length, path.name,
+            )
+            with open(path, "r+b") as fh:
+                fh.truncate(valid_length)
+        return valid_length, records
+
+    @staticmethod
+    def _read_segment(path: Path, limit: int | None = None) -> list[AuditRecord]:
+        """Decode a segment, or only its first ``limit`` bytes."""
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read() if limit is None else fh.read(limit)
+        except FileNotFoundError:
+            return []
+        records, _ = _decode_frames(data)
+        return records
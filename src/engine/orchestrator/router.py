@@ -9,7 +9,9 @@ Supports routing to multiple models for ensemble prediction.
 from __future__ import annotations
 
 import logging
+import math
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Protocol, runtime_checkable
@@ -78,6 +80,9 @@ class RoutingDecision:
         domain: Assessed clinical domain.
         rationale: Human-readable explanation of the routing decision.
         estimated_latency_ms: Expected total latency.
+        fallback_models: Remaining eligible models in rank order that are
+            not part of the ensemble. Used as hedge candidates when the
+            primary model is slow.
     """
 
     primary_model: ModelCapability
@@ -86,6 +91,7 @@ class RoutingDecision:
     domain: ClinicalDomain = ClinicalDomain.GENERAL_SAFETY
     rationale: str = ""
     estimated_latency_ms: int = 0
+    fallback_models: list[ModelCapability] = field(default_factory=list)
 
     @property
     def all_models(self) -> list[ModelCapability]:
@@ -118,6 +124,70 @@ class SafetyQuery:
     context: dict[str, Any] = field(default_factory=dict)
 
 
+# ---------------------------------------------------------------------------
+# Observed latency tracking
+# ---------------------------------------------------------------------------
+
+class ModelLatencyTracker:
+    """Rolling window of observed call latencies per model.
+
+    Used to derive the p95 latency that triggers a hedged request. Until a
+    model has ``min_samples`` observations, the p95 is estimated as
+    ``avg_latency_ms * default_multiplier`` from its ModelCapability.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 200,
+        min_samples: int = 20,
+        default_multiplier: float = 2.0,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            window_size: Number of most recent observations kept per model.
+            min_samples: Observations required before the empirical p95 is
+                trusted over the capability-based estimate.
+            default_multiplier: Multiplier applied to ``avg_latency_ms`` for
+                models with too few observations.
+        """
+        self._window_size = window_size
+        self._min_samples = min_samples
+        self._default_multiplier = default_multiplier
+        self._samples: dict[str, deque[int]] = {}
+
+    def record(self, model_id: str, latency_ms: int) -> None:
+        """Record one observed call latency for a model."""
+        window = self._samples.get(model_id)
+        if window is None:
+            window = deque(maxlen=self._window_size)
+            self._samples[model_id] = window
+        window.append(max(0, latency_ms))
+
+    def sample_count(self, model_id: str) -> int:
+        """Number of latency observations currently held for a model."""
+        return len(self._samples.get(model_id, ()))
+
+    def percentile_ms(self, model: ModelCapability, percentile: float = 95.0) -> float:
+        """Return the observed latency percentile for a model.
+
+        Uses the nearest-rank method over the rolling window.
+
+        Args:
+            model: The model's capability descriptor.
+            percentile: Percentile in ``(0, 100]``.
+
+        Returns:
+            Latency in milliseconds.
+        """
+        window = self._samples.get(model.model_id)
+        if window is None or len(window) < self._min_samples:
+            return model.avg_latency_ms * self._default_multiplier
+        ordered = sorted(window)
+        rank = max(1, math.ceil(percentile / 100.0 * len(ordered)))
+        return float(ordered[rank - 1])
+
+
 # ---------------------------------------------------------------------------
 # Model backend protocol
 # ---------------------------------------------------------------------------
@@ -208,6 +278,7 @@ class PromptRouter:
         self._ensemble_threshold = ensemble_threshold
         self._max_ensemble_size = max_ensemble_size
         self._model_health: dict[str, bool] = {}
+        self._latency = ModelLatencyTracker()
 
     def register_model(self, capability: ModelCapability) -> None:
         """Register a model's capabilities with the router.
@@ -232,6 +303,23 @@ class PromptRouter:
         """
         self._model_health[model_id] = healthy
 
+    def record_latency(self, model_id: str, latency_ms: int) -> None:
+        """Record an observed call latency for a model.
+
+        Args:
+            model_id: The model that was called.
+            latency_ms: Observed wall-clock latency of the call.
+        """
+        self._latency.record(model_id, latency_ms)
+
+    def p95_latency_ms(self, model: ModelCapability) -> float:
+        """Return the observed p95 latency for a model.
+
+        Falls back to a capability-based estimate until enough calls have
+        been observed (see ``ModelLatencyTracker``).
+        """
+        return self._latency.percentile_ms(model, 95.0)
+
     def route(self, query: SafetyQuery) -> RoutingDecision:
         """Route a safety query to the optimal model(s).
 
@@ -292,6 +380,9 @@ class PromptRouter:
             primary, ensemble_models, complexity, domain, query,
         )
 
+        selected = {primary.model_id} | {m.model_id for m in ensemble_models}
+        fallback_models = [m for m in ranked if m.model_id not in selected]
+
         decision = RoutingDecision(
             primary_model=primary,
             ensemble_models=ensemble_models,
@@ -299,6 +390,7 @@ class PromptRouter:
             domain=domain,
             rationale=rationale,
             estimated_latency_ms=estimated_latency,
+            fallback_models=fallback_models,
         )
 
         logger.info(
@@ -231,16 +231,32 @@ class HypothesisGenerator:
         hypotheses: list[MechanisticHypothesis] = []
 
         for node, causal_weight, fold_change in activated_entities:
-            # Find the path from this entity to the adverse event
-            path_result = self._kg.find_paths(
-                node.node_id, ae_node_id, max_hops=4,
+            # Find the highest-weight path from this entity to the adverse event
+            path_result = self._kg.top_k_paths(
+                node.node_id, ae_node_id, k=1, max_hops=4,
             )
+            best_path = path_result.max_weight_path
+            if not best_path and path_result.truncated:
+                # The budget ran out before any path was found; fall back to
+                # the fewest-hops path, which a plain BFS finds cheaply.
+                shortest = self._kg.shortest_path(node.node_id, ae_node_id, max_hops=4)
+                if shortest is None:
+                    logger.warning(
+                        "Path search %s -> %s hit its node budget and no path "
+                        "exists within 4 hops; skipping entity",
+                        node.node_id, ae_node_id,
+                    )
+                    continue
+                logger.warning(
+                    "Path search %s -> %s hit its node budget without a path; "
+                    "using the shortest path instead of the highest-weight one",
+                    node.node_id, ae_node_id,
+                )
+                best_path = shortest
 
-            if not path_result.paths:
+            if not best_path:
                 continue
 
-            # Use the highest-weight path
-            best_path = path_result.max_weight_path
             chain = [step[0] for step in best_path] + [best_path[-1][2]]
 
             # Determine evidence level
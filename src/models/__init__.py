@@ -16,12 +16,14 @@ Models:
 
 Population-level risk models:
     bayesian_risk:      Beta-Binomial Bayesian risk estimation
+    stopping_boundaries: Cached Bayesian stopping-boundary tables
     mitigation_model:   Correlated mitigation combination model
     model_registry:     Multi-method risk estimation registry (7 models)
     model_validation:   Calibration, scoring, coverage, cross-validation
 
 FAERS signal detection:
     faers_signal:       Disproportionality analysis via openFDA API
+    faers_offline:      Full-matrix screen over a local FAERS extract
 """
 
 from src.models.biomarker_scores import (
@@ -41,28 +43,55 @@ from src.models.bayesian_risk import (
     ICAHS_PRIOR,
     ICANS_PRIOR,
     STUDY_TIMELINE,
+    PosteriorBatch,
     PosteriorEstimate,
     PriorSpec,
+    SensitivityGrid,
     StudyDataPoint,
     compute_evidence_accrual,
     compute_posterior,
+    compute_posterior_batch,
+    prior_sensitivity_grid,
 )
+from src.models.stopping_boundaries import (
+    BoundaryTable,
+    BoundaryTableService,
+    compute_boundary_table,
+    get_boundary_table,
+)
+from src.models.batch_scoring import BatchEnsembleResult, BatchModelScores
 from src.models.ensemble_runner import BiomarkerEnsembleRunner, EnsembleResult, LayerResult
 from src.models.faers_signal import (
     CAR_T_PRODUCTS,
     TARGET_AES,
     FAERSSignal,
     FAERSSummary,
+    OpenFDAClient,
+    TokenBucket,
     compute_ebgm,
+    compute_ebgm_batch,
     compute_prr,
     compute_ror,
     classify_signal,
+    classify_signal_batch,
+    compute_prr_batch,
+    compute_ror_batch,
+    faers_cache_stats,
     get_faers_signals,
     get_faers_summary,
 )
+from src.models.faers_offline import (
+    FAERSScreen,
+    build_contingency_table,
+    compute_disproportionality,
+    ingest_faers_extract,
+    precomputed_faers_signals,
+    run_faers_screen,
+)
 from src.models.model_registry import (
     MODEL_REGISTRY,
     RiskModel,
+    bayesian_beta_binomial_update,
     compare_models,
     estimate_risk,
     list_models,
@@ -73,18 +102,22 @@ from src.models.model_validation import (
     coverage_probability,
     leave_one_out_cv,
     model_comparison,
+    run_evaluation_tasks,
     sequential_prediction_test,
 )
 from src.models.mitigation_model import (
     MITIGATION_CORRELATIONS,
     MITIGATION_STRATEGIES,
+    MitigationOptimizationResult,
     MitigationResult,
     MitigationStrategy,
+    RegimenEvaluation,
     calculate_mitigated_risk,
     combine_correlated_rr,
     combine_multiple_rrs,
     get_mitigation_correlation,
     monte_carlo_mitigated_risk,
+    optimize_mitigation_regimens,
 )
 
 __all__ = [
@@ -104,6 +137,8 @@ __all__ = [
     "BiomarkerEnsembleRunner",
     "EnsembleResult",
     "LayerResult",
+    "BatchEnsembleResult",
+    "BatchModelScores",
     # Bayesian risk
     "PriorSpec",
     "PosteriorEstimate",
@@ -114,6 +149,15 @@ __all__ = [
     "STUDY_TIMELINE",
     "compute_posterior",
     "compute_evidence_accrual",
+    "PosteriorBatch",
+    "SensitivityGrid",
+    "compute_posterior_batch",
+    "prior_sensitivity_grid",
+    # Stopping boundaries
+    "BoundaryTable",
+    "BoundaryTableService",
+    "compute_boundary_table",
+    "get_boundary_table",
     # Mitigation model
     "MitigationStrategy",
     "MitigationResult",
@@ -124,16 +168,21 @@ __all__ = [
     "combine_multiple_rrs",
     "monte_carlo_mitigated_risk",
     "calculate_mitigated_risk",
+    "RegimenEvaluation",
+    "MitigationOptimizationResult",
+    "optimize_mitigation_regimens",
     # Model registry
     "MODEL_REGISTRY",
     "RiskModel",
     "estimate_risk",
     "compare_models",
+    "bayesian_beta_binomial_update",
     "list_models",
     # Model validation
     "calibration_check",
     "brier_score",
     "coverage_probability",
+    "run_evaluation_tasks",
     "leave_one_out_cv",
     "model_comparison",
     "sequential_prediction_test",
@@ -145,7 +194,21 @@ __all__ = [
     "compute_prr",
     "compute_ror",
     "compute_ebgm",
+    "compute_ebgm_batch",
     "classify_signal",
     "get_faers_signals",
     "get_faers_summary",
+    "OpenFDAClient",
+    "TokenBucket",
+    "faers_cache_stats",
+    "compute_prr_batch",
+    "compute_ror_batch",
+    "classify_signal_batch",
+    # Offline FAERS screen
+    "FAERSScreen",
+    "ingest_faers_extract",
+    "build_contingency_table",
+    "compute_disproportionality",
+    "run_faers_screen",
+    "precomputed_faers_signals",
 ]
@@ -0,0 +1,709 @@
+"""
+Vectorized batch scoring for the biomarker ensemble.
+
+Computes all seven scores from ``biomarker_scores`` over a whole cohort of lab
+panels at once.  Input is columnar -- a mapping of column name to array-like,
+a pandas DataFrame, or a polars DataFrame -- and every formula, validation
+rule, and risk threshold is evaluated as NumPy array operations.
+
+The per-row semantics reproduce ``BiomarkerEnsembleRunner.run`` exactly:
+
+    - Column names are alias-resolved once per column (``ldh`` ->
+      ``ldh_u_per_l``), with the first column mapping to a canonical name
+      taking precedence, as in ``_resolve_aliases``.
+    - Each model's row status is *run*, *skipped* (a required field is
+      missing, or too few optional variables are present) or *failed*
+      (non-numeric, below physiological minimum, division by zero, etc.).
+    - Scores, risk levels, and confidences match the per-dict scorers.
+
+Missing values are ``None`` or ``NaN``; both are treated like an absent key
+in the per-dict API.
+
+Usage::
+
+    runner = BiomarkerEnsembleRunner()
+    batch = runner.run_batch(cohort_df)
+    easix = batch.models["EASIX"].score          # float64, NaN if not run
+    batch.overall_risk_levels()                  # [RiskLevel | None, ...]
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.models.biomarker_scores import (
+    _FIELD_ALIASES,
+    _PHYSIOLOGICAL_BOUNDS,
+    EASIX,
+    CARHematotox,
+    HayBinaryClassifier,
+    HScore,
+    ModifiedEASIX,
+    PreModifiedEASIX,
+    RiskLevel,
+    TeacheyCytokineModel,
+)
+
+# Row status codes
+STATUS_RUN = 0
+STATUS_SKIPPED = 1
+STATUS_FAILED = 2
+
+# Risk codes; -1 means "no risk level" (model not run)
+RISK_NONE = -1
+_RISK_LEVELS: tuple[RiskLevel, ...] = (RiskLevel.LOW, RiskLevel.MODERATE, RiskLevel.HIGH)
+
+# math.exp overflows above this argument; the per-dict Teachey model raises
+# (and the runner records a failure) for such rows.
+_EXP_OVERFLOW = 709.782712893384
+
+_TRUE_STRINGS = frozenset({"true", "yes", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "0"})
+
+_ORGANOMEGALY_POINTS: dict[str, int] = {
+    "none": 0, "no": 0, "0": 0, "false": 0,
+    "hepatomegaly": 23, "splenomegaly": 23, "hepato": 23, "spleno": 23,
+    "both": 38, "hepatosplenomegaly": 38,
+}
+
+
+# ---------------------------------------------------------------------------
+# Output dataclasses
+# ---------------------------------------------------------------------------
+
+@dataclass
+class BatchModelScores:
+    """Per-row output of one scoring model over a batch.
+
+    Attributes:
+        model_name: Canonical model name (matches ``ScoringResult.model_name``).
+        layer: Ensemble layer (0 = standard labs, 1 = cytokine panel).
+        score: Score per row (float64); NaN where the model did not run.
+        risk_code: Risk per row as an int8 index into
+            ``(LOW, MODERATE, HIGH)``; -1 where the model did not run.
+        confidence: Confidence per row; 0.0 where the model did not run.
+        status: ``STATUS_RUN``, ``STATUS_SKIPPED`` or ``STATUS_FAILED``.
+        metadata: Additional per-row arrays (e.g. HLH probability).
+    """
+
+    model_name: str
+    layer: int
+    score: np.ndarray
+    risk_code: np.ndarray
+    confidence: np.ndarray
+    status: np.ndarray
+    metadata: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def run_mask(self) -> np.ndarray:
+        """Rows where the model produced a valid score."""
+        return self.status == STATUS_RUN
+
+    @property
+    def skipped_mask(self) -> np.ndarray:
+        """Rows skipped for missing or insufficient data."""
+        return self.status == STATUS_SKIPPED
+
+    @property
+    def failed_mask(self) -> np.ndarray:
+        """Rows where validation or computation failed."""
+        return self.status == STATUS_FAILED
+
+    def risk_levels(self) -> list[RiskLevel | None]:
+        """Return the risk level per row as RiskLevel enums."""
+        return _decode_risk(self.risk_code)
+
+
+@dataclass
+class BatchEnsembleResult:
+    """Columnar output from ``BiomarkerEnsembleRunner.run_batch``.
+
+    Row *i* of every array corresponds to row *i* of the input and matches
+    the aggregate fields of ``BiomarkerEnsembleRunner.run`` on that row.
+
+    Attributes:
+        n_rows: Number of input rows.
+        columns: Canonical (alias-resolved) input column names.
+        models: Per-model scores keyed by model name, in ensemble order.
+        layer_risk_code: ``(n_rows, 2)`` maximum risk code per layer.
+        layer_confidence: ``(n_rows, 2)`` mean confidence per layer.
+        overall_risk_code: Maximum risk code across all models.
+        overall_confidence: Mean confidence across all valid models.
+        model_count_run: Models that produced a valid score, per row.
+        model_count_skipped: Models skipped for missing data, per row.
+        model_count_failed: Models that errored, per row.
+        high_risk_count: Models reporting HIGH risk, per row.
+        discordant: Rows where at least one model reports HIGH and another
+            reports LOW (the runner's risk-discordance warning).
+    """
+
+    n_rows: int
+    columns: list[str]
+    models: dict[str, BatchModelScores]
+    layer_risk_code: np.ndarray
+    layer_confidence: np.ndarray
+    overall_risk_code: np.ndarray
+    overall_confidence: np.ndarray
+    model_count_run: np.ndarray
+    model_count_skipped: np.ndarray
+    model_count_failed: np.ndarray
+    high_risk_count: np.ndarray
+    discordant: np.ndarray
+
+    def overall_risk_levels(self) -> list[RiskLevel | None]:
+        """Return the overall risk level per row as RiskLevel enums."""
+        return _decode_risk(self.overall_risk_code)
+
+    def to_pandas(self) -> Any:
+        """Return a flat pandas DataFrame with one row per input row.
+
+        Columns are ``<model>_score``, ``<model>_risk``, ``<model>_confidence``
+        and ``<model>_status`` for every model, followed by the ensemble
+        aggregates.
+        """
+        import pandas as pd
+
+        status_names = np.array(["run", "skipped", "failed"], dtype=object)
+        frame: dict[str, Any] = {}
+        for name, scores in self.models.items():
+            frame[f"{name}_score"] = scores.score
+            frame[f"{name}_risk"] = _risk_names(scores.risk_code)
+            frame[f"{name}_confidence"] = scores.confidence
+            frame[f"{name}_status"] = status_names[scores.status]
+        frame["overall_risk_level"] = _risk_names(self.overall_risk_code)
+        frame["overall_confidence"] = self.overall_confidence
+        frame["model_count_run"] = self.model_count_run
+        frame["model_count_skipped"] = self.model_count_skipped
+        frame["model_count_failed"] = self.model_count_failed
+        frame["high_risk_count"] = self.high_risk_count
+        frame["discordant"] = self.discordant
+        return pd.DataFrame(frame)
+
+
+def _decode_risk(codes: np.ndarray) -> list[RiskLevel | None]:
+    return [_RISK_LEVELS[c] if c >= 0 else None for c in codes.tolist()]
+
+
+def _risk_names(codes: np.ndarray) -> np.ndarray:
+    names = np.array([None, "low", "moderate", "high"], dtype=object)
+    return names[codes.astype(np.int64) + 1]
+
+
+# ---------------------------------------------------------------------------
+# Columnar input coercion
+# ---------------------------------------------------------------------------
+
+def _is_missing(value: Any) -> bool:
+    """Whether a scalar counts as an absent value (None / NaN / pandas NA)."""
+    if value is None:
+        return True
+    if isinstance(value, float) and math.isnan(value):
+        return True
+    return type(value).__name__ in ("NAType", "NaTType")
+
+
+def _as_columns(data: Any) -> tuple[dict[str, np.ndarray], int]:
+    """Convert columnar input into alias-resolved NumPy columns.
+
+    Accepts a pandas or polars DataFrame (anything with ``columns`` and
+    ``__getitem__`` returning a ``to_numpy()``-able series) or a mapping of
+    column name to array-like.
+    """
+    if isinstance(data, Mapping):
+        raw_columns = {str(k): np.asarray(v) for k, v in data.items()}
+    elif hasattr(data, "columns"):
+        raw_columns = {str(k): np.asarray(data[k].to_numpy()) for k in data.columns}
+    else:
+        raise TypeError(
+            "run_batch expects a mapping of column arrays or a pandas/polars "
+            f"DataFrame, got {type(data).__name__}"
+        )
+
+    lengths = {len(col) for col in raw_columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+    n_rows = lengths.pop() if lengths else 0
+
+    resolved: dict[str, np.ndarray] = {}
+    for name, col in raw_columns.items():
+        canonical = _FIELD_ALIASES.get(name, name)
+        if canonical not in resolved:
+            resolved[canonical] = col
+    return resolved, n_rows
+
+
+@dataclass
+class _NumericColumn:
+    """A column parsed as floats with presence and parse masks."""
+
+    values: np.ndarray   # float64, NaN where absent or non-numeric
+    present: np.ndarray  # value supplied (not None/NaN)
+    numeric: np.ndarray  # value supplied and parsed as a number
+
+
+def _numeric(columns: dict[str, np.ndarray], key: str, n: int) -> _NumericColumn:
+    col = columns.get(key)
+    if col is None:
+        empty = np.zeros(n, dtype=bool)
+        return _NumericColumn(np.full(n, np.nan), empty, empty.copy())
+
+    if col.dtype.kind in "fiub":
+        values = col.astype(np.float64)
+        present = ~np.isnan(values)
+        return _NumericColumn(values, present, present.copy())
+
+    values = np.full(n, np.nan)
+    present = np.zeros(n, dtype=bool)
+    numeric = np.zeros(n, dtype=bool)
+    for i, raw in enumerate(col.tolist()):
+        if _is_missing(raw):
+            continue
+        present[i] = True
+        try:
+            values[i] = float(raw)
+        except (TypeError, ValueError):
+            continue
+        numeric[i] = True
+    return _NumericColumn(values, present, numeric)
+
+
+@dataclass
+class _Validated:
+    """Result of vectorized ``_validate_positive`` over one column."""
+
+    values: np.ndarray
+    ok: np.ndarray        # usable value (the scalar helper returned a number)
+    missing: np.ndarray   # "Missing required field" / optional not provided
+    invalid: np.ndarray   # non-numeric or below the physiological minimum
+    above: np.ndarray     # exceeds physiological maximum (warning only)
+
+
+def _positive(columns: dict[str, np.ndarray], key: str, n: int) -> _Validated:
+    col = _numeric(columns, key, n)
+    lo, hi = _PHYSIOLOGICAL_BOUNDS.get(key, (0.0, float("inf")))
+    below = col.numeric & (col.values < lo)
+    ok = col.numeric & ~below
+    return _Validated(
+        values=col.values,
+        ok=ok,
+        missing=~col.present,
+        invalid=(col.present & ~col.numeric) | below,
+        above=ok & (col.values > hi),
+    )
+
+
+def _non_negative_int(columns: dict[str, np.ndarray], key: str, n: int) -> _Validated:
+    """Vectorized ``_validate_non_negative_int`` (``int()`` truncation)."""
+    col = columns.get(key)
+    values = np.full(n, np.nan)
+    present = np.zeros(n, dtype=bool)
+    parsed = np.zeros(n, dtype=bool)
+    if col is not None:
+        if col.dtype.kind in "fiub":
+            raw = col.astype(np.float64)
+            present = ~np.isnan(raw)
+            parsed = present & np.isfinite(raw)
+            values = np.where(parsed, np.trunc(raw), np.nan)
+        else:
+            for i, item in enumerate(col.tolist()):
+                if _is_missing(item):
+                    continue
+                present[i] = True
+                try:
+                    values[i] = int(item)
+                except (TypeError, ValueError, OverflowError):
+                    continue
+                parsed[i] = True
+    negative = parsed & (values < 0)
+    ok = parsed & ~negative
+    return _Validated(
+        values=values,
+        ok=ok,
+        missing=~present,
+        invalid=(present & ~parsed) | negative,
+        above=np.zeros(n, dtype=bool),
+    )
+
+
+def _boolean(columns: dict[str, np.ndarray], key: str, n: int) -> _Validated:
+    """Vectorized ``_validate_bool``; ``values`` holds 1.0 / 0.0."""
+    col = columns.get(key)
+    values = np.zeros(n)
+    present = np.zeros(n, dtype=bool)
+    parsed = np.zeros(n, dtype=bool)
+    if col is not None:
+        if col.dtype.kind in "fiub":
+            raw = col.astype(np.float64)
+            present = ~np.isnan(raw)
+            parsed = present.copy()
+            values = np.where(parsed & (raw != 0), 1.0, 0.0)
+        else:
+            for i, item in enumerate(col.tolist()):
+                if _is_missing(item):
+                    continue
+                present[i] = True
+                if isinstance(item, (bool, int, float, np.bool_, np.number)):
+                    values[i] = 1.0 if bool(item) else 0.0
+                    parsed[i] = True
+                elif isinstance(item, str):
+                    lowered = item.lower()
+                    if lowered in _TRUE_STRINGS:
+                        values[i] = 1.0
+                        parsed[i] = True
+                    elif lowered in _FALSE_STRINGS:
+                        parsed[i] = True
+    return _Validated(
+        values=values,
+        ok=parsed,
+        missing=~present,
+        invalid=present & ~parsed,
+        above=np.zeros(n, dtype=bool),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared vectorized helpers
+# ---------------------------------------------------------------------------
+
+def _classify(values: np.ndarray, low: float, high: float, run: np.ndarray) -> np.ndarray:
+    """Three-way threshold classification (``< low`` / ``< high`` / else)."""
+    codes = np.where(values < low, 0, np.where(values < high, 1, 2)).astype(np.int8)
+    codes[~run] = RISK_NONE
+    return codes
+
+
+def _round3(values: np.ndarray) -> np.ndarray:
+    """Round to 3 decimals exactly as Python's ``round`` does.
+
+    ``np.round`` scales by 1000 before rounding and can differ from the
+    per-dict scorers at half-way values, so confidences are rounded with the
+    builtin to keep batch and per-dict output identical.
+    """
+    return np.array([round(v, 3) for v in values.tolist()], dtype=np.float64)
+
+
+def _status(run: np.ndarray, skipped: np.ndarray) -> np.ndarray:
+    status = np.full(run.shape, STATUS_FAILED, dtype=np.int8)
+    status[skipped] = STATUS_SKIPPED
+    status[run] = STATUS_RUN
+    return status
+
+
+def _tiered_points(
+    values: np.ndarray,
+    cut_low: float,
+    cut_high: float,
+    points: tuple[int, int, int],
+) -> np.ndarray:
+    """Points for ``< cut_low`` / ``<= cut_high`` / above, as in the scorers."""
+    return np.where(
+        values < cut_low,
+        points[0],
+        np.where(values <= cut_high, points[1], points[2]),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Vectorized scorers
+# ---------------------------------------------------------------------------
+
+def _score_ratio(
+    columns: dict[str, np.ndarray],
+    n: int,
+    numerator_keys: tuple[str, str],
+    model_name: str,
+    low: float,
+    high: float,
+) -> BatchModelScores:
+    """EASIX-family score: ``(a * b) / platelets``."""
+    a = _positive(columns, numerator_keys[0], n)
+    b = _positive(columns, numerator_keys[1], n)
+    plt = _positive(columns, "platelets_per_nl", n)
+
+    any_missing = a.missing | b.missing | plt.missing
+    has_error = any_missing | a.invalid | b.invalid | plt.invalid
+    zero_platelets = ~has_error & (plt.values == 0.0)
+    run = ~has_error & ~zero_platelets
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.where(run, a.values * b.values / plt.values, np.nan)
+
+    warned = a.above | b.above | plt.above
+    confidence = np.where(run, np.where(warned, 0.85, 1.0), 0.0)
+
+    return BatchModelScores(
+        model_name=model_name,
+        layer=0,
+        score=score,
+        risk_code=_classify(score, low, high, run),
+        confidence=confidence,
+        status=_status(run, has_error & any_missing),
+    )
+
+
+def _score_hscore(columns: dict[str, np.ndarray], n: int) -> BatchModelScores:
+    temp = _positive(columns, "temperature_c", n)
+    cyto = _non_negative_int(columns, "cytopenias_lineages", n)
+    ferritin = _positive(columns, "ferritin_ng_ml", n)
+    trig = _positive(columns, "triglycerides_mmol_l", n)
+    fib = _positive(columns, "fibrinogen_g_l", n)
+    ast = _positive(columns, "ast_u_per_l", n)
+    hemo = _boolean(columns, "hemophagocytosis_on_bm", n)
+    immuno = _boolean(columns, "known_immunosuppression", n)
+
+    organo_available = np.zeros(n, dtype=bool)
+    organo_points = np.zeros(n, dtype=np.int64)
+    organo_col = columns.get("organomegaly")
+    if organo_col is not None:
+        for i, item in enumerate(organo_col.tolist()):
+            if _is_missing(item):
+                continue
+            organo_available[i] = True
+            organo_points[i] = _ORGANOMEGALY_POINTS.get(str(item).lower().strip(), 0)
+
+    parts = [
+        (temp.ok, _tiered_points(temp.values, 38.4, 39.4, (0, 33, 49))),
+        (organo_available, organo_points),
+        (cyto.ok, np.where(cyto.values <= 1, 0, np.where(cyto.values == 2, 24, 34))),
+        (ferritin.ok, _tiered_points(ferritin.values, 2000.0, 6000.0, (0, 35, 50))),
+        (trig.ok, _tiered_points(trig.values, 1.5, 4.0, (0, 44, 64))),
+        (fib.ok, np.where(fib.values <= 2.5, 30, 0)),
+        (ast.ok, np.where(ast.values >= 30.0, 19, 0)),
+        (hemo.ok, np.where(hemo.values > 0, 35, 0)),
+        (immuno.ok, np.where(immuno.values > 0, 18, 0)),
+    ]
+    available = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n, dtype=np.int64)
+    for mask, points in parts:
+        available += mask
+        total += np.where(mask, points, 0)
+
+    has_error = (
+        temp.invalid | cyto.invalid | ferritin.invalid | trig.invalid
+        | fib.invalid | ast.invalid | hemo.invalid | immuno.invalid
+    )
+    insufficient = ~has_error & (available < 3)
+    run = ~has_error & ~insufficient
+
+    score = np.where(run, total.astype(np.float64), np.nan)
+    confidence = np.where(run, _round3(available / 9), 0.0)
+    probability = np.where(run, 1.0 / (1.0 + np.exp(-0.04 * (total - 168))), np.nan)
+
+    return BatchModelScores(
+        model_name=HScore.MODEL_NAME,
+        layer=0,
+        score=score,
+        risk_code=_classify(score, HScore.THRESHOLD_LOW, HScore.THRESHOLD_HIGH, run),
+        confidence=confidence,
+        status=_status(run, insufficient),
+        metadata={
+            "hlh_probability_estimate": np.round(probability, 4),
+            "variables_available": available,
+        },
+    )
+
+
+def _score_car_hematotox(columns: dict[str, np.ndarray], n: int) -> BatchModelScores:
+    anc = _positive(columns, "anc_10e9_per_l", n)
+    hgb = _positive(columns, "hemoglobin_g_dl", n)
+    plt = _positive(columns, "platelets_per_nl", n)
+    crp = _positive(columns, "crp_mg_l", n)
+    ferritin = _positive(columns, "ferritin_ng_ml", n)
+
+    parts = [
+        (anc.ok, _tiered_points(anc.values, 0.5, 1.0, (2, 1, 0))),
+        (hgb.ok, _tiered_points(hgb.values, 8.0, 10.0, (2, 1, 0))),
+        (plt.ok, _tiered_points(plt.values, 50.0, 100.0, (2, 1, 0))),
+        (crp.ok, _tiered_points(crp.values, 10.0, 50.0, (0, 1, 2))),
+        (ferritin.ok, _tiered_points(ferritin.values, 500.0, 1000.0, (0, 1, 2))),
+    ]
+    available = np.zeros(n, dtype=np.int64)
+    total = np.zeros(n, dtype=np.int64)
+    for mask, points in parts:
+        available += mask
+        total += np.where(mask, points, 0)
+
+    has_error = anc.invalid | hgb.invalid | plt.invalid | crp.invalid | ferritin.invalid
+    insufficient = ~has_error & (available < 3)
+    run = ~has_error & ~insufficient
+
+    score = np.where(run, total.astype(np.float64), np.nan)
+    return BatchModelScores(
+        model_name=CARHematotox.MODEL_NAME,
+        layer=0,
+        score=score,
+        risk_code=_classify(
+            score, CARHematotox.THRESHOLD_LOW, CARHematotox.THRESHOLD_HIGH, run,
+        ),
+        confidence=np.where(run, _round3(available / 5), 0.0),
+        status=_status(run, insufficient),
+        metadata={"variables_available": available},
+    )
+
+
+def _score_teachey(columns: dict[str, np.ndarray], n: int) -> BatchModelScores:
+    model = TeacheyCytokineModel
+    ifn = _positive(columns, "ifn_gamma_pg_ml", n)
+    sgp130 = _positive(columns, "sgp130_ng_ml", n)
+    il1ra = _positive(columns, "il1ra_pg_ml", n)
+
+    any_missing = ifn.missing | sgp130.missing | il1ra.missing
+    has_error = any_missing | ifn.invalid | sgp130.invalid | il1ra.invalid
+    non_positive = ~has_error & (
+        (ifn.values <= 0.0) | (sgp130.values <= 0.0) | (il1ra.values <= 0.0)
+    )
+    candidate = ~has_error & ~non_positive
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        logit = (
+            model.BETA_0
+            + model.BETA_1_IFN_GAMMA * np.log(np.where(candidate, ifn.values, 1.0))
+            + model.BETA_2_SGP130 * np.log(np.where(candidate, sgp130.values, 1.0))
+            + model.BETA_3_IL1RA * np.log(np.where(candidate, il1ra.values, 1.0))
+        )
+        overflow = candidate & (-logit > _EXP_OVERFLOW)
+        run = candidate & ~overflow
+        probability = np.where(run, 1.0 / (1.0 + np.exp(-logit)), np.nan)
+
+    return BatchModelScores(
+        model_name=model.MODEL_NAME,
+        layer=1,
+        score=np.round(probability, 6),
+        risk_code=_classify(probability, model.THRESHOLD_LOW, model.THRESHOLD_HIGH, run),
+        confidence=np.where(run, 0.95, 0.0),
+        status=_status(run, has_error & any_missing),
+        metadata={"logit": np.where(run, logit, np.nan)},
+    )
+
+
+def _score_hay(columns: dict[str, np.ndarray], n: int) -> BatchModelScores:
+    model = HayBinaryClassifier
+    temp_c = _positive(columns, "temperature_c", n)
+    temp_f = _positive(columns, "temperature_f", n)
+
+    run = temp_c.ok | temp_f.ok
+    temperature = np.where(
+        temp_c.ok, temp_c.values,
+        np.where(temp_f.ok, (temp_f.values - 32.0) * 5.0 / 9.0, np.nan),
+    )
+
+    hours = _numeric(columns, "hours_since_infusion", n)
+    timing_valid = ~(hours.numeric & (hours.values > model.MAX_HOURS))
+
+    fever = run & (temperature >= model.FEVER_THRESHOLD_C)
+    mcp1 = _positive(columns, "mcp1_pg_ml", n)
+    tachy = _boolean(columns, "tachycardia", n)
+
+    mcp1_positive = mcp1.ok & (mcp1.values > model.MCP1_THRESHOLD)
+    tachy_positive = tachy.ok & (tachy.values > 0)
+    rule_met = fever & (mcp1_positive | (~mcp1.ok & tachy_positive))
+    indeterminate = fever & ~rule_met & ~mcp1.ok & ~tachy.ok
+
+    # Default: rule not met (fever absent, or MCP-1 below threshold)
+    risk = np.zeros(n, dtype=np.int8)
+    risk[indeterminate] = 1
+    risk[rule_met] = 2
+    risk[~run] = RISK_NONE
+
+    confidence = np.where(
+        ~fever,
+        np.where(timing_valid, 0.95, 0.70),
+        np.where(timing_valid, 0.90, 0.65),
+    )
+    confidence = np.where(rule_met, np.where(timing_valid, 0.95, 0.75), confidence)
+    confidence = np.where(indeterminate, 0.50, confidence)
+    confidence = np.where(run, confidence, 0.0)
+
+    return BatchModelScores(
+        model_name=model.MODEL_NAME,
+        layer=1,
+        score=np.where(run, np.where(rule_met, 1.0, 0.0), np.nan),
+        risk_code=risk,
+        confidence=confidence,
+        status=_status(run, ~run),
+        metadata={"fever_criterion_met": fever},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Public entry point
+# ---------------------------------------------------------------------------
+
+def score_batch(data: Any) -> BatchEnsembleResult:
+    """Score every row of a columnar cohort with all ensemble models.
+
+    Args:
+        data: Mapping of column name to array-like, or a pandas/polars
+            DataFrame.  Column names follow the same canonical names and
+            aliases as the per-dict scorers.
+
+    Returns:
+        A BatchEnsembleResult with per-model and ensemble arrays.
+
+    Raises:
+        TypeError: If ``data`` is not a supported columnar type.
+        ValueError: If columns have differing lengths.
+    """
+    columns, n = _as_columns(data)
+
+    pre_modified = _score_ratio(
+        columns, n, ("ldh_u_per_l", "crp_mg_dl"), PreModifiedEASIX.MODEL_NAME,
+        PreModifiedEASIX.THRESHOLD_LOW, PreModifiedEASIX.THRESHOLD_HIGH,
+    )
+    pre_modified.metadata["is_pre_infusion"] = np.ones(n, dtype=bool)
+
+    ordered = [
+        _score_ratio(
+            columns, n, ("ldh_u_per_l", "creatinine_mg_dl"), EASIX.MODEL_NAME,
+            EASIX.THRESHOLD_LOW, EASIX.THRESHOLD_HIGH,
+        ),
+        _score_ratio(
+            columns, n, ("ldh_u_per_l", "crp_mg_dl"), ModifiedEASIX.MODEL_NAME,
+            ModifiedEASIX.THRESHOLD_LOW, ModifiedEASIX.THRESHOLD_HIGH,
+        ),
+        pre_modified,
+        _score_hscore(columns, n),
+        _score_car_hematotox(columns, n),
+        _score_teachey(columns, n),
+        _score_hay(columns, n),
+    ]
+    models = {m.model_name: m for m in ordered}
+
+    risk = np.stack([m.risk_code for m in ordered], axis=1)
+    conf = np.stack([m.confidence for m in ordered], axis=1)
+    status = np.stack([m.status for m in ordered], axis=1)
+    layers = np.array([m.layer for m in ordered])
+    valid = status == STATUS_RUN
+
+    def _mean_confidence(mask: np.ndarray) -> np.ndarray:
+        count = mask.sum(axis=1)
+        total = np.where(mask, conf, 0.0).sum(axis=1)
+        return np.where(count > 0, _round3(total / np.maximum(count, 1)), 0.0)
+
+    layer_risk = np.stack(
+        [risk[:, layers == layer].max(axis=1, initial=RISK_NONE) for layer in (0, 1)],
+        axis=1,
+    ).astype(np.int8)
+    layer_conf = np.stack(
+        [_mean_confidence(valid & (layers == layer)) for layer in (0, 1)], axis=1,
+    )
+
+    return BatchEnsembleResult(
+        n_rows=n,
+        columns=list(columns),
+        models=models,
+        layer_risk_code=layer_risk,
+        layer_confidence=layer_conf,
+        overall_risk_code=risk.max(axis=1, initial=RISK_NONE).astype(np.int8),
+        overall_confidence=_mean_confidence(valid),
+        model_count_run=valid.sum(axis=1),
+        model_count_skipped=(status == STATUS_SKIPPED).sum(axis=1),
+        model_count_failed=(status == STATUS_FAILED).sum(axis=1),
+        high_risk_count=(risk == 2).sum(axis=1),
+        discordant=(risk == 2).any(axis=1) & (risk == 0).any(axis=1),
+    )
@@ -25,6 +25,9 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
 
 try:
     from scipy.stats import beta as beta_dist
@@ -32,6 +35,8 @@ try:
 except ImportError:
     _HAS_SCIPY = False
 
+from src.models.stopping_boundaries import get_boundary_table
+
 logger = logging.getLogger(__name__)
 
 
@@ -111,6 +116,101 @@ class StudyDataPoint:
     is_projected: bool = False
 
 
+@dataclass
+class PosteriorBatch:
+    """Beta posteriors for many (prior, data) combinations at once.
+
+    Every field is an array of the same (broadcast) shape; rates are
+    percentages (0-100 scale) and, unlike :class:`PosteriorEstimate`, are
+    not rounded.
+
+    Attributes:
+        mean: Posterior mean rates (%).
+        ci_low: Lower credible-interval bounds (%).
+        ci_high: Upper credible-interval bounds (%).
+        ci_width: Credible-interval widths (percentage points).
+        alpha: Posterior alpha parameters.
+        beta: Posterior beta parameters.
+        n_patients: Sample sizes.
+        n_events: Observed event counts.
+        ci_level: Credible-interval probability (e.g. 0.95).
+    """
+
+    mean: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    ci_width: np.ndarray
+    alpha: np.ndarray
+    beta: np.ndarray
+    n_patients: np.ndarray
+    n_events: np.ndarray
+    ci_level: float = 0.95
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Broadcast shape of the batch."""
+        return self.mean.shape
+
+    def estimate(self, index: int | tuple[int, ...]) -> PosteriorEstimate:
+        """One element as a :class:`PosteriorEstimate`, rounded like
+        :func:`compute_posterior`."""
+        return PosteriorEstimate(
+            mean=round(float(self.mean[index]), 4),
+            ci_low=round(float(self.ci_low[index]), 4),
+            ci_high=round(float(self.ci_high[index]), 4),
+            ci_width=round(float(self.ci_width[index]), 4),
+            alpha=round(float(self.alpha[index]), 4),
+            beta=round(float(self.beta[index]), 4),
+            n_patients=int(self.n_patients[index]),
+            n_events=int(self.n_events[index]),
+        )
+
+    def to_estimates(self) -> list[PosteriorEstimate]:
+        """All elements in C order as :class:`PosteriorEstimate` objects."""
+        return [self.estimate(i) for i in np.ndindex(self.shape)]
+
+
+@dataclass
+class SensitivityGrid:
+    """Posteriors over a prior-ESS x prior-mean x observed-data grid.
+
+    Attributes:
+        effective_sample_sizes: Prior effective sample sizes (alpha + beta),
+            axis 0 of ``posteriors``.
+        prior_means: Prior means (proportions), axis 1.
+        events: Observed event counts, axis 2 (paired with ``n_patients``).
+        n_patients: Sample sizes, axis 2.
+        posteriors: Batch of shape ``(len(ess), len(means), len(data))``.
+    """
+
+    effective_sample_sizes: np.ndarray
+    prior_means: np.ndarray
+    events: np.ndarray
+    n_patients: np.ndarray
+    posteriors: PosteriorBatch
+
+    def rows(self) -> list[dict]:
+        """One dict per grid point, ESS varying slowest."""
+        post = self.posteriors
+        rows = []
+        for i, j, k in np.ndindex(post.shape):
+            ess = float(self.effective_sample_sizes[i])
+            prior_mean = float(self.prior_means[j])
+            rows.append({
+                "effective_n": ess,
+                "prior_mean_pct": round(prior_mean * 100.0, 4),
+                "prior_alpha": round(prior_mean * ess, 4),
+                "prior_beta": round((1.0 - prior_mean) * ess, 4),
+                "events": int(self.events[k]),
+                "n_patients": int(self.n_patients[k]),
+                "posterior_mean_pct": round(float(post.mean[i, j, k]), 4),
+                "ci_low_pct": round(float(post.ci_low[i, j, k]), 4),
+                "ci_high_pct": round(float(post.ci_high[i, j, k]), 4),
+                "ci_width_pct": round(float(post.ci_width[i, j, k]), 4),
+            })
+        return rows
+
+
 # ---------------------------------------------------------------------------
 # Key constants -- informative priors
 #
@@ -360,6 +460,151 @@ def compute_posterior(
     )
 
 
+def compute_posterior_batch(
+    alpha,
+    beta,
+    events,
+    n,
+    ci_level: float = 0.95,
+) -> PosteriorBatch:
+    """Vectorized :func:`compute_posterior` over arrays of priors and data.
+
+    Inputs broadcast against each other, so one prior can be applied to many
+    datasets or many priors to one dataset.  Both credible-interval bounds
+    come from a single vectorized ``beta.ppf`` call; elements match
+    :func:`compute_posterior` exactly (before its rounding).
+
+    Args:
+        alpha: Prior alpha parameter(s).
+        beta: Prior beta parameter(s).
+        events: Observed event count(s).
+        n: Sample size(s).
+        ci_level: Credible-interval probability.  Default 0.95.
+
+    Returns:
+        PosteriorBatch with the broadcast shape of the inputs.
+
+    Raises:
+        ValueError: If any events > n, any count is negative, a prior
+            parameter is not positive, or ci_level is outside (0, 1).
+        RuntimeError: If scipy is unavailable and any posterior has
+            alpha + beta < 30 (see :func:`compute_posterior`).
+    """
+    if not (0 < ci_level < 1):
+        raise ValueError(f"ci_level must be in (0, 1), got {ci_level}")
+
+    alpha, beta, events, n = np.broadcast_arrays(
+        np.asarray(alpha, dtype=float),
+        np.asarray(beta, dtype=float),
+        np.asarray(events, dtype=np.int64),
+        np.asarray(n, dtype=np.int64),
+    )
+    if (events < 0).any() or (n < 0).any():
+        raise ValueError("events and n must be non-negative")
+    if (events > n).any():
+        raise ValueError("events cannot exceed n")
+    if (alpha <= 0).any() or (beta <= 0).any():
+        raise ValueError("prior alpha and beta must be positive")
+
+    a = alpha + events
+    b = beta + (n - events)
+    mean = a / (a + b)
+
+    tail = (1.0 - ci_level) / 2.0
+    if _HAS_SCIPY:
+        # Exact Beta quantiles for both bounds in one call
+        levels = np.array([tail, 1.0 - tail]).reshape((2,) + (1,) * a.ndim)
+        ci_low, ci_high = beta_dist.ppf(levels, a, b)
+    else:
+        # Normal-approximation fallback, with the same guard as compute_posterior
+        effective_sample_size = a + b
+        if (effective_sample_size < 30).any():
+            raise RuntimeError(
+                f"Normal approximation fallback is not appropriate for small "
+                f"effective sample sizes (min alpha + beta = "
+                f"{effective_sample_size.min():.2f} < 30).  Install scipy for "
+                f"exact Beta quantiles: pip install scipy"
+            )
+        logger.warning(
+            "Using normal approximation for %d Beta CIs; "
+            "install scipy for exact quantiles.", a.size,
+        )
+        z = NormalDist().inv_cdf(1.0 - tail)
+        std = np.sqrt((a * b) / ((a + b) ** 2 * (a + b + 1)))
+        ci_low = np.maximum(0.0, mean - z * std)
+        ci_high = np.minimum(1.0, mean + z * std)
+
+    mean_pct = mean * 100.0
+    ci_low_pct = ci_low * 100.0
+    ci_high_pct = ci_high * 100.0
+
+    return PosteriorBatch(
+        mean=mean_pct,
+        ci_low=ci_low_pct,
+        ci_high=ci_high_pct,
+        ci_width=ci_high_pct - ci_low_pct,
+        alpha=a,
+        beta=b,
+        n_patients=n.copy(),
+        n_events=events.copy(),
+        ci_level=ci_level,
+    )
+
+
+def prior_sensitivity_grid(
+    prior_means,
+    effective_sample_sizes,
+    events,
+    n,
+    ci_level: float = 0.95,
+) -> SensitivityGrid:
+    """Posteriors for every prior ESS x prior mean x dataset combination.
+
+    Each prior is ``Beta(mean * ess, (1 - mean) * ess)``.  ``events`` and
+    ``n`` are paired element-wise and form the data axis.
+
+    Args:
+        prior_means: Prior means as proportions in (0, 1).
+        effective_sample_sizes: Prior effective sample sizes (> 0).
+        events: Observed event counts, one per dataset.
+        n: Sample sizes, one per dataset.
+        ci_level: Credible-interval probability.  Default 0.95.
+
+    Returns:
+        SensitivityGrid with posteriors of shape
+        ``(len(effective_sample_sizes), len(prior_means), len(events))``.
+
+    Raises:
+        ValueError: If a prior mean is outside (0, 1), an ESS is not
+            positive, or ``events`` and ``n`` differ in length.
+    """
+    means = np.atleast_1d(np.asarray(prior_means, dtype=float))
+    ess = np.atleast_1d(np.asarray(effective_sample_sizes, dtype=float))
+    events = np.atleast_1d(np.asarray(events, dtype=np.int64))
+    n = np.atleast_1d(np.asarray(n, dtype=np.int64))
+    if ((means <= 0) | (means >= 1)).any():
+        raise ValueError("prior_means must be in (0, 1)")
+    if (ess <= 0).any():
+        raise ValueError("effective_sample_sizes must be positive")
+    if events.shape != n.shape:
+        raise ValueError(
+            f"events {events.shape} and n {n.shape} must have the same length"
+        )
+
+    alpha = means[None, :, None] * ess[:, None, None]
+    beta = (1.0 - means)[None, :, None] * ess[:, None, None]
+    posteriors = compute_posterior_batch(
+        alpha, beta, events[None, None, :], n[None, None, :], ci_level,
+    )
+    return SensitivityGrid(
+        effective_sample_sizes=ess,
+        prior_means=means,
+        events=events,
+        n_patients=n,
+        posteriors=posteriors,
+    )
+
+
 def compute_evidence_accrual(
     prior: PriorSpec,
     timeline: list[StudyDataPoint],
@@ -379,6 +624,8 @@ def compute_evidence_accrual(
             count.  Typically ``"crs_grade3plus_events"`` or
             ``"icans_grade3plus_events"``.
 
+    All timepoints are updated in one :func:`compute_posterior_batch` call.
+
     Returns:
         List of PosteriorEstimate, one per timepoint, in the same order as
         the input timeline.
@@ -386,19 +633,21 @@ def compute_evidence_accrual(
     Raises:
         AttributeError: If event_field is not a valid StudyDataPoint attribute.
     """
-    posteriors: list[PosteriorEstimate] = []
+    if not timeline:
+        return []
 
-    for point in timeline:
-        # Events in the timeline data are already cumulative
-        cumulative_events = getattr(point, event_field)
+    # Events in the timeline data are already cumulative
+    events = [getattr(point, event_field) for point in timeline]
 
-        posterior = compute_posterior(
-            prior=prior,
-            events=cumulative_events,
-            n=point.n_cumulative_patients,
-        )
-        posteriors.append(posterior)
+    batch = compute_posterior_batch(
+        prior.alpha,
+        prior.beta,
+        events,
+        [point.n_cumulative_patients for point in timeline],
+    )
+    posteriors = batch.to_estimates()
 
+    for point, cumulative_events, posterior in zip(timeline, events, posteriors, strict=True):
         logger.debug(
             "Evidence accrual [%s]: n=%d, events=%d, mean=%.2f%%, "
             "CI=[%.2f%%, %.2f%%]%s",
@@ -441,6 +690,10 @@ def compute_stopping_boundaries(
         prior_alpha: Beta prior alpha parameter.
         prior_beta: Beta prior beta parameter.
 
+    Boundaries come from the shared table service in
+    :mod:`src.models.stopping_boundaries`, which searches all sample sizes
+    at once and caches tables in memory and on disk.
+
     Returns:
         List of dicts with keys ``n_patients`` and ``max_events``.  Only
         sample sizes where the boundary changes are included to keep the
@@ -458,28 +711,9 @@ def compute_stopping_boundaries(
             f"posterior_threshold must be in (0, 1), got {posterior_threshold}"
         )
 
-    boundaries: list[dict] = []
-    prev_max_k: int | None = None
-
-    for n in range(1, max_n + 1):
-        max_k = -1  # Start with no events allowed
-        for k in range(n + 1):
-            # Posterior: Beta(prior_alpha + k, prior_beta + n - k)
-            a = prior_alpha + k
-            b = prior_beta + (n - k)
-            # P(rate > target_rate | data) = sf(target_rate, a, b)
-            prob_exceeds = beta_dist.sf(target_rate, a, b)
-            if prob_exceeds < posterior_threshold:
-                max_k = k
-            else:
-                break
-
-        # Only record when boundary changes (or at key sample sizes)
-        if max_k != prev_max_k:
-            boundaries.append({
-                "n_patients": n,
-                "max_events": max(max_k, 0),
-            })
-            prev_max_k = max_k
+    if max_n < 1:
+        return []
 
-    return boundaries
+    return get_boundary_table(
+        target_rate, posterior_threshold, max_n, prior_alpha, prior_beta,
+    ).changes()
@@ -18,6 +18,10 @@ standardised field names (e.g. ``ldh_u_per_l``, ``temperature_c``).
 The runner determines which models can produce a result based on the
 patient data keys, runs them, and aggregates the outputs into a single
 ``EnsembleResult`` with per-model breakdowns and a combined risk level.
+
+For whole cohorts, ``run_batch`` scores a columnar input (NumPy arrays or a
+pandas/polars frame) with the vectorized engine in ``batch_scoring``, which
+reproduces the per-row run/skip/fail semantics of ``run``.
 """
 
 from __future__ import annotations
@@ -27,6 +31,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from src.models.batch_scoring import BatchEnsembleResult, score_batch
 from src.models.biomarker_scores import (
     EASIX,
     CARHematotox,
@@ -276,6 +281,25 @@ class BiomarkerEnsembleRunner:
             warnings=ensemble_warnings,
         )
 
+    def run_batch(self, data: Any) -> BatchEnsembleResult:
+        """Score a whole cohort of lab panels with all models, vectorized.
+
+        Row *i* of the result reproduces the scores, risk levels,
+        confidences, and run/skipped/failed classification that
+        :meth:`run` produces for row *i* as a dict.  ``None``/``NaN``
+        entries are treated as absent keys.
+
+        Args:
+            data: Mapping of column name to array-like, or a pandas/polars
+                DataFrame, using the same field names and aliases as
+                :meth:`run`.
+
+        Returns:
+            A BatchEnsembleResult with per-model arrays, validity masks,
+            and per-row ensemble aggregates.
+        """
+        return score_batch(data)
+
     # ------------------------------------------------------------------
     # Layer runners
     # ------------------------------------------------------------------
@@ -0,0 +1,538 @@
+"""
+Offline FAERS disproportionality screen over a local quarterly extract.
+
+The live path in :mod:`src.models.faers_signal` issues openFDA queries per
+product-AE pair and is bounded by the API rate limit.  This module runs the
+same analysis for *every* drug x preferred-term pair in a local copy of the
+FAERS quarterly ASCII extract (the ``$``-delimited DEMO/DRUG/REAC files
+published by FDA), with no network access:
+
+    1. ``ingest_faers_extract`` reads the ASCII files once and writes the
+       needed columns to a Parquet store (one file per table per quarter).
+    2. ``build_contingency_table`` keeps the latest version of each case,
+       joins drugs to reactions per report and counts every pair with a
+       single group-by; cells b, c, d follow from the marginals.
+    3. ``compute_disproportionality`` adds PRR, ROR, EBGM and the signal
+       classification as array operations, with the same semantics as
+       ``compute_prr``, ``compute_ror``, ``compute_ebgm`` and
+       ``classify_signal``.
+
+The result is a :class:`FAERSScreen`, saved as a single Parquet file.  When
+``SAFETY_FAERS_SCREEN_PATH`` points at one, :func:`precomputed_faers_signals`
+answers the ``/api/v1/signals/faers`` request from it instead of openFDA.
+
+Counting follows openFDA: one report per case (latest ``caseversion``),
+a drug counted once per report whatever its role or number of entries, and
+N is the number of reports with at least one drug and one reaction.  Drug
+names are upper-cased; known CAR-T name variants (``CAR_T_PRODUCTS``) map
+to their brand so the screen can be read back by product.
+
+Usage::
+
+    ingest_faers_extract("downloads/faers_ascii_2024Q1", "data/faers_store")
+    screen = run_faers_screen("data/faers_store")
+    screen.save("data/faers_screen.parquet")
+    screen.table.query("is_signal").sort_values("prr", ascending=False)
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from src.models.faers_signal import (
+    _HAS_SCIPY,
+    CAR_T_PRODUCTS,
+    TARGET_AES,
+    FAERSSignal,
+    FAERSSummary,
+    _resolve_products,
+    classify_signal_batch,
+    compute_ebgm,
+    compute_ebgm_batch,
+    compute_prr_batch,
+    compute_ror_batch,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Columns kept from each ASCII table
+_TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "demo": ("primaryid", "caseid", "caseversion"),
+    "drug": ("primaryid", "role_cod", "drugname", "prod_ai"),
+    "reac": ("primaryid", "pt"),
+}
+
+# e.g. DEMO24Q1.txt, drug24q3.TXT
+_FILE_PATTERN = re.compile(r"^(DEMO|DRUG|REAC)(\d{2}Q[1-4])\.TXT$", re.IGNORECASE)
+
+# Environment variable naming the precomputed screen served by the API
+SCREEN_PATH_ENV = "SAFETY_FAERS_SCREEN_PATH"
+_SCREEN_METADATA_KEY = b"faers_screen"
+
+_loaded_screens: dict[str, tuple[float, FAERSScreen]] = {}
+_loaded_screens_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Ingestion
+# ---------------------------------------------------------------------------
+
+def ingest_faers_extract(source: str | Path, store: str | Path) -> list[str]:
+    """Convert FAERS quarterly ASCII files into the Parquet store.
+
+    ``source`` is searched recursively for ``DEMOyyQn.txt``,
+    ``DRUGyyQn.txt`` and ``REACyyQn.txt``; each quarter found is written to
+    ``store/<table>/<yyQn>.parquet``, replacing any earlier ingest of that
+    quarter.  Several quarters can be ingested into one store and are
+    screened together.
+
+    Args:
+        source: Directory holding the unzipped extract(s).
+        store: Output directory for the Parquet store.
+
+    Returns:
+        Sorted list of ingested quarter labels (e.g. ``["24Q1", "24Q2"]``).
+
+    Raises:
+        FileNotFoundError: If no FAERS ASCII files are found.
+        ValueError: If a quarter is missing one of the three tables, or a
+            file lacks a required column.
+    """
+    quarters: dict[str, dict[str, Path]] = {}
+    for path in sorted(Path(source).rglob("*")):
+        match = _FILE_PATTERN.match(path.name)
+        if match and path.is_file():
+            table, quarter = match.group(1).lower(), match.group(2).upper()
+            quarters.setdefault(quarter, {})[table] = path
+
+    if not quarters:
+        raise FileNotFoundError(f"No FAERS DEMO/DRUG/REAC ASCII files under {source}")
+
+    for quarter, files in quarters.items():
+        missing = sorted(set(_TABLE_COLUMNS) - set(files))
+        if missing:
+            raise ValueError(f"FAERS quarter {quarter} is missing tables: {missing}")
+
+    store = Path(store)
+    for quarter, files in sorted(quarters.items()):
+        for table, columns in _TABLE_COLUMNS.items():
+            df = _read_ascii_table(files[table], columns)
+            out = store / table / f"{quarter}.parquet"
+            out.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(out, index=False)
+            logger.info("Ingested %s: %d rows -> %s", files[table].name, len(df), out)
+
+    return sorted(quarters)
+
+
+def _read_ascii_table(path: Path, columns: tuple[str, ...]) -> Any:
+    """Read the wanted columns of one ``$``-delimited FAERS file."""
+    import pandas as pd
+
+    df = pd.read_csv(
+        path,
+        sep="$",
+        dtype=str,
+        encoding="latin-1",
+        quoting=csv.QUOTE_NONE,
+        keep_default_na=False,
+        usecols=lambda name: name.strip().lower() in columns,
+        on_bad_lines="warn",
+    )
+    df.columns = [name.strip().lower() for name in df.columns]
+    missing = [name for name in columns if name not in df.columns]
+    if missing:
+        raise ValueError(f"{path.name}: missing columns {missing}")
+
+    df["primaryid"] = pd.to_numeric(df["primaryid"], errors="coerce")
+    df = df.dropna(subset=["primaryid"])
+    df["primaryid"] = df["primaryid"].astype("int64")
+
+    if "caseid" in df.columns:
+        df["caseid"] = pd.to_numeric(df["caseid"], errors="coerce").fillna(-1).astype("int64")
+        df["caseversion"] = (
+            pd.to_numeric(df["caseversion"], errors="coerce").fillna(0).astype("int64")
+        )
+    for name in ("drugname", "prod_ai", "pt", "role_cod"):
+        if name in df.columns:
+            df[name] = _normalize_terms(df[name])
+
+    return df[list(columns)]
+
+
+def _normalize_terms(values: Any) -> Any:
+    """Upper-case, collapse whitespace and drop trailing periods."""
+    return (
+        values.str.upper()
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+        .str.rstrip(".")
+    )
+
+
+# ---------------------------------------------------------------------------
+# Contingency counts
+# ---------------------------------------------------------------------------
+
+def default_drug_map() -> dict[str, str]:
+    """Name variant -> brand for every product in ``CAR_T_PRODUCTS``."""
+    return {
+        name.upper(): brand
+        for brand, names in CAR_T_PRODUCTS.items()
+        for name in names
+    }
+
+
+def build_contingency_table(
+    store: str | Path,
+    roles: Iterable[str] | None = None,
+    drug_map: Mapping[str, str] | None = None,
+) -> tuple[Any, int]:
+    """Count every drug x PT pair in the store with a single group-by.
+
+    Args:
+        store: Parquet store written by :func:`ingest_faers_extract`.
+        roles: Drug role codes to count (``PS``, ``SS``, ``C``, ``I``).
+            Defaults to all roles, as openFDA does.
+        drug_map: Drug name (or active ingredient) -> canonical name.
+            Defaults to :func:`default_drug_map`; unmapped drugs keep their
+            normalized ``drugname``.
+
+    Returns:
+        Tuple ``(table, n_reports)``.  ``table`` is a DataFrame with one
+        row per pair with at least one report and columns ``drug``, ``pt``,
+        ``a``, ``b``, ``c``, ``d``, ``n_drug`` (a + b) and ``n_pt`` (a + c);
+        ``n_reports`` is N = a + b + c + d.
+
+    Raises:
+        FileNotFoundError: If the store holds no ingested quarters.
+    """
+    import pandas as pd
+
+    demo, drug, reac = (_read_store_table(store, t) for t in _TABLE_COLUMNS)
+
+    # Latest version of each case; earlier versions are superseded
+    demo = demo.sort_values(["caseid", "caseversion", "primaryid"])
+    latest = demo.drop_duplicates("caseid", keep="last")["primaryid"]
+
+    # N: reports with at least one drug and one reaction
+    reports = pd.Index(latest).intersection(drug["primaryid"].unique())
+    reports = reports.intersection(reac["primaryid"].unique())
+    n_reports = len(reports)
+
+    drug = drug[drug["primaryid"].isin(reports)]
+    if roles is not None:
+        drug = drug[drug["role_cod"].isin({r.strip().upper() for r in roles})]
+    if drug_map is None:
+        drug_map = default_drug_map()
+    mapping = {k.upper(): v for k, v in drug_map.items()}
+    named = drug["drugname"].where(drug["drugname"] != "", drug["prod_ai"])
+    canonical = drug["drugname"].map(mapping).fillna(drug["prod_ai"].map(mapping))
+    drug = pd.DataFrame({
+        "primaryid": drug["primaryid"],
+        "drug": canonical.fillna(named),
+    })
+    drug = drug[drug["drug"] != ""].drop_duplicates()
+    drug["drug"] = drug["drug"].astype("category")
+
+    reac = reac.loc[reac["primaryid"].isin(reports) & (reac["pt"] != ""), ["primaryid", "pt"]]
+    reac = reac.drop_duplicates()
+    reac["pt"] = reac["pt"].astype("category")
+
+    # One row per (report, drug, PT); cell a is the size of each group
+    pairs = drug.merge(reac, on="primaryid")
+    table = pairs.groupby(["drug", "pt"], observed=True).size().rename("a").reset_index()
+
+    n_drug = drug.groupby("drug", observed=True).size()
+    n_pt = reac.groupby("pt", observed=True).size()
+    table["n_drug"] = table["drug"].map(n_drug).astype("int64")
+    table["n_pt"] = table["pt"].map(n_pt).astype("int64")
+    table["drug"] = table["drug"].astype(str)
+    table["pt"] = table["pt"].astype(str)
+
+    table["a"] = table["a"].astype("int64")
+    table["b"] = table["n_drug"] - table["a"]
+    table["c"] = table["n_pt"] - table["a"]
+    table["d"] = n_reports - table["a"] - table["b"] - table["c"]
+
+    columns = ["drug", "pt", "a", "b", "c", "d", "n_drug", "n_pt"]
+    return table[columns], n_reports
+
+
+def _read_store_table(store: str | Path, table: str) -> Any:
+    import pandas as pd
+
+    files = sorted((Path(store) / table).glob("*.parquet"))
+    if not files:
+        raise FileNotFoundError(f"No ingested FAERS '{table}' files in {store}")
+    return pd.concat((pd.read_parquet(f) for f in files), ignore_index=True)
+
+
+# ---------------------------------------------------------------------------
+# Disproportionality
+# ---------------------------------------------------------------------------
+
+def compute_disproportionality(table: Any) -> Any:
+    """Add PRR, ROR, EBGM and signal columns to a contingency table.
+
+    Every metric is computed for all rows at once and matches the scalar
+    functions in :mod:`src.models.faers_signal` row by row.  Without scipy
+    EBGM falls back to the per-pair approximation in ``compute_ebgm`` and
+    ``eb95`` is NaN.
+
+    Args:
+        table: DataFrame with integer columns ``a``, ``b``, ``c``, ``d``.
+
+    Returns:
+        A copy of ``table`` with ``expected``, ``prr``, ``prr_ci_low``,
+        ``prr_ci_high``, ``ror``, ``ror_ci_low``, ``ror_ci_high``, ``ebgm``,
+        ``ebgm05``, ``eb95``, ``is_signal`` and ``signal_strength``.
+    """
+    out = table.copy()
+    a, b, c, d = (out[k].to_numpy(dtype=np.int64) for k in ("a", "b", "c", "d"))
+
+    # Expected count under independence: E = (a + b)(a + c) / N
+    n_total = (a + b + c + d).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = np.where(n_total > 0, ((a + b) * (a + c)) / n_total, 0.0)
+
+    prr, prr_ci_low, prr_ci_high = compute_prr_batch(a, b, c, d)
+    ror, ror_ci_low, ror_ci_high = compute_ror_batch(a, b, c, d)
+    if _HAS_SCIPY:
+        ebgm, ebgm05, eb95 = compute_ebgm_batch(a, expected)
+    else:
+        pairs = [compute_ebgm(int(n), e) for n, e in zip(a, expected, strict=True)]
+        ebgm = np.array([p[0] for p in pairs], dtype=float)
+        ebgm05 = np.array([p[1] for p in pairs], dtype=float)
+        eb95 = np.full(len(pairs), np.nan)
+
+    is_signal, strength = classify_signal_batch(
+        prr, prr_ci_low, ror, ror_ci_low, ebgm05, a,
+    )
+
+    out["expected"] = expected
+    out["prr"] = prr
+    out["prr_ci_low"] = prr_ci_low
+    out["prr_ci_high"] = prr_ci_high
+    out["ror"] = ror
+    out["ror_ci_low"] = ror_ci_low
+    out["ror_ci_high"] = ror_ci_high
+    out["ebgm"] = ebgm
+    out["ebgm05"] = ebgm05
+    out["eb95"] = eb95
+    out["is_signal"] = is_signal
+    out["signal_strength"] = strength
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Screen
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FAERSScreen:
+    """Disproportionality metrics for every drug x PT pair in an extract.
+
+    Attributes:
+        table: DataFrame from :func:`compute_disproportionality`, one row
+            per pair with at least one report.
+        n_reports: Total reports in the screened extract (N).
+        quarters: Quarter labels included (e.g. ``["24Q1"]``).
+        built_at: ISO-8601 timestamp of when the screen was computed.
+    """
+
+    table: Any
+    n_reports: int
+    quarters: list[str]
+    built_at: str
+
+    def save(self, path: str | Path) -> Path:
+        """Write the screen to a single Parquet file."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrow = pa.Table.from_pandas(self.table, preserve_index=False)
+        metadata = dict(arrow.schema.metadata or {})
+        metadata[_SCREEN_METADATA_KEY] = json.dumps({
+            "n_reports": self.n_reports,
+            "quarters": self.quarters,
+            "built_at": self.built_at,
+        }).encode()
+        pq.write_table(arrow.replace_schema_metadata(metadata), path)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> FAERSScreen:
+        """Read a screen written by :meth:`save`.
+
+        Raises:
+            ValueError: If the file is not a saved FAERS screen.
+        """
+        import pyarrow.parquet as pq
+
+        arrow = pq.read_table(path)
+        raw = (arrow.schema.metadata or {}).get(_SCREEN_METADATA_KEY)
+        if raw is None:
+            raise ValueError(f"{path} is not a FAERS screen file")
+        meta = json.loads(raw)
+        return cls(
+            table=arrow.to_pandas(),
+            n_reports=int(meta["n_reports"]),
+            quarters=list(meta["quarters"]),
+            built_at=meta["built_at"],
+        )
+
+    def to_summary(
+        self,
+        products: list[str] | None = None,
+        adverse_events: list[str] | None = None,
+    ) -> FAERSSummary:
+        """Read product x AE signals from the screen, like ``get_faers_signals``.
+
+        Products are resolved as in :func:`get_faers_signals`; pairs with no
+        reports are omitted, and signals are sorted detected-first, then by
+        PRR descending.  Metrics are rounded to 4 decimals as in the live
+        path.
+
+        Args:
+            products: Product names.  Defaults to all ``CAR_T_PRODUCTS``.
+            adverse_events: MedDRA PTs.  Defaults to ``TARGET_AES``.
+        """
+        brands = _resolve_products(products)
+        labels = {ae.upper(): ae for ae in (adverse_events or TARGET_AES)}
+
+        table = self.table
+        product_rows = table[table["drug"].isin(brands)]
+        n_product = product_rows.groupby("drug")["n_drug"].first()
+        rows = product_rows[product_rows["pt"].isin(list(labels))]
+
+        signals = [
+            FAERSSignal(
+                product=row.drug,
+                adverse_event=labels[row.pt],
+                n_cases=int(row.a),
+                n_total_product=int(row.n_drug),
+                n_total_ae=int(row.n_pt),
+                n_total_database=self.n_reports,
+                prr=round(row.prr, 4),
+                prr_ci_low=round(row.prr_ci_low, 4),
+                prr_ci_high=round(row.prr_ci_high, 4),
+                ror=round(row.ror, 4),
+                ror_ci_low=round(row.ror_ci_low, 4),
+                ror_ci_high=round(row.ror_ci_high, 4),
+                ebgm=round(row.ebgm, 4),
+                ebgm05=round(row.ebgm05, 4),
+                is_signal=bool(row.is_signal),
+                signal_strength=row.signal_strength,
+            )
+            for row in rows.itertuples(index=False)
+        ]
+        signals.sort(key=lambda s: (not s.is_signal, -s.prr))
+
+        return FAERSSummary(
+            products_queried=brands,
+            total_reports=int(n_product.sum()),
+            signals_detected=sum(1 for s in signals if s.is_signal),
+            strong_signals=sum(1 for s in signals if s.signal_strength == "strong"),
+            signals=signals,
+            query_timestamp=self.built_at,
+        )
+
+
+def run_faers_screen(
+    store: str | Path,
+    roles: Iterable[str] | None = None,
+    drug_map: Mapping[str, str] | None = None,
+    min_cases: int = 1,
+) -> FAERSScreen:
+    """Screen every drug x PT pair in an ingested store.
+
+    Args:
+        store: Parquet store written by :func:`ingest_faers_extract`.
+        roles: Drug role codes to count; defaults to all roles.
+        drug_map: Drug name -> canonical name; see
+            :func:`build_contingency_table`.
+        min_cases: Drop pairs with fewer reports than this before scoring.
+
+    Returns:
+        FAERSScreen over all ingested quarters.
+    """
+    if min_cases < 1:
+        raise ValueError("min_cases must be >= 1")
+
+    table, n_reports = build_contingency_table(store, roles=roles, drug_map=drug_map)
+    if min_cases > 1:
+        table = table[table["a"] >= min_cases].reset_index(drop=True)
+    quarters = sorted(p.stem for p in (Path(store) / "demo").glob("*.parquet"))
+
+    screen = FAERSScreen(
+        table=compute_disproportionality(table),
+        n_reports=n_reports,
+        quarters=quarters,
+        built_at=datetime.now(UTC).isoformat(),
+    )
+    logger.info(
+        "FAERS screen over %s: %d reports, %d pairs, %d signals",
+        ",".join(quarters), n_reports, len(table),
+        int(screen.table["is_signal"].sum()),
+    )
+    return screen
+
+
+def load_precomputed_screen() -> FAERSScreen | None:
+    """The screen named by ``SAFETY_FAERS_SCREEN_PATH``, or None.
+
+    The file is loaded once and reloaded when its modification time
+    changes, so a rebuilt screen is picked up without a restart.  A
+    missing or unreadable file is logged and treated as not configured.
+    """
+    path = os.environ.get(SCREEN_PATH_ENV)
+    if not path:
+        return None
+
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        logger.warning("%s=%s does not exist; using live openFDA", SCREEN_PATH_ENV, path)
+        return None
+
+    with _loaded_screens_lock:
+        cached = _loaded_screens.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        try:
+            screen = FAERSScreen.load(path)
+        except (OSError, ValueError):
+            logger.warning("Could not load FAERS screen %s", path, exc_info=True)
+            return None
+        _loaded_screens[path] = (mtime, screen)
+        return screen
+
+
+def precomputed_faers_signals(products: list[str] | None = None) -> FAERSSummary | None:
+    """Answer a ``get_faers_signals`` request from the precomputed screen.
+
+    Returns:
+        FAERSSummary for ``products`` x ``TARGET_AES``, or None when no
+        screen is configured.
+    """
+    screen = load_precomputed_screen()
+    if screen is None:
+        return None
+    return screen.to_summary(products)
@@ -0,0 +1,273 @@
+"""
+Persistent on-disk cache for openFDA FAERS query results.
+
+Responses are stored in a SQLite database keyed by the normalized query
+(URL plus sorted parameters), so they survive restarts and are shared by
+every worker process on the host.  The database runs in WAL mode, which
+lets readers proceed while another process writes.
+
+Each entry moves through three states:
+
+    fresh    age < ``ttl_seconds``: served directly.
+    stale    age < ``ttl_seconds + stale_seconds``: served, and the caller
+             should revalidate it in the background (stale-while-revalidate).
+    expired  older still: treated as a miss and deleted.
+
+The cache is bounded to ``max_entries`` rows; once full, the least recently
+used entries are evicted.  Hit/miss counters are kept per process and
+reported by :meth:`FAERSQueryCache.stats`.
+
+Cache failures (e.g. a read-only filesystem) are logged and degrade to
+misses; they never fail the query.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL,
+    stored_at   REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value and whether it is still within its TTL."""
+
+    value: Any
+    stored_at: float
+    fresh: bool
+
+
+class FAERSQueryCache:
+    """SQLite-backed TTL + LRU cache shared across processes.
+
+    Usage::
+
+        cache = FAERSQueryCache("/var/cache/safety/faers.sqlite3")
+        entry = cache.lookup(key)
+        if entry is None:
+            cache.set(key, fetch())
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: float = 86400.0,
+        stale_seconds: float = 7 * 86400.0,
+        max_entries: int = 10_000,
+        touch_interval_seconds: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create a cache backed by the SQLite file at ``path``.
+
+        The database is opened lazily on first use.
+
+        Args:
+            path: SQLite database file.  Parent directories are created.
+            ttl_seconds: Age below which an entry is fresh.
+            stale_seconds: Additional age during which an expired entry is
+                still served as stale.
+            max_entries: Maximum number of entries before LRU eviction.
+            touch_interval_seconds: Minimum interval between access-time
+                updates of one entry, to avoid a write on every hit.
+            clock: Time source (seconds since the epoch).
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if stale_seconds < 0:
+            raise ValueError("stale_seconds must be >= 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._max_entries = max_entries
+        self._touch_interval = touch_interval_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._conn_pid: int | None = None
+
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @property
+    def path(self) -> Path:
+        """Location of the SQLite database."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key``, fresh or stale, or None on a miss."""
+        now = self._clock()
+        with self._lock:
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT value, stored_at, accessed_at FROM entries WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self._misses += 1
+                    return None
+
+                value, stored_at, accessed_at = row
+                age = now - stored_at
+                if age >= self._ttl + self._stale:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._misses += 1
+                    return None
+
+                if now - accessed_at >= self._touch_interval:
+                    conn.execute(
+                        "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key),
+                    )
+                entry = CacheEntry(json.loads(value), stored_at, age < self._ttl)
+            except (sqlite3.Error, OSError):
+                self._record_error("lookup")
+                self._misses += 1
+                return None
+
+            if entry.fresh:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+            return entry
+
+    def get(self, key: str) -> Any | None:
+        """Return the value for ``key`` only if it is fresh."""
+        entry = self.lookup(key)
+        return entry.value if entry is not None and entry.fresh else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` (JSON-serializable) and evict LRU overflow."""
+        payload = json.dumps(value)
+        now = self._clock()
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, payload, now, now),
+                )
+                self._sets += 1
+                self._evict(conn, now)
+            except (sqlite3.Error, OSError):
+                self._record_error("set")
+
+    def clear(self) -> None:
+        """Delete every entry (metrics are kept)."""
+        with self._lock:
+            try:
+                self._connection().execute("DELETE FROM entries")
+            except (sqlite3.Error, OSError):
+                self._record_error("clear")
+
+    def stats(self) -> dict[str, Any]:
+        """Per-process hit/miss counters plus the current entry count."""
+        with self._lock:
+            try:
+                (entries,) = self._connection().execute(
+                    "SELECT COUNT(*) FROM entries"
+                ).fetchone()
+            except (sqlite3.Error, OSError):
+                self._record_error("stats")
+                entries = None
+            lookups = self._hits + self._stale_hits + self._misses
+            return {
+                "path": str(self._path),
+                "entries": entries,
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": (self._hits + self._stale_hits) / lookups if lookups else 0.0,
+                "sets": self._sets,
+                "evictions": self._evictions,
+                "errors": self._errors,
+            }
+
+    def close(self) -> None:
+        """Close this process's database connection."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        # A connection inherited across fork() must not be reused.
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path,
+                timeout=5.0,
+                isolation_level=None,  # autocommit
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._conn_pid = pid
+        return self._conn
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        cursor = conn.execute(
+            "DELETE FROM entries WHERE stored_at <= ?",
+            (now - self._ttl - self._stale,),
+        )
+        evicted = max(cursor.rowcount, 0)
+        (count,) = conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        overflow = count - self._max_entries
+        if overflow > 0:
+            cursor = conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            evicted += max(cursor.rowcount, 0)
+        if evicted:
+            self._evictions += evicted
+            logger.debug("FAERS query cache evicted %d entries", evicted)
+
+    def _record_error(self, operation: str) -> None:
+        self._errors += 1
+        logger.warning(
+            "FAERS query cache %s failed (%s)", operation, self._path, exc_info=True,
+        )
@@ -21,9 +21,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
+import os
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from src.models.faers_query_cache import FAERSQueryCache
+
+try:
+    from scipy import special as _special
+
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
 
 logger = logging.getLogger(__name__)
 
@@ -150,55 +164,301 @@ TARGET_AES: list[str] = [
 # Rate limiting: openFDA allows 40 requests/minute without an API key.
 _RATE_LIMIT_REQUESTS = 40
 _RATE_LIMIT_WINDOW_SECONDS = 60.0
-_request_timestamps: list[float] = []
 
-# Simple in-memory cache: key -> (timestamp, data).  24-hour TTL.
-_cache: dict[str, tuple[float, object]] = {}
+# Maximum openFDA requests in flight at once from one client.
+_MAX_CONCURRENT_REQUESTS = 4
+
+# Persistent query cache shared by all worker processes on the host.  Fresh
+# for 24 hours, then served stale (and refreshed in the background) for up
+# to 7 more days.  Override the location with SAFETY_FAERS_CACHE_PATH.
 _CACHE_TTL_SECONDS = 86400
+_CACHE_STALE_SECONDS = 7 * 86400
+_CACHE_MAX_ENTRIES = 10_000
+_CACHE_PATH = Path(
+    os.environ.get("SAFETY_FAERS_CACHE_PATH")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "predictive-safety-platform" / "faers_openfda.sqlite3"
+)
+_cache = FAERSQueryCache(
+    _CACHE_PATH,
+    ttl_seconds=_CACHE_TTL_SECONDS,
+    stale_seconds=_CACHE_STALE_SECONDS,
+    max_entries=_CACHE_MAX_ENTRIES,
+)
+
+# Background revalidation tasks for stale entries, keyed by cache key.
+_revalidating: dict[str, asyncio.Task] = {}
 
 
 # ---------------------------------------------------------------------------
 # Caching helpers
 # ---------------------------------------------------------------------------
 
-def _cache_get(key: str) -> object | None:
-    """Return cached value if still within TTL, else None."""
-    if key in _cache:
-        ts, data = _cache[key]
-        if time.time() - ts < _CACHE_TTL_SECONDS:
-            return data
-        del _cache[key]
-    return None
+def _query_key(url: str, params: dict[str, str]) -> str:
+    """Normalized cache key for an openFDA query."""
+    return url + "?" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+
+
+def _schedule_revalidation(
+    key: str,
+    url: str,
+    params: dict[str, str],
+    client: OpenFDAClient,
+) -> None:
+    """Refresh a stale cache entry in the background (once per key)."""
+    task = _revalidating.get(key)
+    if task is not None and not task.done():
+        return
+
+    async def refresh() -> None:
+        try:
+            data = await client.get_json(url, params)
+        except Exception:
+            logger.exception("Background refresh of openFDA query failed")
+            return
+        if data:
+            await asyncio.to_thread(_cache.set, key, data)
 
+    def forget(done: asyncio.Task) -> None:
+        if _revalidating.get(key) is done:
+            del _revalidating[key]
 
-def _cache_set(key: str, data: object) -> None:
-    """Store value in cache with current timestamp."""
-    _cache[key] = (time.time(), data)
+    task = asyncio.get_running_loop().create_task(refresh())
+    _revalidating[key] = task
+    task.add_done_callback(forget)
+
+
+def faers_cache_stats() -> dict:
+    """Hit/miss metrics for the openFDA query cache (this process)."""
+    return _cache.stats()
 
 
 # ---------------------------------------------------------------------------
 # Rate limiting
 # ---------------------------------------------------------------------------
 
-async def _rate_limit() -> None:
-    """Enforce openFDA rate limit (40 requests per 60 seconds).
+class TokenBucket:
+    """Token-bucket rate limiter shared across event loops and threads.
+
+    Each :meth:`acquire` reserves the next free slot under a thread lock
+    (GCRA-style virtual scheduling) and then sleeps until that slot, so
+    waiters are served in arrival order without holding any asyncio
+    primitive. Requests are spaced at ``window_seconds / rate`` intervals,
+    so no window holds more than ``rate`` of them. A ``capacity`` above 1
+    lets that many requests burst immediately, but then up to
+    ``capacity + rate - 1`` can fall within one window.
+    """
+
+    def __init__(
+        self,
+        rate: int = _RATE_LIMIT_REQUESTS,
+        window_seconds: float = _RATE_LIMIT_WINDOW_SECONDS,
+        capacity: int = 1,
+    ) -> None:
+        if rate < 1:
+            raise ValueError("rate must be >= 1")
+        if window_seconds <= 0.0:
+            raise ValueError("window_seconds must be positive")
+        self._interval = window_seconds / rate
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self._capacity = capacity
+        self._next_free = 0.0  # theoretical arrival time of the next token
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Reserve a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._next_free = max(self._next_free, now) + self._interval
+            start = self._next_free - self._capacity * self._interval
+            return max(0.0, start - now)
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is available."""
+        delay = self.reserve()
+        if delay > 0.0:
+            logger.debug("Rate limit reached; sleeping %.2f seconds", delay)
+            await asyncio.sleep(delay)
+
+
+# ---------------------------------------------------------------------------
+# Pooled openFDA client
+# ---------------------------------------------------------------------------
+
+class _LoopResources:
+    """Per-event-loop state: asyncio objects cannot be shared across loops."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_concurrency: int) -> None:
+        self.loop = loop
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.inflight: dict[tuple, asyncio.Future] = {}
+        self.http: httpx.AsyncClient | None = None
+
+
+class OpenFDAClient:
+    """Pooled, rate-limited, concurrency-bounded openFDA client.
+
+    - One ``httpx.AsyncClient`` (connection pool) is reused for all
+      requests on an event loop.
+    - A shared :class:`TokenBucket` enforces the openFDA rate limit across
+      all callers of this client.
+    - At most ``max_concurrency`` requests are in flight at once.
+    - Identical concurrent requests are coalesced into a single HTTP call.
 
-    Blocks until a request slot is available.
+    Errors are logged and surface as an empty dict, as before.
+
+    Usage::
+
+        async with OpenFDAClient(max_concurrency=8) as client:
+            summary = await get_faers_signals(client=client)
     """
-    now = time.time()
-    cutoff = now - _RATE_LIMIT_WINDOW_SECONDS
 
-    # Prune timestamps outside the window
-    while _request_timestamps and _request_timestamps[0] < cutoff:
-        _request_timestamps.pop(0)
+    def __init__(
+        self,
+        max_concurrency: int = _MAX_CONCURRENT_REQUESTS,
+        rate_limiter: TokenBucket | None = None,
+        timeout: float = 30.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Create a client.
+
+        Args:
+            max_concurrency: Maximum simultaneous HTTP requests.
+            rate_limiter: Token bucket to draw from. Defaults to a new
+                40 requests/minute bucket.
+            timeout: Per-request timeout in seconds.
+            transport: Optional httpx transport (e.g. for testing).
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = rate_limiter or TokenBucket()
+        self._timeout = timeout
+        self._transport = transport
+        self._resources: _LoopResources | None = None
+        self._requests_sent = 0
+        self._requests_coalesced = 0
+
+    async def __aenter__(self) -> OpenFDAClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @property
+    def requests_sent(self) -> int:
+        """Number of HTTP requests actually sent."""
+        return self._requests_sent
+
+    @property
+    def requests_coalesced(self) -> int:
+        """Number of requests served by joining an identical in-flight one."""
+        return self._requests_coalesced
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client for the current event loop."""
+        resources = self._resources
+        self._resources = None
+        if resources is not None and resources.http is not None:
+            await resources.http.aclose()
+
+    async def get_json(self, url: str, params: dict[str, str]) -> dict:
+        """GET ``url`` with ``params`` and return parsed JSON.
+
+        Returns:
+            Parsed JSON response as a dict.  Returns empty dict on error.
+        """
+        resources = self._loop_resources()
+        key = (url, tuple(sorted(params.items())))
+
+        # The fetch runs in its own task that every caller (the first one
+        # included) awaits through a shield, so cancelling one caller never
+        # cancels the fetch the others are waiting on.
+        task = resources.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_limited(resources, url, params))
+            resources.inflight[key] = task
+
+            def forget(done: asyncio.Future) -> None:
+                if resources.inflight.get(key) is done:
+                    del resources.inflight[key]
+                # Mark retrieved so an unawaited failure does not log a warning.
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(forget)
+        else:
+            self._requests_coalesced += 1
+        return await asyncio.shield(task)
+
+    async def _fetch_limited(
+        self, resources: _LoopResources, url: str, params: dict[str, str],
+    ) -> dict:
+        async with resources.semaphore:
+            await self._rate_limiter.acquire()
+            self._requests_sent += 1
+            return await self._fetch(resources, url, params)
+
+    def _loop_resources(self) -> _LoopResources:
+        loop = asyncio.get_running_loop()
+        if self._resources is None or self._resources.loop is not loop:
+            # A client bound to a previous (now finished) loop cannot be
+            # reused; start a fresh pool for this loop.
+            self._resources = _LoopResources(loop, self._max_concurrency)
+        return self._resources
+
+    async def _fetch(self, resources: _LoopResources, url: str, params: dict[str, str]) -> dict:
+        if not _HAS_HTTPX:
+            return await asyncio.to_thread(_urllib_get_json, url, params, self._timeout)
+
+        if resources.http is None:
+            resources.http = httpx.AsyncClient(
+                timeout=self._timeout,
+                transport=self._transport,
+                limits=httpx.Limits(max_connections=self._max_concurrency),
+            )
+        try:
+            resp = await resources.http.get(url, params=params)
+            if resp.status_code == 200:
+                return resp.json()
+            elif resp.status_code == 404:
+                logger.debug("openFDA 404 for params %s", params)
+                return {}
+            else:
+                logger.warning(
+                    "openFDA returned %d: %s",
+                    resp.status_code,
+                    resp.text[:200],
+                )
+                return {}
+        except Exception:
+            logger.exception("HTTP request to openFDA failed")
+            return {}
+
+
+def _urllib_get_json(url: str, params: dict[str, str], timeout: float) -> dict:
+    """Synchronous urllib fallback used when httpx is not installed."""
+    try:
+        query_string = urllib.parse.urlencode(params)
+        full_url = f"{url}?{query_string}"
+        req = urllib.request.Request(full_url)
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            if resp.status == 200:
+                return json.loads(resp.read().decode())
+            return {}
+    except urllib.error.HTTPError as exc:
+        if exc.code == 404:
+            return {}
+        logger.warning("openFDA urllib error %d", exc.code)
+        return {}
+    except Exception:
+        logger.exception("urllib request to openFDA failed")
+        return {}
 
-    if len(_request_timestamps) >= _RATE_LIMIT_REQUESTS:
-        # Wait until the oldest request in the window expires
-        wait_time = _request_timestamps[0] - cutoff + 0.1
-        logger.debug("Rate limit hit; sleeping %.2f seconds", wait_time)
-        await asyncio.sleep(wait_time)
 
-    _request_timestamps.append(time.time())
+# Shared client used when callers do not supply their own.
+_default_client = OpenFDAClient()
 
 
 # ---------------------------------------------------------------------------
@@ -301,6 +561,83 @@ def compute_ror(a: int, b: int, c: int, d: int) -> tuple[float, float, float]:
         return (0.0, 0.0, 0.0)
 
 
+def compute_prr_batch(a, b, c, d) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`compute_prr` over arrays of 2x2 cells.
+
+    Element-wise identical to the scalar function, including its zero-cell
+    handling: undefined ratios give ``(0, 0, 0)`` and ``a == 0`` gives a
+    PRR with a zero CI.
+
+    Args:
+        a, b, c, d: Array-likes of cell counts, broadcastable together.
+
+    Returns:
+        Tuple of arrays ``(prr, ci_low, ci_high)``.
+    """
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (a, b, c, d)))
+    prr = np.zeros(a.shape)
+    ci_low = np.zeros(a.shape)
+    ci_high = np.zeros(a.shape)
+
+    defined = ((a + b) != 0) & ((c + d) != 0) & (c != 0)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ratio = (a / (a + b)) / (c / (c + d))
+        prr[defined] = ratio[defined]
+
+        has_ci = defined & (a > 0) & (prr > 0.0)
+        se_ln_prr = np.sqrt((1 / a) - (1 / (a + b)) + (1 / c) - (1 / (c + d)))
+        ln_prr = np.log(ratio)
+        low = np.exp(ln_prr - 1.96 * se_ln_prr)
+        high = np.exp(ln_prr + 1.96 * se_ln_prr)
+    ci_low[has_ci] = low[has_ci]
+    ci_high[has_ci] = high[has_ci]
+
+    return _zero_non_finite(prr, ci_low, ci_high)
+
+
+def compute_ror_batch(a, b, c, d) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized :func:`compute_ror` over arrays of 2x2 cells.
+
+    Element-wise identical to the scalar function, including its zero-cell
+    handling.
+
+    Args:
+        a, b, c, d: Array-likes of cell counts, broadcastable together.
+
+    Returns:
+        Tuple of arrays ``(ror, ci_low, ci_high)``.
+    """
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (a, b, c, d)))
+    ror = np.zeros(a.shape)
+    ci_low = np.zeros(a.shape)
+    ci_high = np.zeros(a.shape)
+
+    defined = (b != 0) & (c != 0)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ratio = (a * d) / (b * c)
+        ror[defined] = ratio[defined]
+
+        has_ci = defined & (a > 0) & (d > 0) & (ror > 0.0)
+        se_ln_ror = np.sqrt(1 / a + 1 / b + 1 / c + 1 / d)
+        ln_ror = np.log(ratio)
+        low = np.exp(ln_ror - 1.96 * se_ln_ror)
+        high = np.exp(ln_ror + 1.96 * se_ln_ror)
+    ci_low[has_ci] = low[has_ci]
+    ci_high[has_ci] = high[has_ci]
+
+    return _zero_non_finite(ror, ci_low, ci_high)
+
+
+def _zero_non_finite(
+    ratio: np.ndarray, ci_low: np.ndarray, ci_high: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Zero whole rows that overflowed, as the scalar versions do."""
+    bad = ~(np.isfinite(ratio) & np.isfinite(ci_low) & np.isfinite(ci_high))
+    for arr in (ratio, ci_low, ci_high):
+        arr[bad] = 0.0
+    return ratio, ci_low, ci_high
+
+
 def compute_ebgm(
     observed: int,
     expected: float,
@@ -310,7 +647,7 @@ def compute_ebgm(
     beta2: float = 4.0,
     p: float = 1 / 3,
 ) -> tuple[float, float]:
-    """Compute EBGM and approximate EBGM05 using Multi-item Gamma Poisson Shrinker.
+    """Compute EBGM and EBGM05 using Multi-item Gamma Poisson Shrinker.
 
     Implements the GPS (Gamma Poisson Shrinker) model from DuMouchel (1999).
     The prior on the Poisson rate lambda is a mixture of two Gamma distributions:
@@ -326,35 +663,18 @@ def compute_ebgm(
         E[ln(lambda) | n, E] for each component, weighted by posterior
         component probabilities, then exponentiated.
 
-    .. warning:: Known Limitation -- EBGM05 Approximation
-
-       The EBGM05 value returned by this function is an **approximation**, not
-       the true 5th percentile of the two-component Gamma mixture posterior.
-
-       The true 5th percentile requires solving the mixture CDF equation:
-
-           q1 * F_Gamma1(x) + q2 * F_Gamma2(x) = 0.05
-
-       which has no closed-form solution and requires numerical root-finding
-       (e.g., bisection on the mixture CDF) or Monte Carlo sampling.
+    EBGM05 is the exact 5th percentile of the posterior mixture, found by
+    solving ``q1 * F_Gamma1(x) + q2 * F_Gamma2(x) = 0.05`` numerically (see
+    :func:`compute_ebgm_batch`, which this delegates to).
 
-       Instead, this implementation computes a **weighted average of the
-       per-component 5th percentiles**:
+    .. note:: Fallback without scipy
 
-           approximate_ebgm05 = q1 * Q05_component1 + q2 * Q05_component2
-
-       This approximation tends to **overestimate** the true 5th percentile
-       when the two Gamma components are well-separated, making the
-       conservative bound **less conservative** than intended.  For most
-       drug-event pairs where the components overlap substantially, the
-       error is small.  For rare events with extreme posterior weights,
-       the discrepancy could be clinically relevant and may lead to
-       false-positive signal declarations when using the EBGM05 >= 2
-       threshold.
-
-       A proper implementation would use ``scipy.stats`` (if available) to
-       numerically invert the mixture CDF via bisection, or sample from the
-       mixture posterior.  This is tracked as a known improvement item.
+       The exact solver needs ``scipy.special`` for the incomplete gamma
+       function.  Without scipy, EBGM05 falls back to a weighted average of
+       per-component Wilson-Hilferty quantiles,
+       ``q1 * Q05_component1 + q2 * Q05_component2``, which overestimates
+       the true 5th percentile when the components are well-separated
+       (i.e. is less conservative than intended).
 
     Args:
         observed: Observed count (n) for the drug-event pair.
@@ -366,10 +686,18 @@ def compute_ebgm(
         p: Prior mixing weight for the first component.
 
     Returns:
-        Tuple of (ebgm, approximate_ebgm05).  The second element is an
-        approximation of the true mixture 5th percentile (see warning above).
-        Returns (0.0, 0.0) if expected <= 0 or computation fails.
+        Tuple of (ebgm, ebgm05).  Returns (0.0, 0.0) if expected <= 0 or
+        computation fails.
     """
+    if _HAS_SCIPY:
+        try:
+            ebgm, ebgm05, _ = compute_ebgm_batch(
+                [observed], [expected], alpha1, beta1, alpha2, beta2, p,
+            )
+        except (ValueError, FloatingPointError):
+            return (0.0, 0.0)
+        return (float(ebgm[0]), float(ebgm05[0]))
+
     try:
         if expected <= 0.0 or observed < 0:
             return (0.0, 0.0)
@@ -419,22 +747,12 @@ def compute_ebgm(
         e_ln_lambda = q1 * eln1 + q2 * eln2
         ebgm = math.exp(e_ln_lambda)
 
-        # EBGM05 -- approximate 5th percentile of the posterior mixture.
-        #
-        # KNOWN LIMITATION: This computes a weighted average of per-component
-        # 5th percentiles, NOT the true 5th percentile of the mixture
-        # distribution.  The true quantile requires solving
-        #     q1 * F_1(x) + q2 * F_2(x) = 0.05
-        # via numerical root-finding (bisection on mixture CDF).  The weighted
-        # average overestimates the true 5th percentile when components are
-        # well-separated.  See docstring for full discussion.
-        #
-        # Per-component quantiles use Wilson-Hilferty cube-root normal
-        # approximation to the Gamma quantile.
+        # EBGM05 -- approximate 5th percentile of the posterior mixture
+        # (scipy unavailable; see docstring).  Per-component quantiles use
+        # the Wilson-Hilferty cube-root normal approximation.
         q05_1 = _gamma_quantile_approx(a1_post, b1_post, 0.05)
         q05_2 = _gamma_quantile_approx(a2_post, b2_post, 0.05)
 
-        # Weighted average of component quantiles (approximation -- see above)
         approximate_ebgm05 = q1 * q05_1 + q2 * q05_2
 
         return (ebgm, approximate_ebgm05)
@@ -443,6 +761,178 @@ def compute_ebgm(
         return (0.0, 0.0)
 
 
+# Convergence settings for the mixture-quantile solver (tolerance on
+# log(x), i.e. relative precision of the quantile)
+_QUANTILE_TOL = 1e-12
+_QUANTILE_MAX_ITER = 100
+
+
+def compute_ebgm_batch(
+    observed,
+    expected,
+    alpha1: float = 0.2,
+    beta1: float = 0.1,
+    alpha2: float = 2.0,
+    beta2: float = 4.0,
+    p: float = 1 / 3,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized MGPS EBGM with exact EBGM05 and EB95 for many pairs.
+
+    Same model as :func:`compute_ebgm`.  For every pair the posterior is
+    ``q1 * Gamma(alpha1 + n, beta1 + E) + q2 * Gamma(alpha2 + n, beta2 + E)``
+    and the 5th/95th percentiles solve ``q1 * F1(x) + q2 * F2(x) = level``.
+    The mixture quantile lies between the two component quantiles, which
+    bracket the root; all pairs are then solved together with a safeguarded
+    Newton iteration (bisection whenever a Newton step leaves the bracket).
+
+    Args:
+        observed: Array-like of observed counts (n).
+        expected: Array-like of expected counts (E), same shape.
+        alpha1: Shape parameter for the first Gamma component.
+        beta1: Rate parameter for the first Gamma component.
+        alpha2: Shape parameter for the second Gamma component.
+        beta2: Rate parameter for the second Gamma component.
+        p: Prior mixing weight for the first component.
+
+    Returns:
+        Tuple of arrays ``(ebgm, ebgm05, eb95)``.  Pairs with
+        ``expected <= 0`` or ``observed < 0`` get 0.0 in all three.
+
+    Raises:
+        RuntimeError: If scipy is not installed.
+        ValueError: If ``observed`` and ``expected`` differ in shape.
+    """
+    if not _HAS_SCIPY:
+        raise RuntimeError(
+            "compute_ebgm_batch requires scipy for the incomplete gamma "
+            "function: pip install scipy"
+        )
+
+    n = np.asarray(observed, dtype=float)
+    E = np.asarray(expected, dtype=float)
+    if n.shape != E.shape:
+        raise ValueError(
+            f"observed {n.shape} and expected {E.shape} must have the same shape"
+        )
+
+    valid = (E > 0.0) & (n >= 0.0)
+    ebgm = np.zeros(n.shape)
+    eb05 = np.zeros(n.shape)
+    eb95 = np.zeros(n.shape)
+    if not valid.any():
+        return ebgm, eb05, eb95
+
+    n = n[valid]
+    E = E[valid]
+
+    # Posterior component parameters
+    a1 = alpha1 + n
+    b1 = beta1 + E
+    a2 = alpha2 + n
+    b2 = beta2 + E
+
+    # Posterior mixing weights from the Negative Binomial marginals (the
+    # shared -log(n!) term cancels)
+    log_w1 = (
+        math.log(p) + _special.gammaln(a1) - math.lgamma(alpha1)
+        + alpha1 * math.log(beta1) - a1 * np.log(b1)
+    )
+    log_w2 = (
+        math.log(1 - p) + _special.gammaln(a2) - math.lgamma(alpha2)
+        + alpha2 * math.log(beta2) - a2 * np.log(b2)
+    )
+    q1 = _special.expit(log_w1 - log_w2)
+    q2 = 1.0 - q1
+
+    # EBGM = exp(E[ln lambda | data]); for Gamma(a, b), E[ln X] = digamma(a) - ln(b)
+    e_ln_lambda = (
+        q1 * (_special.digamma(a1) - np.log(b1))
+        + q2 * (_special.digamma(a2) - np.log(b2))
+    )
+    ebgm[valid] = np.exp(e_ln_lambda)
+
+    for level, out in ((0.05, eb05), (0.95, eb95)):
+        out[valid] = _gamma_mixture_quantile(q1, a1, b1, a2, b2, level)
+
+    return ebgm, eb05, eb95
+
+
+def _compute_ebgm_pairs(
+    observed: list[int],
+    expected: list[float],
+) -> list[tuple[float, float]]:
+    """(EBGM, EBGM05) per pair, batched when scipy is available."""
+    if not observed:
+        return []
+    if not _HAS_SCIPY:
+        return [compute_ebgm(n, e) for n, e in zip(observed, expected, strict=True)]
+    ebgm, ebgm05, _ = compute_ebgm_batch(observed, expected)
+    return list(zip(ebgm.tolist(), ebgm05.tolist(), strict=True))
+
+
+def _gamma_mixture_quantile(
+    q1: np.ndarray,
+    a1: np.ndarray,
+    b1: np.ndarray,
+    a2: np.ndarray,
+    b2: np.ndarray,
+    level: float,
+) -> np.ndarray:
+    """Solve ``q1 * F(x; a1, b1) + (1 - q1) * F(x; a2, b2) = level`` element-wise.
+
+    Iterates on ``u = log(x)``: posterior shapes near 0 (e.g. n = 0) make
+    the CDF behave like ``x**a``, which is badly scaled in ``x`` but close
+    to exponential in ``u``, so both Newton and bisection converge fast.
+    """
+    q2 = 1.0 - q1
+    u1 = np.log(_special.gammaincinv(a1, level) / b1)
+    u2 = np.log(_special.gammaincinv(a2, level) / b2)
+    lo = np.minimum(u1, u2)
+    hi = np.maximum(u1, u2)
+    u = np.log(q1 * np.exp(u1) + q2 * np.exp(u2))  # weighted-average start
+
+    # Density of the mixture in u: x * pdf(x), in log form per component
+    log_c1 = a1 * np.log(b1) - _special.gammaln(a1)
+    log_c2 = a2 * np.log(b2) - _special.gammaln(a2)
+
+    active = hi - lo > _QUANTILE_TOL
+    for _ in range(_QUANTILE_MAX_ITER):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        ua = u[idx]
+        xa = np.exp(ua)
+        f = (
+            q1[idx] * _special.gammainc(a1[idx], b1[idx] * xa)
+            + q2[idx] * _special.gammainc(a2[idx], b2[idx] * xa)
+            - level
+        )
+
+        # Tighten the bracket around the root
+        below = f < 0.0
+        lo_a = np.where(below, ua, lo[idx])
+        hi_a = np.where(below, hi[idx], ua)
+        lo[idx] = lo_a
+        hi[idx] = hi_a
+
+        # Newton step, or bisection if it leaves the bracket
+        with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+            density = (
+                q1[idx] * np.exp(log_c1[idx] + a1[idx] * ua - b1[idx] * xa)
+                + q2[idx] * np.exp(log_c2[idx] + a2[idx] * ua - b2[idx] * xa)
+            )
+            step = ua - f / density
+        in_bracket = np.isfinite(step) & (step >= lo_a) & (step <= hi_a)
+        new_u = np.where(in_bracket, step, 0.5 * (lo_a + hi_a))
+        new_u = np.where(f == 0.0, ua, new_u)
+        u[idx] = new_u
+
+        done = (np.abs(new_u - ua) <= _QUANTILE_TOL) | (hi_a - lo_a <= _QUANTILE_TOL)
+        active[idx[done]] = False
+
+    return np.exp(u)
+
+
 def _digamma(x: float) -> float:
     """Compute the digamma function psi(x) using Stirling's asymptotic series.
 
@@ -587,68 +1077,92 @@ def classify_signal(
     return (False, "none")
 
 
+def classify_signal_batch(
+    prr,
+    prr_ci_low,
+    ror,
+    ror_ci_low,
+    ebgm05,
+    n_cases,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized :func:`classify_signal` with the same tiered thresholds.
+
+    Args:
+        prr: Array-like of PRRs.
+        prr_ci_low: PRR 95% CI lower bounds.
+        ror: Reporting Odds Ratios (unused, as in the scalar version).
+        ror_ci_low: ROR 95% CI lower bounds.
+        ebgm05: EBGM 5th percentiles.
+        n_cases: Report counts for each pair.
+
+    Returns:
+        Tuple of arrays ``(is_signal, strength)``; ``strength`` holds the
+        same labels as :func:`classify_signal`.
+    """
+    prr = np.asarray(prr, dtype=float)
+    prr_ci_low = np.asarray(prr_ci_low, dtype=float)
+    ror_ci_low = np.asarray(ror_ci_low, dtype=float)
+    ebgm05 = np.asarray(ebgm05, dtype=float)
+    n_cases = np.asarray(n_cases)
+
+    strong = (prr >= 2.0) & (prr_ci_low > 1.0) & (n_cases >= 3) & (ebgm05 >= 2.0)
+    moderate = (prr >= 2.0) & (ror_ci_low > 1.0) & (n_cases >= 3)
+    weak = (prr >= 1.5) | (ebgm05 >= 1.0)
+
+    strength = np.select(
+        [strong, moderate, weak], ["strong", "moderate", "weak"], default="none",
+    ).astype(object)
+    return strength != "none", strength
+
+
 # ---------------------------------------------------------------------------
 # openFDA API integration
 # ---------------------------------------------------------------------------
 
-async def _http_get_json(url: str, params: dict[str, str]) -> dict:
+async def _http_get_json(
+    url: str,
+    params: dict[str, str],
+    client: OpenFDAClient | None = None,
+) -> dict:
     """Make an HTTP GET request and return parsed JSON.
 
-    Uses httpx if available, otherwise falls back to urllib.
-    Includes rate limiting for the openFDA API.
+    Successful responses are served from the persistent query cache when
+    possible; a stale entry is returned immediately and refreshed in the
+    background.  Cache reads and writes run in a worker thread so SQLite
+    lock waits do not stall the event loop.  Cache misses go through
+    ``client`` (or the shared default client), which applies the openFDA
+    rate limit, bounds concurrency, and coalesces duplicate in-flight
+    requests.
 
     Args:
         url: Base URL.
         params: Query parameters.
+        client: openFDA client to use.  Defaults to the shared client.
 
     Returns:
         Parsed JSON response as a dict.  Returns empty dict on error.
     """
-    await _rate_limit()
+    client = client or _default_client
+    key = _query_key(url, params)
 
-    if _HAS_HTTPX:
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(url, params=params)
-                if resp.status_code == 200:
-                    return resp.json()
-                elif resp.status_code == 404:
-                    logger.debug("openFDA 404 for params %s", params)
-                    return {}
-                else:
-                    logger.warning(
-                        "openFDA returned %d: %s",
-                        resp.status_code,
-                        resp.text[:200],
-                    )
-                    return {}
-        except Exception:
-            logger.exception("HTTP request to openFDA failed")
-            return {}
-    else:
-        # Synchronous urllib fallback
-        try:
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-            req = urllib.request.Request(full_url)
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                if resp.status == 200:
-                    return json.loads(resp.read().decode())
-                return {}
-        except urllib.error.HTTPError as exc:
-            if exc.code == 404:
-                return {}
-            logger.warning("openFDA urllib error %d", exc.code)
-            return {}
-        except Exception:
-            logger.exception("urllib request to openFDA failed")
-            return {}
+    # SQLite may block on the busy timeout; keep it off the event loop.
+    entry = await asyncio.to_thread(_cache.lookup, key)
+    if entry is not None:
+        if not entry.fresh:
+            _schedule_revalidation(key, url, params, client)
+        return entry.value
+
+    data = await client.get_json(url, params)
+    if data:
+        await asyncio.to_thread(_cache.set, key, data)
+    return data
 
 
 async def query_openfda(
     product_names: list[str],
     adverse_event: str,
     limit: int = 100,
+    client: OpenFDAClient | None = None,
 ) -> dict:
     """Query the openFDA FAERS API for a specific product-AE combination.
 
@@ -666,6 +1180,7 @@ async def query_openfda(
             ``["KYMRIAH", "TISAGENLECLEUCEL"]``).
         adverse_event: MedDRA preferred term (e.g. "Cytokine release syndrome").
         limit: Maximum number of results to return.
+        client: openFDA client to use.  Defaults to the shared client.
 
     Returns:
         Parsed JSON response from openFDA, or empty dict on error / no results.
@@ -679,64 +1194,60 @@ async def query_openfda(
             "search": search,
             "limit": str(limit),
         }
-        data = await _http_get_json(OPENFDA_BASE, params)
+        data = await _http_get_json(OPENFDA_BASE, params, client)
         if data:
             return data
 
     return {}
 
 
-async def _get_total_product_reports(product_names: list[str]) -> int:
+async def _get_total_product_reports(
+    product_names: list[str],
+    client: OpenFDAClient | None = None,
+) -> int:
     """Get total FAERS reports for a product (tries all name variants).
 
     Args:
         product_names: List of name variants.
+        client: openFDA client to use.
 
     Returns:
         Total report count, or 0 if not found.
     """
-    cache_key = f"faers_total_{'_'.join(product_names)}"
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached  # type: ignore[return-value]
-
     for name in product_names:
         params = {
             "search": f'patient.drug.openfda.brand_name:"{name}"',
             "limit": "1",
         }
-        data = await _http_get_json(OPENFDA_BASE, params)
+        data = await _http_get_json(OPENFDA_BASE, params, client)
         if data:
             total = data.get("meta", {}).get("results", {}).get("total", 0)
             if total > 0:
-                _cache_set(cache_key, total)
                 return total
 
     return 0
 
 
-async def _get_total_ae_reports(adverse_event: str) -> int:
+async def _get_total_ae_reports(
+    adverse_event: str,
+    client: OpenFDAClient | None = None,
+) -> int:
     """Get total FAERS reports for a specific AE across all drugs.
 
     Args:
         adverse_event: MedDRA preferred term.
+        client: openFDA client to use.
 
     Returns:
         Total report count, or 0 if not found.
     """
-    cache_key = f"faers_ae_{adverse_event}"
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached  # type: ignore[return-value]
-
     params = {
         "search": f'patient.reaction.reactionmeddrapt:"{adverse_event}"',
         "limit": "1",
     }
-    data = await _http_get_json(OPENFDA_BASE, params)
+    data = await _http_get_json(OPENFDA_BASE, params, client)
     if data:
         total = data.get("meta", {}).get("results", {}).get("total", 0)
-        _cache_set(cache_key, total)
         return total
 
     return 0
@@ -754,7 +1265,7 @@ _FAERS_NAUSEA_MULTIPLIER: int = 10
 _FAERS_FALLBACK_TOTAL: int = 20_000_000
 
 
-async def _get_total_database_reports() -> int:
+async def _get_total_database_reports(client: OpenFDAClient | None = None) -> int:
     """Get approximate total FAERS database size.
 
     Queries a very common reaction (NAUSEA) and extrapolates from its total
@@ -772,20 +1283,14 @@ async def _get_total_database_reports() -> int:
         Estimated total report count.  Falls back to ``_FAERS_FALLBACK_TOTAL``
         on error.
     """
-    cache_key = "faers_total_database"
-    cached = _cache_get(cache_key)
-    if cached is not None:
-        return cached  # type: ignore[return-value]
-
     params = {
         "search": 'patient.reaction.reactionmeddrapt:"NAUSEA"',
         "limit": "1",
     }
-    data = await _http_get_json(OPENFDA_BASE, params)
+    data = await _http_get_json(OPENFDA_BASE, params, client)
     if data:
         total = data.get("meta", {}).get("results", {}).get("total", 0)
         estimated_total = max(total * _FAERS_NAUSEA_MULTIPLIER, _FAERS_FALLBACK_TOTAL)
-        _cache_set(cache_key, estimated_total)
         return estimated_total
 
     return _FAERS_FALLBACK_TOTAL
@@ -794,24 +1299,55 @@ async def _get_total_database_reports() -> int:
 async def _get_drug_ae_count(
     product_names: list[str],
     adverse_event: str,
+    client: OpenFDAClient | None = None,
 ) -> int:
     """Get the count of reports for a specific drug-AE pair.
 
     Args:
         product_names: List of name variants for the product.
         adverse_event: MedDRA preferred term.
+        client: openFDA client to use.
 
     Returns:
         Report count (cell ``a`` of the 2x2 table).
     """
-    data = await query_openfda(product_names, adverse_event, limit=1)
+    data = await query_openfda(product_names, adverse_event, limit=1, client=client)
     if data:
         return data.get("meta", {}).get("results", {}).get("total", 0)
     return 0
 
 
+def _resolve_products(products: list[str] | None) -> list[str]:
+    """Map requested product names to ``CAR_T_PRODUCTS`` brand keys.
+
+    Names are matched case-insensitively against brands, then against the
+    generic-name variants.  Unknown names are skipped; if nothing matches
+    (or ``products`` is None) every known product is returned.
+    """
+    if products is None:
+        return list(CAR_T_PRODUCTS.keys())
+
+    # Normalise to uppercase and filter to known products
+    resolved = []
+    for p in products:
+        p_upper = p.strip().upper()
+        if p_upper in CAR_T_PRODUCTS:
+            resolved.append(p_upper)
+        else:
+            # Try matching against generic names
+            for brand, names in CAR_T_PRODUCTS.items():
+                if any(p_upper in n.upper() for n in names):
+                    resolved.append(brand)
+                    break
+            else:
+                logger.warning("Unknown product '%s'; skipping", p)
+
+    return resolved or list(CAR_T_PRODUCTS.keys())
+
+
 async def get_faers_signals(
     products: list[str] | None = None,
+    client: OpenFDAClient | None = None,
 ) -> FAERSSummary:
     """Run full FAERS signal detection for specified CAR-T products.
 
@@ -821,55 +1357,57 @@ async def get_faers_signals(
         3. Classify signal strength.
         4. Collect into an FAERSSummary.
 
+    The openFDA queries are issued concurrently through ``client``, which
+    bounds concurrency and enforces the rate limit; results are assembled
+    in product and AE order, so the output matches a sequential run.
+
     Args:
         products: List of product brand names to query (keys from
             ``CAR_T_PRODUCTS``).  If None, queries all known products.
+        client: openFDA client to use.  Defaults to the shared client.
 
     Returns:
         FAERSSummary containing all signal results, sorted with detected
         signals first and then by PRR descending.
     """
-    if products is None:
-        products_to_query = list(CAR_T_PRODUCTS.keys())
-    else:
-        # Normalise to uppercase and filter to known products
-        products_to_query = []
-        for p in products:
-            p_upper = p.strip().upper()
-            if p_upper in CAR_T_PRODUCTS:
-                products_to_query.append(p_upper)
-            else:
-                # Try matching against generic names
-                for brand, names in CAR_T_PRODUCTS.items():
-                    if any(p_upper in n.upper() for n in names):
-                        products_to_query.append(brand)
-                        break
-                else:
-                    logger.warning("Unknown product '%s'; skipping", p)
-
-        if not products_to_query:
-            products_to_query = list(CAR_T_PRODUCTS.keys())
+    products_to_query = _resolve_products(products)
 
-    # Get database-wide total
-    n_total_database = await _get_total_database_reports()
-
-    signals: list[FAERSSignal] = []
-    total_product_reports = 0
-
-    for brand in products_to_query:
-        product_names = CAR_T_PRODUCTS[brand]
-
-        # Total reports for this product
-        n_product = await _get_total_product_reports(product_names)
-        total_product_reports += n_product
+    # Database-wide and per-product totals
+    n_total_database, *product_totals = await asyncio.gather(
+        _get_total_database_reports(client),
+        *(_get_total_product_reports(CAR_T_PRODUCTS[b], client) for b in products_to_query),
+    )
+    total_product_reports = sum(product_totals)
 
+    active = []
+    for brand, n_product in zip(products_to_query, product_totals, strict=True):
         if n_product == 0:
             logger.info("No FAERS reports for %s; skipping", brand)
             continue
+        active.append((brand, n_product))
+
+    # Cell a for every product-AE pair, plus AE totals (shared across
+    # products, fetched once per AE)
+    pair_counts, ae_totals = await asyncio.gather(
+        asyncio.gather(*(
+            _get_drug_ae_count(CAR_T_PRODUCTS[brand], ae, client)
+            for brand, _ in active
+            for ae in TARGET_AES
+        )),
+        asyncio.gather(*(
+            _get_total_ae_reports(ae, client) for ae in (TARGET_AES if active else [])
+        )),
+    )
+    n_ae_totals = dict(zip(TARGET_AES, ae_totals, strict=False))
 
+    # 2x2 tables: (brand, ae, a, b, c, d, n_product, n_ae_total)
+    tables: list[tuple[str, str, int, int, int, int, int, int]] = []
+    pair_iter = iter(pair_counts)
+
+    for brand, n_product in active:
         for ae in TARGET_AES:
             # Cell a: drug AND event
-            a = await _get_drug_ae_count(product_names, ae)
+            a = next(pair_iter)
             if a == 0:
                 continue
 
@@ -877,54 +1415,63 @@ async def get_faers_signals(
             b = max(n_product - a, 0)
 
             # Cell c: NOT drug, WITH event
-            n_ae_total = await _get_total_ae_reports(ae)
+            n_ae_total = n_ae_totals[ae]
             c = max(n_ae_total - a, 0)
 
             # Cell d: NOT drug, NOT event
             d = max(n_total_database - a - b - c, 0)
 
-            # Compute disproportionality metrics
-            prr, prr_ci_low, prr_ci_high = compute_prr(a, b, c, d)
-            ror, ror_ci_low, ror_ci_high = compute_ror(a, b, c, d)
+            tables.append((brand, ae, a, b, c, d, n_product, n_ae_total))
 
-            # Expected count for EBGM
-            N = a + b + c + d
-            expected = ((a + b) * (a + c)) / N if N > 0 else 0.0
-            ebgm, ebgm05 = compute_ebgm(a, expected)
+    # EBGM for every pair in one batch.  Expected count under independence:
+    # E = (a + b)(a + c) / N
+    expected_counts = []
+    for _, _, a, b, c, d, _, _ in tables:
+        N = a + b + c + d
+        expected_counts.append(((a + b) * (a + c)) / N if N > 0 else 0.0)
+    ebgm_results = _compute_ebgm_pairs([t[2] for t in tables], expected_counts)
 
-            # Classify
-            is_signal, signal_strength = classify_signal(
-                prr, prr_ci_low, ror, ror_ci_low, ebgm05, a,
-            )
+    signals: list[FAERSSignal] = []
+    for (brand, ae, a, b, c, d, n_product, n_ae_total), (ebgm, ebgm05) in zip(
+        tables, ebgm_results, strict=True,
+    ):
+        # Compute disproportionality metrics
+        prr, prr_ci_low, prr_ci_high = compute_prr(a, b, c, d)
+        ror, ror_ci_low, ror_ci_high = compute_ror(a, b, c, d)
+
+        # Classify
+        is_signal, signal_strength = classify_signal(
+            prr, prr_ci_low, ror, ror_ci_low, ebgm05, a,
+        )
 
-            signals.append(
-                FAERSSignal(
-                    product=brand,
-                    adverse_event=ae,
-                    n_cases=a,
-                    n_total_product=n_product,
-                    n_total_ae=n_ae_total,
-                    n_total_database=n_total_database,
-                    prr=round(prr, 4),
-                    prr_ci_low=round(prr_ci_low, 4),
-                    prr_ci_high=round(prr_ci_high, 4),
-                    ror=round(ror, 4),
-                    ror_ci_low=round(ror_ci_low, 4),
-                    ror_ci_high=round(ror_ci_high, 4),
-                    ebgm=round(ebgm, 4),
-                    ebgm05=round(ebgm05, 4),
-                    is_signal=is_signal,
-                    signal_strength=signal_strength,
-                )
+        signals.append(
+            FAERSSignal(
+                product=brand,
+                adverse_event=ae,
+                n_cases=a,
+                n_total_product=n_product,
+                n_total_ae=n_ae_total,
+                n_total_database=n_total_database,
+                prr=round(prr, 4),
+                prr_ci_low=round(prr_ci_low, 4),
+                prr_ci_high=round(prr_ci_high, 4),
+                ror=round(ror, 4),
+                ror_ci_low=round(ror_ci_low, 4),
+                ror_ci_high=round(ror_ci_high, 4),
+                ebgm=round(ebgm, 4),
+                ebgm05=round(ebgm05, 4),
+                is_signal=is_signal,
+                signal_strength=signal_strength,
             )
+        )
 
-            logger.debug(
-                "Signal: %s + %s | a=%d PRR=%.2f [%.2f-%.2f] "
-                "ROR=%.2f [%.2f-%.2f] EBGM=%.2f EBGM05=%.2f => %s",
-                brand, ae, a, prr, prr_ci_low, prr_ci_high,
-                ror, ror_ci_low, ror_ci_high, ebgm, ebgm05,
-                signal_strength,
-            )
+        logger.debug(
+            "Signal: %s + %s | a=%d PRR=%.2f [%.2f-%.2f] "
+            "ROR=%.2f [%.2f-%.2f] EBGM=%.2f EBGM05=%.2f => %s",
+            brand, ae, a, prr, prr_ci_low, prr_ci_high,
+            ror, ror_ci_low, ror_ci_high, ebgm, ebgm05,
+            signal_strength,
+        )
 
     # Sort: detected signals first, then by PRR descending
     signals.sort(key=lambda s: (not s.is_signal, -s.prr))
@@ -942,11 +1489,48 @@ async def get_faers_signals(
     )
 
 
-async def get_faers_summary() -> dict:
+async def _get_product_summary(
+    brand: str,
+    names: list[str],
+    client: OpenFDAClient | None = None,
+) -> dict:
+    """Report count and top adverse events for one product."""
+    total_reports = await _get_total_product_reports(names, client)
+
+    top_aes: list[dict] = []
+    if total_reports > 0:
+        # Get top adverse events for this product
+        for name in names:
+            params = {
+                "search": f'patient.drug.openfda.brand_name:"{name}"',
+                "count": "patient.reaction.reactionmeddrapt.exact",
+                "limit": "10",
+            }
+            data = await _http_get_json(OPENFDA_BASE, params, client)
+            if data and "results" in data:
+                for r in data["results"][:10]:
+                    top_aes.append({
+                        "term": r.get("term", ""),
+                        "count": r.get("count", 0),
+                    })
+                break  # Got results from this name variant
+
+    return {
+        "brand_name": brand,
+        "generic_name": names[-1] if len(names) > 1 else names[0],
+        "total_reports": total_reports,
+        "top_adverse_events": top_aes,
+    }
+
+
+async def get_faers_summary(client: OpenFDAClient | None = None) -> dict:
     """High-level summary of FAERS data for all CAR-T products.
 
     Returns a dict with product-level report counts and top signals, suitable
-    for quick dashboard display.
+    for quick dashboard display.  Products are queried concurrently.
+
+    Args:
+        client: openFDA client to use.  Defaults to the shared client.
 
     Returns:
         Dict with keys:
@@ -956,37 +1540,11 @@ async def get_faers_summary() -> dict:
             - ``query_timestamp``: ISO-8601 timestamp.
             - ``data_source``: Attribution string.
     """
-    product_summaries: list[dict] = []
-    total_all = 0
-
-    for brand, names in CAR_T_PRODUCTS.items():
-        total_reports = await _get_total_product_reports(names)
-        total_all += total_reports
-
-        top_aes: list[dict] = []
-        if total_reports > 0:
-            # Get top adverse events for this product
-            for name in names:
-                params = {
-                    "search": f'patient.drug.openfda.brand_name:"{name}"',
-                    "count": "patient.reaction.reactionmeddrapt.exact",
-                    "limit": "10",
-                }
-                data = await _http_get_json(OPENFDA_BASE, params)
-                if data and "results" in data:
-                    for r in data["results"][:10]:
-                        top_aes.append({
-                            "term": r.get("term", ""),
-                            "count": r.get("count", 0),
-                        })
-                    break  # Got results from this name variant
-
-        product_summaries.append({
-            "brand_name": brand,
-            "generic_name": names[-1] if len(names) > 1 else names[0],
-            "total_reports": total_reports,
-            "top_adverse_events": top_aes,
-        })
+    product_summaries: list[dict] = list(await asyncio.gather(*(
+        _get_product_summary(brand, names, client)
+        for brand, names in CAR_T_PRODUCTS.items()
+    )))
+    total_all = sum(p["total_reports"] for p in product_summaries)
 
     # Sort by total reports descending
     product_summaries.sort(key=lambda p: -p["total_reports"])
@@ -16,8 +16,10 @@ product.  The correlation-adjusted formula smoothly interpolates between:
 Key capabilities:
     1. Pairwise correlated relative-risk combination.
     2. Greedy multi-strategy combination (most-correlated pair first).
-    3. Monte Carlo uncertainty propagation from Beta baseline + LogNormal RR.
+    3. Vectorized Monte Carlo uncertainty propagation from Beta baseline +
+       LogNormal RR.
     4. High-level convenience function for CRS + ICANS mitigated estimates.
+    5. Regimen optimizer: best combinations up to size k, Pareto frontier.
 
 Mitigation strategies:
     - tocilizumab:                  Anti-IL-6R, targets CRS
@@ -29,12 +31,14 @@ Mitigation strategies:
 
 from __future__ import annotations
 
+import itertools
 import logging
 import math
-import random
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -363,11 +367,42 @@ def combine_multiple_rrs(
     if len(mitigation_ids) == 0:
         raise ValueError("At least one mitigation must be provided")
 
-    if len(mitigation_ids) == 1:
-        return rrs[0]
+    values = list(rrs)
+    names = list(mitigation_ids)
+    for slot_a, slot_b, rho in _combination_plan(mitigation_ids):
+        combined_rr = combine_correlated_rr(values[slot_a], values[slot_b], rho)
+
+        logger.debug(
+            "Combining %s (RR=%.3f) + %s (RR=%.3f), rho=%.2f -> RR=%.4f",
+            names[slot_a], values[slot_a], names[slot_b], values[slot_b],
+            rho, combined_rr,
+        )
+
+        values.append(combined_rr)
+        names.append(f"{names[slot_a]}+{names[slot_b]}")
+
+    return values[-1]
+
 
-    # Working pool: list of (id, rr)
-    pool: list[tuple[str, float]] = list(zip(mitigation_ids, rrs))
+def _combination_plan(mitigation_ids: list[str]) -> list[tuple[int, int, float]]:
+    """Precompute the greedy pairing order for ``combine_multiple_rrs``.
+
+    The most-correlated pair is chosen from the mitigation IDs alone, so the
+    order does not depend on the RR values being combined.  Slots
+    ``0..n-1`` hold the input RRs; each step combines two slots and appends
+    the result as the next slot, so the final step's output is the last
+    slot.
+
+    Args:
+        mitigation_ids: Mitigation IDs, in input order.
+
+    Returns:
+        One ``(slot_a, slot_b, rho)`` step per combination (``n - 1`` steps).
+    """
+    # Working pool: list of (id, slot)
+    pool: list[tuple[str, int]] = [(mid, i) for i, mid in enumerate(mitigation_ids)]
+    next_slot = len(pool)
+    plan: list[tuple[int, int, float]] = []
 
     while len(pool) > 1:
         # Find the most-correlated pair
@@ -381,25 +416,19 @@ def combine_multiple_rrs(
                     best_i, best_j = i, j
                     best_rho = rho
 
-        # Combine the best pair
-        id_a, rr_a = pool[best_i]
-        id_b, rr_b = pool[best_j]
-        combined_rr = combine_correlated_rr(rr_a, rr_b, best_rho)
-
-        logger.debug(
-            "Combining %s (RR=%.3f) + %s (RR=%.3f), rho=%.2f -> RR=%.4f",
-            id_a, rr_a, id_b, rr_b, best_rho, combined_rr,
-        )
+        id_a, slot_a = pool[best_i]
+        id_b, slot_b = pool[best_j]
+        plan.append((slot_a, slot_b, best_rho))
 
         # Remove the pair (higher index first to preserve lower index)
         for idx in sorted([best_i, best_j], reverse=True):
             pool.pop(idx)
 
         # Insert the combined entry with a synthetic ID
-        synthetic_id = f"{id_a}+{id_b}"
-        pool.append((synthetic_id, combined_rr))
+        pool.append((f"{id_a}+{id_b}", next_slot))
+        next_slot += 1
 
-    return pool[0][1]
+    return plan
 
 
 # ---------------------------------------------------------------------------
@@ -422,12 +451,16 @@ def monte_carlo_mitigated_risk(
         3. Combine the sampled RRs using greedy correlated combination.
         4. Compute mitigated risk = baseline * combined_rr.
 
+    All samples are drawn and combined as NumPy arrays: the greedy pairing
+    order is computed once from the mitigation IDs, then applied
+    column-wise.  A given ``seed`` yields identical results across runs.
+
     Args:
         baseline_alpha: Alpha parameter of the Beta baseline distribution.
         baseline_beta: Beta parameter of the Beta baseline distribution.
         mitigation_ids: List of mitigation strategy IDs to apply.
         n_samples: Number of Monte Carlo samples.
-        seed: Optional random seed for reproducibility.
+        seed: Optional seed for ``numpy.random.default_rng``.
 
     Returns:
         Dict with keys:
@@ -436,75 +469,70 @@ def monte_carlo_mitigated_risk(
             - "p97_5": 97.5th percentile (upper bound of 95% interval).
             - "mean": Mean mitigated risk.
             - "n_samples": Number of samples used.
+
+    Raises:
+        ValueError: If ``mitigation_ids`` is empty or ``n_samples`` < 1.
     """
-    rng = random.Random(seed)
+    if n_samples < 1:
+        raise ValueError(f"n_samples must be >= 1: n_samples={n_samples}")
+
+    if not mitigation_ids:
+        raise ValueError("At least one mitigation must be provided")
+
+    # The pairing order depends only on the IDs, so plan it once.
+    plan = _combination_plan(mitigation_ids)
 
     # Pre-compute LogNormal parameters for each mitigation
-    log_params: list[tuple[float, float]] = []  # (mu, sigma)
-    for mid in mitigation_ids:
+    log_mu = np.empty(len(mitigation_ids))
+    log_se = np.empty(len(mitigation_ids))
+    for k, mid in enumerate(mitigation_ids):
         strategy = MITIGATION_STRATEGIES[mid]
-        rr = strategy.relative_risk
         ci_low, ci_high = strategy.confidence_interval
 
         # Derive SE from 95% CI: SE ~ (log(ci_high) - log(ci_low)) / (2 * 1.96)
-        log_mu = math.log(rr)
-        log_se = (math.log(ci_high) - math.log(ci_low)) / (2.0 * 1.96)
-        log_params.append((log_mu, log_se))
+        log_mu[k] = math.log(strategy.relative_risk)
+        log_se[k] = (math.log(ci_high) - math.log(ci_low)) / (2.0 * 1.96)
 
-    mitigated_samples: list[float] = []
+    rng = np.random.default_rng(seed)
 
-    for _ in range(n_samples):
-        # 1. Sample baseline from Beta
-        baseline = _sample_beta(rng, baseline_alpha, baseline_beta)
+    # 1. Baseline risk per sample
+    baseline = rng.beta(baseline_alpha, baseline_beta, size=n_samples)
 
-        # 2. Sample RR for each mitigation from LogNormal
-        sampled_rrs: list[float] = []
-        for log_mu, log_se in log_params:
-            log_rr = rng.gauss(log_mu, log_se)
-            sampled_rrs.append(math.exp(log_rr))
+    # 2. One LogNormal RR per (sample, mitigation)
+    sampled_rrs = np.exp(rng.normal(log_mu, log_se, size=(n_samples, len(mitigation_ids))))
 
-        # 3. Combine using correlated pairwise
-        combined_rr = combine_multiple_rrs(mitigation_ids, sampled_rrs)
+    # 3. Combine column-wise following the precomputed plan
+    slots: list[np.ndarray] = [sampled_rrs[:, k] for k in range(len(mitigation_ids))]
+    for slot_a, slot_b, rho in plan:
+        slots.append(_combine_correlated_rr_array(slots[slot_a], slots[slot_b], rho))
 
-        # 4. Mitigated risk
-        mitigated = baseline * combined_rr
-        mitigated_samples.append(min(mitigated, 1.0))
-
-    # Sort for percentile computation
-    mitigated_samples.sort()
+    # 4. Mitigated risk, capped at 1
+    mitigated = np.minimum(baseline * slots[-1], 1.0)
 
+    # Order statistics at the same ranks as a full sort, in O(n)
     idx_2_5 = int(n_samples * 0.025)
     idx_50 = int(n_samples * 0.50)
-    idx_97_5 = int(n_samples * 0.975)
+    idx_97_5 = min(int(n_samples * 0.975), n_samples - 1)
+    ranked = np.partition(mitigated, [idx_2_5, idx_50, idx_97_5])
 
     return {
-        "median": mitigated_samples[idx_50],
-        "p2_5": mitigated_samples[idx_2_5],
-        "p97_5": mitigated_samples[idx_97_5],
-        "mean": sum(mitigated_samples) / len(mitigated_samples),
+        "median": float(ranked[idx_50]),
+        "p2_5": float(ranked[idx_2_5]),
+        "p97_5": float(ranked[idx_97_5]),
+        "mean": float(mitigated.mean()),
         "n_samples": n_samples,
     }
 
 
-def _sample_beta(rng: random.Random, alpha: float, beta: float) -> float:
-    """Sample from Beta(alpha, beta) using the gamma-ratio method.
-
-    Python's ``random.betavariate`` is available but we use the rng instance
-    for reproducibility.
-
-    Args:
-        rng: Seeded Random instance.
-        alpha: Alpha shape parameter (> 0).
-        beta: Beta shape parameter (> 0).
-
-    Returns:
-        A sample in [0, 1].
-    """
-    x = rng.gammavariate(alpha, 1.0)
-    y = rng.gammavariate(beta, 1.0)
-    if x + y == 0:
-        return 0.5
-    return x / (x + y)
+def _combine_correlated_rr_array(
+    rr_a: np.ndarray,
+    rr_b: np.ndarray,
+    rho: float,
+) -> np.ndarray:
+    """Element-wise :func:`combine_correlated_rr` for sampled RR arrays."""
+    if rho == 0.0:
+        return rr_a * rr_b
+    return (rr_a * rr_b) ** (1.0 - rho) * np.minimum(rr_a, rr_b) ** rho
 
 
 # ---------------------------------------------------------------------------
@@ -596,3 +624,264 @@ def calculate_mitigated_risk(
         )
 
     return results
+
+
+# ---------------------------------------------------------------------------
+# Regimen optimization
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RegimenEvaluation:
+    """One candidate mitigation regimen scored against each target AE.
+
+    Attributes:
+        mitigation_ids: IDs in the regimen, in ``MITIGATION_STRATEGIES`` order.
+        combined_rr: Correlation-adjusted combined RR per AE type (1.0 when
+            no mitigation in the regimen targets that AE).
+        mitigated_risk: Baseline risk times combined RR per AE type.
+        pareto_optimal: True if no other regimen is at least as good on
+            every AE and on regimen size, and strictly better on one.
+        intervals: Monte Carlo 95% intervals per AE type (keys ``p2_5``,
+            ``median``, ``p97_5``, ``mean``).  Only populated for Pareto-
+            optimal regimens, and only when requested.
+    """
+
+    mitigation_ids: list[str]
+    combined_rr: dict[str, float]
+    mitigated_risk: dict[str, float]
+    pareto_optimal: bool = False
+    intervals: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.mitigation_ids)
+
+
+@dataclass
+class MitigationOptimizationResult:
+    """Output of :func:`optimize_mitigation_regimens`.
+
+    Attributes:
+        target_aes: AE types the regimens were scored against.
+        evaluations: Every feasible regimen, ranked by total combined RR
+            across target AEs, then by size.
+        pareto_frontier: The Pareto-optimal subset of ``evaluations``.
+        best_by_size: Best-ranked regimen for each regimen size.
+        n_combination_evaluations: Distinct greedy combinations computed
+            (after memoization) while scoring all regimens.
+    """
+
+    target_aes: list[str]
+    evaluations: list[RegimenEvaluation]
+    pareto_frontier: list[RegimenEvaluation]
+    best_by_size: dict[int, RegimenEvaluation]
+    n_combination_evaluations: int
+
+
+class _CombinationMemo:
+    """Memoized greedy combination over frozen pools of mitigation IDs.
+
+    A pool is a tuple of entries in greedy order; an entry is either a
+    mitigation ID or a ``(entry_a, entry_b)`` pair produced by an earlier
+    combination step.  Each pool maps to the single entry the greedy
+    algorithm reduces it to, and each entry to its combined RR, so
+    regimens that share an intermediate pool (e.g. the same most-correlated
+    pair) reuse that work.
+    """
+
+    def __init__(self) -> None:
+        self._reduced: dict[tuple, Any] = {}
+        self._rr: dict[Any, float] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._reduced)
+
+    def combined_rr(self, mitigation_ids: tuple[str, ...]) -> float:
+        return self._entry_rr(self._reduce(mitigation_ids))
+
+    def _reduce(self, pool: tuple) -> Any:
+        if len(pool) == 1:
+            return pool[0]
+        reduced = self._reduced.get(pool)
+        if reduced is None:
+            # Same most-correlated-pair search as combine_multiple_rrs;
+            # combined entries are independent of everything (rho 0).
+            best_i, best_j = 0, 1
+            best_rho = _entry_correlation(pool[0], pool[1])
+            for i in range(len(pool)):
+                for j in range(i + 1, len(pool)):
+                    rho = _entry_correlation(pool[i], pool[j])
+                    if rho > best_rho:
+                        best_i, best_j = i, j
+                        best_rho = rho
+
+            rest = tuple(e for k, e in enumerate(pool) if k not in (best_i, best_j))
+            reduced = self._reduce((*rest, (pool[best_i], pool[best_j])))
+            self._reduced[pool] = reduced
+        return reduced
+
+    def _entry_rr(self, entry: Any) -> float:
+        if isinstance(entry, str):
+            return MITIGATION_STRATEGIES[entry].relative_risk
+        rr = self._rr.get(entry)
+        if rr is None:
+            entry_a, entry_b = entry
+            rr = combine_correlated_rr(
+                self._entry_rr(entry_a),
+                self._entry_rr(entry_b),
+                _entry_correlation(entry_a, entry_b),
+            )
+            self._rr[entry] = rr
+        return rr
+
+
+def _entry_correlation(entry_a: Any, entry_b: Any) -> float:
+    if isinstance(entry_a, str) and isinstance(entry_b, str):
+        return get_mitigation_correlation(entry_a, entry_b)
+    return 0.0
+
+
+def _dominates(a: RegimenEvaluation, b: RegimenEvaluation, target_aes: list[str]) -> bool:
+    """True if ``a`` is no worse than ``b`` everywhere and better somewhere."""
+    a_scores = [a.combined_rr[ae] for ae in target_aes] + [a.size]
+    b_scores = [b.combined_rr[ae] for ae in target_aes] + [b.size]
+    return (
+        all(x <= y for x, y in zip(a_scores, b_scores, strict=True))
+        and any(x < y for x, y in zip(a_scores, b_scores, strict=True))
+    )
+
+
+def optimize_mitigation_regimens(
+    baseline_risks: dict[str, float],
+    max_size: int = 3,
+    required: list[str] | None = None,
+    excluded: list[str] | None = None,
+    baseline_params: dict[str, tuple[float, float]] | None = None,
+    n_samples: int = 0,
+    seed: int | None = None,
+) -> MitigationOptimizationResult:
+    """Find the best mitigation regimens of up to ``max_size`` strategies.
+
+    Every subset of ``MITIGATION_STRATEGIES`` (minus ``excluded``, always
+    including ``required``) up to ``max_size`` is scored: for each target
+    AE, the strategies targeting it are combined with the same greedy
+    correlated combination as :func:`combine_multiple_rrs`.  Combination
+    results are memoized by frozen ID pool, so shared sub-combinations are
+    computed once.
+
+    Regimens are then reduced to the Pareto frontier over (combined RR per
+    target AE, regimen size).  Monte Carlo intervals, the expensive part,
+    are computed only for frontier regimens.
+
+    Args:
+        baseline_risks: Baseline risk (proportion, 0-1) per target AE type,
+            e.g. ``{"CRS": 0.02, "ICANS": 0.01}``.  Keys define the targets.
+        max_size: Maximum number of strategies in a regimen.
+        required: Strategy IDs every regimen must include.
+        excluded: Strategy IDs no regimen may include.
+        baseline_params: Beta ``(alpha, beta)`` baseline distribution per
+            AE type, used for Monte Carlo intervals.
+        n_samples: Monte Carlo samples per frontier regimen and AE; 0
+            disables intervals.
+        seed: Optional Monte Carlo seed.
+
+    Returns:
+        MitigationOptimizationResult with all evaluations, the Pareto
+        frontier, and the best regimen per size.
+
+    Raises:
+        ValueError: On unknown strategy IDs, an empty target set, a
+            ``max_size`` below 1 or below the number of required strategies,
+            or a strategy that is both required and excluded.
+    """
+    target_aes = [ae.upper() for ae in baseline_risks]
+    baselines = {ae.upper(): risk for ae, risk in baseline_risks.items()}
+    required_ids = list(dict.fromkeys(required or []))
+    excluded_ids = set(excluded or [])
+
+    unknown = [
+        mid for mid in [*required_ids, *excluded_ids] if mid not in MITIGATION_STRATEGIES
+    ]
+    if unknown:
+        raise ValueError(f"Unknown mitigation IDs: {unknown}")
+    if not target_aes:
+        raise ValueError("At least one target AE must be provided")
+    if max_size < 1:
+        raise ValueError(f"max_size must be >= 1: max_size={max_size}")
+    if len(required_ids) > max_size:
+        raise ValueError(
+            f"{len(required_ids)} required mitigations exceed max_size={max_size}"
+        )
+    conflicting = excluded_ids.intersection(required_ids)
+    if conflicting:
+        raise ValueError(f"Mitigations both required and excluded: {sorted(conflicting)}")
+
+    catalog = list(MITIGATION_STRATEGIES)
+    optional = [
+        mid for mid in catalog if mid not in excluded_ids and mid not in required_ids
+    ]
+    order = {mid: i for i, mid in enumerate(catalog)}
+    applicable = {
+        ae: {mid for mid in catalog if ae in MITIGATION_STRATEGIES[mid].target_aes}
+        for ae in target_aes
+    }
+
+    memo = _CombinationMemo()
+    evaluations: list[RegimenEvaluation] = []
+    min_extra = 0 if required_ids else 1
+    for extra in range(min_extra, max_size - len(required_ids) + 1):
+        for chosen in itertools.combinations(optional, extra):
+            regimen = sorted([*required_ids, *chosen], key=order.__getitem__)
+            combined: dict[str, float] = {}
+            for ae in target_aes:
+                ids = tuple(mid for mid in regimen if mid in applicable[ae])
+                combined[ae] = memo.combined_rr(ids) if ids else 1.0
+            evaluations.append(RegimenEvaluation(
+                mitigation_ids=regimen,
+                combined_rr=combined,
+                mitigated_risk={
+                    ae: min(baselines[ae] * combined[ae], 1.0) for ae in target_aes
+                },
+            ))
+
+    evaluations.sort(key=lambda e: (sum(e.combined_rr.values()), e.size))
+
+    frontier: list[RegimenEvaluation] = []
+    for candidate in evaluations:
+        if not any(_dominates(other, candidate, target_aes) for other in evaluations):
+            candidate.pareto_optimal = True
+            frontier.append(candidate)
+
+    if n_samples > 0 and baseline_params:
+        # Frontier regimens often share their per-AE applicable subset.
+        intervals: dict[tuple[str, tuple[str, ...]], dict[str, float]] = {}
+        for regimen in frontier:
+            for ae in target_aes:
+                ids = tuple(mid for mid in regimen.mitigation_ids if mid in applicable[ae])
+                if ae not in baseline_params or not ids:
+                    continue
+                if (ae, ids) not in intervals:
+                    alpha, beta = baseline_params[ae]
+                    mc = monte_carlo_mitigated_risk(alpha, beta, list(ids), n_samples, seed)
+                    intervals[(ae, ids)] = {
+                        key: mc[key] for key in ("p2_5", "median", "p97_5", "mean")
+                    }
+                regimen.intervals[ae] = dict(intervals[(ae, ids)])
+
+    best_by_size: dict[int, RegimenEvaluation] = {}
+    for evaluation in evaluations:
+        best_by_size.setdefault(evaluation.size, evaluation)
+
+    logger.debug(
+        "Scored %d regimens (%d memoized combinations); frontier size %d",
+        len(evaluations), memo.size, len(frontier),
+    )
+
+    return MitigationOptimizationResult(
+        target_aes=target_aes,
+        evaluations=evaluations,
+        pareto_frontier=frontier,
+        best_by_size=dict(sorted(best_by_size.items())),
+        n_combination_evaluations=memo.size,
+    )
@@ -15,6 +15,11 @@ Registered models:
     7. predictive_posterior    — predict rate in the *next* study, not just current
 
 All percentage outputs are on the 0-100 scale for clinical readability.
+
+The multi-study models (random_effects_meta, empirical_bayes) are computed
+with numpy over columnar study data, so they scale to registries with
+hundreds of studies, and can add bootstrap / permutation intervals computed
+for all resamples at once (``n_bootstrap``).
 """
 
 from __future__ import annotations
@@ -24,6 +29,7 @@ import math
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+import numpy as np
 from scipy.stats import beta as beta_dist
 from scipy.stats import binom, norm
 
@@ -106,6 +112,31 @@ def bayesian_beta_binomial(data: dict[str, Any]) -> dict[str, Any]:
     )
 
 
+def bayesian_beta_binomial_update(
+    previous: dict[str, Any], data: dict[str, Any],
+) -> dict[str, Any]:
+    """Conjugate update of a ``bayesian_beta_binomial`` result with new data.
+
+    The Beta posterior after the previous data is the prior for the new
+    data, so the updated posterior only needs the accumulated event and
+    patient counts.  The result is identical to refitting
+    ``bayesian_beta_binomial`` on the pooled counts.
+
+    Args:
+        previous: Result dict returned by ``bayesian_beta_binomial`` (or by
+            an earlier update).
+        data: New, non-cumulative data with 'events' and 'n'.
+    """
+    meta = previous["metadata"]
+    return bayesian_beta_binomial({
+        "events": previous["n_events"] + data["events"],
+        "n": previous["n_patients"] + data["n"],
+        "prior_alpha": meta["prior_alpha"],
+        "prior_beta": meta["prior_beta"],
+        "prior_source": meta["prior_source"],
+    })
+
+
 # ---------------------------------------------------------------------------
 # 2. Frequentist exact binomial (Clopper-Pearson)
 # ---------------------------------------------------------------------------
@@ -252,98 +283,168 @@ def random_effects_meta(data: dict[str, Any]) -> dict[str, Any]:
     transformation for proportions to stabilise the variance.
 
     Required data keys:
-        studies (list[dict]): Each study dict must have:
+        studies: Either a list of study dicts, each with:
             - events (int)
             - n (int)
             - label (str, optional)
+            or columnar data (a dict of arrays or a DataFrame) with
+            'events' and 'n' columns and an optional 'label' column.
+
+    Optional data keys:
+        n_bootstrap (int): Number of resamples for bootstrap percentile CIs
+            of the pooled rate, tau-squared and I-squared, and for a
+            permutation test of heterogeneity.  Default 0 (analytic only).
+        seed (int): Seed for the resampling.
     """
-    studies = data["studies"]
-    k = len(studies)
+    events, sizes, study_labels = _study_columns(data["studies"])
+    k = len(events)
 
     if k == 0:
         raise ValueError("At least one study is required for meta-analysis")
 
     if k == 1:
         # Fall back to single-study exact estimate
-        s = studies[0]
-        return frequentist_exact({"events": s["events"], "n": s["n"]})
+        return frequentist_exact({"events": int(events[0]), "n": int(sizes[0])})
 
     # Freeman-Tukey double arcsine transformation for proportions
     # y_i = arcsin(sqrt(x_i / (n_i+1))) + arcsin(sqrt((x_i+1) / (n_i+1)))
     # var_i = 1 / (n_i + 0.5)
-    ys = []
-    ws = []
-    study_labels = []
-    total_events = 0
-    total_n = 0
-
-    for s in studies:
-        ei = s["events"]
-        ni = s["n"]
-        total_events += ei
-        total_n += ni
-        study_labels.append(s.get("label", f"Study (n={ni})"))
-
-        yi = math.asin(math.sqrt(ei / (ni + 1))) + math.asin(
-            math.sqrt((ei + 1) / (ni + 1))
+    ys = _double_arcsine(events, sizes)
+    ws = sizes + 0.5
+
+    theta_re, se_re, q, tau2, i_squared, ws_re = _dersimonian_laird(ys, ws)
+    z_crit = norm.ppf(0.975)
+
+    pooled = _inverse_double_arcsine(theta_re)
+    ci_low = _inverse_double_arcsine(theta_re - z_crit * se_re)
+    ci_high = _inverse_double_arcsine(theta_re + z_crit * se_re)
+
+    metadata = {
+        "n_studies": k,
+        "tau_squared": round(float(tau2), 6),
+        "cochran_q": round(float(q), 4),
+        "i_squared": round(float(i_squared), 4),
+        "study_labels": study_labels,
+        "study_weights": [round(w, 4) for w in (ws_re / ws_re.sum()).tolist()],
+        "transformation": "Freeman-Tukey double arcsine",
+    }
+
+    n_bootstrap = data.get("n_bootstrap", 0)
+    if n_bootstrap > 0:
+        rng = np.random.default_rng(data.get("seed"))
+
+        # Study-level bootstrap: every resample is one row of an index matrix
+        idx = rng.integers(0, k, size=(n_bootstrap, k))
+        boot_theta, _, _, boot_tau2, boot_i2, _ = _dersimonian_laird(ys[idx], ws[idx])
+
+        # Permutation test of homogeneity: shuffling patient outcomes across
+        # studies of fixed size draws event counts from a multivariate
+        # hypergeometric distribution
+        perm_events = rng.multivariate_hypergeometric(
+            sizes.astype(np.int64), int(events.sum()), size=n_bootstrap,
         )
-        vi = 1.0 / (ni + 0.5)
-        wi = 1.0 / vi
+        perm_q = _dersimonian_laird(_double_arcsine(perm_events, sizes), ws)[2]
+
+        metadata["bootstrap"] = {
+            "n_resamples": n_bootstrap,
+            "estimate_ci_pct": _percentile_ci(_inverse_double_arcsine(boot_theta) * 100.0, 4),
+            "tau_squared_ci": _percentile_ci(boot_tau2, 6),
+            "i_squared_ci": _percentile_ci(boot_i2, 4),
+            "heterogeneity_p_permutation": round(
+                float((1 + np.count_nonzero(perm_q >= q)) / (n_bootstrap + 1)), 4,
+            ),
+        }
 
-        ys.append(yi)
-        ws.append(wi)
+    return _result(
+        estimate_pct=float(pooled) * 100.0,
+        ci_low_pct=float(ci_low) * 100.0,
+        ci_high_pct=float(ci_high) * 100.0,
+        method="DerSimonian-Laird Random Effects",
+        n_patients=int(sizes.sum()),
+        n_events=int(events.sum()),
+        metadata=metadata,
+    )
 
-    # Fixed-effects pooled estimate
-    w_sum = sum(ws)
-    theta_fe = sum(w * y for w, y in zip(ws, ys)) / w_sum
 
-    # Cochran's Q statistic
-    q = sum(w * (y - theta_fe) ** 2 for w, y in zip(ws, ys))
+def _study_columns(
+    studies: Any, name_key: str = "label",
+) -> tuple[np.ndarray, np.ndarray, list]:
+    """Event counts, sample sizes and labels from study records or columns.
 
-    # DerSimonian-Laird tau-squared estimate
-    c = w_sum - sum(w * w for w in ws) / w_sum
-    tau2 = max(0.0, (q - (k - 1)) / c) if c > 0 else 0.0
+    ``studies`` is either a list of dicts or a mapping of columns (dict of
+    arrays, DataFrame).  Labels default to ``"Study (n=...)"``.
+    """
+    if isinstance(studies, (list, tuple)):
+        events = np.array([s["events"] for s in studies])
+        sizes = np.array([s["n"] for s in studies])
+        labels = [s.get(name_key, f"Study (n={s['n']})") for s in studies]
+    else:
+        events = np.asarray(studies["events"])
+        sizes = np.asarray(studies["n"])
+        labels = (
+            list(studies[name_key]) if name_key in studies
+            else [f"Study (n={ni})" for ni in sizes.tolist()]
+        )
+    if events.shape != sizes.shape or events.ndim != 1:
+        raise ValueError("'events' and 'n' must be one-dimensional and of equal length")
+    return events.astype(float), sizes.astype(float), labels
 
-    # Random-effects weights
-    ws_re = [1.0 / (1.0 / w + tau2) for w in ws]
-    w_re_sum = sum(ws_re)
-    theta_re = sum(w * y for w, y in zip(ws_re, ys)) / w_re_sum
 
-    se_re = math.sqrt(1.0 / w_re_sum)
-    z_crit = norm.ppf(0.975)
+def _double_arcsine(events: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    return np.arcsin(np.sqrt(events / (sizes + 1))) + np.arcsin(
+        np.sqrt((events + 1) / (sizes + 1))
+    )
 
-    theta_low = theta_re - z_crit * se_re
-    theta_high = theta_re + z_crit * se_re
 
-    # Back-transform from double arcsine to proportion
+def _inverse_double_arcsine(theta: np.ndarray) -> np.ndarray:
     # Inverse: p = (sin(theta/2))^2
-    def back_transform(t: float) -> float:
-        return max(0.0, min(1.0, (math.sin(t / 2)) ** 2))
+    return np.clip(np.sin(theta / 2) ** 2, 0.0, 1.0)
 
-    pooled = back_transform(theta_re)
-    ci_low = back_transform(theta_low)
-    ci_high = back_transform(theta_high)
 
-    # I-squared heterogeneity
-    i_squared = max(0.0, (q - (k - 1)) / q) if q > 0 else 0.0
+def _dersimonian_laird(
+    ys: np.ndarray, ws: np.ndarray,
+) -> tuple[np.ndarray, ...]:
+    """DerSimonian-Laird pooling along the last axis.
 
-    return _result(
-        estimate_pct=pooled * 100.0,
-        ci_low_pct=ci_low * 100.0,
-        ci_high_pct=ci_high * 100.0,
-        method="DerSimonian-Laird Random Effects",
-        n_patients=total_n,
-        n_events=total_events,
-        metadata={
-            "n_studies": k,
-            "tau_squared": round(tau2, 6),
-            "cochran_q": round(q, 4),
-            "i_squared": round(i_squared, 4),
-            "study_labels": study_labels,
-            "study_weights": [round(w / w_re_sum, 4) for w in ws_re],
-            "transformation": "Freeman-Tukey double arcsine",
-        },
+    ``ys`` and ``ws`` hold transformed effects and inverse-variance weights
+    with studies on the last axis; leading axes (e.g. bootstrap resamples)
+    are pooled independently.
+
+    Returns:
+        (theta_re, se_re, q, tau2, i_squared, random-effects weights).
+    """
+    k = ys.shape[-1]
+
+    # Fixed-effects pooled estimate
+    w_sum = ws.sum(axis=-1)
+    theta_fe = (ws * ys).sum(axis=-1) / w_sum
+
+    # Cochran's Q statistic
+    q = (ws * (ys - theta_fe[..., None]) ** 2).sum(axis=-1)
+
+    # DerSimonian-Laird tau-squared estimate
+    c = w_sum - (ws * ws).sum(axis=-1) / w_sum
+    tau2 = np.where(
+        c > 0, np.maximum(0.0, (q - (k - 1)) / np.where(c > 0, c, 1.0)), 0.0,
+    )
+
+    # Random-effects weights
+    ws_re = 1.0 / (1.0 / ws + tau2[..., None])
+    w_re_sum = ws_re.sum(axis=-1)
+    theta_re = (ws_re * ys).sum(axis=-1) / w_re_sum
+    se_re = np.sqrt(1.0 / w_re_sum)
+
+    # I-squared heterogeneity
+    i_squared = np.where(
+        q > 0, np.maximum(0.0, (q - (k - 1)) / np.where(q > 0, q, 1.0)), 0.0,
     )
+    return theta_re, se_re, q, tau2, i_squared, ws_re
+
+
+def _percentile_ci(samples: np.ndarray, digits: int) -> list[float]:
+    """Equal-tailed 95% percentile interval of bootstrap samples."""
+    low, high = np.percentile(samples, [2.5, 97.5], axis=0)
+    return [round(float(low), digits), round(float(high), digits)]
 
 
 # ---------------------------------------------------------------------------
@@ -363,113 +464,141 @@ def empirical_bayes(data: dict[str, Any]) -> dict[str, Any]:
     where tau2 is the between-type variance estimated from the data.
 
     Required data keys:
-        ae_types (list[dict]): Each dict must have:
+        ae_types: Either a list of dicts, each with:
             - name (str): AE type name
             - events (int)
             - n (int)
+            or columnar data (a dict of arrays or a DataFrame) with 'name',
+            'events' and 'n' columns.
         target (str): Name of the AE type to report.
 
     Optional data keys:
         prior_weight (float): Weight on the grand mean (0=no shrinkage).
             If not provided, computed from data via method-of-moments.
+        n_bootstrap (int): Number of parametric bootstrap resamples (event
+            counts redrawn from each type's raw rate) for percentile CIs of
+            the shrunk rate, shrinkage factor and tau-squared.  Default 0.
+        seed (int): Seed for the resampling.
     """
-    ae_types = data["ae_types"]
+    events, sizes, names = _study_columns(data["ae_types"], name_key="name")
     target_name = data["target"]
+    k = len(events)
 
-    if len(ae_types) == 0:
+    if k == 0:
         raise ValueError("At least one AE type is required")
 
-    # Compute raw rates and within-type variance
-    raw_rates = []
-    within_vars = []
-    for ae in ae_types:
-        ei = ae["events"]
-        ni = ae["n"]
-        pi = ei / ni if ni > 0 else 0.0
-        vi = pi * (1 - pi) / ni if ni > 0 else 0.0
-        raw_rates.append(pi)
-        within_vars.append(vi)
+    # Find target AE type
+    if target_name not in names:
+        raise ValueError(
+            f"Target AE type '{target_name}' not found in ae_types"
+        )
+    target_idx = names.index(target_name)
+
+    prior_weight = data.get("prior_weight")
+    raw_rates, grand_mean, tau2, b_i, shrunk, shrunk_se = _shrinkage(
+        events, sizes, target_idx, prior_weight,
+    )
+    z_crit = norm.ppf(0.975)
+
+    ci_low = shrunk - z_crit * shrunk_se
+    ci_high = shrunk + z_crit * shrunk_se
+
+    metadata = {
+        "target_ae": target_name,
+        "raw_rate_pct": round(float(raw_rates[target_idx]) * 100.0, 4),
+        "grand_mean_pct": round(float(grand_mean) * 100.0, 4),
+        "shrinkage_factor": round(float(b_i), 4),
+        "tau_squared": round(float(tau2), 6),
+        "n_ae_types": k,
+        "all_rates_pct": {
+            name: round(r * 100.0, 4)
+            for name, r in zip(names, raw_rates.tolist())
+        },
+    }
+
+    n_bootstrap = data.get("n_bootstrap", 0)
+    if n_bootstrap > 0:
+        rng = np.random.default_rng(data.get("seed"))
+        boot_events = rng.binomial(
+            sizes.astype(np.int64), raw_rates, size=(n_bootstrap, k),
+        )
+        _, _, boot_tau2, boot_b, boot_shrunk, _ = _shrinkage(
+            boot_events.astype(float), sizes, target_idx, prior_weight,
+        )
+        metadata["bootstrap"] = {
+            "n_resamples": n_bootstrap,
+            "estimate_ci_pct": _percentile_ci(boot_shrunk * 100.0, 4),
+            "shrinkage_factor_ci": _percentile_ci(boot_b, 4),
+            "tau_squared_ci": _percentile_ci(boot_tau2, 6),
+        }
+
+    return _result(
+        estimate_pct=float(shrunk) * 100.0,
+        ci_low_pct=float(ci_low) * 100.0,
+        ci_high_pct=float(ci_high) * 100.0,
+        method="Empirical Bayes Shrinkage",
+        n_patients=int(sizes[target_idx]),
+        n_events=int(events[target_idx]),
+        metadata=metadata,
+    )
+
+
+def _shrinkage(
+    events: np.ndarray,
+    sizes: np.ndarray,
+    target_idx: int,
+    prior_weight: float | None = None,
+) -> tuple[np.ndarray, ...]:
+    """Method-of-moments shrinkage of one AE type along the last axis.
+
+    ``events`` has AE types on the last axis; leading axes (e.g. bootstrap
+    resamples) are estimated independently.
+
+    Returns:
+        (raw rates, grand mean, tau2, shrinkage factor, shrunk rate,
+        standard error of the shrunk rate).
+    """
+    k = events.shape[-1]
+
+    # Raw rates and within-type variance (zero for types with n = 0)
+    has_n = sizes > 0
+    safe_n = np.where(has_n, sizes, 1.0)
+    raw_rates = np.where(has_n, events / safe_n, 0.0)
+    within_vars = np.where(has_n, raw_rates * (1 - raw_rates) / safe_n, 0.0)
 
     # Grand mean (unweighted)
-    grand_mean = sum(raw_rates) / len(raw_rates) if raw_rates else 0.0
+    grand_mean = raw_rates.mean(axis=-1)
+    sq_dev = ((raw_rates - grand_mean[..., None]) ** 2).sum(axis=-1)
 
     # Estimate between-type variance (tau2) via method-of-moments
-    k = len(ae_types)
     if k > 1:
-        mean_within_var = sum(within_vars) / k
-        # Variance of the raw rates
-        var_of_rates = sum((r - grand_mean) ** 2 for r in raw_rates) / (k - 1)
-        tau2 = max(0.0, var_of_rates - mean_within_var)
+        mean_within_var = within_vars.mean(axis=-1)
+        var_of_rates = sq_dev / (k - 1)
+        tau2 = np.maximum(0.0, var_of_rates - mean_within_var)
     else:
-        tau2 = 0.0
+        tau2 = np.zeros_like(grand_mean)
 
-    # Allow override (reserved for future manual shrinkage control)
-    # if "prior_weight" in data:
-    #     B = data["prior_weight"]
-
-    # Find target AE type and compute shrunken estimate
-    target_idx = None
-    for i, ae in enumerate(ae_types):
-        if ae["name"] == target_name:
-            target_idx = i
-            break
-
-    if target_idx is None:
-        raise ValueError(
-            f"Target AE type '{target_name}' not found in ae_types"
-        )
-
-    target_ae = ae_types[target_idx]
-    target_raw = raw_rates[target_idx]
-    target_var = within_vars[target_idx]
-    target_n = target_ae["n"]
-    target_events = target_ae["events"]
+    target_raw = raw_rates[..., target_idx]
+    target_var = within_vars[..., target_idx]
 
     # Shrinkage factor: proportion of variance that is within-type
-    if "prior_weight" in data:
-        b_i = data["prior_weight"]
-    elif (target_var + tau2) > 0:
-        b_i = target_var / (target_var + tau2)
+    if prior_weight is not None:
+        b_i = np.full_like(grand_mean, prior_weight)
     else:
-        b_i = 0.0  # No shrinkage when variance is zero
+        total_var = target_var + tau2
+        b_i = np.where(
+            total_var > 0, target_var / np.where(total_var > 0, total_var, 1.0), 0.0,
+        )
 
     # Shrunk estimate: weighted average of raw rate and grand mean
     shrunk = (1 - b_i) * target_raw + b_i * grand_mean
 
     # Approximate CI for the shrunk estimate
     # Var(shrunk) ~ (1 - B)^2 * Var(raw) + B^2 * Var(grand mean)
-    var_grand_mean = (
-        sum((r - grand_mean) ** 2 for r in raw_rates) / (k * (k - 1))
-        if k > 1
-        else target_var
-    )
+    var_grand_mean = sq_dev / (k * (k - 1)) if k > 1 else target_var
     shrunk_var = ((1 - b_i) ** 2) * target_var + (b_i ** 2) * var_grand_mean
-    shrunk_se = math.sqrt(shrunk_var) if shrunk_var > 0 else 0.0
-    z_crit = norm.ppf(0.975)
-
-    ci_low = shrunk - z_crit * shrunk_se
-    ci_high = shrunk + z_crit * shrunk_se
-
-    return _result(
-        estimate_pct=shrunk * 100.0,
-        ci_low_pct=ci_low * 100.0,
-        ci_high_pct=ci_high * 100.0,
-        method="Empirical Bayes Shrinkage",
-        n_patients=target_n,
-        n_events=target_events,
-        metadata={
-            "target_ae": target_name,
-            "raw_rate_pct": round(target_raw * 100.0, 4),
-            "grand_mean_pct": round(grand_mean * 100.0, 4),
-            "shrinkage_factor": round(b_i, 4),
-            "tau_squared": round(tau2, 6),
-            "n_ae_types": k,
-            "all_rates_pct": {
-                ae["name"]: round(r * 100.0, 4)
-                for ae, r in zip(ae_types, raw_rates)
-            },
-        },
-    )
+    shrunk_se = np.sqrt(np.maximum(shrunk_var, 0.0))
+    return raw_rates, grand_mean, tau2, b_i, shrunk, shrunk_se
 
 
 # ---------------------------------------------------------------------------
@@ -716,6 +845,9 @@ class RiskModel:
         suitable_for: Contexts where this model is appropriate.
         requires: Data keys the compute function needs.
         compute_fn: Callable that takes a data dict and returns a result dict.
+        update_fn: For conjugate models, callable that takes a previous
+            result dict and new (non-cumulative) data and returns the
+            updated result without refitting on the full history.
     """
 
     id: str
@@ -724,6 +856,7 @@ class RiskModel:
     suitable_for: list[str]
     requires: list[str]
     compute_fn: Callable[[dict[str, Any]], dict[str, Any]]
+    update_fn: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]] | None = None
 
 
 MODEL_REGISTRY: dict[str, RiskModel] = {
@@ -737,6 +870,7 @@ MODEL_REGISTRY: dict[str, RiskModel] = {
         suitable_for=["small_sample", "sequential_updating", "informative_prior"],
         requires=["events", "n"],
         compute_fn=bayesian_beta_binomial,
+        update_fn=bayesian_beta_binomial_update,
     ),
     "frequentist_exact": RiskModel(
         id="frequentist_exact",
@@ -6,6 +6,14 @@ estimates produced by the model registry.  Includes calibration diagnostics,
 scoring rules, coverage analysis, cross-validation, and head-to-head model
 comparison.
 
+Cross-validation folds are independent, so ``leave_one_out_cv`` and
+``model_comparison`` can spread model x fold tasks over a process pool
+(``n_workers``) via ``run_evaluation_tasks``; results are always assembled
+in model and fold order, so the output does not depend on the worker
+count.  ``sequential_prediction_test`` updates conjugate models (those with
+an ``update_fn`` in the registry) from the previous posterior instead of
+refitting on the whole history at every timepoint.
+
 All functions operate on standardised result dicts as produced by
 ``model_registry.estimate_risk()``.
 """
@@ -14,10 +22,23 @@ from __future__ import annotations
 
 import math
 import logging
-from typing import Any, Callable
+import multiprocessing
+import os
+import pickle
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from src.models.model_registry import MODEL_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+ModelFn = Callable[[dict[str, Any]], dict[str, Any]]
+UpdateFn = Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]]
+
 
 # ---------------------------------------------------------------------------
 # 1. Calibration check
@@ -225,12 +246,84 @@ def _assess_coverage(coverage: float, n: int) -> str:
 
 
 # ---------------------------------------------------------------------------
-# 4. Leave-one-out cross-validation
+# 4. Parallel evaluation runner
+# ---------------------------------------------------------------------------
+
+def run_evaluation_tasks(
+    task_fn: Callable[[T], R],
+    tasks: Sequence[T],
+    n_workers: int | None = 1,
+) -> list[R]:
+    """Run ``task_fn`` over ``tasks`` and return results in task order.
+
+    With ``n_workers`` > 1 the tasks are spread over a process pool.  Tasks
+    are dispatched in chunks and the results are gathered in submission
+    order, so the output is identical to the serial run.  Falls back to
+    running serially if ``task_fn`` or the tasks cannot be pickled (e.g.
+    lambdas or closures as model functions).
+
+    Args:
+        task_fn: Module-level function applied to each task.
+        tasks: Task arguments, one per call.
+        n_workers: Worker processes; 1 runs in-process, None uses every CPU.
+
+    Returns:
+        List with ``task_fn(task)`` for each task, in order.
+    """
+    tasks = list(tasks)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(tasks))
+    if n_workers <= 1:
+        return [task_fn(task) for task in tasks]
+
+    try:
+        pickle.dumps((task_fn, tasks))
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        logger.info("Evaluation tasks are not picklable (%s); running serially", exc)
+        return [task_fn(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (n_workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        return list(pool.map(task_fn, tasks, chunksize=chunksize))
+
+
+def _fit_history(
+    model_fn: ModelFn, history: list[dict[str, Any]], context: str,
+) -> dict[str, Any] | None:
+    """Fit ``model_fn`` on ``history`` as a multi-study dataset, falling back
+    to pooled counts for single-study models.
+
+    Returns None (and logs a warning naming ``context``) if the pooled fit
+    fails too.
+    """
+    try:
+        return model_fn({"studies": history})
+    except (ValueError, KeyError, TypeError):
+        pooled_events = sum(s["events"] for s in history)
+        pooled_n = sum(s["n"] for s in history)
+        try:
+            return model_fn({"events": pooled_events, "n": pooled_n})
+        except Exception as exc:
+            logger.warning("%s failed: %s", context, exc)
+            return None
+
+
+def _observed_rate_pct(study: dict[str, Any]) -> float:
+    return (study["events"] / study["n"]) * 100.0 if study["n"] > 0 else 0.0
+
+
+# ---------------------------------------------------------------------------
+# 5. Leave-one-out cross-validation
 # ---------------------------------------------------------------------------
 
 def leave_one_out_cv(
     studies: list[dict[str, Any]],
-    model_fn: Callable[[dict[str, Any]], dict[str, Any]],
+    model_fn: ModelFn,
+    n_workers: int | None = 1,
 ) -> dict[str, Any]:
     """Leave-one-out cross-validation for study-level predictions.
 
@@ -242,6 +335,8 @@ def leave_one_out_cv(
         model_fn: A function that takes a data dict (with 'studies' key for
             meta-analysis or 'events'/'n' for single-study models) and
             returns a standardised result dict.
+        n_workers: Worker processes for the folds (see
+            ``run_evaluation_tasks``).
 
     Returns:
         Dict with per-fold results, RMSE, MAE, and coverage.
@@ -250,58 +345,46 @@ def leave_one_out_cv(
     if k < 2:
         raise ValueError("At least 2 studies are required for LOO-CV")
 
-    fold_results = []
-    errors = []
-    ci_list = []
-    true_rates = []
-
-    for i in range(k):
-        held_out = studies[i]
-        training = [s for j, s in enumerate(studies) if j != i]
-
-        # True rate of the held-out study
-        true_rate_pct = (
-            (held_out["events"] / held_out["n"]) * 100.0
-            if held_out["n"] > 0
-            else 0.0
-        )
-
-        # Build data for the model function
-        # Try meta-analysis first (multi-study), fall back to pooled single
-        try:
-            data = {"studies": training}
-            result = model_fn(data)
-        except (ValueError, KeyError, TypeError):
-            # Fall back to pooled counts
-            pooled_events = sum(s["events"] for s in training)
-            pooled_n = sum(s["n"] for s in training)
-            data = {"events": pooled_events, "n": pooled_n}
-            try:
-                result = model_fn(data)
-            except Exception as exc:
-                logger.warning("LOO fold %d failed: %s", i, exc)
-                continue
-
-        pred_rate_pct = result["estimate_pct"]
-        error = pred_rate_pct - true_rate_pct
-        errors.append(error)
-        ci_list.append((result["ci_low_pct"], result["ci_high_pct"]))
-        true_rates.append(true_rate_pct)
+    tasks = [(studies, i, model_fn) for i in range(k)]
+    return _summarize_folds(run_evaluation_tasks(_loo_fold, tasks, n_workers))
+
+
+def _loo_fold(
+    task: tuple[list[dict[str, Any]], int, ModelFn],
+) -> tuple[dict[str, Any], float, tuple[float, float], float] | None:
+    """Fit one LOO fold; returns (fold record, error, CI, true rate) or None
+    if the model cannot be fitted."""
+    studies, i, model_fn = task
+    held_out = studies[i]
+    training = [s for j, s in enumerate(studies) if j != i]
+    true_rate_pct = _observed_rate_pct(held_out)
+
+    result = _fit_history(model_fn, training, f"LOO fold {i}")
+    if result is None:
+        return None
+
+    pred_rate_pct = result["estimate_pct"]
+    error = pred_rate_pct - true_rate_pct
+    fold = {
+        "fold": i,
+        "held_out_label": held_out.get("label", f"Study {i}"),
+        "true_rate_pct": round(true_rate_pct, 4),
+        "predicted_pct": round(pred_rate_pct, 4),
+        "error_pct": round(error, 4),
+        "ci_low_pct": round(result["ci_low_pct"], 4),
+        "ci_high_pct": round(result["ci_high_pct"], 4),
+        "covered": (
+            result["ci_low_pct"] <= true_rate_pct <= result["ci_high_pct"]
+        ),
+    }
+    return fold, error, (result["ci_low_pct"], result["ci_high_pct"]), true_rate_pct
 
-        fold_results.append({
-            "fold": i,
-            "held_out_label": held_out.get("label", f"Study {i}"),
-            "true_rate_pct": round(true_rate_pct, 4),
-            "predicted_pct": round(pred_rate_pct, 4),
-            "error_pct": round(error, 4),
-            "ci_low_pct": round(result["ci_low_pct"], 4),
-            "ci_high_pct": round(result["ci_high_pct"], 4),
-            "covered": (
-                result["ci_low_pct"] <= true_rate_pct <= result["ci_high_pct"]
-            ),
-        })
 
-    n_folds = len(errors)
+def _summarize_folds(
+    outcomes: list[tuple[dict[str, Any], float, tuple[float, float], float] | None],
+) -> dict[str, Any]:
+    outcomes = [o for o in outcomes if o is not None]
+    n_folds = len(outcomes)
     if n_folds == 0:
         return {
             "folds": [],
@@ -311,6 +394,11 @@ def leave_one_out_cv(
             "n_folds": 0,
         }
 
+    fold_results = [o[0] for o in outcomes]
+    errors = [o[1] for o in outcomes]
+    ci_list = [o[2] for o in outcomes]
+    true_rates = [o[3] for o in outcomes]
+
     rmse = math.sqrt(sum(e ** 2 for e in errors) / n_folds)
     mae = sum(abs(e) for e in errors) / n_folds
     coverage = coverage_probability(ci_list, true_rates)
@@ -325,21 +413,26 @@ def leave_one_out_cv(
 
 
 # ---------------------------------------------------------------------------
-# 5. Model comparison
+# 6. Model comparison
 # ---------------------------------------------------------------------------
 
 def model_comparison(
     studies: list[dict[str, Any]],
-    model_fns: dict[str, Callable[[dict[str, Any]], dict[str, Any]]],
+    model_fns: dict[str, ModelFn],
+    n_workers: int | None = 1,
 ) -> dict[str, Any]:
     """Head-to-head comparison of multiple models via LOO cross-validation.
 
-    Runs leave_one_out_cv for each model function and compiles a comparison
-    table with RMSE, MAE, and coverage.
+    Runs leave-one-out CV for each model function and compiles a comparison
+    table with RMSE, MAE, and coverage.  Every model x fold pair is an
+    independent task, so with ``n_workers`` > 1 all models are evaluated
+    concurrently.
 
     Args:
         studies: List of study dicts.
         model_fns: Dict mapping model name to model function.
+        n_workers: Worker processes for the model x fold tasks (see
+            ``run_evaluation_tasks``).
 
     Returns:
         Dict with per-model results and a ranked summary table.
@@ -347,20 +440,32 @@ def model_comparison(
     results = {}
     summary = []
 
-    for name, fn in model_fns.items():
-        try:
-            cv_result = leave_one_out_cv(studies, fn)
-            results[name] = cv_result
-            summary.append({
-                "model": name,
-                "rmse_pct": cv_result["rmse_pct"],
-                "mae_pct": cv_result["mae_pct"],
-                "coverage": cv_result["coverage"],
-                "n_folds": cv_result["n_folds"],
-            })
-        except Exception as exc:
-            results[name] = {"error": str(exc)}
-            logger.warning("Model '%s' comparison failed: %s", name, exc)
+    k = len(studies)
+    if k < 2:
+        for name in model_fns:
+            results[name] = {"error": "At least 2 studies are required for LOO-CV"}
+            logger.warning("Model '%s' comparison failed: %s", name, results[name]["error"])
+        return {"per_model": results, "summary": summary, "best_model": None}
+
+    tasks = [(studies, i, fn) for fn in model_fns.values() for i in range(k)]
+    outcomes = run_evaluation_tasks(_comparison_fold, tasks, n_workers)
+
+    for m, name in enumerate(model_fns):
+        folds = outcomes[m * k:(m + 1) * k]
+        failure = next((f for f in folds if isinstance(f, str)), None)
+        if failure is not None:
+            results[name] = {"error": failure}
+            logger.warning("Model '%s' comparison failed: %s", name, failure)
+            continue
+        cv_result = _summarize_folds(folds)
+        results[name] = cv_result
+        summary.append({
+            "model": name,
+            "rmse_pct": cv_result["rmse_pct"],
+            "mae_pct": cv_result["mae_pct"],
+            "coverage": cv_result["coverage"],
+            "n_folds": cv_result["n_folds"],
+        })
 
     # Sort by RMSE ascending
     summary.sort(key=lambda x: x.get("rmse_pct", float("inf")))
@@ -372,13 +477,25 @@ def model_comparison(
     }
 
 
+def _comparison_fold(
+    task: tuple[list[dict[str, Any]], int, ModelFn],
+) -> tuple[dict[str, Any], float, tuple[float, float], float] | str | None:
+    """``_loo_fold`` that returns the error message instead of raising, so
+    one failing model does not abort the others."""
+    try:
+        return _loo_fold(task)
+    except Exception as exc:
+        return str(exc)
+
+
 # ---------------------------------------------------------------------------
-# 6. Sequential prediction test
+# 7. Sequential prediction test
 # ---------------------------------------------------------------------------
 
 def sequential_prediction_test(
     timeline: list[dict[str, Any]],
-    model_fn: Callable[[dict[str, Any]], dict[str, Any]],
+    model_fn: ModelFn,
+    update_fn: UpdateFn | None = None,
 ) -> dict[str, Any]:
     """Predict each timepoint from all preceding timepoints.
 
@@ -386,10 +503,17 @@ def sequential_prediction_test(
     the rate at timepoint t.  Measures how well the model tracks the
     evolving data.
 
+    For conjugate models the fit at t is the fit at t-1 updated with
+    timepoint t-1, which gives the same posterior without refitting on the
+    whole history.  If an update fails, the step is refitted from scratch.
+
     Args:
         timeline: Ordered list of study dicts, each with 'events' and 'n'.
             These are assumed to be incremental (non-cumulative).
         model_fn: Model function to test.
+        update_fn: Incremental update ``(previous_result, new_data) ->
+            result``.  Defaults to the registry ``update_fn`` when
+            ``model_fn`` is a registered conjugate model.
 
     Returns:
         Dict with per-step predictions, cumulative error, and trend.
@@ -399,33 +523,32 @@ def sequential_prediction_test(
             "At least 2 timepoints are required for sequential prediction"
         )
 
+    if update_fn is None:
+        update_fn = next(
+            (m.update_fn for m in MODEL_REGISTRY.values() if m.compute_fn is model_fn),
+            None,
+        )
+
     steps = []
     errors = []
+    previous = None
 
     for t in range(1, len(timeline)):
         history = timeline[:t]
         current = timeline[t]
+        true_rate_pct = _observed_rate_pct(current)
 
-        true_rate_pct = (
-            (current["events"] / current["n"]) * 100.0
-            if current["n"] > 0
-            else 0.0
-        )
-
-        # Try multi-study format
-        try:
-            data = {"studies": history}
-            result = model_fn(data)
-        except (ValueError, KeyError, TypeError):
-            # Fall back to pooled
-            pooled_events = sum(s["events"] for s in history)
-            pooled_n = sum(s["n"] for s in history)
-            data = {"events": pooled_events, "n": pooled_n}
+        result = None
+        if update_fn is not None and previous is not None:
             try:
-                result = model_fn(data)
+                result = update_fn(previous, history[-1])
             except Exception as exc:
-                logger.warning("Sequential step %d failed: %s", t, exc)
-                continue
+                logger.debug("Sequential step %d update failed, refitting: %s", t, exc)
+        if result is None:
+            result = _fit_history(model_fn, history, f"Sequential step {t}")
+        previous = result
+        if result is None:
+            continue
 
         pred_rate_pct = result["estimate_pct"]
         error = pred_rate_pct - true_rate_pct
@@ -0,0 +1,369 @@
+"""
+Precomputed Bayesian stopping-boundary tables.
+
+A boundary table gives, for every sample size n = 1..max_n, the largest
+number of events k for which the Beta-Binomial posterior probability that
+the true AE rate exceeds ``target_rate`` stays below
+``posterior_threshold`` (see ``compute_stopping_boundaries`` in
+:mod:`src.models.bayesian_risk`).
+
+``P(rate > target | k, n)`` increases with k, so the boundary for each n is
+found by bisection over k.  All sample sizes are bisected together, one
+vectorized Beta survival-function call per step, which takes
+``O(max_n log max_n)`` evaluations instead of the ``O(max_n**2)`` of a
+per-n linear scan and makes tables with thousands of patients cheap.
+
+:class:`BoundaryTableService` memoizes tables by
+``(target_rate, posterior_threshold, prior_alpha, prior_beta)`` and keeps
+the longest table computed for each key, so any shorter ``max_n`` is a
+slice.  Given a cache directory, tables are also written there as ``.npz``
+files and shared across restarts and worker processes.  The shared service
+behind :func:`get_boundary_table` only persists tables when the
+``SAFETY_STOPPING_CACHE_DIR`` environment variable names a directory.
+Cached files are keyed by ``_ALGORITHM_VERSION`` as well, so a change to
+the computation never serves stale tables.  Disk failures are logged and
+degrade to recomputation.
+
+Usage::
+
+    table = get_boundary_table(target_rate=0.05, posterior_threshold=0.8, max_n=2000)
+    table.at(100)                 # max tolerable events at n = 100
+    table.changes()               # compact [{"n_patients", "max_events"}, ...]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    from scipy.stats import beta as beta_dist
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MEMORY_ENTRIES = 256
+
+# Bump whenever compute_boundary_table can return different tables
+_ALGORITHM_VERSION = 1
+
+# Disk persistence for the shared service is opt-in
+_CACHE_DIR = os.environ.get("SAFETY_STOPPING_CACHE_DIR") or None
+
+
+# ---------------------------------------------------------------------------
+# Boundary tables
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class BoundaryTable:
+    """Stopping boundaries for one parameter set.
+
+    Attributes:
+        target_rate: Maximum tolerable AE rate (proportion, 0-1).
+        posterior_threshold: Posterior probability above which to stop.
+        prior_alpha: Beta prior alpha parameter.
+        prior_beta: Beta prior beta parameter.
+        max_events: Integer array; element ``n - 1`` is the largest k
+            allowed at sample size n, or -1 if even zero events would
+            cross the threshold.
+    """
+
+    target_rate: float
+    posterior_threshold: float
+    prior_alpha: float
+    prior_beta: float
+    max_events: np.ndarray
+
+    @property
+    def max_n(self) -> int:
+        """Largest sample size in the table."""
+        return len(self.max_events)
+
+    def at(self, n: int) -> int:
+        """Maximum tolerable events at sample size ``n`` (floored at 0).
+
+        Raises:
+            ValueError: If ``n`` is outside ``1..max_n``.
+        """
+        if not 1 <= n <= self.max_n:
+            raise ValueError(f"n must be in [1, {self.max_n}], got {n}")
+        return max(int(self.max_events[n - 1]), 0)
+
+    def truncated(self, max_n: int) -> BoundaryTable:
+        """The same table restricted to sample sizes ``1..max_n``."""
+        if max_n >= self.max_n:
+            return self
+        return BoundaryTable(
+            self.target_rate, self.posterior_threshold,
+            self.prior_alpha, self.prior_beta, self.max_events[:max_n],
+        )
+
+    def changes(self) -> list[dict]:
+        """Sample sizes where the boundary changes.
+
+        Same format as ``compute_stopping_boundaries``: dicts with
+        ``n_patients`` and ``max_events`` (floored at 0), starting at n = 1.
+        """
+        k = self.max_events
+        if len(k) == 0:
+            return []
+        idx = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+        return [
+            {"n_patients": int(i) + 1, "max_events": max(int(k[i]), 0)}
+            for i in idx
+        ]
+
+
+def compute_boundary_table(
+    target_rate: float,
+    posterior_threshold: float = 0.8,
+    max_n: int = 100,
+    prior_alpha: float = 0.5,
+    prior_beta: float = 0.5,
+) -> BoundaryTable:
+    """Compute a boundary table for n = 1..max_n (uncached).
+
+    Args:
+        target_rate: Maximum tolerable AE rate (as a proportion, 0-1).
+        posterior_threshold: Posterior probability threshold above which to
+            stop.
+        max_n: Maximum sample size.
+        prior_alpha: Beta prior alpha parameter.
+        prior_beta: Beta prior beta parameter.
+
+    Returns:
+        BoundaryTable covering sample sizes 1..max_n.
+
+    Raises:
+        RuntimeError: If scipy is not installed.
+        ValueError: If a parameter is out of range.
+    """
+    if not _HAS_SCIPY:
+        raise RuntimeError("scipy is required for compute_boundary_table")
+    _validate(target_rate, posterior_threshold, max_n, prior_alpha, prior_beta)
+
+    n = np.arange(1, max_n + 1)
+    # Invariant: sf(lo) < threshold (k = -1 counts as allowed) and
+    # sf(hi) >= threshold (k = n + 1 is out of range)
+    lo = np.full(max_n, -1)
+    hi = n + 1
+    active = np.flatnonzero(hi - lo > 1)
+    while active.size:
+        mid = (lo[active] + hi[active]) // 2
+        prob_exceeds = beta_dist.sf(
+            target_rate,
+            prior_alpha + mid,
+            prior_beta + (n[active] - mid),
+        )
+        below = prob_exceeds < posterior_threshold
+        lo[active[below]] = mid[below]
+        hi[active[~below]] = mid[~below]
+        active = active[hi[active] - lo[active] > 1]
+
+    return BoundaryTable(
+        float(target_rate), float(posterior_threshold),
+        float(prior_alpha), float(prior_beta), lo,
+    )
+
+
+def _validate(
+    target_rate: float,
+    posterior_threshold: float,
+    max_n: int,
+    prior_alpha: float,
+    prior_beta: float,
+) -> None:
+    if not (0 < target_rate < 1):
+        raise ValueError(f"target_rate must be in (0, 1), got {target_rate}")
+    if not (0 < posterior_threshold < 1):
+        raise ValueError(
+            f"posterior_threshold must be in (0, 1), got {posterior_threshold}"
+        )
+    if max_n < 1:
+        raise ValueError(f"max_n must be >= 1, got {max_n}")
+    if prior_alpha <= 0 or prior_beta <= 0:
+        raise ValueError(
+            f"prior parameters must be positive, got ({prior_alpha}, {prior_beta})"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Cached service
+# ---------------------------------------------------------------------------
+
+class BoundaryTableService:
+    """Memory + disk cache of boundary tables.
+
+    Usage::
+
+        service = BoundaryTableService("/var/cache/safety/stopping")
+        table = service.get(0.05, 0.8, max_n=500)
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_memory_entries: int = _DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        """Create a service.
+
+        Args:
+            cache_dir: Directory for persisted tables; None keeps tables in
+                memory only.  Created on first write.
+            max_memory_entries: Parameter sets held in memory before the
+                least recently used is dropped.
+        """
+        if max_memory_entries < 1:
+            raise ValueError("max_memory_entries must be >= 1")
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._max_memory_entries = max_memory_entries
+        self._tables: OrderedDict[tuple[float, ...], BoundaryTable] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._computed = 0
+        self._errors = 0
+
+    def get(
+        self,
+        target_rate: float,
+        posterior_threshold: float = 0.8,
+        max_n: int = 100,
+        prior_alpha: float = 0.5,
+        prior_beta: float = 0.5,
+    ) -> BoundaryTable:
+        """Boundary table for n = 1..max_n, from cache when possible.
+
+        Arguments are as for :func:`compute_boundary_table`.
+        """
+        _validate(target_rate, posterior_threshold, max_n, prior_alpha, prior_beta)
+        key = (
+            float(target_rate), float(posterior_threshold),
+            float(prior_alpha), float(prior_beta),
+        )
+
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None and table.max_n >= max_n:
+                self._tables.move_to_end(key)
+                self._memory_hits += 1
+                return table.truncated(max_n)
+
+        table = self._load(key)
+        from_disk = table is not None and table.max_n >= max_n
+        if not from_disk:
+            table = compute_boundary_table(target_rate, posterior_threshold, max_n,
+                                           prior_alpha, prior_beta)
+            self._store(key, table)
+
+        with self._lock:
+            if from_disk:
+                self._disk_hits += 1
+            else:
+                self._computed += 1
+            current = self._tables.get(key)
+            if current is None or current.max_n < table.max_n:
+                self._tables[key] = table
+            self._tables.move_to_end(key)
+            while len(self._tables) > self._max_memory_entries:
+                self._tables.popitem(last=False)
+        return table.truncated(max_n)
+
+    def clear(self) -> None:
+        """Drop in-memory tables (files on disk are kept)."""
+        with self._lock:
+            self._tables.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-process cache counters."""
+        with self._lock:
+            return {
+                "cache_dir": str(self._cache_dir) if self._cache_dir else None,
+                "memory_entries": len(self._tables),
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "computed": self._computed,
+                "errors": self._errors,
+            }
+
+    # ------------------------------------------------------------------
+    # Disk persistence
+    # ------------------------------------------------------------------
+
+    def _path(self, key: tuple[float, ...]) -> Path:
+        digest = hashlib.sha256(
+            json.dumps([_ALGORITHM_VERSION, *(repr(v) for v in key)]).encode()
+        ).hexdigest()
+        return self._cache_dir / f"{digest[:32]}.npz"
+
+    def _load(self, key: tuple[float, ...]) -> BoundaryTable | None:
+        if self._cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                if (int(data["version"]) != _ALGORITHM_VERSION
+                        or tuple(data["params"].tolist()) != key):
+                    return None
+                return BoundaryTable(*key, data["max_events"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError):
+            self._record_error("load", path)
+            return None
+
+    def _store(self, key: tuple[float, ...], table: BoundaryTable) -> None:
+        if self._cache_dir is None:
+            return
+        path = self._path(key)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npz")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            np.savez(tmp, version=_ALGORITHM_VERSION, params=np.array(key),
+                     max_events=table.max_events)
+            os.replace(tmp, path)
+        except OSError:
+            self._record_error("store", path)
+            with contextlib.suppress(OSError):
+                tmp.unlink(missing_ok=True)
+
+    def _record_error(self, operation: str, path: Path) -> None:
+        with self._lock:
+            self._errors += 1
+        logger.warning(
+            "Stopping boundary cache %s failed (%s)", operation, path, exc_info=True,
+        )
+
+
+_service = BoundaryTableService(_CACHE_DIR)
+
+
+def get_boundary_table(
+    target_rate: float,
+    posterior_threshold: float = 0.8,
+    max_n: int = 100,
+    prior_alpha: float = 0.5,
+    prior_beta: float = 0.5,
+) -> BoundaryTable:
+    """Boundary table from the shared, disk-backed service."""
+    return _service.get(target_rate, posterior_threshold, max_n, prior_alpha, prior_beta)
+
+
+def boundary_cache_stats() -> dict[str, Any]:
+    """Counters for the shared boundary-table service."""
+    return _service.stats()
@@ -305,6 +305,19 @@ class TestStoppingRules:
         for rule in data["rules"]:
             assert 0.0 < rule["posterior_threshold"] < 1.0
 
+    def test_stopping_rules_custom_sample_sizes(self, client):
+        data = client.get("/api/v1/cdp/stopping-rules?sample_sizes=2000,50,500").json()
+        for rule in data["rules"]:
+            ns = [b["n_patients"] for b in rule["boundaries"]]
+            assert ns == [50, 500, 2000]
+            events = [b["max_events"] for b in rule["boundaries"]]
+            assert events == sorted(events)
+
+    @pytest.mark.parametrize("sizes", ["0,10", "abc", "20000"])
+    def test_stopping_rules_invalid_sample_sizes(self, client, sizes):
+        response = client.get(f"/api/v1/cdp/stopping-rules?sample_sizes={sizes}")
+        assert response.status_code == 400
+
 
 # ===========================================================================
 # GET /api/v1/cdp/sample-size
@@ -0,0 +1,356 @@
+"""
+Integration tests for the pooled openFDA client in src/models/faers_signal.py.
+
+Uses ``httpx.MockTransport`` in place of the network to check rate limiting,
+bounded concurrency, request coalescing, the concurrent FAERS signal
+fan-out, and the persistent query cache in front of the client.
+"""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import src.models.faers_signal as faers
+from src.models.faers_query_cache import FAERSQueryCache
+from src.models.faers_signal import (
+    OPENFDA_BASE,
+    OpenFDAClient,
+    TokenBucket,
+    get_faers_signals,
+    get_faers_summary,
+)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _total(n: int) -> dict:
+    return {"meta": {"results": {"total": n}}, "results": [{"term": "X", "count": n}]}
+
+
+class _FakeOpenFDA:
+    """Async MockTransport handler that records calls and concurrency."""
+
+    def __init__(self, delay: float = 0.0, status_code: int = 200):
+        self.delay = delay
+        self.status_code = status_code
+        self.calls: list[dict[str, str]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        self.calls.append(params)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, text="unavailable")
+        return httpx.Response(200, json=_total(100 + len(params.get("search", ""))))
+
+
+def _client(handler: _FakeOpenFDA, max_concurrency: int = 4) -> OpenFDAClient:
+    return OpenFDAClient(
+        max_concurrency=max_concurrency,
+        rate_limiter=TokenBucket(rate=10_000, window_seconds=1.0),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+@pytest.fixture(autouse=True)
+def query_cache(monkeypatch, tmp_path):
+    cache = FAERSQueryCache(tmp_path / "faers.sqlite3", touch_interval_seconds=0.0)
+    monkeypatch.setattr(faers, "_cache", cache)
+    yield cache
+    cache.close()
+
+
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestTokenBucket:
+
+    def test_burst_then_spaced(self):
+        bucket = TokenBucket(rate=4, window_seconds=1.0, capacity=4)
+        delays = [bucket.reserve() for _ in range(6)]
+
+        assert delays[:4] == [0.0, 0.0, 0.0, 0.0]
+        assert delays[4] == pytest.approx(0.25, abs=0.02)
+        assert delays[5] == pytest.approx(0.5, abs=0.02)
+
+    def test_default_spaces_evenly(self):
+        bucket = TokenBucket(rate=40, window_seconds=60.0)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.5, abs=0.02)
+
+    def test_default_never_exceeds_rate_in_any_window(self, monkeypatch):
+        monkeypatch.setattr(faers.time, "monotonic", lambda: 1000.0)
+        bucket = TokenBucket()
+        starts = [1000.0 + bucket.reserve() for _ in range(200)]
+
+        for start in starts:
+            in_window = [s for s in starts if start <= s < start + 60.0]
+            assert len(in_window) <= 40
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(window_seconds=0.0)
+        with pytest.raises(ValueError):
+            TokenBucket(capacity=0)
+
+
+# ---------------------------------------------------------------------------
+# OpenFDAClient
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestOpenFDAClient:
+
+    def test_identical_concurrent_requests_are_coalesced(self):
+        handler = _FakeOpenFDA(delay=0.05)
+        client = _client(handler)
+        params = {"search": 'patient.reaction.reactionmeddrapt:"X"', "limit": "1"}
+
+        async def main():
+            async with client:
+                return await asyncio.gather(
+                    *(client.get_json(OPENFDA_BASE, dict(params)) for _ in range(5))
+                )
+
+        results = _run(main())
+
+        assert len(handler.calls) == 1
+        assert client.requests_sent == 1
+        assert client.requests_coalesced == 4
+        assert all(r == results[0] for r in results)
+
+    def test_cancelling_first_caller_keeps_coalesced_request(self):
+        handler = _FakeOpenFDA(delay=0.05)
+        client = _client(handler)
+        params = {"search": "q", "limit": "1"}
+
+        async def main():
+            async with client:
+                first = asyncio.ensure_future(client.get_json(OPENFDA_BASE, dict(params)))
+                await asyncio.sleep(0)
+                second = asyncio.ensure_future(client.get_json(OPENFDA_BASE, dict(params)))
+                await asyncio.sleep(0.01)
+                first.cancel()
+                return first, await second
+
+        first, result = _run(main())
+
+        assert first.cancelled()
+        assert result == _total(101)
+        assert len(handler.calls) == 1
+        assert client.requests_coalesced == 1
+
+    def test_concurrency_is_bounded(self):
+        handler = _FakeOpenFDA(delay=0.02)
+        client = _client(handler, max_concurrency=3)
+
+        async def main():
+            async with client:
+                await asyncio.gather(*(
+                    client.get_json(OPENFDA_BASE, {"search": f"q{i}"}) for i in range(12)
+                ))
+
+        _run(main())
+
+        assert len(handler.calls) == 12
+        assert handler.peak == 3
+
+    def test_rate_limit_spaces_requests(self):
+        handler = _FakeOpenFDA()
+        client = OpenFDAClient(
+            rate_limiter=TokenBucket(rate=2, window_seconds=0.2, capacity=2),
+            transport=httpx.MockTransport(handler),
+        )
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            async with client:
+                await asyncio.gather(*(
+                    client.get_json(OPENFDA_BASE, {"search": f"q{i}"}) for i in range(4)
+                ))
+            return loop.time() - start
+
+        # 2 immediate, then one every 0.1s
+        assert _run(main()) >= 0.18
+
+    def test_error_status_returns_empty_dict(self):
+        client = _client(_FakeOpenFDA(status_code=503))
+
+        async def main():
+            async with client:
+                return await client.get_json(OPENFDA_BASE, {"search": "q"})
+
+        assert _run(main()) == {}
+
+    def test_reusable_across_event_loops(self):
+        handler = _FakeOpenFDA()
+        client = _client(handler)
+
+        async def fetch(query):
+            return await client.get_json(OPENFDA_BASE, {"search": query})
+
+        assert _run(fetch("first"))
+        assert _run(fetch("second"))
+        assert len(handler.calls) == 2
+
+
+# ---------------------------------------------------------------------------
+# FAERS fan-out
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestFAERSFanOut:
+
+    def test_signals_fetched_concurrently(self):
+        handler = _FakeOpenFDA(delay=0.01)
+        client = _client(handler, max_concurrency=4)
+
+        async def main():
+            async with client:
+                return await get_faers_signals(["KYMRIAH", "YESCARTA"], client=client)
+
+        summary = _run(main())
+
+        assert summary.products_queried == ["KYMRIAH", "YESCARTA"]
+        assert summary.total_reports > 0
+        assert {s.product for s in summary.signals} == {"KYMRIAH", "YESCARTA"}
+        assert handler.peak > 1
+        # AE totals are shared across products and fetched once each
+        ae_total_calls = [
+            c for c in handler.calls
+            if c.get("search", "").startswith("patient.reaction.")
+            and "NAUSEA" not in c["search"]
+        ]
+        assert len(ae_total_calls) == len(faers.TARGET_AES)
+
+    def test_summary_preserves_product_fields(self):
+        handler = _FakeOpenFDA()
+        client = _client(handler)
+
+        async def main():
+            async with client:
+                return await get_faers_summary(client=client)
+
+        summary = _run(main())
+
+        assert len(summary["products"]) == len(faers.CAR_T_PRODUCTS)
+        assert summary["total_reports"] == sum(
+            p["total_reports"] for p in summary["products"]
+        )
+        assert all(p["top_adverse_events"] for p in summary["products"])
+
+
+# ---------------------------------------------------------------------------
+# Persistent query cache
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestQueryCache:
+
+    def test_second_run_served_from_cache(self, query_cache):
+        handler = _FakeOpenFDA()
+
+        async def main():
+            async with _client(handler) as client:
+                return await get_faers_signals(["KYMRIAH"], client=client)
+
+        first = _run(main())
+        calls = len(handler.calls)
+        second = _run(main())
+
+        assert len(handler.calls) == calls
+        assert second.signals == first.signals
+        stats = faers.faers_cache_stats()
+        assert stats["hits"] >= calls
+        assert stats["entries"] == calls
+
+    def test_cache_survives_reopen(self, query_cache, monkeypatch):
+        handler = _FakeOpenFDA()
+        params = {"search": "q"}
+
+        async def fetch():
+            async with _client(handler) as client:
+                return await faers._http_get_json(OPENFDA_BASE, params, client)
+
+        _run(fetch())
+        query_cache.close()
+        reopened = FAERSQueryCache(query_cache.path)
+        monkeypatch.setattr(faers, "_cache", reopened)
+        _run(fetch())
+        reopened.close()
+
+        assert len(handler.calls) == 1
+
+    def test_cache_accessed_off_event_loop(self, query_cache, monkeypatch):
+        threads = []
+        for name in ("lookup", "set"):
+            method = getattr(query_cache, name)
+
+            def spy(*args, _method=method, _name=name):
+                threads.append((_name, threading.get_ident()))
+                return _method(*args)
+
+            monkeypatch.setattr(query_cache, name, spy)
+
+        async def fetch():
+            async with _client(_FakeOpenFDA()) as client:
+                await faers._http_get_json(OPENFDA_BASE, {"search": "q"}, client)
+            return threading.get_ident()
+
+        loop_thread = _run(fetch())
+
+        assert [name for name, _ in threads] == ["lookup", "set"]
+        assert all(ident != loop_thread for _, ident in threads)
+
+    def test_errors_are_not_cached(self, query_cache):
+        handler = _FakeOpenFDA(status_code=500)
+
+        async def fetch():
+            async with _client(handler) as client:
+                return await faers._http_get_json(OPENFDA_BASE, {"search": "q"}, client)
+
+        assert _run(fetch()) == {}
+        assert _run(fetch()) == {}
+        assert len(handler.calls) == 2
+
+    def test_stale_entry_served_and_revalidated(self, monkeypatch, tmp_path):
+        now = [1_000.0]
+        cache = FAERSQueryCache(
+            tmp_path / "swr.sqlite3", ttl_seconds=10.0, stale_seconds=100.0,
+            clock=lambda: now[0],
+        )
+        monkeypatch.setattr(faers, "_cache", cache)
+        params = {"search": "q"}
+        key = faers._query_key(OPENFDA_BASE, params)
+        cache.set(key, {"old": True})
+        now[0] += 50.0  # past the TTL, inside the stale window
+        handler = _FakeOpenFDA()
+
+        async def main():
+            async with _client(handler) as client:
+                value = await faers._http_get_json(OPENFDA_BASE, params, client)
+                await asyncio.gather(*faers._revalidating.values())
+                return value
+
+        assert _run(main()) == {"old": True}
+        assert len(handler.calls) == 1
+        entry = cache.lookup(key)
+        assert entry.fresh
+        assert "meta" in entry.value
+        cache.close()
@@ -12,6 +12,11 @@ from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 
 from src.api.app import app
+from src.models.faers_offline import (
+    SCREEN_PATH_ENV,
+    FAERSScreen,
+    compute_disproportionality,
+)
 from src.models.faers_signal import FAERSSummary, FAERSSignal
 
 
@@ -183,6 +188,38 @@ class TestBayesianPosterior:
         assert response.status_code == 200
 
 
+@pytest.mark.integration
+class TestBayesianPosteriorBatch:
+    """Tests for the batched Bayesian posterior endpoint."""
+
+    QUERIES = [
+        {"adverse_event": "CRS", "n_events": 1, "n_patients": 47},
+        {"adverse_event": "icans", "n_events": 0, "n_patients": 20},
+        {"adverse_event": "ICAHS", "n_events": 3, "n_patients": 100},
+    ]
+
+    def test_matches_single_endpoint(self, client):
+        batch = client.post(
+            "/api/v1/population/bayesian/batch", json={"queries": self.QUERIES},
+        )
+        assert batch.status_code == 200
+        estimates = batch.json()["estimates"]
+        assert len(estimates) == len(self.QUERIES)
+        for query, estimate in zip(self.QUERIES, estimates):
+            single = client.post("/api/v1/population/bayesian", json=query).json()
+            assert estimate == single["estimate"]
+
+    def test_empty_batch_rejected(self, client):
+        response = client.post("/api/v1/population/bayesian/batch", json={"queries": []})
+        assert response.status_code == 422
+
+    def test_invalid_query_rejected(self, client):
+        response = client.post("/api/v1/population/bayesian/batch", json={"queries": [
+            {"adverse_event": "CRS", "n_events": 5, "n_patients": 2},
+        ]})
+        assert response.status_code == 422
+
+
 # ===========================================================================
 # POST /api/v1/population/mitigations
 # ===========================================================================
@@ -257,6 +294,55 @@ class TestMitigationAnalysis:
         assert "timestamp" in data
 
 
+# ===========================================================================
+# POST /api/v1/population/mitigations/optimize
+# ===========================================================================
+
+@pytest.mark.integration
+class TestMitigationOptimization:
+    """Tests for the mitigation regimen optimizer endpoint."""
+
+    def test_optimize_default_request(self, client):
+        response = client.post("/api/v1/population/mitigations/optimize", json={})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["target_aes"] == ["CRS", "ICANS"]
+        assert data["pareto_frontier"]
+        assert all(r["pareto_optimal"] for r in data["pareto_frontier"])
+        assert [r["size"] for r in data["best_by_size"]] == [1, 2, 3]
+
+    def test_frontier_has_intervals(self, client):
+        data = client.post("/api/v1/population/mitigations/optimize", json={
+            "target_aes": ["CRS"], "n_monte_carlo_samples": 1000,
+        }).json()
+        for regimen in data["pareto_frontier"]:
+            interval = regimen["intervals_pct"]["CRS"]
+            assert interval["p2_5"] <= interval["median"] <= interval["p97_5"]
+
+    def test_intervals_can_be_disabled(self, client):
+        data = client.post("/api/v1/population/mitigations/optimize", json={
+            "n_monte_carlo_samples": 0,
+        }).json()
+        assert all(not r["intervals_pct"] for r in data["pareto_frontier"])
+
+    def test_constraints_respected(self, client):
+        data = client.post("/api/v1/population/mitigations/optimize", json={
+            "max_size": 2,
+            "required_mitigations": ["anakinra"],
+            "excluded_mitigations": ["tocilizumab"],
+        }).json()
+        for regimen in data["pareto_frontier"] + data["best_by_size"]:
+            assert "anakinra" in regimen["mitigation_ids"]
+            assert "tocilizumab" not in regimen["mitigation_ids"]
+            assert regimen["size"] <= 2
+
+    def test_unknown_mitigation_returns_400(self, client):
+        response = client.post("/api/v1/population/mitigations/optimize", json={
+            "required_mitigations": ["nonexistent_drug"],
+        })
+        assert response.status_code == 400
+
+
 # ===========================================================================
 # GET /api/v1/population/evidence-accrual
 # ===========================================================================
@@ -464,6 +550,38 @@ class TestFAERSSignals:
         assert data["signals_detected"] == 1
         assert data["strong_signals"] == 1
 
+    def test_faers_reads_precomputed_screen(self, client, tmp_path, monkeypatch):
+        import pandas as pd
+
+        table = pd.DataFrame({
+            "drug": ["KYMRIAH", "KYMRIAH", "ASPIRIN"],
+            "pt": ["CYTOKINE RELEASE SYNDROME", "NAUSEA", "CYTOKINE RELEASE SYNDROME"],
+            "a": [400, 20, 600],
+            "b": [100, 480, 9_400],
+            "c": [600, 5_000, 400],
+            "d": [98_900, 94_500, 89_600],
+            "n_drug": [500, 500, 10_000],
+            "n_pt": [1_000, 5_020, 1_000],
+        })
+        screen = FAERSScreen(
+            table=compute_disproportionality(table),
+            n_reports=100_000,
+            quarters=["24Q1"],
+            built_at="2026-01-01T00:00:00+00:00",
+        )
+        monkeypatch.setenv(SCREEN_PATH_ENV, str(screen.save(tmp_path / "screen.parquet")))
+
+        with patch(
+            "src.api.population_routes.get_faers_signals", new_callable=AsyncMock,
+        ) as live:
+            data = client.get("/api/v1/signals/faers?products=KYMRIAH").json()
+
+        live.assert_not_called()
+        assert data["products_queried"] == ["KYMRIAH"]
+        assert data["total_reports"] == 500
+        assert [s["adverse_event"] for s in data["signals"]] == ["Cytokine release syndrome"]
+        assert data["signals"][0]["n_cases"] == 400
+
 
 # ===========================================================================
 # GET /api/v1/population/mitigations/strategies
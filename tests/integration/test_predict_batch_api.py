@@ -0,0 +1,145 @@
+"""
+Integration tests for the prediction endpoints' worker-pool execution path.
+
+Exercises ``/api/v1/predict`` and ``/api/v1/predict/batch`` against the real
+application (src/api/app.py) with FastAPI's TestClient, checking ordering,
+failure isolation, parallel scoring, and bulk timeline/WebSocket publishing.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.api.app as api_app
+from src.api.app import app
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def pool_size(monkeypatch):
+    """Run the test with a fresh 4-worker prediction pool."""
+    monkeypatch.setattr(api_app, "_prediction_workers", 4)
+    monkeypatch.setattr(api_app, "_prediction_executor", None)
+    return 4
+
+
+def _patient(patient_id: str, ldh: float = 450.0) -> dict:
+    return {
+        "patient_id": patient_id,
+        "labs": {"ldh": ldh, "creatinine": 1.1, "platelets": 120.0},
+    }
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+@pytest.mark.integration
+class TestBatchPredictionPool:
+
+    def test_batch_matches_single_predictions(self, client):
+        patients = [_patient(f"BATCH-EQ-{i}", ldh=200.0 + 100 * i) for i in range(5)]
+        batch = client.post("/api/v1/predict/batch", json={"patients": patients}).json()
+
+        assert batch["successful"] == 5
+        assert [p["patient_id"] for p in batch["predictions"]] == [
+            p["patient_id"] for p in patients
+        ]
+        for patient, predicted in zip(patients, batch["predictions"]):
+            single = client.post("/api/v1/predict", json=patient).json()
+            assert predicted["composite_score"] == single["composite_score"]
+            assert predicted["risk_level"] == single["risk_level"]
+
+    def test_batch_records_timeline_for_each_patient(self, client):
+        patients = [_patient(f"BATCH-TL-{i}") for i in range(3)]
+        client.post("/api/v1/predict/batch", json={"patients": patients})
+
+        for patient in patients:
+            response = client.get(f"/api/v1/patient/{patient['patient_id']}/timeline")
+            assert response.status_code == 200
+            assert len(response.json()["timeline"]) == 1
+
+    def test_failure_is_isolated_to_one_patient(self, client, monkeypatch):
+        real_run = api_app._ensemble_runner.run
+
+        def flaky_run(patient_data):
+            if patient_data.get("ldh_u_per_l") == 666.0:
+                raise RuntimeError("scorer exploded")
+            return real_run(patient_data)
+
+        monkeypatch.setattr(api_app._ensemble_runner, "run", flaky_run)
+        patients = [_patient("BATCH-OK-1"), _patient("BATCH-BAD", ldh=666.0),
+                    _patient("BATCH-OK-2")]
+        data = client.post("/api/v1/predict/batch", json={"patients": patients}).json()
+
+        assert data["successful"] == 2
+        assert data["failed"] == 1
+        assert data["errors"][0]["patient_id"] == "BATCH-BAD"
+        assert "scorer exploded" in data["errors"][0]["error"]
+        assert [p["patient_id"] for p in data["predictions"]] == ["BATCH-OK-1", "BATCH-OK-2"]
+        assert "BATCH-BAD" not in api_app._patient_timelines
+
+    def test_cancelled_patient_reported_as_failure(self, client, monkeypatch):
+        real_run_scoring = api_app._run_scoring
+
+        async def cancelling_run(request):
+            if request.patient_id == "BATCH-CANCEL":
+                raise asyncio.CancelledError()
+            return await real_run_scoring(request)
+
+        monkeypatch.setattr(api_app, "_run_scoring", cancelling_run)
+        patients = [_patient("BATCH-CANCEL"), _patient("BATCH-OK-3")]
+        data = client.post("/api/v1/predict/batch", json={"patients": patients}).json()
+
+        assert data["successful"] == 1
+        assert data["failed"] == 1
+        assert data["errors"][0]["patient_id"] == "BATCH-CANCEL"
+        assert "BATCH-CANCEL" not in api_app._patient_timelines
+
+    def test_patients_scored_in_parallel(self, client, monkeypatch, pool_size):
+        real_run = api_app._ensemble_runner.run
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_run(patient_data):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.1)
+            with lock:
+                active -= 1
+            return real_run(patient_data)
+
+        monkeypatch.setattr(api_app._ensemble_runner, "run", slow_run)
+        patients = [_patient(f"BATCH-PAR-{i}") for i in range(8)]
+
+        start = time.monotonic()
+        data = client.post("/api/v1/predict/batch", json={"patients": patients}).json()
+        elapsed = time.monotonic() - start
+
+        assert data["successful"] == 8
+        assert peak == pool_size
+        assert elapsed < 0.6  # serial scoring would take >= 0.8s
+
+    def test_websocket_notified_after_batch(self, client):
+        with client.websocket_connect("/ws/monitor/BATCH-WS") as ws:
+            ws.receive_json()  # connection acknowledgement
+            client.post("/api/v1/predict/batch", json={"patients": [_patient("BATCH-WS")]})
+            update = ws.receive_json()
+
+        assert update["type"] == "prediction_update"
+        assert update["patient_id"] == "BATCH-WS"
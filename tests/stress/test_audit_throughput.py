@@ -0,0 +1,133 @@
+"""
+Throughput benchmark for audit trail recording.
+
+Compares ``AuditTrail.record()`` throughput with the legacy hashing path
+(a single ``json.dumps`` of the full content under the lock) against the
+pluggable serializers, using payloads sized like real model calls, both
+single-threaded and with concurrent writers. Rates are reported as
+``record_property`` entries (see ``--junitxml``) rather than asserted on;
+the test itself checks that every trail recorded all events with an
+intact hash chain.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+import pytest
+
+from src.engine.integration.audit import AuditEventType, AuditRecord, AuditTrail
+
+
+_INPUT = {
+    "prompt": "p" * 2000,
+    "biomarkers": {f"marker_{i}": i * 1.5 for i in range(50)},
+    "history": [{"hour": i, "value": i * 0.1} for i in range(100)],
+}
+_OUTPUT = {
+    "risk_score": 0.42,
+    "reasoning": "r" * 1500,
+    "severity_distribution": {f"grade_{i}": 0.2 for i in range(5)},
+}
+
+
+class _LegacyAuditTrail(AuditTrail):
+    """AuditTrail with the pre-serializer hashing path, for comparison.
+
+    Stores and indexes records exactly like ``AuditTrail.record()``; only
+    the content hash differs, computed with one ``json.dumps`` under the
+    lock. The encoding matches the ``json`` serializer, so the chain still
+    verifies.
+    """
+
+    def record(self, event_type, patient_id="", session_id="", actor="",
+               input_data=None, output_data=None, parameters=None,
+               duration_ms=0, parent_record_id=None):
+        with self._lock:
+            self._record_counter += 1
+            record_id = self._record_counter
+            content = {
+                "record_id": record_id,
+                "event_type": event_type.value,
+                "patient_id": patient_id,
+                "session_id": session_id,
+                "actor": actor,
+                "input_data": input_data or {},
+                "output_data": output_data or {},
+                "parameters": parameters or {},
+                "duration_ms": duration_ms,
+                "parent_record_id": parent_record_id,
+            }
+            serialized = json.dumps(content, sort_keys=True, default=str)
+            content_hash = hashlib.sha256(serialized.encode()).hexdigest()
+            chain_input = f"{self._last_chain_hash}:{content_hash}"
+            chain_hash = hashlib.sha256(chain_input.encode()).hexdigest()
+
+            self._records.append(AuditRecord(
+                record_id=record_id,
+                event_type=event_type,
+                timestamp=time.time(),
+                patient_id=patient_id,
+                session_id=session_id,
+                actor=actor,
+                input_data=input_data or {},
+                output_data=output_data or {},
+                parameters=parameters or {},
+                duration_ms=duration_ms,
+                parent_record_id=parent_record_id,
+                content_hash=content_hash,
+                chain_hash=chain_hash,
+            ))
+            self._session_index.add(session_id, record_id)
+            self._patient_index.add(patient_id, record_id)
+            self._event_counts[event_type.value] = (
+                self._event_counts.get(event_type.value, 0) + 1
+            )
+            self._last_chain_hash = chain_hash
+        return record_id
+
+
+def _records_per_second(audit: AuditTrail, n: int, threads: int) -> float:
+    def work():
+        for _ in range(n // threads):
+            audit.record(
+                AuditEventType.MODEL_CALL,
+                patient_id="PAT-BENCH",
+                session_id="SESSION-BENCH",
+                actor="model-a",
+                input_data=_INPUT,
+                output_data=_OUTPUT,
+                parameters={"temperature": 0.1},
+            )
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return n / (time.perf_counter() - start)
+
+
+@pytest.mark.stress
+class TestAuditRecordThroughput:
+
+    @pytest.mark.parametrize("threads", [1, 4])
+    def test_record_throughput(self, threads, record_property):
+        pytest.importorskip("orjson")
+        n = 4000
+        trails = {
+            "legacy": _LegacyAuditTrail(max_records=n),
+            "json": AuditTrail(max_records=n),
+            "orjson": AuditTrail(max_records=n, serializer="orjson"),
+        }
+
+        for name, audit in trails.items():
+            rate = _records_per_second(audit, n, threads)
+            record_property(f"{name}_records_per_second", round(rate))
+
+            assert audit.record_count == n
+            assert len(audit.get_session_records("SESSION-BENCH")) == n
+            valid, message = audit.verify_chain_integrity()
+            assert valid, f"{name}: {message}"
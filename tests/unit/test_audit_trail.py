@@ -0,0 +1,507 @@
+"""
+Tests for the audit trail (src/engine/integration/audit.py) and its
+segmented on-disk storage backend (src/engine/integration/audit_storage.py).
+"""
+
+import dataclasses
+import hashlib
+import json
+import threading
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.engine.integration.audit import AuditEventType, AuditTrail
+from src.engine.integration.audit_serializers import (
+    PendingContentHash,
+    get_serializer,
+)
+from src.engine.integration.audit_storage import (
+    SegmentedAuditStorage,
+    record_from_dict,
+    record_to_dict,
+)
+
+
+def _fill(audit: AuditTrail, sessions: int, events_per_session: int = 3) -> list[str]:
+    session_ids = []
+    for i in range(sessions):
+        patient_id = f"PAT-{i % 4:03d}"
+        session_id = audit.start_session(patient_id)
+        for j in range(events_per_session):
+            audit.record(
+                event_type=AuditEventType.MODEL_CALL,
+                patient_id=patient_id,
+                session_id=session_id,
+                actor=f"model-{j}",
+                input_data={"prompt": "x" * 50, "step": j},
+            )
+        session_ids.append(session_id)
+    return session_ids
+
+
+def _assert_chain_valid(records) -> None:
+    prev = "genesis"
+    for record in records:
+        expected = hashlib.sha256(f"{prev}:{record.content_hash}".encode()).hexdigest()
+        assert record.chain_hash == expected, record.record_id
+        prev = record.chain_hash
+
+
+# ---------------------------------------------------------------------------
+# In-memory behaviour
+# ---------------------------------------------------------------------------
+
+class TestInMemoryTrail:
+
+    def test_chain_verifies_after_archiving(self):
+        audit = AuditTrail(max_records=10)
+        _fill(audit, sessions=10)
+        assert audit.record_count == 10
+        is_valid, _ = audit.verify_chain_integrity()
+        assert is_valid
+
+    def test_archived_records_are_dropped_without_storage(self):
+        audit = AuditTrail(max_records=10)
+        _fill(audit, sessions=10)
+        assert audit.get_record(1) is None
+
+
+# ---------------------------------------------------------------------------
+# Indexed queries and incremental summary
+# ---------------------------------------------------------------------------
+
+class _CountingStorage(SegmentedAuditStorage):
+    """Segmented storage that counts scans and segment reads."""
+
+    scans = 0
+
+    def __init__(self, *args, **kwargs):
+        self.segment_reads = []
+        super().__init__(*args, **kwargs)
+
+    def iter_records(self, start_id=None, end_id=None):
+        self.scans += 1
+        return super().iter_records(start_id, end_id)
+
+    def iter_matching(self, field, key, end_id=None):
+        self.scans += 1
+        return super().iter_matching(field, key, end_id)
+
+    def _read_segment(self, path, limit=None):
+        self.segment_reads.append(path.name)
+        return super()._read_segment(path, limit)
+
+
+class TestIndexedQueries:
+
+    def test_summary_matches_full_scan_after_archiving(self):
+        audit = AuditTrail(max_records=25)
+        _fill(audit, sessions=30)
+        audit.record(AuditEventType.ERROR, actor="system")
+
+        live = [audit.get_record(i) for i in range(1, 122)]
+        live = [r for r in live if r is not None]
+        assert len(live) == 25
+
+        summary = audit.summary()
+        expected_counts = {}
+        for r in live:
+            expected_counts[r.event_type.value] = expected_counts.get(r.event_type.value, 0) + 1
+        assert summary["total_records"] == 25
+        assert summary["event_counts"] == expected_counts
+        assert summary["unique_sessions"] == len({r.session_id for r in live if r.session_id})
+        assert summary["unique_patients"] == len({r.patient_id for r in live if r.patient_id})
+        assert summary["oldest_timestamp"] == live[0].timestamp
+        assert summary["newest_timestamp"] == live[-1].timestamp
+
+    def test_lookups_survive_compaction(self):
+        audit = AuditTrail(max_records=7)
+        session_ids = _fill(audit, sessions=50)
+        assert audit.get_record(200) is not None
+        assert audit.get_record(200).record_id == 200
+        assert audit.get_record(193) is None
+        assert [r.record_id for r in audit.get_session_records(session_ids[-1])] == [
+            197, 198, 199, 200,
+        ]
+        assert audit.get_session_records(session_ids[0]) == []
+
+    def test_in_memory_session_skips_storage(self, tmp_path):
+        storage = _CountingStorage(tmp_path)
+        audit = AuditTrail(max_records=10, storage=storage)
+        session_ids = _fill(audit, sessions=10)
+
+        assert len(audit.get_session_records(session_ids[-1])) == 4
+        assert storage.scans == 0
+
+        assert len(audit.get_session_records(session_ids[0])) == 4
+        assert storage.scans == 1
+
+
+# ---------------------------------------------------------------------------
+# Chain verification
+# ---------------------------------------------------------------------------
+
+def _tamper(audit: AuditTrail, record_id: int, **changes) -> None:
+    position = audit._position(record_id)
+    audit._records[position] = dataclasses.replace(audit._records[position], **changes)
+
+
+class TestChainVerification:
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_detects_content_tampering(self, max_workers):
+        audit = AuditTrail()
+        _fill(audit, sessions=10)
+        _tamper(audit, 23, input_data={"prompt": "edited"})
+        _tamper(audit, 31, actor="someone-else")
+
+        is_valid, message = audit.verify_chain_integrity(
+            max_workers=max_workers, chunk_size=4,
+        )
+        assert not is_valid
+        assert message == "Content hash mismatch at record 23"
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_detects_chain_tampering(self, max_workers):
+        audit = AuditTrail()
+        _fill(audit, sessions=10)
+        _tamper(audit, 17, chain_hash="0" * 64)
+
+        is_valid, message = audit.verify_chain_integrity(
+            max_workers=max_workers, chunk_size=4,
+        )
+        assert not is_valid
+        assert message == "Chain hash mismatch at record 17"
+
+    def test_parallel_matches_sequential(self):
+        audit = AuditTrail()
+        _fill(audit, sessions=25)
+        assert audit.verify_chain_integrity(max_workers=2, chunk_size=7) == (
+            audit.verify_chain_integrity()
+        )
+
+    def test_incremental_only_checks_new_records(self):
+        audit = AuditTrail()
+        _fill(audit, sessions=5)
+        assert audit.verify_chain_integrity(incremental=True) == (
+            True, "Audit trail integrity verified (20 records)",
+        )
+
+        _fill(audit, sessions=2)
+        _tamper(audit, 3, actor="edited-after-checkpoint")
+        assert audit.verify_chain_integrity(incremental=True) == (
+            True, "Audit trail integrity verified (8 new records)",
+        )
+        assert audit.verify_chain_integrity(incremental=True) == (
+            True, "Audit trail integrity verified (0 new records)",
+        )
+        assert not audit.verify_chain_integrity()[0]
+
+    def test_failed_verification_keeps_checkpoint(self):
+        audit = AuditTrail()
+        _fill(audit, sessions=2)
+        audit.verify_chain_integrity(incremental=True)
+        _fill(audit, sessions=1)
+        _tamper(audit, 10, actor="edited")
+
+        assert not audit.verify_chain_integrity(incremental=True)[0]
+        assert not audit.verify_chain_integrity(incremental=True)[0]
+
+    def test_includes_archived_records(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, flush_batch_size=5)
+        audit = AuditTrail(max_records=10, storage=storage)
+        _fill(audit, sessions=10)
+
+        assert audit.verify_chain_integrity(include_archived=True, chunk_size=6) == (
+            True, "Audit trail integrity verified (40 records)",
+        )
+        _fill(audit, sessions=1)
+        assert audit.verify_chain_integrity(
+            incremental=True, include_archived=True, max_workers=2, chunk_size=3,
+        ) == (True, "Audit trail integrity verified (4 new records)")
+
+    def test_detects_archived_gap(self, tmp_path):
+        audit = AuditTrail(max_records=10, storage=SegmentedAuditStorage(tmp_path))
+        _fill(audit, sessions=10)
+        audit._archived_chain_hash = "f" * 64
+
+        is_valid, message = audit.verify_chain_integrity(include_archived=True)
+        assert not is_valid
+        assert "does not join" in message
+
+
+# ---------------------------------------------------------------------------
+# Canonical serializers
+# ---------------------------------------------------------------------------
+
+_CONTENT = {
+    "event_type": "model_call",
+    "patient_id": "PAT-\u00e9",
+    "session_id": "",
+    "actor": "model-a",
+    "input_data": {"b": [1, 2.5, None], "a": {"z": True, "y": "\u2603"}},
+    "output_data": {"when": datetime(2025, 1, 15, 10, 30), "risk": 0.1 + 0.2},
+    "parameters": {},
+    "duration_ms": 12,
+    "parent_record_id": None,
+}
+
+
+class TestCanonicalSerializers:
+
+    def test_json_split_hash_matches_legacy_encoding(self):
+        pending = PendingContentHash(get_serializer("json"), _CONTENT, "record_id")
+        legacy = json.dumps({**_CONTENT, "record_id": 42}, sort_keys=True, default=str)
+        assert pending.finish(42) == hashlib.sha256(legacy.encode()).hexdigest()
+
+    def test_orjson_split_hash_matches_full_encoding(self):
+        pending = PendingContentHash(get_serializer("orjson"), _CONTENT, "record_id")
+        full = orjson.dumps(
+            {**_CONTENT, "record_id": 42}, default=str, option=orjson.OPT_SORT_KEYS,
+        )
+        assert pending.finish(42) == hashlib.sha256(full).hexdigest()
+
+    def test_default_serializer_keeps_existing_hashes(self):
+        audit = AuditTrail()
+        audit.record(AuditEventType.MODEL_CALL, actor="model-a", input_data={"x": 1})
+        record = audit.get_record(1)
+        legacy = json.dumps(AuditTrail._record_content(record), sort_keys=True, default=str)
+        assert record.content_hash == hashlib.sha256(legacy.encode()).hexdigest()
+
+    @pytest.mark.parametrize("max_workers", [None, 2])
+    def test_orjson_trail_verifies_and_detects_tampering(self, max_workers):
+        audit = AuditTrail(serializer="orjson")
+        _fill(audit, sessions=5)
+        assert audit.verify_chain_integrity(max_workers=max_workers, chunk_size=4)[0]
+
+        _tamper(audit, 6, input_data={"prompt": "edited"})
+        assert audit.verify_chain_integrity(max_workers=max_workers, chunk_size=4) == (
+            False, "Content hash mismatch at record 6",
+        )
+
+    def test_orjson_handles_oversized_integers(self):
+        audit = AuditTrail(serializer="orjson")
+        audit.record(AuditEventType.MODEL_CALL, input_data={"big": 2 ** 80})
+        assert audit.verify_chain_integrity()[0]
+
+    def test_rejects_unknown_serializer(self):
+        with pytest.raises(ValueError, match="Unknown audit serializer"):
+            AuditTrail(serializer="msgpack")
+
+
+# ---------------------------------------------------------------------------
+# Segmented storage
+# ---------------------------------------------------------------------------
+
+class TestSegmentedAuditStorage:
+
+    def test_archived_records_served_from_disk(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, flush_batch_size=8)
+        audit = AuditTrail(max_records=10, storage=storage)
+        session_ids = _fill(audit, sessions=10)
+
+        assert audit.record_count == 10
+        first = audit.get_record(1)
+        assert first is not None
+        assert first.input_data == {"action": "session_start"}
+
+        session_records = audit.get_session_records(session_ids[0])
+        assert [r.record_id for r in session_records] == [1, 2, 3, 4]
+
+        patient_calls = audit.get_patient_records(
+            "PAT-000", event_type=AuditEventType.MODEL_CALL,
+        )
+        assert len(patient_calls) == 3 * 3  # sessions 0, 4, 8
+        ids = [r.record_id for r in patient_calls]
+        assert ids == sorted(ids)
+
+    def test_buffered_records_visible_before_flush(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, flush_batch_size=1000)
+        audit = AuditTrail(max_records=2, storage=storage)
+        _fill(audit, sessions=2)
+
+        assert storage.segment_count == 0
+        assert audit.get_record(1) is not None
+        audit.flush()
+        assert storage.segment_count == 1
+        assert len(list(storage.iter_records())) == 8
+
+    def test_segments_rotate(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, segment_max_bytes=2048, flush_batch_size=4)
+        audit = AuditTrail(max_records=5, storage=storage)
+        _fill(audit, sessions=20)
+        audit.flush()
+
+        assert storage.segment_count > 1
+        records = list(storage.iter_records())
+        assert [r.record_id for r in records] == list(range(1, 81))
+        assert [r.record_id for r in storage.iter_records(30, 33)] == [30, 31, 32, 33]
+        _assert_chain_valid(records)
+
+    def test_resumes_after_restart(self, tmp_path):
+        audit = AuditTrail(max_records=5, storage=SegmentedAuditStorage(tmp_path))
+        session_ids = _fill(audit, sessions=3)
+        audit.close()
+
+        reopened = AuditTrail(max_records=5, storage=SegmentedAuditStorage(tmp_path))
+        new_session = reopened.start_session("PAT-NEW")
+        assert new_session == "SESSION-00000004"
+        assert reopened.get_session_records(new_session)[0].record_id == 13
+        assert len(reopened.get_session_records(session_ids[0])) == 4
+
+        is_valid, _ = reopened.verify_chain_integrity()
+        assert is_valid
+        reopened.flush()
+        _assert_chain_valid(SegmentedAuditStorage(tmp_path).iter_records())
+
+    def test_session_counter_resumes_past_older_segments(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, segment_max_bytes=2048, flush_batch_size=4)
+        audit = AuditTrail(max_records=5, storage=storage)
+        _fill(audit, sessions=5)
+        # Enough session-less records that the newest segment has no sessions
+        for _ in range(40):
+            audit.record(AuditEventType.MODEL_CALL, input_data={"prompt": "y" * 50})
+        audit.close()
+        assert not any(r.session_id for r in storage.recent_records())
+
+        reopened = AuditTrail(max_records=5, storage=SegmentedAuditStorage(tmp_path))
+        assert reopened.start_session() == "SESSION-00000006"
+
+    def test_iteration_not_duplicated_by_concurrent_flush(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, segment_max_bytes=32768, flush_batch_size=1000)
+        audit = AuditTrail(max_records=5, storage=storage)
+        _fill(audit, sessions=20)
+        audit.flush()
+        _fill(audit, sessions=2)  # buffered; fits in the active segment
+        assert storage.segment_count == 2
+
+        records = storage.iter_records()
+        first = next(records)
+        storage.flush()
+        ids = [first.record_id] + [r.record_id for r in records]
+        assert ids == list(range(1, 89))
+
+    def test_prepared_frame_round_trips(self, tmp_path):
+        audit = AuditTrail()
+        audit.record(
+            AuditEventType.MODEL_RESPONSE,
+            patient_id="PAT-\u00e9",
+            session_id="SESSION-00000001",
+            actor="model-a",
+            output_data={"risk": 0.1 + 0.2, "notes": ["a", None]},
+            duration_ms=7,
+        )
+        record = audit.get_record(1)
+        fields = record_to_dict(record)
+        for key in ("record_id", "timestamp", "content_hash", "chain_hash"):
+            del fields[key]
+
+        storage = SegmentedAuditStorage(tmp_path)
+        assert not storage.append(record, storage.prepare(fields))
+        storage.flush()
+        assert list(SegmentedAuditStorage(tmp_path).iter_records()) == [record]
+
+    def test_flush_runs_outside_trail_lock(self, tmp_path):
+        class _BlockingStorage(SegmentedAuditStorage):
+            writing = threading.Event()
+            release = threading.Event()
+
+            def _write(self, records, frames):
+                self.writing.set()
+                assert self.release.wait(5)
+                super()._write(records, frames)
+
+        storage = _BlockingStorage(tmp_path, flush_batch_size=4)
+        audit = AuditTrail(storage=storage)
+        writer = threading.Thread(target=_fill, args=(audit, 1))
+        writer.start()
+        assert storage.writing.wait(5)
+
+        # The trail accepts records and storage serves the batch being written
+        audit.record(AuditEventType.ERROR, actor="system")
+        assert [r.record_id for r in storage.iter_records()] == [1, 2, 3, 4, 5]
+
+        storage.release.set()
+        writer.join(5)
+        audit.close()
+        reopened = SegmentedAuditStorage(tmp_path)
+        assert [r.record_id for r in reopened.iter_records()] == [1, 2, 3, 4, 5]
+
+    def test_key_lookups_read_only_matching_segments(self, tmp_path):
+        storage = _CountingStorage(tmp_path, segment_max_bytes=2048, flush_batch_size=4)
+        audit = AuditTrail(max_records=5, storage=storage)
+        session_ids = _fill(audit, sessions=20)
+        audit.flush()
+        assert storage.segment_count > 3
+        assert len(list(tmp_path.glob("segment-*.keys"))) == storage.segment_count - 1
+
+        storage.segment_reads.clear()
+        assert [r.record_id for r in audit.get_session_records(session_ids[0])] == [1, 2, 3, 4]
+        assert storage.segment_reads == ["segment-000000000001.log"]
+
+        calls = audit.get_patient_records("PAT-001", event_type=AuditEventType.MODEL_CALL)
+        assert len(calls) == 5 * 3  # sessions 1, 5, 9, 13, 17
+        with pytest.raises(ValueError, match="actor"):
+            storage.iter_matching("actor", "model-0")
+
+    def test_recovery_reads_sidecars_not_segments(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, segment_max_bytes=2048, flush_batch_size=4)
+        audit = AuditTrail(max_records=5, storage=storage)
+        session_ids = _fill(audit, sessions=20)
+        audit.close()
+
+        reopened = _CountingStorage(tmp_path)
+        last_segment = sorted(tmp_path.glob("segment-*.log"))[-1].name
+        resumed = AuditTrail(max_records=5, storage=reopened)
+        assert set(reopened.segment_reads) == {last_segment}
+        assert resumed.start_session() == "SESSION-00000021"
+        assert len(resumed.get_session_records(session_ids[0])) == 4
+
+    def test_missing_sidecars_are_rebuilt(self, tmp_path):
+        storage = SegmentedAuditStorage(tmp_path, segment_max_bytes=2048, flush_batch_size=4)
+        audit = AuditTrail(max_records=5, storage=storage)
+        session_ids = _fill(audit, sessions=20)
+        audit.close()
+        sidecars = sorted(tmp_path.glob("segment-*.keys"))
+        assert sidecars
+        expected = [path.read_bytes() for path in sidecars]
+        for path in sidecars:
+            path.unlink()
+
+        resumed = AuditTrail(max_records=5, storage=SegmentedAuditStorage(tmp_path))
+        assert [path.read_bytes() for path in sidecars] == expected
+        assert resumed.start_session() == "SESSION-00000021"
+        assert len(resumed.get_session_records(session_ids[3])) == 4
+
+    def test_torn_tail_is_truncated(self, tmp_path):
+        audit = AuditTrail(storage=SegmentedAuditStorage(tmp_path))
+        _fill(audit, sessions=2)
+        audit.close()
+
+        segment = next(tmp_path.glob("segment-*.log"))
+        with open(segment, "ab") as fh:
+            fh.write(b"\x00\x00\x01\x00{\"record_id\": 9")
+
+        storage = SegmentedAuditStorage(tmp_path)
+        assert [r.record_id for r in storage.iter_records()] == list(range(1, 9))
+        resumed = AuditTrail(storage=storage)
+        assert resumed.record(AuditEventType.ERROR) == 9
+
+    def test_record_dict_round_trip(self, tmp_path):
+        audit = AuditTrail()
+        audit.record(
+            AuditEventType.ALERT_GENERATED,
+            patient_id="PAT-1",
+            output_data={"level": "high"},
+            parent_record_id=None,
+        )
+        record = audit.get_record(1)
+        assert record_from_dict(record_to_dict(record)) == record
+
+    def test_rejects_invalid_configuration(self, tmp_path):
+        with pytest.raises(ValueError, match="flush_batch_size"):
+            SegmentedAuditStorage(tmp_path, flush_batch_size=0)
+        with pytest.raises(ValueError, match="segment_max_bytes"):
+            SegmentedAuditStorage(tmp_path, segment_max_bytes=0)
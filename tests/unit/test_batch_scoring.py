@@ -0,0 +1,193 @@
+"""
+Tests for vectorized batch scoring (src/models/batch_scoring.py).
+
+The central property is equivalence: for every row, ``run_batch`` must
+reproduce the score, risk level, confidence, and run/skipped/failed status
+that ``BiomarkerEnsembleRunner.run`` produces for the same row as a dict.
+"""
+
+import math
+import random
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from src.models.batch_scoring import STATUS_FAILED, STATUS_RUN, STATUS_SKIPPED
+from src.models.ensemble_runner import BiomarkerEnsembleRunner
+
+
+# Per-field generators: mostly valid values, with missing, boundary,
+# out-of-range, and non-numeric values mixed in.
+_FIELDS = {
+    "ldh_u_per_l": [120.0, 450.0, 980.0, 0.0, -5.0, 60_000.0, "abc"],
+    "creatinine_mg_dl": [0.6, 1.2, 3.5, 0.0],
+    "platelets_per_nl": [0.0, 15.0, 49.9, 50.0, 100.0, 220.0],
+    "crp_mg_dl": [0.2, 4.0, 12.0, 600.0],
+    "crp_mg_l": [2.0, 10.0, 50.0, 80.0],
+    "temperature_c": [36.8, 38.4, 38.9, 39.4, 39.5, 29.0, "hot"],
+    "temperature_f": [98.6, 102.5, 80.0],
+    "organomegaly": ["none", "hepatomegaly", "both", "BOTH ", "enlarged"],
+    "cytopenias_lineages": [1, 2, 3, 4, -1, "two"],
+    "ferritin_ng_ml": [300.0, 800.0, 1500.0, 2000.0, 6000.0, 9000.0],
+    "triglycerides_mmol_l": [1.0, 1.5, 4.0, 5.0],
+    "fibrinogen_g_l": [1.5, 2.5, 3.5],
+    "ast_u_per_l": [20.0, 30.0, 200.0],
+    "hemophagocytosis_on_bm": [True, False, "yes", "maybe"],
+    "known_immunosuppression": [True, False, "no"],
+    "anc_10e9_per_l": [0.3, 0.5, 1.0, 2.5],
+    "hemoglobin_g_dl": [7.5, 8.0, 10.0, 12.0],
+    "ifn_gamma_pg_ml": [0.0, 5.0, 150.0, 3000.0],
+    "sgp130_ng_ml": [150.0, 300.0, 600.0],
+    "il1ra_pg_ml": [100.0, 5000.0, 40_000.0],
+    "mcp1_pg_ml": [500.0, 1343.0, 2500.0, -1.0],
+    "tachycardia": [True, False, "true", "unknown"],
+    "hours_since_infusion": [6.0, 24.0, 36.0, 48.0, "soon"],
+}
+
+_MODEL_NAMES = [
+    "EASIX",
+    "Modified_EASIX",
+    "Pre_Modified_EASIX",
+    "HScore",
+    "CAR_HEMATOTOX",
+    "Teachey_Cytokine_3var",
+    "Hay_Binary_Classifier",
+]
+
+
+def _random_cohort(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(n):
+        row = {}
+        for key, choices in _FIELDS.items():
+            if rng.random() < 0.25:
+                continue  # absent
+            row[key] = rng.choice(choices)
+        rows.append(row)
+    return rows
+
+
+def _to_columns(rows: list[dict]) -> dict[str, np.ndarray]:
+    return {
+        key: np.array([row.get(key) for row in rows], dtype=object)
+        for key in _FIELDS
+    }
+
+
+def _expected_status(runner_result, name: str) -> int:
+    for layer in runner_result.layers:
+        if name in layer.models_run:
+            return STATUS_RUN
+        if name in layer.models_skipped:
+            return STATUS_SKIPPED
+        if name in layer.models_failed:
+            return STATUS_FAILED
+    raise AssertionError(f"{name} not classified")
+
+
+@pytest.fixture(scope="module")
+def runner():
+    return BiomarkerEnsembleRunner()
+
+
+@pytest.fixture(scope="module")
+def cohort():
+    return _random_cohort(400)
+
+
+class TestBatchEquivalence:
+
+    def test_matches_per_dict_runner(self, runner, cohort):
+        batch = runner.run_batch(_to_columns(cohort))
+        assert batch.n_rows == len(cohort)
+
+        for i, row in enumerate(cohort):
+            expected = runner.run(row)
+            for name in _MODEL_NAMES:
+                model = batch.models[name]
+                status = _expected_status(expected, name)
+                assert model.status[i] == status, (i, name, row)
+
+                result = expected.get_result(name)
+                if status == STATUS_RUN:
+                    assert model.score[i] == pytest.approx(result.score), (i, name)
+                    assert model.risk_levels()[i] == result.risk_level, (i, name)
+                    assert model.confidence[i] == pytest.approx(result.confidence)
+                else:
+                    assert math.isnan(model.score[i])
+                    assert model.risk_levels()[i] is None
+
+            assert batch.overall_risk_levels()[i] == expected.overall_risk_level
+            assert batch.overall_confidence[i] == pytest.approx(expected.overall_confidence)
+            assert batch.model_count_run[i] == expected.model_count_run
+            assert batch.model_count_skipped[i] == expected.model_count_skipped
+            assert batch.model_count_failed[i] == expected.model_count_failed
+            assert batch.high_risk_count[i] == len(expected.high_risk_models)
+            has_discordance = any("discordance" in w for w in expected.warnings)
+            assert bool(batch.discordant[i]) == has_discordance
+
+    def test_aliases_resolved_per_column(self, runner):
+        batch = runner.run_batch({
+            "ldh": [450.0],
+            "creatinine": [1.2],
+            "plt": [120.0],
+        })
+        expected = runner.run({"ldh": 450.0, "creatinine": 1.2, "plt": 120.0})
+        assert batch.models["EASIX"].score[0] == pytest.approx(
+            expected.get_result("EASIX").score
+        )
+        assert "ldh_u_per_l" in batch.columns
+
+    def test_nan_treated_as_missing(self, runner):
+        batch = runner.run_batch({
+            "ldh_u_per_l": [450.0, np.nan],
+            "creatinine_mg_dl": [1.2, 1.2],
+            "platelets_per_nl": [120.0, 120.0],
+        })
+        assert batch.models["EASIX"].status.tolist() == [STATUS_RUN, STATUS_SKIPPED]
+
+
+class TestBatchInputs:
+
+    def test_pandas_and_polars_frames(self, runner, cohort):
+        numeric = [
+            {k: v for k, v in row.items() if isinstance(v, float)}
+            for row in cohort[:50]
+        ]
+        columns = {
+            key: [row.get(key, np.nan) for row in numeric]
+            for key in ("ldh_u_per_l", "creatinine_mg_dl", "platelets_per_nl",
+                        "ferritin_ng_ml", "crp_mg_l", "hemoglobin_g_dl")
+        }
+        from_dict = runner.run_batch(columns)
+        from_pandas = runner.run_batch(pd.DataFrame(columns))
+        from_polars = runner.run_batch(pl.DataFrame(columns, nan_to_null=True))
+
+        for other in (from_pandas, from_polars):
+            np.testing.assert_array_equal(
+                other.overall_risk_code, from_dict.overall_risk_code,
+            )
+            np.testing.assert_allclose(
+                other.models["EASIX"].score, from_dict.models["EASIX"].score,
+            )
+
+    def test_rejects_mismatched_lengths(self, runner):
+        with pytest.raises(ValueError, match="same length"):
+            runner.run_batch({"ldh_u_per_l": [1.0, 2.0], "platelets_per_nl": [1.0]})
+
+    def test_rejects_unsupported_input(self, runner):
+        with pytest.raises(TypeError):
+            runner.run_batch([{"ldh_u_per_l": 1.0}])
+
+    def test_empty_batch(self, runner):
+        batch = runner.run_batch({})
+        assert batch.n_rows == 0
+        assert batch.overall_risk_levels() == []
+
+    def test_to_pandas_has_row_per_input(self, runner, cohort):
+        frame = runner.run_batch(_to_columns(cohort[:20])).to_pandas()
+        assert len(frame) == 20
+        assert {"EASIX_score", "HScore_status", "overall_risk_level"} <= set(frame.columns)
@@ -5,6 +5,7 @@ Tests the Beta-Binomial posterior computation, evidence accrual pipeline,
 prior constants, and the study timeline data.
 """
 
+import numpy as np
 import pytest
 
 from src.models.bayesian_risk import (
@@ -15,6 +16,8 @@ from src.models.bayesian_risk import (
     PriorSpec,
     compute_evidence_accrual,
     compute_posterior,
+    compute_posterior_batch,
+    prior_sensitivity_grid,
 )
 
 
@@ -102,6 +105,81 @@ class TestComputePosterior:
         assert large.ci_width < small.ci_width
 
 
+# ============================================================================
+# compute_posterior_batch() / prior_sensitivity_grid()
+# ============================================================================
+
+
+class TestComputePosteriorBatch:
+    """The vectorized posterior must agree with compute_posterior."""
+
+    def test_matches_scalar(self):
+        priors = [CRS_PRIOR, ICANS_PRIOR, ICAHS_PRIOR, PriorSpec(3.0, 97.0, "")]
+        data = [(0, 5), (1, 47), (10, 100), (0, 0)]
+        batch = compute_posterior_batch(
+            [p.alpha for p in priors], [p.beta for p in priors],
+            [e for e, _ in data], [n for _, n in data],
+        )
+        expected = [compute_posterior(p, e, n) for p, (e, n) in zip(priors, data)]
+        assert batch.to_estimates() == expected
+
+    def test_broadcasts_one_prior_over_data(self):
+        batch = compute_posterior_batch(CRS_PRIOR.alpha, CRS_PRIOR.beta, [0, 1, 2], 20)
+        assert batch.shape == (3,)
+        assert batch.estimate(2) == compute_posterior(CRS_PRIOR, 2, 20)
+
+    def test_ci_level(self):
+        wide = compute_posterior_batch(0.5, 0.5, 3, 30, ci_level=0.99)
+        narrow = compute_posterior_batch(0.5, 0.5, 3, 30, ci_level=0.80)
+        assert wide.ci_width > narrow.ci_width
+
+    @pytest.mark.parametrize("events,n", [([5], [3]), ([-1], [3]), ([1], [-2])])
+    def test_invalid_data_raises(self, events, n):
+        with pytest.raises(ValueError):
+            compute_posterior_batch(0.5, 0.5, events, n)
+
+    def test_invalid_prior_raises(self):
+        with pytest.raises(ValueError, match="prior"):
+            compute_posterior_batch(0.0, 0.5, 1, 10)
+
+
+class TestPriorSensitivityGrid:
+
+    def test_grid_matches_scalar(self):
+        means = [0.03, 0.10]
+        ess = [1, 10, 50]
+        grid = prior_sensitivity_grid(means, ess, events=[0, 2], n=[20, 47])
+
+        assert grid.posteriors.shape == (3, 2, 2)
+        for i, e in enumerate(ess):
+            for j, m in enumerate(means):
+                for k, (events, n) in enumerate([(0, 20), (2, 47)]):
+                    prior = PriorSpec(m * e, (1 - m) * e, "")
+                    assert grid.posteriors.estimate((i, j, k)) == compute_posterior(
+                        prior, events, n,
+                    )
+
+    def test_rows(self):
+        grid = prior_sensitivity_grid([0.03], [1, 2], events=[1], n=[47])
+        rows = grid.rows()
+        assert [r["effective_n"] for r in rows] == [1.0, 2.0]
+        assert rows[0]["prior_alpha"] == pytest.approx(0.03)
+        assert rows[1]["ci_width_pct"] < rows[0]["ci_width_pct"]
+
+    def test_stronger_prior_pulls_toward_prior_mean(self):
+        grid = prior_sensitivity_grid([0.20], np.geomspace(1, 1000, 20), events=[0], n=[50])
+        means = grid.posteriors.mean[:, 0, 0]
+        assert (np.diff(means) > 0).all()
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError):
+            prior_sensitivity_grid([1.0], [10], [0], [10])
+        with pytest.raises(ValueError):
+            prior_sensitivity_grid([0.1], [0], [0], [10])
+        with pytest.raises(ValueError):
+            prior_sensitivity_grid([0.1], [10], [0, 1], [10])
+
+
 # ============================================================================
 # compute_evidence_accrual()
 # ============================================================================
@@ -138,6 +216,19 @@ class TestComputeEvidenceAccrual:
         assert first.n_patients == first_study.n_cumulative_patients
         assert first.n_events == first_study.crs_grade3plus_events
 
+    def test_matches_per_timepoint_posteriors(self):
+        """The batched accrual equals compute_posterior at each timepoint."""
+        posteriors = compute_evidence_accrual(
+            ICANS_PRIOR, STUDY_TIMELINE, "icans_grade3plus_events"
+        )
+        for point, post in zip(STUDY_TIMELINE, posteriors):
+            assert post == compute_posterior(
+                ICANS_PRIOR, point.icans_grade3plus_events, point.n_cumulative_patients,
+            )
+
+    def test_empty_timeline(self):
+        assert compute_evidence_accrual(CRS_PRIOR, [], "crs_grade3plus_events") == []
+
     def test_invalid_event_field_raises_attributeerror(self):
         """An invalid field name should raise AttributeError."""
         with pytest.raises(AttributeError):
@@ -0,0 +1,194 @@
+"""
+Unit tests for src/models/faers_offline.py
+
+Builds a small synthetic FAERS ASCII extract and checks ingestion, case
+deduplication, the contingency counts, agreement of the vectorized metrics
+with the scalar functions, and reading signals back from a saved screen.
+"""
+
+import pytest
+
+import src.models.faers_offline as offline
+from src.models.faers_offline import (
+    SCREEN_PATH_ENV,
+    FAERSScreen,
+    build_contingency_table,
+    compute_disproportionality,
+    ingest_faers_extract,
+    precomputed_faers_signals,
+    run_faers_screen,
+)
+from src.models.faers_signal import (
+    classify_signal,
+    compute_ebgm,
+    compute_prr,
+    compute_ror,
+)
+
+_DEMO = """primaryid$caseid$caseversion$i_f_code$event_dt
+1001$100$1$I$20240101
+1002$100$2$F$20240101
+2001$200$1$I$20240101
+3001$300$1$I$20240101
+4001$400$1$I$20240101
+5001$500$1$I$20240101
+"""
+
+_DRUG = """primaryid$caseid$drug_seq$role_cod$drugname$val_vbm$prod_ai
+1001$100$1$PS$Kymriah$1$TISAGENLECLEUCEL
+1002$100$1$PS$Kymriah.$1$TISAGENLECLEUCEL
+1002$100$2$C$kymriah$1$TISAGENLECLEUCEL
+2001$200$1$PS$TISA-CEL$1$TISAGENLECLEUCEL
+3001$300$1$PS$ASPIRIN$1$ASPIRIN
+4001$400$1$SS$ASPIRIN$1$ASPIRIN
+4001$400$2$C$Kymriah$1$TISAGENLECLEUCEL
+5001$500$1$PS$ASPIRIN$1$ASPIRIN
+"""
+
+_REAC = """primaryid$caseid$pt$drug_rec_act
+1001$100$Nausea$
+1002$100$Cytokine release syndrome$
+2001$200$Cytokine  release syndrome$
+3001$300$Nausea$
+4001$400$Cytokine release syndrome$
+4001$400$Nausea$
+"""
+
+
+@pytest.fixture
+def extract(tmp_path):
+    source = tmp_path / "ascii"
+    source.mkdir()
+    (source / "DEMO24Q1.txt").write_text(_DEMO)
+    (source / "DRUG24Q1.txt").write_text(_DRUG)
+    (source / "REAC24Q1.txt").write_text(_REAC)
+    return source
+
+
+@pytest.fixture
+def store(extract, tmp_path):
+    store = tmp_path / "store"
+    ingest_faers_extract(extract, store)
+    return store
+
+
+def _counts(table):
+    return {
+        (row.drug, row.pt): (row.a, row.b, row.c, row.d)
+        for row in table.itertuples(index=False)
+    }
+
+
+class TestIngest:
+
+    def test_writes_parquet_per_table(self, extract, tmp_path):
+        quarters = ingest_faers_extract(extract, tmp_path / "store")
+        assert quarters == ["24Q1"]
+        for table in ("demo", "drug", "reac"):
+            assert (tmp_path / "store" / table / "24Q1.parquet").exists()
+
+    def test_missing_table_raises(self, extract, tmp_path):
+        (extract / "REAC24Q1.txt").unlink()
+        with pytest.raises(ValueError, match="REAC|reac"):
+            ingest_faers_extract(extract, tmp_path / "store")
+
+    def test_no_files_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ingest_faers_extract(tmp_path, tmp_path / "store")
+
+
+class TestContingencyTable:
+
+    def test_counts(self, store):
+        table, n_reports = build_contingency_table(store)
+
+        # Case 100 keeps only version 2; report 5001 has no reactions
+        assert n_reports == 4
+        assert _counts(table) == {
+            ("KYMRIAH", "CYTOKINE RELEASE SYNDROME"): (3, 0, 0, 1),
+            ("KYMRIAH", "NAUSEA"): (1, 2, 1, 0),
+            ("ASPIRIN", "CYTOKINE RELEASE SYNDROME"): (1, 1, 2, 0),
+            ("ASPIRIN", "NAUSEA"): (2, 0, 0, 2),
+        }
+
+    def test_role_filter(self, store):
+        table, n_reports = build_contingency_table(store, roles=["PS", "SS"])
+
+        assert n_reports == 4
+        counts = _counts(table)
+        assert counts[("KYMRIAH", "CYTOKINE RELEASE SYNDROME")] == (2, 0, 1, 1)
+        assert ("KYMRIAH", "NAUSEA") not in counts
+
+    def test_custom_drug_map(self, store):
+        table, _ = build_contingency_table(store, drug_map={})
+        assert {"KYMRIAH", "TISA-CEL", "ASPIRIN"} == set(table["drug"])
+
+
+class TestDisproportionality:
+
+    def test_matches_scalar_functions(self, store):
+        table, _ = build_contingency_table(store)
+        scored = compute_disproportionality(table)
+
+        for row in scored.itertuples(index=False):
+            cells = (row.a, row.b, row.c, row.d)
+            n = sum(cells)
+            assert (row.prr, row.prr_ci_low, row.prr_ci_high) == pytest.approx(
+                compute_prr(*cells)
+            )
+            assert (row.ror, row.ror_ci_low, row.ror_ci_high) == pytest.approx(
+                compute_ror(*cells)
+            )
+            expected = (row.a + row.b) * (row.a + row.c) / n
+            assert (row.ebgm, row.ebgm05) == pytest.approx(compute_ebgm(row.a, expected))
+            assert (row.is_signal, row.signal_strength) == classify_signal(
+                row.prr, row.prr_ci_low, row.ror, row.ror_ci_low, row.ebgm05, row.a,
+            )
+
+    def test_min_cases(self, store):
+        screen = run_faers_screen(store, min_cases=2)
+        assert set(screen.table["a"]) == {2, 3}
+        with pytest.raises(ValueError):
+            run_faers_screen(store, min_cases=0)
+
+
+class TestScreen:
+
+    def test_save_load_roundtrip(self, store, tmp_path):
+        screen = run_faers_screen(store)
+        path = screen.save(tmp_path / "screen.parquet")
+
+        loaded = FAERSScreen.load(path)
+        assert loaded.n_reports == screen.n_reports
+        assert loaded.quarters == ["24Q1"]
+        assert loaded.built_at == screen.built_at
+        assert _counts(loaded.table) == _counts(screen.table)
+
+    def test_load_rejects_other_parquet(self, store, tmp_path):
+        path = tmp_path / "other.parquet"
+        run_faers_screen(store).table.to_parquet(path)
+        with pytest.raises(ValueError):
+            FAERSScreen.load(path)
+
+    def test_summary_by_product(self, store):
+        summary = run_faers_screen(store).to_summary(["tisagenlecleucel"])
+
+        assert summary.products_queried == ["KYMRIAH"]
+        assert summary.total_reports == 3
+        assert [s.adverse_event for s in summary.signals] == ["Cytokine release syndrome"]
+        signal = summary.signals[0]
+        assert (signal.n_cases, signal.n_total_ae, signal.n_total_database) == (3, 3, 4)
+
+    def test_precomputed_signals_from_env(self, store, tmp_path, monkeypatch):
+        monkeypatch.setattr(offline, "_loaded_screens", {})
+        monkeypatch.delenv(SCREEN_PATH_ENV, raising=False)
+        assert precomputed_faers_signals() is None
+
+        monkeypatch.setenv(SCREEN_PATH_ENV, str(tmp_path / "missing.parquet"))
+        assert precomputed_faers_signals() is None
+
+        path = run_faers_screen(store).save(tmp_path / "screen.parquet")
+        monkeypatch.setenv(SCREEN_PATH_ENV, str(path))
+        summary = precomputed_faers_signals(["KYMRIAH"])
+        assert summary.signals[0].product == "KYMRIAH"
+        assert precomputed_faers_signals(["KYMRIAH"]) == summary
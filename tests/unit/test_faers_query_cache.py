@@ -0,0 +1,132 @@
+"""
+Unit tests for src/models/faers_query_cache.py
+
+Covers TTL and stale windows, LRU eviction, hit/miss metrics, persistence
+across reopen, and sharing between processes.
+"""
+
+import multiprocessing
+
+import pytest
+
+from src.models.faers_query_cache import FAERSQueryCache
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    c = FAERSQueryCache(
+        tmp_path / "cache.sqlite3",
+        ttl_seconds=10.0,
+        stale_seconds=20.0,
+        max_entries=3,
+        touch_interval_seconds=0.0,
+        clock=clock,
+    )
+    yield c
+    c.close()
+
+
+def _child_write(path: str) -> None:
+    cache = FAERSQueryCache(path)
+    cache.set("from-child", {"pid": "child"})
+    cache.close()
+
+
+class TestFAERSQueryCache:
+
+    def test_miss_then_hit(self, cache):
+        assert cache.lookup("k") is None
+        cache.set("k", {"total": 5})
+
+        entry = cache.lookup("k")
+        assert entry.value == {"total": 5}
+        assert entry.fresh
+        assert cache.get("k") == {"total": 5}
+
+    def test_stale_window_then_expiry(self, cache, clock):
+        cache.set("k", 1)
+
+        clock.now += 15.0
+        entry = cache.lookup("k")
+        assert entry.value == 1
+        assert not entry.fresh
+        assert cache.get("k") is None  # get() only returns fresh values
+
+        clock.now += 20.0
+        assert cache.lookup("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, cache, clock):
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+            clock.now += 1.0
+        cache.lookup("a")  # "b" is now least recently used
+        clock.now += 1.0
+        cache.set("d", "d")
+
+        assert cache.lookup("b") is None
+        assert cache.get("a") == "a"
+        assert cache.get("d") == "d"
+        assert cache.stats()["evictions"] == 1
+
+    def test_stats(self, cache, clock):
+        cache.set("k", 1)
+        cache.lookup("k")
+        cache.lookup("missing")
+        clock.now += 15.0
+        cache.lookup("k")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["stale_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert stats["sets"] == 1
+        assert stats["entries"] == 1
+
+    def test_persists_across_reopen(self, cache, clock):
+        cache.set("k", [1, 2, 3])
+        cache.close()
+
+        reopened = FAERSQueryCache(cache.path, clock=clock)
+        assert reopened.get("k") == [1, 2, 3]
+        reopened.close()
+
+    def test_shared_between_processes(self, cache):
+        ctx = multiprocessing.get_context("spawn")
+        child = ctx.Process(target=_child_write, args=(str(cache.path),))
+        child.start()
+        child.join(timeout=60)
+
+        assert child.exitcode == 0
+        assert cache.lookup("from-child").value == {"pid": "child"}
+
+    def test_unwritable_location_degrades_to_miss(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = FAERSQueryCache(blocker / "cache.sqlite3")
+
+        cache.set("k", 1)
+        assert cache.lookup("k") is None
+        assert cache.stats()["errors"] >= 2
+
+    def test_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            FAERSQueryCache(tmp_path / "c", ttl_seconds=0)
+        with pytest.raises(ValueError):
+            FAERSQueryCache(tmp_path / "c", stale_seconds=-1)
+        with pytest.raises(ValueError):
+            FAERSQueryCache(tmp_path / "c", max_entries=0)
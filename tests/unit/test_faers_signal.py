@@ -7,13 +7,18 @@ Does NOT test the async openFDA API integration (that belongs in integration tes
 
 import math
 
+import numpy as np
 import pytest
 
 from src.models.faers_signal import (
     classify_signal,
+    classify_signal_batch,
     compute_ebgm,
+    compute_ebgm_batch,
     compute_prr,
+    compute_prr_batch,
     compute_ror,
+    compute_ror_batch,
 )
 
 
@@ -170,6 +175,68 @@ class TestComputeEBGM:
         assert ebgm05 > 1.0
 
 
+# ============================================================================
+# compute_ebgm_batch()
+# ============================================================================
+
+
+def _mixture_cdf(x, n, e, alpha1=0.2, beta1=0.1, alpha2=2.0, beta2=4.0, p=1 / 3):
+    """Reference posterior mixture CDF, computed independently with scipy.stats."""
+    stats = pytest.importorskip("scipy.stats")
+    log_w1 = math.log(p) + stats.nbinom.logpmf(n, alpha1, beta1 / (beta1 + e))
+    log_w2 = math.log(1 - p) + stats.nbinom.logpmf(n, alpha2, beta2 / (beta2 + e))
+    q1 = 1.0 / (1.0 + math.exp(log_w2 - log_w1))
+    return (
+        q1 * stats.gamma.cdf(x, alpha1 + n, scale=1.0 / (beta1 + e))
+        + (1 - q1) * stats.gamma.cdf(x, alpha2 + n, scale=1.0 / (beta2 + e))
+    )
+
+
+class TestComputeEBGMBatch:
+    """Tests for the vectorized exact mixture-quantile solver."""
+
+    PAIRS = [(0, 5.0), (0, 0.001), (1, 0.05), (3, 0.2), (10, 10.0),
+             (50, 5.0), (100, 2.0), (2500, 40.0)]
+
+    def test_quantiles_solve_mixture_cdf(self):
+        observed, expected = zip(*self.PAIRS)
+        _, eb05, eb95 = compute_ebgm_batch(observed, expected)
+        for (n, e), lo, hi in zip(self.PAIRS, eb05, eb95):
+            assert _mixture_cdf(lo, n, e) == pytest.approx(0.05, abs=1e-9)
+            assert _mixture_cdf(hi, n, e) == pytest.approx(0.95, abs=1e-9)
+
+    def test_ordering(self):
+        observed, expected = zip(*self.PAIRS)
+        ebgm, eb05, eb95 = compute_ebgm_batch(observed, expected)
+        assert np.all(eb05 < ebgm)
+        assert np.all(ebgm < eb95)
+
+    def test_matches_scalar(self):
+        observed, expected = zip(*self.PAIRS)
+        ebgm, eb05, _ = compute_ebgm_batch(observed, expected)
+        for i, (n, e) in enumerate(self.PAIRS):
+            assert compute_ebgm(n, e) == (pytest.approx(ebgm[i]), pytest.approx(eb05[i]))
+
+    def test_invalid_pairs_are_zero(self):
+        ebgm, eb05, eb95 = compute_ebgm_batch([10, -1, 5], [0.0, 5.0, 5.0])
+        assert ebgm[:2].tolist() == [0.0, 0.0]
+        assert eb05[:2].tolist() == [0.0, 0.0]
+        assert eb95[:2].tolist() == [0.0, 0.0]
+        assert ebgm[2] > 0.0
+
+    def test_large_table(self):
+        rng = np.random.default_rng(0)
+        observed = rng.integers(0, 1000, size=20_000)
+        expected = rng.uniform(0.001, 100.0, size=20_000)
+        ebgm, eb05, eb95 = compute_ebgm_batch(observed, expected)
+        assert np.all(np.isfinite(eb05)) and np.all(np.isfinite(eb95))
+        assert np.all((eb05 < ebgm) & (ebgm < eb95))
+
+    def test_shape_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            compute_ebgm_batch([1, 2], [1.0])
+
+
 # ============================================================================
 # classify_signal()
 # ============================================================================
@@ -282,3 +349,45 @@ class TestClassifySignal:
         )
         assert is_signal is False
         assert strength == "none"
+
+
+# ============================================================================
+# Vectorized PRR / ROR / classification
+# ============================================================================
+
+
+class TestBatchMetrics:
+    """The array versions must agree with the scalar functions row by row."""
+
+    # Includes every zero-cell branch of compute_prr / compute_ror
+    TABLES = [
+        (50, 450, 1000, 98500), (10, 90, 500, 99400), (0, 100, 50, 1000),
+        (5, 0, 10, 100), (5, 10, 0, 100), (5, 10, 20, 0), (0, 0, 0, 0),
+        (3, 7, 1, 1), (1, 1, 1, 1), (2500, 10, 3, 10_000_000),
+    ]
+
+    def test_prr_matches_scalar(self):
+        prr, lo, hi = compute_prr_batch(*zip(*self.TABLES))
+        for i, cells in enumerate(self.TABLES):
+            assert (prr[i], lo[i], hi[i]) == pytest.approx(compute_prr(*cells), rel=1e-12)
+
+    def test_ror_matches_scalar(self):
+        ror, lo, hi = compute_ror_batch(*zip(*self.TABLES))
+        for i, cells in enumerate(self.TABLES):
+            assert (ror[i], lo[i], hi[i]) == pytest.approx(compute_ror(*cells), rel=1e-12)
+
+    def test_classification_matches_scalar(self):
+        rng = np.random.default_rng(1)
+        n = 500
+        prr = rng.uniform(0.5, 4.0, n)
+        prr_lo = rng.uniform(0.5, 2.0, n)
+        ror = rng.uniform(0.5, 4.0, n)
+        ror_lo = rng.uniform(0.5, 2.0, n)
+        eb05 = rng.uniform(0.0, 3.0, n)
+        cases = rng.integers(0, 6, n)
+
+        is_signal, strength = classify_signal_batch(prr, prr_lo, ror, ror_lo, eb05, cases)
+        for i in range(n):
+            expected = classify_signal(prr[i], prr_lo[i], ror[i], ror_lo[i], eb05[i], cases[i])
+            assert (bool(is_signal[i]), strength[i]) == expected
+
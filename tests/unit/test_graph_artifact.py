@@ -0,0 +1,144 @@
+"""
+Unit tests for src/data/graph/artifact.py
+
+Writes small graph artifacts in the builder's layout (Arrow node/edge
+tables, CSR arrays, metadata.json) and checks what
+``load_graph_artifact`` puts into a KnowledgeGraph: schema-typed nodes and
+edges with their properties, skipped and mapped builder types, loading into
+an existing graph, and rejection of malformed artifacts.
+"""
+
+import json
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from src.data.graph.artifact import load_graph_artifact
+from src.data.graph.knowledge_graph import KnowledgeGraph
+from src.data.graph.schema import EdgeType, GraphNode, NodeType
+
+_NODES = [
+    {"id": "IL6", "type": "Cytokine", "is_focus": True,
+     "normal_range_pg_ml": "[0, 10]"},
+    {"id": "IL6_SIGNALING", "type": "Pathway", "name": "IL-6 signaling"},
+    {"id": "CRS_Grade_3", "type": "Adverse_Event", "severity": 3},
+    {"id": "Tocilizumab", "type": "Drug"},
+    {"id": "IL6R", "type": "Protein"},
+    {"id": "Imatinib", "type": "Chemical"},
+]
+# (source, target, attributes); listed in CSR order (grouped by source row)
+_EDGES = [
+    ("IL6", "IL6_SIGNALING", {"type": "PARTICIPATES_IN", "source": "Reactome"}),
+    ("IL6", "IL6R", {"type": "INTERACTS_WITH", "weight": 0.9}),
+    ("IL6_SIGNALING", "CRS_Grade_3", {"type": "TRIGGERS", "weight": 0.8,
+                                      "evidence": '["PMID:1", "PMID:2"]'}),
+    ("Tocilizumab", "IL6R", {"type": "TARGETS"}),
+    ("Imatinib", "IL6R", {"type": "TARGETS"}),
+]
+
+
+def _write_artifact(path, nodes=_NODES, edges=_EDGES, **meta):
+    path.mkdir()
+    index = {node["id"]: i for i, node in enumerate(nodes)}
+    keys = list(dict.fromkeys(k for node in nodes for k in node))
+    edge_keys = list(dict.fromkeys(k for _, _, attrs in edges for k in attrs))
+    for name, table in [
+        ("nodes.arrow", pa.table({k: [node.get(k) for node in nodes] for k in keys})),
+        ("edges.arrow", pa.table({k: [attrs.get(k) for _, _, attrs in edges] for k in edge_keys})),
+    ]:
+        with pa.OSFile(str(path / name), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    sources = np.array([index[s] for s, _, _ in edges], dtype=np.int64)
+    np.save(path / "indptr.npy",
+            np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=len(nodes)))]))
+    np.save(path / "indices.npy", np.array([index[t] for _, t, _ in edges], dtype=np.int32))
+    (path / "metadata.json").write_text(json.dumps({
+        "format": "knowledge-graph-artifact",
+        "version": 1,
+        "node_count": len(nodes),
+        "edge_count": len(edges),
+        "json_columns": {"nodes": ["normal_range_pg_ml"], "edges": ["evidence"]},
+        **meta,
+    }))
+    return path
+
+
+class TestLoad:
+
+    def test_nodes_and_properties(self, tmp_path):
+        kg = load_graph_artifact(_write_artifact(tmp_path / "graph_artifact"))
+
+        il6 = kg.get_node("IL6")
+        assert il6.node_type == NodeType.CYTOKINE
+        assert il6.name == "IL6"
+        assert il6.properties == {"is_focus": True, "normal_range_pg_ml": [0, 10]}
+        assert kg.get_node("IL6_SIGNALING").name == "IL-6 signaling"
+        assert kg.get_node("CRS_Grade_3").properties == {"severity": 3}
+
+    def test_edges_and_queries(self, tmp_path):
+        kg = load_graph_artifact(_write_artifact(tmp_path / "graph_artifact"))
+
+        [(edge, node)] = kg.get_neighbors("IL6_SIGNALING")
+        assert node.node_id == "CRS_Grade_3"
+        assert edge.edge_type == EdgeType.TRIGGERS
+        assert edge.weight == pytest.approx(0.8)
+        assert edge.properties == {"evidence": ["PMID:1", "PMID:2"]}
+
+        result = kg.find_paths("IL6", "CRS_Grade_3")
+        assert result.min_hops == 2
+        assert kg.active_pathways({"IL6": 50.0}) == {"IL6_SIGNALING"}
+        assert kg.summary()["pathways"] == ["IL6_SIGNALING"]
+
+    def test_unknown_types_skipped(self, tmp_path):
+        kg = load_graph_artifact(_write_artifact(tmp_path / "graph_artifact"))
+
+        assert kg.get_node("Imatinib") is None
+        assert kg.node_count == 5
+        # INTERACTS_WITH has no EdgeType; Imatinib -> IL6R lost its source
+        assert kg.edge_count == 3
+
+    def test_type_mappings(self, tmp_path):
+        kg = load_graph_artifact(
+            _write_artifact(tmp_path / "graph_artifact"),
+            node_types={"Chemical": NodeType.DRUG},
+            edge_types={"INTERACTS_WITH": EdgeType.BINDS},
+        )
+
+        assert kg.get_node("Imatinib").node_type == NodeType.DRUG
+        assert kg.edge_count == 5
+        assert kg.has_path("IL6", "IL6R", max_hops=1)
+
+    def test_into_existing_graph(self, tmp_path):
+        kg = KnowledgeGraph()
+        kg.add_node(GraphNode("IL6", NodeType.CYTOKINE, "Interleukin-6"))
+
+        assert load_graph_artifact(_write_artifact(tmp_path / "graph_artifact"), kg=kg) is kg
+        assert kg.get_node("IL6").name == "Interleukin-6"
+        assert kg.node_count == 5
+
+    def test_empty_edge_table(self, tmp_path):
+        kg = load_graph_artifact(_write_artifact(tmp_path / "graph_artifact", edges=[]))
+        assert (kg.node_count, kg.edge_count) == (5, 0)
+
+
+class TestMalformed:
+
+    def test_unsupported_version(self, tmp_path):
+        path = _write_artifact(tmp_path / "graph_artifact", version=2)
+        with pytest.raises(ValueError, match="Unsupported"):
+            load_graph_artifact(path)
+
+    def test_adjacency_mismatch(self, tmp_path):
+        path = _write_artifact(tmp_path / "graph_artifact")
+        np.save(path / "indptr.npy", np.zeros(3, dtype=np.int64))
+        with pytest.raises(ValueError, match="disagree"):
+            load_graph_artifact(path)
+
+    def test_missing_file(self, tmp_path):
+        path = _write_artifact(tmp_path / "graph_artifact")
+        (path / "edges.arrow").unlink()
+        with pytest.raises(FileNotFoundError):
+            load_graph_artifact(path)
@@ -0,0 +1,109 @@
+"""
+Unit tests for gpuserver_tasks/task1_build_knowledge_graph.py
+
+Loads the build script without its side effects (output directories, log
+file) and checks that ``_read_chunks`` falls back to pandas when pyarrow
+fails partway through a file without yielding any row twice, and that
+the sparse per-component betweenness matches NetworkX.
+"""
+
+import gzip
+import importlib.util
+import logging
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+for _module in ("networkx", "numpy", "pandas", "scipy", "pyarrow", "tqdm"):
+    pytest.importorskip(_module)
+
+import networkx as nx  # noqa: E402
+import pandas as pd  # noqa: E402
+
+_SCRIPT = (
+    Path(__file__).resolve().parents[2]
+    / "gpuserver_tasks" / "task1_build_knowledge_graph.py"
+)
+
+
+@pytest.fixture(scope="module")
+def builder():
+    spec = importlib.util.spec_from_file_location("kg_builder", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    handlers = list(logging.getLogger().handlers)
+    with mock.patch.object(Path, "mkdir"), mock.patch("logging.FileHandler"):
+        spec.loader.exec_module(module)
+    logging.getLogger().handlers[:] = handlers
+    return module
+
+
+def _write(path: Path, header: bool) -> Path:
+    lines = [f"ID{i}\tNAME{i}\n".encode() for i in range(2000)]
+    lines[100] = b"short\n"
+    lines[200] = b"too\tmany\tfields\n"
+    lines[300] = b"\n"
+    # Invalid UTF-8 well past the first 4 KB block
+    lines[1500] = b"BAD\xff\tNAME1500\n"
+    if header:
+        lines.insert(0, b"id\tname\n")
+    data = b"".join(lines)
+    path.write_bytes(gzip.compress(data) if path.suffix == ".gz" else data)
+    return path
+
+
+class TestReadChunks:
+
+    @pytest.mark.parametrize("header", [False, True])
+    @pytest.mark.parametrize("name", ["rows.tsv", "rows.tsv.gz"])
+    def test_fallback_after_first_block_does_not_duplicate(
+        self, builder, monkeypatch, tmp_path, caplog, name, header,
+    ):
+        monkeypatch.setattr(builder, "CSV_BLOCK_SIZE", 4096)
+        monkeypatch.setattr(builder, "CSV_CHUNK_ROWS", 300)
+        path = _write(tmp_path / name, header)
+
+        chunks = list(builder._read_chunks(path, 2, header=header))
+        rows = pd.concat(chunks)["0"].tolist()
+
+        # pyarrow yielded rows before failing on the bad byte
+        assert "using the pandas reader after row" in caplog.text
+        assert len(rows) == len(set(rows))
+        assert [r for r in rows if r.startswith("ID")] == [
+            f"ID{i}" for i in range(2000) if i not in (100, 200, 300, 1500)
+        ]
+        assert "BAD�" in rows
+        assert "short" not in rows
+
+    def test_valid_file_read_by_pyarrow(self, builder, tmp_path):
+        path = tmp_path / "rows.tsv"
+        path.write_text("".join(f"ID{i}\tNAME{i}\n" for i in range(10)))
+
+        rows = pd.concat(builder._read_chunks(path, 2))
+        assert rows["1"].tolist() == [f"NAME{i}" for i in range(10)]
+
+
+class TestComponentBetweenness:
+
+    def test_matches_networkx_per_component(self, builder):
+        graph = nx.DiGraph()
+        # Largest component, a path of three, a 4-cycle, a pair and a singleton
+        graph.add_edges_from([("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"),
+                              ("d", "e"), ("b", "e"), ("e", "f")])
+        graph.add_edges_from([("p", "q"), ("r", "q")])
+        graph.add_edges_from([("x", "y"), ("y", "z"), ("z", "w"), ("w", "x")])
+        graph.add_edge("s", "t")
+        graph.add_node("lonely")
+
+        nodes, adjacency = builder.graph_to_csr(graph)
+        structure = builder._undirected_structure(adjacency)
+        _, labels = builder.connected_components(structure, directed=False)
+        betweenness = builder.component_betweenness(structure, labels)
+
+        undirected = graph.to_undirected()
+        expected = {}
+        for component in nx.connected_components(undirected):
+            expected.update(nx.betweenness_centrality(undirected.subgraph(component)))
+        assert betweenness.tolist() == pytest.approx([expected[v] for v in nodes])
+        assert betweenness[nodes.index("q")] == 1.0
+        assert betweenness[nodes.index("s")] == 0.0
@@ -0,0 +1,297 @@
+"""
+Unit tests for src/data/graph/knowledge_graph.py and src/data/graph/compiled.py
+
+Exercises the production KnowledgeGraph queries on a small hand-built graph
+and on the default CRS/ICANS/HLH pathways: path enumeration, upstream
+causes, neighbor queries, and the compiled CSR adjacency behind them.
+"""
+
+import pytest
+
+from src.data.graph.compiled import CompiledGraph
+from src.data.graph.crs_pathways import get_all_pathways
+from src.data.graph.knowledge_graph import KnowledgeGraph
+from src.data.graph.schema import EdgeType, GraphEdge, GraphNode, NodeType
+
+
+def _graph() -> KnowledgeGraph:
+    """CAR-T -> IFNG -> macrophage -> IL6 -> CRS, plus a direct IL6 shortcut."""
+    kg = KnowledgeGraph()
+    for node_id, node_type in [
+        ("CELL:CAR_T", NodeType.CELL_TYPE),
+        ("CYTOKINE:IFNG", NodeType.CYTOKINE),
+        ("CELL:MACROPHAGE", NodeType.CELL_TYPE),
+        ("CYTOKINE:IL6", NodeType.CYTOKINE),
+        ("AE:CRS", NodeType.ADVERSE_EVENT),
+        ("PATHWAY:IL6", NodeType.PATHWAY),
+    ]:
+        kg.add_node(GraphNode(node_id, node_type, node_id.split(":")[1]))
+    for src, tgt, etype, weight in [
+        ("CELL:CAR_T", "CYTOKINE:IFNG", EdgeType.PRODUCES, 0.9),
+        ("CYTOKINE:IFNG", "CELL:MACROPHAGE", EdgeType.ACTIVATES, 0.8),
+        ("CELL:MACROPHAGE", "CYTOKINE:IL6", EdgeType.PRODUCES, 0.9),
+        ("CYTOKINE:IL6", "AE:CRS", EdgeType.TRIGGERS, 0.7),
+        ("CELL:CAR_T", "CYTOKINE:IL6", EdgeType.ACTIVATES, 0.2),
+        ("CYTOKINE:IL6", "PATHWAY:IL6", EdgeType.PARTICIPATES_IN, 1.0),
+    ]:
+        kg.add_edge(GraphEdge(src, tgt, etype, weight))
+    return kg
+
+
+class TestFindPaths:
+
+    def test_paths_in_breadth_first_order(self):
+        result = _graph().find_paths("CELL:CAR_T", "AE:CRS", max_hops=4)
+
+        assert [len(p) for p in result.paths] == [2, 4]
+        assert result.min_hops == 2
+        # The longer path carries more total weight
+        assert result.max_weight_path == result.paths[1]
+        assert result.max_weight_path[0] == ("CELL:CAR_T", EdgeType.PRODUCES, "CYTOKINE:IFNG")
+
+    def test_max_hops_limits_paths(self):
+        result = _graph().find_paths("CELL:CAR_T", "AE:CRS", max_hops=3)
+        assert len(result.paths) == 1
+
+    def test_edge_type_filter(self):
+        result = _graph().find_paths(
+            "CELL:CAR_T", "AE:CRS", edge_types={EdgeType.ACTIVATES, EdgeType.TRIGGERS},
+        )
+        assert result.paths == [[
+            ("CELL:CAR_T", EdgeType.ACTIVATES, "CYTOKINE:IL6"),
+            ("CYTOKINE:IL6", EdgeType.TRIGGERS, "AE:CRS"),
+        ]]
+
+    def test_unknown_node(self):
+        result = _graph().find_paths("CELL:CAR_T", "AE:MISSING")
+        assert result.paths == [] and result.max_weight_path == []
+
+    def test_parallel_edges_scored_by_first(self):
+        kg = _graph()
+        kg.add_edge(GraphEdge("CYTOKINE:IL6", "AE:CRS", EdgeType.TRIGGERS, 0.1))
+        result = kg.find_paths("CYTOKINE:IL6", "AE:CRS", max_hops=1)
+
+        # One path per parallel edge, as with the adjacency-list scan
+        assert len(result.paths) == 2
+        assert result.paths[0] == result.paths[1]
+
+
+class TestUpstreamAndNeighbors:
+
+    def test_upstream_causes(self):
+        ranked = _graph().get_upstream_causes("AE:CRS", max_depth=4)
+        weights = {node.node_id: w for node, w in ranked}
+
+        # Reached first via the direct (weak) activation, breadth-first
+        assert weights["CYTOKINE:IL6"] == pytest.approx(0.7)
+        assert weights["CELL:CAR_T"] == pytest.approx(0.14)
+        assert "CELL:MACROPHAGE" not in weights  # PRODUCES is not causal
+        assert [w for _, w in ranked] == sorted(weights.values(), reverse=True)
+
+    def test_upstream_of_unknown_node(self):
+        assert _graph().get_upstream_causes("AE:MISSING") == []
+
+    def test_neighbors(self):
+        kg = _graph()
+        out = kg.get_neighbors("CYTOKINE:IL6")
+        assert [n.node_id for _, n in out] == ["AE:CRS", "PATHWAY:IL6"]
+
+        both = kg.get_neighbors("CYTOKINE:IL6", {EdgeType.PRODUCES}, direction="both")
+        assert [n.node_id for _, n in both] == ["CELL:MACROPHAGE"]
+        assert kg.get_neighbors("CYTOKINE:MISSING") == []
+
+
+class TestFreeze:
+
+    def test_freeze_and_mutation_invalidates(self):
+        kg = _graph()
+        assert not kg.frozen
+        compiled = kg.freeze()
+        assert kg.frozen
+        assert kg.freeze() is compiled
+
+        kg.add_node(GraphNode("AE:ICANS", NodeType.ADVERSE_EVENT, "ICANS"))
+        assert not kg.frozen
+        kg.add_edge(GraphEdge("CYTOKINE:IL6", "AE:ICANS", EdgeType.TRIGGERS, 0.5))
+        assert [n.node_id for _, n in kg.get_neighbors("CYTOKINE:IL6")][-1] == "AE:ICANS"
+        assert kg.frozen
+
+    def test_default_pathways_query(self):
+        kg = KnowledgeGraph()
+        for pathway in get_all_pathways():
+            kg.load_pathway(pathway)
+        kg.freeze()
+
+        valid, _ = kg.validate_mechanism("CYTOKINE:IL6", "AE:CRS")
+        assert valid
+        assert kg.get_upstream_causes("AE:CRS", max_depth=5)
+
+
+class TestCompiledGraph:
+
+    def test_csr_per_edge_type(self):
+        kg = _graph()
+        compiled = CompiledGraph(kg._nodes, kg._edges)
+        car_t = compiled.index["CELL:CAR_T"]
+
+        full = compiled.adjacency("outgoing")
+        assert full.indptr[-1] == compiled.edge_count == 6
+        assert full.row(car_t).tolist() == [0, 4]
+
+        produces = compiled.adjacency("outgoing", {EdgeType.PRODUCES})
+        assert produces.row(car_t).tolist() == [0]
+        assert compiled.adjacency("outgoing", [EdgeType.PRODUCES]) is produces
+
+        incoming = compiled.adjacency("incoming", {EdgeType.PRODUCES})
+        il6 = compiled.index["CYTOKINE:IL6"]
+        assert incoming.neighbors[incoming.indptr[il6]:incoming.indptr[il6 + 1]].tolist() == [
+            compiled.index["CELL:MACROPHAGE"],
+        ]
+
+    def test_invalid_direction(self):
+        kg = _graph()
+        with pytest.raises(ValueError):
+            kg.freeze().adjacency("sideways")
+
+
+class TestQueryCache:
+
+    def test_repeat_queries_hit(self):
+        kg = _graph()
+        first = kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4)
+        again = kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4)
+        kg.get_upstream_causes("AE:CRS")
+        kg.get_upstream_causes("AE:CRS")
+
+        assert again == first
+        stats = kg.summary()["query_cache"]
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 2, 2)
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_arguments_are_part_of_key(self):
+        kg = _graph()
+        kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4)
+        assert len(kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=3).paths) == 1
+        kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4, edge_types={EdgeType.ACTIVATES})
+        assert kg.query_cache_stats()["hits"] == 0
+
+    def test_mutation_invalidates(self):
+        kg = _graph()
+        before = kg.get_upstream_causes("AE:CRS")
+        version = kg.version
+
+        kg.add_node(GraphNode("DRUG:X", NodeType.DRUG, "X"))
+        kg.add_edge(GraphEdge("DRUG:X", "AE:CRS", EdgeType.CAUSES, 0.5))
+
+        after = kg.get_upstream_causes("AE:CRS")
+        assert kg.version == version + 2
+        assert len(after) == len(before) + 1
+        assert kg.query_cache_stats()["hits"] == 0
+
+    def test_load_pathway_invalidates(self):
+        kg = _graph()
+        kg.get_upstream_causes("AE:CRS")
+        kg.load_pathway(get_all_pathways()[0])
+        assert kg.query_cache_stats()["entries"] == 0
+
+    def test_results_are_copies(self):
+        kg = _graph()
+        kg.get_upstream_causes("AE:CRS").clear()
+        kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4).paths[0].clear()
+
+        assert kg.get_upstream_causes("AE:CRS")
+        assert len(kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4).paths[0]) == 2
+
+    def test_bounded_and_disableable(self):
+        kg = KnowledgeGraph(query_cache_size=1)
+        for pathway in get_all_pathways():
+            kg.load_pathway(pathway)
+        kg.get_upstream_causes("AE:CRS")
+        kg.get_upstream_causes("AE:ICANS")
+        assert kg.query_cache_stats()["entries"] == 1
+
+        uncached = KnowledgeGraph(query_cache_size=0)
+        uncached.get_upstream_causes("AE:CRS")
+        uncached.get_upstream_causes("AE:CRS")
+        assert uncached.query_cache_stats()["entries"] == 0
+        assert uncached.query_cache_stats()["hits"] == 0
+
+        with pytest.raises(ValueError):
+            KnowledgeGraph(query_cache_size=-1)
+
+
+class TestBoundedPathSearch:
+
+    def test_shortest_path_length(self):
+        kg = _graph()
+        assert kg.shortest_path_length("CELL:CAR_T", "AE:CRS") == 2
+        assert kg.shortest_path_length("CELL:CAR_T", "AE:CRS", edge_types={EdgeType.PRODUCES}) is None
+        assert kg.shortest_path_length("CELL:CAR_T", "AE:CRS", max_hops=1) is None
+        assert kg.shortest_path_length("AE:CRS", "CELL:CAR_T") is None
+        assert kg.shortest_path_length("CELL:CAR_T", "AE:MISSING") is None
+
+    def test_shortest_path(self):
+        kg = _graph()
+        assert kg.shortest_path("CELL:CAR_T", "AE:CRS") == [
+            ("CELL:CAR_T", EdgeType.ACTIVATES, "CYTOKINE:IL6"),
+            ("CYTOKINE:IL6", EdgeType.TRIGGERS, "AE:CRS"),
+        ]
+        assert kg.shortest_path("CELL:CAR_T", "AE:CRS", edge_types={EdgeType.PRODUCES}) is None
+        assert kg.shortest_path("CELL:CAR_T", "AE:CRS", max_hops=1) is None
+        assert kg.shortest_path("AE:CRS", "AE:CRS") is None
+        assert kg.shortest_path("CELL:CAR_T", "AE:MISSING") is None
+
+        # Answers a query whose weighted search was truncated empty
+        assert not kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=1, max_hops=4, node_budget=0).paths
+        assert len(kg.shortest_path("CELL:CAR_T", "AE:CRS", max_hops=4)) == 2
+
+    def test_has_path(self):
+        kg = _graph()
+        assert kg.has_path("CYTOKINE:IFNG", "PATHWAY:IL6")
+        assert not kg.has_path("PATHWAY:IL6", "CYTOKINE:IFNG")
+
+    def test_top_k_ordered_by_weight(self):
+        kg = _graph()
+        full = kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4)
+        top = kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=2, max_hops=4)
+
+        assert top.paths == [full.paths[1], full.paths[0]]
+        assert top.max_weight_path == full.max_weight_path
+        assert top.min_hops == 2 and not top.truncated
+
+        best = kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=1, max_hops=4)
+        assert best.paths == [full.max_weight_path]
+        assert kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=1, max_hops=3).paths == [full.paths[0]]
+
+    def test_top_k_on_default_pathways(self):
+        kg = KnowledgeGraph()
+        for pathway in get_all_pathways():
+            kg.load_pathway(pathway)
+
+        full = kg.find_paths("CYTOKINE:IL6", "AE:CRS", max_hops=4)
+        top = kg.top_k_paths("CYTOKINE:IL6", "AE:CRS", k=len(full.paths) + 1, max_hops=4)
+        assert len(top.paths) == len(full.paths)
+        assert top.paths[0] == full.max_weight_path
+
+    def test_node_budget_truncates(self):
+        kg = _graph()
+        result = kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4, node_budget=1)
+        assert result.truncated
+        assert kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=2, max_hops=4, node_budget=1).truncated
+        assert not kg.find_paths("CELL:CAR_T", "AE:CRS", max_hops=4).truncated
+
+        with pytest.raises(ValueError):
+            kg.top_k_paths("CELL:CAR_T", "AE:CRS", k=0)
+
+    def test_validate_mechanism(self):
+        kg = _graph()
+        assert kg.validate_mechanism("CELL:CAR_T", "AE:CRS") == (
+            True, "Valid mechanism: 2-hop path found",
+        )
+        valid, message = kg.validate_mechanism(
+            "CELL:CAR_T", "AE:CRS", required_intermediates=["CELL:MACROPHAGE"],
+        )
+        assert valid and "CELL:MACROPHAGE" in message
+
+        valid, message = kg.validate_mechanism("AE:CRS", "CELL:CAR_T")
+        assert not valid
@@ -6,16 +6,20 @@ correlation lookups, Monte Carlo simulation, high-level mitigated risk
 calculation, and the mitigation strategy registry.
 """
 
+import numpy as np
 import pytest
 
 from src.models.mitigation_model import (
     MITIGATION_STRATEGIES,
     MitigationResult,
+    _combination_plan,
+    _combine_correlated_rr_array,
     calculate_mitigated_risk,
     combine_correlated_rr,
     combine_multiple_rrs,
     get_mitigation_correlation,
     monte_carlo_mitigated_risk,
+    optimize_mitigation_regimens,
 )
 
 
@@ -281,6 +285,37 @@ class TestMonteCarloMitigatedRisk:
         assert result["p97_5"] >= 0.0
         assert result["median"] >= 0.0
 
+    def test_vectorized_combination_matches_scalar(self):
+        """The precomputed plan applied to arrays should reproduce
+        combine_multiple_rrs row by row."""
+        ids = list(MITIGATION_STRATEGIES)
+        rng = np.random.default_rng(7)
+        sampled = rng.uniform(0.2, 1.2, size=(50, len(ids)))
+
+        slots = [sampled[:, k] for k in range(len(ids))]
+        for slot_a, slot_b, rho in _combination_plan(ids):
+            slots.append(_combine_correlated_rr_array(slots[slot_a], slots[slot_b], rho))
+
+        for row, combined in zip(sampled, slots[-1]):
+            assert combined == pytest.approx(combine_multiple_rrs(ids, list(row)), rel=1e-12)
+
+    def test_seed_reproducible_at_large_n(self):
+        """Large sample counts should run quickly and reproduce exactly."""
+        kwargs = dict(
+            baseline_alpha=1.21,
+            baseline_beta=47.29,
+            mitigation_ids=list(MITIGATION_STRATEGIES),
+            n_samples=200_000,
+            seed=2024,
+        )
+        assert monte_carlo_mitigated_risk(**kwargs) == monte_carlo_mitigated_risk(**kwargs)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            monte_carlo_mitigated_risk(1.21, 47.29, [], n_samples=100)
+        with pytest.raises(ValueError):
+            monte_carlo_mitigated_risk(1.21, 47.29, ["tocilizumab"], n_samples=0)
+
 
 # ============================================================================
 # calculate_mitigated_risk()
@@ -422,3 +457,94 @@ class TestMitigationStrategies:
         """Point estimate of RR should be within its CI."""
         s = MITIGATION_STRATEGIES[strategy_id]
         assert s.confidence_interval[0] <= s.relative_risk <= s.confidence_interval[1]
+
+
+# ============================================================================
+# optimize_mitigation_regimens()
+# ============================================================================
+
+
+class TestOptimizeMitigationRegimens:
+    """Tests for the exhaustive regimen optimizer."""
+
+    BASELINES = {"CRS": 0.05, "ICANS": 0.03}
+
+    def test_enumerates_all_subsets_up_to_max_size(self):
+        n = len(MITIGATION_STRATEGIES)
+        result = optimize_mitigation_regimens(self.BASELINES, max_size=2)
+        assert len(result.evaluations) == n + n * (n - 1) // 2
+
+    def test_combined_rr_matches_combine_multiple_rrs(self):
+        result = optimize_mitigation_regimens(self.BASELINES, max_size=len(MITIGATION_STRATEGIES))
+        for evaluation in result.evaluations:
+            for ae in result.target_aes:
+                ids = [
+                    mid for mid in evaluation.mitigation_ids
+                    if ae in MITIGATION_STRATEGIES[mid].target_aes
+                ]
+                expected = combine_multiple_rrs(
+                    ids, [MITIGATION_STRATEGIES[mid].relative_risk for mid in ids],
+                ) if ids else 1.0
+                assert evaluation.combined_rr[ae] == pytest.approx(expected, rel=1e-12)
+
+    def test_memoization_shares_sub_combinations(self):
+        result = optimize_mitigation_regimens(self.BASELINES, max_size=len(MITIGATION_STRATEGIES))
+        multi = sum(
+            1 for e in result.evaluations for ae in result.target_aes
+            if sum(ae in MITIGATION_STRATEGIES[m].target_aes for m in e.mitigation_ids) > 1
+        )
+        assert 0 < result.n_combination_evaluations < multi
+
+    def test_frontier_is_non_dominated(self):
+        result = optimize_mitigation_regimens(self.BASELINES, max_size=3)
+        frontier_ids = {tuple(e.mitigation_ids) for e in result.pareto_frontier}
+        for candidate in result.evaluations:
+            dominated = any(
+                all(o.combined_rr[ae] <= candidate.combined_rr[ae] for ae in result.target_aes)
+                and o.size <= candidate.size
+                and (o.size < candidate.size or any(
+                    o.combined_rr[ae] < candidate.combined_rr[ae] for ae in result.target_aes
+                ))
+                for o in result.evaluations
+            )
+            assert (tuple(candidate.mitigation_ids) in frontier_ids) == (not dominated)
+
+    def test_best_by_size_is_lowest_total_rr(self):
+        result = optimize_mitigation_regimens(self.BASELINES, max_size=3)
+        for size, best in result.best_by_size.items():
+            same_size = [e for e in result.evaluations if e.size == size]
+            assert sum(best.combined_rr.values()) == min(
+                sum(e.combined_rr.values()) for e in same_size
+            )
+
+    def test_intervals_only_on_frontier(self):
+        result = optimize_mitigation_regimens(
+            self.BASELINES, max_size=2,
+            baseline_params={"CRS": (2.0, 40.0), "ICANS": (1.0, 45.0)},
+            n_samples=500, seed=3,
+        )
+        for evaluation in result.evaluations:
+            if evaluation.pareto_optimal:
+                assert evaluation.intervals
+            else:
+                assert evaluation.intervals == {}
+
+    def test_required_and_excluded(self):
+        result = optimize_mitigation_regimens(
+            self.BASELINES, max_size=3,
+            required=["anakinra"], excluded=["tocilizumab"],
+        )
+        assert all("anakinra" in e.mitigation_ids for e in result.evaluations)
+        assert all("tocilizumab" not in e.mitigation_ids for e in result.evaluations)
+
+    def test_invalid_constraints(self):
+        with pytest.raises(ValueError):
+            optimize_mitigation_regimens(self.BASELINES, required=["unknown"])
+        with pytest.raises(ValueError):
+            optimize_mitigation_regimens(self.BASELINES, max_size=0)
+        with pytest.raises(ValueError):
+            optimize_mitigation_regimens(
+                self.BASELINES, required=["anakinra"], excluded=["anakinra"],
+            )
+        with pytest.raises(ValueError):
+            optimize_mitigation_regimens({})
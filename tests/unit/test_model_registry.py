@@ -7,12 +7,15 @@ functions.
 """
 
 import math
+
+import numpy as np
 import pytest
 
 from src.models.model_registry import (
     MODEL_REGISTRY,
     RiskModel,
     bayesian_beta_binomial,
+    bayesian_beta_binomial_update,
     compare_models,
     empirical_bayes,
     estimate_risk,
@@ -29,6 +32,7 @@ from src.models.model_validation import (
     coverage_probability,
     leave_one_out_cv,
     model_comparison,
+    run_evaluation_tasks,
     sequential_prediction_test,
 )
 
@@ -376,6 +380,40 @@ class TestRandomEffectsMeta:
         result = random_effects_meta(data)
         assert result["estimate_pct"] < 5.0  # Very low with all zeros
 
+    def test_columnar_matches_records(self, three_studies):
+        records = three_studies["studies"]
+        columns = {
+            "events": np.array([s["events"] for s in records]),
+            "n": np.array([s["n"] for s in records]),
+            "label": [s["label"] for s in records],
+        }
+        assert random_effects_meta({"studies": columns}) == random_effects_meta(three_studies)
+
+    def test_columnar_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="equal length"):
+            random_effects_meta({"studies": {"events": [1, 2], "n": [10]}})
+
+    def test_bootstrap_intervals(self, three_studies):
+        result = random_effects_meta({**three_studies, "n_bootstrap": 500, "seed": 7})
+        boot = result["metadata"]["bootstrap"]
+        assert boot["n_resamples"] == 500
+        assert boot["estimate_ci_pct"][0] <= result["estimate_pct"] <= boot["estimate_ci_pct"][1]
+        assert 0.0 <= boot["i_squared_ci"][0] <= boot["i_squared_ci"][1] <= 1.0
+        assert 0.0 < boot["heterogeneity_p_permutation"] <= 1.0
+        # Same seed, same resamples; analytic fields are unchanged
+        again = random_effects_meta({**three_studies, "n_bootstrap": 500, "seed": 7})
+        assert again == result
+        assert "bootstrap" not in random_effects_meta(three_studies)["metadata"]
+
+    def test_permutation_detects_heterogeneity(self, homogeneous_studies):
+        heterogeneous = {"studies": [
+            {"events": 1, "n": 100}, {"events": 30, "n": 100}, {"events": 2, "n": 100},
+        ]}
+        p_het = random_effects_meta({**heterogeneous, "n_bootstrap": 999, "seed": 1})
+        p_hom = random_effects_meta({**homogeneous_studies, "n_bootstrap": 999, "seed": 1})
+        assert p_het["metadata"]["bootstrap"]["heterogeneity_p_permutation"] < 0.01
+        assert p_hom["metadata"]["bootstrap"]["heterogeneity_p_permutation"] > 0.1
+
 
 # ===========================================================================
 # 5. Empirical Bayes Shrinkage
@@ -462,6 +500,29 @@ class TestEmpiricalBayes:
         result = empirical_bayes(data)
         assert result["metadata"]["shrinkage_factor"] == 0.5
 
+    def test_columnar_matches_records(self, ae_data):
+        records = ae_data["ae_types"]
+        columns = {
+            "name": [ae["name"] for ae in records],
+            "events": [ae["events"] for ae in records],
+            "n": [ae["n"] for ae in records],
+        }
+        assert empirical_bayes({**ae_data, "ae_types": columns}) == empirical_bayes(ae_data)
+
+    def test_bootstrap_intervals(self, ae_data):
+        result = empirical_bayes({**ae_data, "n_bootstrap": 1000, "seed": 3})
+        boot = result["metadata"]["bootstrap"]
+        assert boot["n_resamples"] == 1000
+        assert boot["estimate_ci_pct"][0] <= boot["estimate_ci_pct"][1]
+        assert 0.0 <= boot["shrinkage_factor_ci"][0] <= boot["shrinkage_factor_ci"][1] <= 1.0
+        assert boot["tau_squared_ci"][0] >= 0.0
+
+    def test_bootstrap_respects_prior_weight(self, ae_data):
+        result = empirical_bayes({
+            **ae_data, "prior_weight": 0.25, "n_bootstrap": 200, "seed": 3,
+        })
+        assert result["metadata"]["bootstrap"]["shrinkage_factor_ci"] == [0.25, 0.25]
+
 
 # ===========================================================================
 # 6. Kaplan-Meier
@@ -751,6 +812,12 @@ class TestLeaveOneOutCV:
         result = leave_one_out_cv(five_studies, frequentist_exact)
         assert result["n_folds"] == 5
 
+    def test_unpicklable_model_runs_serially(self, five_studies):
+        result = leave_one_out_cv(
+            five_studies, lambda d: frequentist_exact(d), n_workers=4,
+        )
+        assert result == leave_one_out_cv(five_studies, frequentist_exact)
+
 
 class TestModelComparison:
     """Tests for model_comparison()."""
@@ -783,6 +850,46 @@ class TestModelComparison:
         rmses = [s["rmse_pct"] for s in result["summary"]]
         assert rmses == sorted(rmses)
 
+    def test_parallel_matches_serial(self, comparison_studies):
+        model_fns = {
+            "meta": random_effects_meta,
+            "exact": frequentist_exact,
+            "bayes": bayesian_beta_binomial,
+        }
+        serial = model_comparison(comparison_studies, model_fns)
+        parallel = model_comparison(comparison_studies, model_fns, n_workers=2)
+        assert parallel == serial
+        assert list(parallel["per_model"]) == ["meta", "exact", "bayes"]
+
+    def test_failing_model_does_not_abort_others(self, comparison_studies):
+        def broken(data):
+            raise RuntimeError("boom")
+
+        result = model_comparison(
+            comparison_studies, {"broken": broken, "exact": frequentist_exact},
+        )
+        assert result["per_model"]["broken"] == {"error": "boom"}
+        assert result["best_model"] == "exact"
+
+    def test_insufficient_studies(self):
+        result = model_comparison([{"events": 1, "n": 10}], {"exact": frequentist_exact})
+        assert "At least 2" in result["per_model"]["exact"]["error"]
+        assert result["best_model"] is None
+
+
+class TestRunEvaluationTasks:
+    """Tests for run_evaluation_tasks()."""
+
+    def test_serial_preserves_order(self):
+        assert run_evaluation_tasks(abs, [-3, 1, -2]) == [3, 1, 2]
+
+    def test_parallel_preserves_order(self):
+        tasks = list(range(-20, 20))
+        assert run_evaluation_tasks(abs, tasks, n_workers=2) == [abs(t) for t in tasks]
+
+    def test_empty(self):
+        assert run_evaluation_tasks(abs, [], n_workers=None) == []
+
 
 class TestSequentialPredictionTest:
     """Tests for sequential_prediction_test()."""
@@ -815,3 +922,43 @@ class TestSequentialPredictionTest:
             assert "true_rate_pct" in step
             assert "predicted_pct" in step
             assert "covered" in step
+
+    def test_incremental_update_matches_refit(self, timeline):
+        incremental = sequential_prediction_test(timeline, bayesian_beta_binomial)
+        refit = sequential_prediction_test(
+            timeline, lambda d: bayesian_beta_binomial(d),
+        )
+        assert incremental == refit
+
+    def test_update_fn_is_used(self, timeline):
+        calls = []
+
+        def update(previous, data):
+            calls.append(data["label"])
+            return bayesian_beta_binomial_update(previous, data)
+
+        sequential_prediction_test(timeline, bayesian_beta_binomial, update_fn=update)
+        assert calls == ["T2", "T3", "T4"]
+
+    def test_failed_update_falls_back_to_refit(self, timeline):
+        def update(previous, data):
+            raise ValueError("no update")
+
+        result = sequential_prediction_test(
+            timeline, bayesian_beta_binomial, update_fn=update,
+        )
+        assert result == sequential_prediction_test(timeline, bayesian_beta_binomial)
+
+
+class TestBayesianBetaBinomialUpdate:
+    """Tests for bayesian_beta_binomial_update()."""
+
+    def test_matches_pooled_fit(self):
+        prior = {"prior_alpha": 0.21, "prior_beta": 6.79, "prior_source": "CRS"}
+        first = bayesian_beta_binomial({"events": 1, "n": 12, **prior})
+        updated = bayesian_beta_binomial_update(first, {"events": 2, "n": 30})
+        assert updated == bayesian_beta_binomial({"events": 3, "n": 42, **prior})
+
+    def test_registered_on_model(self):
+        assert MODEL_REGISTRY["bayesian_beta_binomial"].update_fn is bayesian_beta_binomial_update
+        assert MODEL_REGISTRY["frequentist_exact"].update_fn is None
@@ -0,0 +1,187 @@
+"""
+Unit tests for src/data/graph/similarity.py
+
+Builds a small graph of cytokines participating in pathways and checks the
+patient similarity index against pairwise
+``KnowledgeGraph.compute_patient_similarity``: scores, ordering, replacement
+and removal of patients, and LSH candidate search.
+"""
+
+import random
+
+import pytest
+
+from src.data.graph.knowledge_graph import KnowledgeGraph
+from src.data.graph.schema import EdgeType, GraphEdge, GraphNode, NodeType
+from src.data.graph.similarity import PatientSimilarityIndex
+
+# Cytokine -> pathways it participates in; upper normal range is 10 pg/mL
+_PARTICIPATION = {
+    "CYTOKINE:IL6": ["PATHWAY:IL6", "PATHWAY:JAK_STAT"],
+    "CYTOKINE:IFNG": ["PATHWAY:IFNG", "PATHWAY:JAK_STAT"],
+    "CYTOKINE:TNF": ["PATHWAY:NFKB"],
+    "CYTOKINE:IL1B": ["PATHWAY:INFLAMMASOME", "PATHWAY:NFKB"],
+    "CYTOKINE:IL10": ["PATHWAY:IL10"],
+}
+
+
+def _graph() -> KnowledgeGraph:
+    kg = KnowledgeGraph()
+    pathways = sorted({p for ps in _PARTICIPATION.values() for p in ps})
+    for pathway_id in pathways:
+        kg.add_node(GraphNode(pathway_id, NodeType.PATHWAY, pathway_id))
+    for cyt_id, pathway_ids in _PARTICIPATION.items():
+        kg.add_node(GraphNode(
+            cyt_id, NodeType.CYTOKINE, cyt_id,
+            properties={"normal_range_pg_ml": (0, 10)},
+        ))
+        for pathway_id in pathway_ids:
+            kg.add_edge(GraphEdge(cyt_id, pathway_id, EdgeType.PARTICIPATES_IN))
+    return kg
+
+
+def _cohort(n: int, seed: int = 7) -> list[tuple[str, dict[str, float]]]:
+    rng = random.Random(seed)
+    cytokines = list(_PARTICIPATION)
+    return [
+        (f"PT-{i:03d}", {c: rng.uniform(0, 40) for c in rng.sample(cytokines, 3)})
+        for i in range(n)
+    ]
+
+
+class TestExactSearch:
+
+    def test_matches_pairwise_similarity(self):
+        kg = _graph()
+        cohort = _cohort(200)
+        index = PatientSimilarityIndex(kg)
+        for patient_id, cytokines in cohort:
+            index.add(patient_id, cytokines)
+
+        query = {"CYTOKINE:IL6": 80.0, "CYTOKINE:TNF": 35.0}
+        expected = [
+            (patient_id, kg.compute_patient_similarity(query, cytokines))
+            for patient_id, cytokines in cohort
+        ]
+        expected = sorted(
+            [(p, r) for p, r in expected if r.score > 0],
+            key=lambda x: -x[1].score,
+        )
+
+        assert index.nearest(query, k=len(cohort), method="exact") == expected
+        assert index.nearest(query, k=5) == expected[:5]
+
+    def test_result_fields(self):
+        index = PatientSimilarityIndex(_graph())
+        index.add("PT-A", {"CYTOKINE:IL6": 50.0, "CYTOKINE:IL10": 50.0})
+
+        [(patient_id, result)] = index.nearest({"CYTOKINE:IL6": 50.0, "CYTOKINE:TNF": 50.0})
+        assert patient_id == "PT-A"
+        assert result.score == pytest.approx(2 / 4)
+        assert result.shared_pathways == ["PATHWAY:IL6", "PATHWAY:JAK_STAT"]
+        assert result.unique_to_query == ["PATHWAY:NFKB"]
+
+    def test_below_threshold_and_disjoint_not_returned(self):
+        index = PatientSimilarityIndex(_graph())
+        index.add("PT-A", {"CYTOKINE:IL10": 50.0})
+        index.add("PT-B", {"CYTOKINE:IL6": 15.0})  # not above 2x normal
+
+        assert index.nearest({"CYTOKINE:IL6": 50.0}) == []
+        assert index.pathways("PT-B") == []
+
+    def test_invalid_arguments(self):
+        index = PatientSimilarityIndex(_graph())
+        with pytest.raises(ValueError):
+            index.nearest({}, k=0)
+        with pytest.raises(ValueError):
+            index.nearest({}, method="brute")
+        with pytest.raises(ValueError):
+            PatientSimilarityIndex(_graph(), num_perm=64, bands=10)
+
+
+class TestCohortUpdates:
+
+    def test_replace_and_remove(self):
+        index = PatientSimilarityIndex(_graph())
+        index.add("PT-A", {"CYTOKINE:IL6": 50.0})
+        index.add("PT-B", {"CYTOKINE:IL6": 50.0, "CYTOKINE:TNF": 50.0})
+        index.add("PT-A", {"CYTOKINE:TNF": 50.0})
+
+        assert len(index) == 2
+        assert index.pathways("PT-A") == ["PATHWAY:NFKB"]
+        assert [p for p, _ in index.nearest({"CYTOKINE:IL6": 50.0})] == ["PT-B"]
+
+        index.remove("PT-B")
+        assert "PT-B" not in index
+        assert index.nearest({"CYTOKINE:IL6": 50.0}) == []
+        with pytest.raises(KeyError):
+            index.remove("PT-B")
+
+    def test_nearest_to_patient_excludes_self(self):
+        index = PatientSimilarityIndex(_graph())
+        index.add_pathways("PT-A", ["PATHWAY:IL6", "PATHWAY:JAK_STAT", "PATHWAY:UNKNOWN"])
+        index.add("PT-B", {"CYTOKINE:IL6": 50.0})
+        index.add("PT-C", {"CYTOKINE:IFNG": 50.0})
+
+        neighbors = index.nearest_to_patient("PT-A", k=5)
+        assert [(p, r.score) for p, r in neighbors] == [
+            ("PT-B", 1.0), ("PT-C", pytest.approx(1 / 3)),
+        ]
+
+    def test_dead_slots_compacted(self):
+        cohort = _cohort(60)
+        index = PatientSimilarityIndex(_graph(), compact_min_dead=4)
+        for patient_id, cytokines in cohort:
+            index.add(patient_id, cytokines)
+        # Re-add every patient (replacing it) and drop every third one
+        for patient_id, cytokines in cohort:
+            index.add(patient_id, cytokines)
+        for patient_id, _ in cohort[::3]:
+            index.remove(patient_id)
+
+        fresh = PatientSimilarityIndex(_graph())
+        for patient_id, cytokines in cohort:
+            if patient_id in index:
+                fresh.add(patient_id, cytokines)
+
+        assert len(index._patient_ids) <= 2 * len(index)
+        for _, cytokines in cohort[:10]:
+            for method in ("exact", "lsh"):
+                assert index.nearest(cytokines, k=10, method=method) == fresh.nearest(
+                    cytokines, k=10, method=method,
+                )
+
+    def test_graph_change_requires_rebuild(self):
+        kg = _graph()
+        index = PatientSimilarityIndex(kg)
+        index.add("PT-A", {"CYTOKINE:IL6": 50.0})
+        kg.add_edge(GraphEdge("CYTOKINE:IL10", "PATHWAY:NFKB", EdgeType.PARTICIPATES_IN))
+
+        with pytest.raises(RuntimeError, match="rebuild"):
+            index.nearest({"CYTOKINE:IL6": 50.0})
+        with pytest.raises(RuntimeError, match="rebuild"):
+            index.add("PT-B", {"CYTOKINE:IL10": 50.0})
+        assert PatientSimilarityIndex(kg).graph_version == kg.version
+
+
+class TestLSH:
+
+    def test_finds_identical_profiles(self):
+        index = PatientSimilarityIndex(_graph(), num_perm=32, bands=16)
+        for patient_id, cytokines in _cohort(300):
+            index.add(patient_id, cytokines)
+
+        exact = index.nearest_to_patient("PT-000", k=10, method="exact")
+        approx = index.nearest_to_patient("PT-000", k=10, method="lsh")
+        identical = {p for p, r in exact if r.score == 1.0}
+
+        assert identical <= {p for p, _ in approx}
+        # Candidates are rescored exactly
+        scores = dict(exact)
+        assert all(r == scores[p] for p, r in approx if p in scores)
+
+    def test_auto_switches_on_cohort_size(self):
+        index = PatientSimilarityIndex(_graph(), lsh_threshold=1)
+        index.add("PT-A", {"CYTOKINE:IL6": 50.0})
+        index.add("PT-B", {"CYTOKINE:IL6": 50.0})
+        assert [p for p, _ in index.nearest({"CYTOKINE:IL6": 50.0})] == ["PT-A", "PT-B"]
@@ -0,0 +1,334 @@
+"""
+Tests for the SafetyEngine pipeline scheduler (src/engine/core.py) and
+model call fan-out / hedging.
+
+Uses a fake async model backend with configurable per-model delays so that
+concurrency, timeouts, and audit attribution can be verified without any
+network access.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.engine.core import PipelineExecutionConfig, SafetyEngine
+from src.engine.integration.audit import AuditEventType
+from src.engine.orchestrator.router import (
+    ClinicalDomain,
+    ModelCapability,
+    ModelLatencyTracker,
+    QueryComplexity,
+)
+from src.safety_index.index import AdverseEventType
+from src.safety_index.patient.scorer import PatientData
+
+
+# ---------------------------------------------------------------------------
+# Fakes and fixtures
+# ---------------------------------------------------------------------------
+
+class FakeBackend:
+    """Async model backend that sleeps for a fixed per-model delay."""
+
+    def __init__(self, delays_s: dict[str, float], risk_score: float = 0.4):
+        self.delays_s = delays_s
+        self.risk_score = risk_score
+        self.calls: list[str] = []
+
+    async def predict(self, prompt, model_id, max_tokens=4096, temperature=0.1):
+        self.calls.append(model_id)
+        await asyncio.sleep(self.delays_s.get(model_id, 0.0))
+        return {"risk_score": self.risk_score, "confidence": 0.8, "reasoning": "fake"}
+
+    async def health_check(self, model_id):
+        return True
+
+
+def _capability(model_id: str, provider: str, latency_ms: int = 1000) -> ModelCapability:
+    return ModelCapability(
+        model_id=model_id,
+        provider=provider,
+        max_complexity=QueryComplexity.EXPERT,
+        clinical_domains=frozenset(ClinicalDomain),
+        avg_latency_ms=latency_ms,
+        max_tokens=8192,
+        cost_per_1k_tokens=0.01,
+    )
+
+
+def _make_engine(backend, execution_config=None, models=None) -> SafetyEngine:
+    engine = SafetyEngine(model_backend=backend, execution_config=execution_config)
+    engine.initialize()
+    for cap in models or [_capability("model-a", "alpha")]:
+        engine.register_model(cap)
+    return engine
+
+
+@pytest.fixture
+def patient():
+    return PatientData(
+        patient_id="PAT-ENG-001",
+        hours_since_infusion=24.0,
+        biomarkers={"il6": 80.0, "ferritin": 1200.0, "crp": 60.0},
+    )
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# PipelineExecutionConfig
+# ---------------------------------------------------------------------------
+
+class TestPipelineExecutionConfig:
+
+    def test_defaults_are_sequential(self):
+        config = PipelineExecutionConfig()
+        assert config.concurrent_events is False
+        assert config.event_timeout_s is None
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrent_events"):
+            PipelineExecutionConfig(max_concurrent_events=0)
+
+    def test_rejects_non_positive_timeout(self):
+        with pytest.raises(ValueError, match="event_timeout_s"):
+            PipelineExecutionConfig(event_timeout_s=0)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent adverse-event pipelines
+# ---------------------------------------------------------------------------
+
+class TestConcurrentAdverseEvents:
+
+    def test_concurrent_matches_sequential_results(self, patient):
+        seq = _make_engine(FakeBackend({"model-a": 0.0}))
+        conc = _make_engine(
+            FakeBackend({"model-a": 0.0}),
+            PipelineExecutionConfig(concurrent_events=True),
+        )
+        seq_result = _run(seq.process_patient(patient))
+        conc_result = _run(conc.process_patient(patient))
+
+        assert list(conc_result.safety_indices) == list(seq_result.safety_indices)
+        for ae, index in seq_result.safety_indices.items():
+            assert conc_result.safety_indices[ae].composite_score == pytest.approx(
+                index.composite_score
+            )
+        assert [a.adverse_event for a in conc_result.alerts] == [
+            a.adverse_event for a in seq_result.alerts
+        ]
+
+    def test_concurrent_latency_is_bounded_by_slowest_event(self, patient):
+        backend = FakeBackend({"model-a": 0.2})
+        engine = _make_engine(backend, PipelineExecutionConfig(concurrent_events=True))
+
+        start = time.monotonic()
+        result = _run(engine.process_patient(patient))
+        elapsed = time.monotonic() - start
+
+        assert len(result.safety_indices) == 3
+        assert elapsed < 0.5  # sequential would take >= 0.6s
+
+    def test_concurrency_cap_limits_in_flight_events(self, patient):
+        backend = FakeBackend({"model-a": 0.15})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(concurrent_events=True, max_concurrent_events=1),
+        )
+        start = time.monotonic()
+        _run(engine.process_patient(patient))
+        assert time.monotonic() - start >= 0.45
+
+    def test_timeout_isolates_slow_event(self, patient):
+        backend = FakeBackend({"model-a": 1.0})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(concurrent_events=True, event_timeout_s=0.1),
+        )
+        result = _run(engine.process_patient(patient))
+
+        assert result.safety_indices == {}
+        errors = [
+            r for r in engine.audit_trail.get_session_records(result.session_id)
+            if r.event_type == AuditEventType.ERROR
+        ]
+        assert len(errors) == 3
+        assert all(r.output_data["error"] == "pipeline_timeout" for r in errors)
+
+    def test_audit_records_attributed_to_each_session(self, patient):
+        engine = _make_engine(
+            FakeBackend({"model-a": 0.05}),
+            PipelineExecutionConfig(concurrent_events=True),
+        )
+        other = PatientData(patient_id="PAT-ENG-002", hours_since_infusion=12.0)
+
+        async def _both():
+            return await asyncio.gather(
+                engine.process_patient(patient),
+                engine.process_patient(other),
+            )
+
+        first, second = _run(_both())
+        for result in (first, second):
+            records = engine.audit_trail.get_session_records(result.session_id)
+            assert records
+            assert {r.patient_id for r in records} == {result.patient_id}
+            indexed = [
+                r for r in records
+                if r.event_type == AuditEventType.SAFETY_INDEX_COMPUTATION
+            ]
+            assert len(indexed) == 3
+
+
+# ---------------------------------------------------------------------------
+# Model fan-out and hedged requests
+# ---------------------------------------------------------------------------
+
+class TestModelFanOut:
+
+    def test_ensemble_members_called_concurrently(self, patient):
+        models = [
+            _capability("model-a", "alpha"),
+            _capability("model-b", "beta"),
+            _capability("model-c", "gamma"),
+        ]
+        backend = FakeBackend({"model-a": 0.2, "model-b": 0.2, "model-c": 0.2})
+        engine = _make_engine(backend, models=models)
+
+        start = time.monotonic()
+        result = _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+        elapsed = time.monotonic() - start
+
+        preds = result.individual_predictions[AdverseEventType.CRS]
+        assert [p.model_id for p in preds] == ["model-a", "model-b", "model-c"]
+        assert elapsed < 0.5  # sequential would take >= 0.6s
+
+    def test_hedge_fires_when_primary_exceeds_p95(self, patient):
+        # Single provider: the router keeps the extra models as fallbacks.
+        models = [
+            _capability("model-a", "alpha", latency_ms=50),
+            _capability("model-b", "alpha", latency_ms=50),
+            _capability("model-c", "alpha", latency_ms=50),
+        ]
+        backend = FakeBackend({"model-a": 1.0, "model-b": 0.0})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(hedge_requests=True),
+            models=models,
+        )
+
+        start = time.monotonic()
+        result = _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+        elapsed = time.monotonic() - start
+
+        preds = result.individual_predictions[AdverseEventType.CRS]
+        assert [p.model_id for p in preds] == ["model-b"]
+        assert backend.calls == ["model-a", "model-b"]
+        assert elapsed < 0.8
+
+        hedge_calls = [
+            r for r in engine.audit_trail.get_session_records(result.session_id)
+            if r.event_type == AuditEventType.MODEL_CALL
+            and r.parameters.get("hedge_for") == "model-a"
+        ]
+        assert len(hedge_calls) == 1
+
+    def test_cancelled_primary_records_latency(self, patient):
+        models = [
+            _capability("model-a", "alpha", latency_ms=50),
+            _capability("model-b", "alpha", latency_ms=50),
+            _capability("model-c", "alpha", latency_ms=50),
+        ]
+        backend = FakeBackend({"model-a": 1.0, "model-b": 0.0})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(hedge_requests=True),
+            models=models,
+        )
+        recorded: list[tuple[str, int]] = []
+        engine._router.record_latency = lambda model_id, ms: recorded.append((model_id, ms))
+
+        _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+
+        latencies = dict(recorded)
+        assert set(latencies) == {"model-a", "model-b"}
+        # The cancelled primary ran at least until the hedge was launched
+        assert latencies["model-a"] >= 100
+
+    def test_falls_back_to_last_prediction_when_no_hedge_is_valid(self, patient):
+        class UnparseableBackend(FakeBackend):
+            async def predict(self, prompt, model_id, max_tokens=4096, temperature=0.1):
+                self.calls.append(model_id)
+                return ["not", "a", "response"]
+
+        models = [
+            _capability("model-a", "alpha", latency_ms=50),
+            _capability("model-b", "alpha", latency_ms=50),
+            _capability("model-c", "alpha", latency_ms=50),
+        ]
+        backend = UnparseableBackend({})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(hedge_requests=True),
+            models=models,
+        )
+        result = _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+
+        assert len(backend.calls) > 1
+        preds = result.individual_predictions[AdverseEventType.CRS]
+        assert [p.model_id for p in preds] == [backend.calls[-1]]
+        assert preds[0].raw_response["error"] == "unparseable"
+
+    def test_no_hedge_when_primary_is_fast(self, patient):
+        models = [
+            _capability("model-a", "alpha", latency_ms=500),
+            _capability("model-b", "alpha", latency_ms=500),
+            _capability("model-c", "alpha", latency_ms=500),
+        ]
+        backend = FakeBackend({"model-a": 0.0, "model-b": 0.0})
+        engine = _make_engine(
+            backend,
+            PipelineExecutionConfig(hedge_requests=True),
+            models=models,
+        )
+        result = _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+
+        assert backend.calls == ["model-a"]
+        assert result.individual_predictions[AdverseEventType.CRS][0].model_id == "model-a"
+
+    def test_hedging_disabled_by_default(self, patient):
+        models = [
+            _capability("model-a", "alpha", latency_ms=50),
+            _capability("model-b", "alpha", latency_ms=50),
+            _capability("model-c", "alpha", latency_ms=50),
+        ]
+        backend = FakeBackend({"model-a": 0.2, "model-b": 0.0})
+        engine = _make_engine(backend, models=models)
+        _run(engine.process_patient(patient, adverse_events=[AdverseEventType.CRS]))
+        assert backend.calls == ["model-a"]
+
+
+class TestModelLatencyTracker:
+
+    def test_falls_back_to_capability_estimate(self):
+        tracker = ModelLatencyTracker(min_samples=5, default_multiplier=2.0)
+        cap = _capability("model-a", "alpha", latency_ms=300)
+        tracker.record("model-a", 10)
+        assert tracker.percentile_ms(cap) == 600.0
+
+    def test_nearest_rank_p95(self):
+        tracker = ModelLatencyTracker(min_samples=1)
+        cap = _capability("model-a", "alpha")
+        for latency in range(1, 101):
+            tracker.record("model-a", latency)
+        assert tracker.percentile_ms(cap, 95.0) == 95.0
+
+    def test_window_is_bounded(self):
+        tracker = ModelLatencyTracker(window_size=10)
+        for latency in range(50):
+            tracker.record("model-a", latency)
+        assert tracker.sample_count("model-a") == 10
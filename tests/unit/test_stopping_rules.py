@@ -7,7 +7,9 @@ monotonicity, edge cases, prior sensitivity, and posterior probability accuracy.
 
 import pytest
 
+import src.models.stopping_boundaries as stopping_boundaries
 from src.models.bayesian_risk import compute_stopping_boundaries
+from src.models.stopping_boundaries import BoundaryTableService, compute_boundary_table
 
 try:
     from scipy.stats import beta as beta_dist
@@ -20,6 +22,14 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolated_boundary_cache(monkeypatch, tmp_path):
+    """Keep the shared boundary-table service's files inside tmp_path."""
+    monkeypatch.setattr(
+        stopping_boundaries, "_service", BoundaryTableService(tmp_path / "shared"),
+    )
+
+
 # ============================================================================
 # Monotonicity — more events allowed with more patients
 # ============================================================================
@@ -364,3 +374,122 @@ class TestOutputStructure:
         )
         for b in boundaries:
             assert b["n_patients"] <= 50
+
+
+# ============================================================================
+# Vectorized boundary tables and the cached service
+# ============================================================================
+
+
+def _linear_scan(target_rate, threshold, max_n, prior_alpha=0.5, prior_beta=0.5):
+    """Reference: per-n linear scan over k, one sf() call at a time."""
+    max_events = []
+    for n in range(1, max_n + 1):
+        max_k = -1
+        for k in range(n + 1):
+            if beta_dist.sf(target_rate, prior_alpha + k, prior_beta + n - k) < threshold:
+                max_k = k
+            else:
+                break
+        max_events.append(max_k)
+    return max_events
+
+
+class TestBoundaryTable:
+
+    @pytest.mark.parametrize("target_rate,threshold,prior", [
+        (0.05, 0.8, (0.5, 0.5)),
+        (0.005, 0.8, (0.5, 0.5)),
+        (0.10, 0.95, (5.0, 5.0)),
+        (0.99, 0.5, (0.21, 1.29)),
+    ])
+    def test_matches_linear_scan(self, target_rate, threshold, prior):
+        table = compute_boundary_table(target_rate, threshold, 80, *prior)
+        assert table.max_events.tolist() == _linear_scan(target_rate, threshold, 80, *prior)
+
+    def test_large_max_n(self):
+        table = compute_boundary_table(0.05, 0.8, max_n=5000)
+        k = table.max_events
+        assert len(k) == 5000
+        assert (k[1:] >= k[:-1]).all()
+        assert ((k[1:] - k[:-1]) <= 1).all()
+        # Boundary rate approaches the target rate
+        assert table.at(5000) / 5000 == pytest.approx(0.05, abs=0.005)
+
+    def test_at_and_truncated(self):
+        table = compute_boundary_table(0.05, 0.8, max_n=100)
+        short = table.truncated(30)
+        assert short.max_n == 30
+        assert short.at(30) == table.at(30)
+        assert short.changes() == compute_stopping_boundaries(0.05, 0.8, max_n=30)
+        with pytest.raises(ValueError):
+            table.at(101)
+
+    def test_invalid_max_n(self):
+        with pytest.raises(ValueError, match="max_n"):
+            compute_boundary_table(0.05, max_n=0)
+        assert compute_stopping_boundaries(0.05, max_n=0) == []
+
+
+class TestBoundaryTableService:
+
+    def test_memory_hit_and_slice(self, tmp_path):
+        service = BoundaryTableService(tmp_path)
+        full = service.get(0.05, 0.8, max_n=200)
+        part = service.get(0.05, 0.8, max_n=50)
+
+        assert part.max_events.tolist() == full.max_events[:50].tolist()
+        stats = service.stats()
+        assert stats["computed"] == 1
+        assert stats["memory_hits"] == 1
+
+    def test_longer_request_recomputes(self, tmp_path):
+        service = BoundaryTableService(tmp_path)
+        service.get(0.05, 0.8, max_n=50)
+        assert service.get(0.05, 0.8, max_n=100).max_n == 100
+        assert service.get(0.05, 0.8, max_n=75).max_n == 75
+        assert service.stats()["computed"] == 2
+
+    def test_persisted_across_instances(self, tmp_path):
+        first = BoundaryTableService(tmp_path).get(0.03, 0.8, max_n=300)
+
+        service = BoundaryTableService(tmp_path)
+        second = service.get(0.03, 0.8, max_n=120)
+        assert second.max_events.tolist() == first.max_events[:120].tolist()
+        assert service.stats()["disk_hits"] == 1
+        assert service.stats()["computed"] == 0
+
+    def test_corrupt_file_is_recomputed(self, tmp_path):
+        BoundaryTableService(tmp_path).get(0.05, 0.8, max_n=20)
+        for path in tmp_path.glob("*.npz"):
+            path.write_bytes(b"not a table")
+
+        service = BoundaryTableService(tmp_path)
+        table = service.get(0.05, 0.8, max_n=20)
+        assert table.max_events.tolist() == _linear_scan(0.05, 0.8, 20)
+        assert service.stats()["errors"] == 1
+
+    def test_algorithm_version_invalidates_files(self, tmp_path, monkeypatch):
+        BoundaryTableService(tmp_path).get(0.05, 0.8, max_n=20)
+        monkeypatch.setattr(stopping_boundaries, "_ALGORITHM_VERSION", 2)
+
+        service = BoundaryTableService(tmp_path)
+        service.get(0.05, 0.8, max_n=20)
+        assert service.stats()["disk_hits"] == 0
+        assert service.stats()["computed"] == 1
+        assert len(list(tmp_path.glob("*.npz"))) == 2
+
+    def test_unwritable_dir_degrades(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        service = BoundaryTableService(blocker / "tables")
+
+        assert service.get(0.05, 0.8, max_n=20).max_n == 20
+        assert service.stats()["errors"] >= 1
+
+    def test_lru_bound(self):
+        service = BoundaryTableService(max_memory_entries=2)
+        for rate in (0.01, 0.02, 0.03):
+            service.get(rate, 0.8, max_n=10)
+        assert service.stats()["memory_entries"] == 2
+